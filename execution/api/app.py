@@ -19,7 +19,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Annotated, Any
 
-from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 
@@ -28,6 +28,7 @@ from execution.api.middleware import (
     RateLimitMiddleware,
     RequestIDMiddleware,
 )
+from execution.api.response_cache import ResponseCache
 from execution.core import get_logger, setup_logging, setup_observability
 
 # Initialize logging and observability
@@ -51,6 +52,10 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
     )
 
+    # Serialized metrics responses, rebuilt only when their history file changes
+    response_cache = ResponseCache()
+    app.state.response_cache = response_cache
+
     # Add middleware (order matters - last added is executed first)
     app.add_middleware(CacheControlMiddleware)  # Cache headers (innermost)
     app.add_middleware(RequestIDMiddleware)  # Request tracking
@@ -122,6 +127,7 @@ def create_app() -> FastAPI:
             Status of the API and data freshness
         """
         from execution.core import check_data_freshness
+        from execution.core.history_store import HistoryStore
 
         observatory_dir = Path(".tmp/observatory")
 
@@ -137,7 +143,8 @@ def create_app() -> FastAPI:
             "data_freshness": {},
         }
 
-        for name, file_path in [("quality", quality_file), ("security", security_file), ("flow", flow_file)]:
+        for name, history_file in [("quality", quality_file), ("security", security_file), ("flow", flow_file)]:
+            file_path = HistoryStore(history_file).data_path
             if file_path.exists():
                 is_fresh, age_hours = check_data_freshness(file_path, max_age_hours=25.0)
                 health_status["data_freshness"][name] = {"fresh": is_fresh, "age_hours": round(age_hours, 2)}
@@ -157,7 +164,7 @@ def create_app() -> FastAPI:
     # ============================================================
 
     @app.get("/api/v1/metrics/quality/latest", tags=["Quality Metrics"])
-    async def get_latest_quality_metrics(username: str = Depends(verify_credentials)):
+    async def get_latest_quality_metrics(request: Request, username: str = Depends(verify_credentials)):
         """
         Get latest quality metrics.
 
@@ -166,12 +173,10 @@ def create_app() -> FastAPI:
         """
         from execution.collectors.ado_quality_loader import ADOQualityLoader
 
-        try:
-            loader = ADOQualityLoader()
-            metrics = loader.load_latest_metrics()
-
-            logger.info("Quality metrics accessed", extra={"username": username, "project": metrics.project})
+        loader = ADOQualityLoader()
 
+        def build() -> dict[str, Any]:
+            metrics = loader.load_latest_metrics()
             return {
                 "timestamp": metrics.timestamp.isoformat(),
                 "project": metrics.project,
@@ -182,6 +187,13 @@ def create_app() -> FastAPI:
                 "p1_count": metrics.p1_count,
                 "p2_count": metrics.p2_count,
             }
+
+        try:
+            response = response_cache.respond(request, ("quality_latest",), [loader.history_file], build)
+
+            logger.info("Quality metrics accessed", extra={"username": username})
+
+            return response
         except FileNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Quality metrics data not found. Run collectors first."
@@ -193,7 +205,7 @@ def create_app() -> FastAPI:
             )
 
     @app.get("/api/v1/metrics/quality/history", tags=["Quality Metrics"])
-    async def get_quality_history(weeks: int = 12, username: str = Depends(verify_credentials)):
+    async def get_quality_history(request: Request, weeks: int = 12, username: str = Depends(verify_credentials)):
         """
         Get historical quality metrics.
 
@@ -203,26 +215,24 @@ def create_app() -> FastAPI:
         Returns:
             Time series of quality metrics
         """
-        import json
+        from execution.core.history_store import history_exists, load_weeks
 
         history_file = Path(".tmp/observatory/quality_history.json")
 
-        if not history_file.exists():
+        if not history_exists(history_file):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quality history not found")
 
+        def build() -> dict[str, Any]:
+            # Return last N weeks (only N week partitions are read once migrated)
+            weeks_data = list(load_weeks(history_file, last_n=weeks))
+            return {"weeks": weeks_data, "count": len(weeks_data)}
+
         try:
-            with open(history_file, encoding="utf-8") as f:
-                data = json.load(f)
+            response = response_cache.respond(request, ("quality_history", weeks), [history_file], build)
 
-            # Return last N weeks
-            weeks_data = data.get("weeks", [])[-weeks:]
+            logger.info("Quality history accessed", extra={"username": username, "weeks_requested": weeks})
 
-            logger.info(
-                "Quality history accessed",
-                extra={"username": username, "weeks_requested": weeks, "weeks_returned": len(weeks_data)},
-            )
-
-            return {"weeks": weeks_data, "count": len(weeks_data)}
+            return response
         except Exception as e:
             logger.error("Failed to load quality history", exc_info=True)
             raise HTTPException(
@@ -234,7 +244,7 @@ def create_app() -> FastAPI:
     # ============================================================
 
     @app.get("/api/v1/metrics/security/latest", tags=["Security Metrics"])
-    async def get_latest_security_metrics(username: str = Depends(verify_credentials)):
+    async def get_latest_security_metrics(request: Request, username: str = Depends(verify_credentials)):
         """
         Get latest security metrics across all products.
 
@@ -243,8 +253,7 @@ def create_app() -> FastAPI:
         """
         from execution.collectors.armorcode_loader import ArmorCodeLoader
 
-        try:
-            loader = ArmorCodeLoader()
+        def build() -> dict[str, Any]:
             metrics_by_product = loader.load_latest_metrics()
 
             # Aggregate across products
@@ -252,10 +261,6 @@ def create_app() -> FastAPI:
             total_critical = sum(m.critical for m in metrics_by_product.values())
             total_high = sum(m.high for m in metrics_by_product.values())
 
-            logger.info(
-                "Security metrics accessed", extra={"username": username, "product_count": len(metrics_by_product)}
-            )
-
             return {
                 "timestamp": datetime.now().isoformat(),
                 "total_vulnerabilities": total_vulns,
@@ -272,6 +277,14 @@ def create_app() -> FastAPI:
                     for name, m in metrics_by_product.items()
                 ],
             }
+
+        try:
+            loader = ArmorCodeLoader()
+            response = response_cache.respond(request, ("security_latest",), [loader.history_file], build)
+
+            logger.info("Security metrics accessed", extra={"username": username})
+
+            return response
         except FileNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Security metrics data not found. Run collectors first."
@@ -283,7 +296,9 @@ def create_app() -> FastAPI:
             )
 
     @app.get("/api/v1/metrics/security/product/{product_name}", tags=["Security Metrics"])
-    async def get_product_security_metrics(product_name: str, username: str = Depends(verify_credentials)):
+    async def get_product_security_metrics(
+        request: Request, product_name: str, username: str = Depends(verify_credentials)
+    ):
         """
         Get security metrics for a specific product.
 
@@ -295,17 +310,13 @@ def create_app() -> FastAPI:
         """
         from execution.collectors.armorcode_loader import ArmorCodeLoader
 
-        try:
-            loader = ArmorCodeLoader()
+        def build() -> dict[str, Any]:
             metrics_by_product = loader.load_latest_metrics()
 
             if product_name not in metrics_by_product:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Product '{product_name}' not found")
 
             metrics = metrics_by_product[product_name]
-
-            logger.info("Product security metrics accessed", extra={"username": username, "product": product_name})
-
             return {
                 "timestamp": metrics.timestamp.isoformat(),
                 "product": product_name,
@@ -313,6 +324,14 @@ def create_app() -> FastAPI:
                 "critical": metrics.critical,
                 "high": metrics.high,
             }
+
+        try:
+            loader = ArmorCodeLoader()
+            response = response_cache.respond(request, ("security_product", product_name), [loader.history_file], build)
+
+            logger.info("Product security metrics accessed", extra={"username": username, "product": product_name})
+
+            return response
         except HTTPException:
             raise
         except Exception as e:
@@ -326,7 +345,7 @@ def create_app() -> FastAPI:
     # ============================================================
 
     @app.get("/api/v1/metrics/flow/latest", tags=["Flow Metrics"])
-    async def get_latest_flow_metrics(username: str = Depends(verify_credentials)):
+    async def get_latest_flow_metrics(request: Request, username: str = Depends(verify_credentials)):
         """
         Get latest flow metrics (cycle time, lead time).
 
@@ -335,12 +354,10 @@ def create_app() -> FastAPI:
         """
         from execution.collectors.ado_flow_loader import ADOFlowLoader
 
-        try:
-            loader = ADOFlowLoader()
-            metrics = loader.load_latest_metrics()
-
-            logger.info("Flow metrics accessed", extra={"username": username, "project": metrics.project})
+        loader = ADOFlowLoader()
 
+        def build() -> dict[str, Any]:
+            metrics = loader.load_latest_metrics()
             return {
                 "timestamp": metrics.timestamp.isoformat(),
                 "project": metrics.project,
@@ -352,6 +369,13 @@ def create_app() -> FastAPI:
                 "lead_time_p95": metrics.lead_time_p95,
                 "work_items_completed": metrics.throughput,
             }
+
+        try:
+            response = response_cache.respond(request, ("flow_latest",), [loader.history_file], build)
+
+            logger.info("Flow metrics accessed", extra={"username": username})
+
+            return response
         except FileNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Flow metrics data not found. Run collectors first."
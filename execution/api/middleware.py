@@ -9,7 +9,6 @@ Middleware for FastAPI application to handle:
 
 import time
 import uuid
-from collections import defaultdict
 from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
@@ -18,6 +17,7 @@ from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from execution.api.rate_limit import MemoryRateLimitBackend, RateDecision, RateLimitBackend, RateWindow
 from execution.core import get_logger
 
 if TYPE_CHECKING:
@@ -35,20 +35,33 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Rate limiting middleware to prevent API abuse.
 
-    Implements a simple sliding window rate limiter per IP address.
+    Implements a sliding window counter per IP address with fixed memory per
+    client (see execution/api/rate_limit.py). Pass a shared backend, e.g.
+    SQLiteRateLimitBackend, to enforce one limit across several workers.
 
     Configuration:
         - requests_per_minute: Maximum requests per minute per IP
         - requests_per_hour: Maximum requests per hour per IP
+        - backend: Where per-IP state is kept (default: in-process dict)
     """
 
-    def __init__(self, app, requests_per_minute: int = 60, requests_per_hour: int = 1000):
+    def __init__(
+        self,
+        app,
+        requests_per_minute: int = 60,
+        requests_per_hour: int = 1000,
+        backend: RateLimitBackend | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
-
-        # Track requests: {ip: [(timestamp, count), ...]}
-        self.request_counts: dict[str, list[tuple[datetime, int]]] = defaultdict(list)
+        self.windows = (
+            RateWindow(period=60, limit=requests_per_minute, label="minute"),
+            RateWindow(period=3600, limit=requests_per_hour, label="hour"),
+        )
+        self.backend = backend if backend is not None else MemoryRateLimitBackend()
+        self._clock = clock
 
         # Cleanup counter to periodically remove stale IPs
         self._request_counter = 0
@@ -64,119 +77,57 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Get client IP
         client_ip = request.client.host if request.client else "unknown"
 
-        # Check rate limits
-        is_allowed, reason = self._check_rate_limit(client_ip)
+        # Check and record in one step
+        decision = self._acquire(client_ip)
 
-        if not is_allowed:
-            logger.warning("Rate limit exceeded", extra={"ip": client_ip, "path": request.url.path, "reason": reason})
+        if not decision.allowed:
+            logger.warning(
+                "Rate limit exceeded", extra={"ip": client_ip, "path": request.url.path, "reason": decision.reason}
+            )
 
             return JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={"detail": f"Rate limit exceeded: {reason}", "retry_after": 60},  # seconds
+                content={"detail": f"Rate limit exceeded: {decision.reason}", "retry_after": 60},  # seconds
                 headers={"Retry-After": "60"},
             )
 
-        # Record request
-        self._record_request(client_ip)
-
         # Process request
         response = await call_next(request)
 
         # Add rate limit headers
-        remaining = self._get_remaining_requests(client_ip)
         response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
+        response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
 
         return response
 
-    def _get_recent_requests(self, client_ip: str, now: datetime) -> list | None:
+    def _acquire(self, client_ip: str) -> RateDecision:
         """
-        Filter stored requests to the last hour and update storage.
-
-        Returns the filtered list, or None if the IP had no recent requests
-        (in which case it has been removed from the store).
-        """
-        hour_ago = now - timedelta(hours=1)
-        recent = [(ts, count) for ts, count in self.request_counts[client_ip] if ts >= hour_ago]
-        if recent:
-            self.request_counts[client_ip] = recent
-        elif client_ip in self.request_counts:
-            del self.request_counts[client_ip]
-            return None
-        return recent
-
-    def _check_rate_limit(self, client_ip: str) -> tuple[bool, str]:
-        """
-        Check if client has exceeded rate limits.
+        Check the client's limits and count the request if it is allowed.
 
         Returns:
-            Tuple of (is_allowed, reason)
+            RateDecision (allowed, reason, remaining requests this minute)
         """
-        now = datetime.now()
-        recent_requests = self._get_recent_requests(client_ip, now)
-
-        # No requests in the last hour — not rate limited
-        if recent_requests is None:
-            return True, ""
-
-        minute_ago = now - timedelta(minutes=1)
-        requests_last_minute = sum(count for ts, count in recent_requests if ts >= minute_ago)
-        requests_last_hour = sum(count for ts, count in recent_requests)
-
-        if requests_last_minute >= self.requests_per_minute:
-            return False, f"{self.requests_per_minute} requests per minute exceeded"
-
-        if requests_last_hour >= self.requests_per_hour:
-            return False, f"{self.requests_per_hour} requests per hour exceeded"
-
-        return True, ""
-
-    def _record_request(self, client_ip: str) -> None:
-        """Record a request for rate limiting."""
-        now = datetime.now()
-        hour_ago = now - timedelta(hours=1)
-
-        # Clean old entries (keep last hour only)
-        self.request_counts[client_ip] = [
-            (timestamp, count) for timestamp, count in self.request_counts[client_ip] if timestamp >= hour_ago
-        ]
-
-        # Add new request
-        self.request_counts[client_ip].append((now, 1))
+        now = self._clock()
+        decision = self.backend.hit(client_ip, self.windows, now)
 
         # Periodic cleanup: remove stale IPs to prevent memory leak
         self._request_counter += 1
         if self._request_counter >= self._cleanup_interval:
-            self._cleanup_stale_ips(hour_ago)
+            self._cleanup_stale_ips(now)
             self._request_counter = 0
 
-    def _cleanup_stale_ips(self, cutoff_time: datetime) -> None:
+        return decision
+
+    def _cleanup_stale_ips(self, now: float) -> None:
         """
-        Remove IPs with no recent requests to prevent memory leak.
+        Remove IPs whose request counts have aged out of every window.
 
         Args:
-            cutoff_time: Remove IPs with no requests after this time
+            now: Monotonic time in seconds
         """
-        stale_ips = [
-            ip for ip, requests in self.request_counts.items() if not any(ts >= cutoff_time for ts, _ in requests)
-        ]
-
-        for ip in stale_ips:
-            del self.request_counts[ip]
-
-        if stale_ips:
-            logger.debug(f"Cleaned up {len(stale_ips)} stale IP(s) from rate limiter cache")
-
-    def _get_remaining_requests(self, client_ip: str) -> int:
-        """Get remaining requests for client in current minute."""
-        now = datetime.now()
-        minute_ago = now - timedelta(minutes=1)
-
-        requests_last_minute = sum(
-            count for timestamp, count in self.request_counts[client_ip] if timestamp >= minute_ago
-        )
-
-        return max(0, self.requests_per_minute - requests_last_minute)
+        removed = self.backend.sweep(self.windows, now)
+        if removed:
+            logger.debug(f"Cleaned up {removed} stale IP(s) from rate limiter cache")
 
 
 # ============================================================
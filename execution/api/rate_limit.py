@@ -0,0 +1,226 @@
+"""
+API Rate Limit State - Fixed-memory sliding window counters
+
+RateLimitMiddleware used to keep one (timestamp, count) tuple per request for
+an hour and filter the whole list on every request. The sliding window counter
+here keeps, per client and window (minute, hour), only the counts of the
+current and previous fixed windows. Requests over the last `period` seconds
+are estimated as
+
+    previous * (1 - fraction of the current window elapsed) + current
+
+so a check costs the same at 10 or 10,000 requests per minute and a client's
+state is six integers.
+
+State lives in a RateLimitBackend so several uvicorn workers can share it:
+- MemoryRateLimitBackend: per-process dict (default)
+- SQLiteRateLimitBackend: one SQLite file, read-modify-write in an IMMEDIATE transaction
+
+Times are time.monotonic() seconds. The monotonic clock is system-wide, so
+workers on one host agree on window boundaries.
+
+Usage:
+    app.add_middleware(RateLimitMiddleware, backend=SQLiteRateLimitBackend(".tmp/rate_limit.db"))
+"""
+
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from execution.core import get_logger
+
+logger = get_logger(__name__)
+
+# (window index, requests in current window, requests in previous window)
+WindowState = tuple[int, int, int]
+ClientState = tuple[WindowState, ...]
+
+
+@dataclass(frozen=True)
+class RateWindow:
+    """
+    One limit: at most `limit` requests in any `period` seconds.
+
+    Attributes:
+        period: Window length in seconds
+        limit: Requests allowed per window
+        label: Name used in the rejection reason ("minute", "hour")
+    """
+
+    period: float
+    limit: int
+    label: str
+
+
+@dataclass(frozen=True)
+class RateDecision:
+    """
+    Outcome of one rate-limited request.
+
+    Attributes:
+        allowed: False if any window's limit would be exceeded
+        reason: Which limit was exceeded ("" when allowed)
+        remaining: Requests left in the first window after this one
+    """
+
+    allowed: bool
+    reason: str = ""
+    remaining: int = 0
+
+
+def _roll(state: WindowState, index: int) -> WindowState:
+    """Advance a window state to window `index` (counts older than the previous window drop out)."""
+    start, current, previous = state
+    if start == index:
+        return state
+    if start == index - 1:
+        return (index, 0, current)
+    return (index, 0, 0)
+
+
+def _estimate(state: WindowState, window: RateWindow, now: float) -> float:
+    """Estimated requests in the `window.period` seconds before `now`."""
+    index, current, previous = state
+    elapsed_fraction = now / window.period - index
+    return previous * (1.0 - elapsed_fraction) + current
+
+
+def apply_request(
+    state: ClientState | None, windows: Sequence[RateWindow], now: float
+) -> tuple[ClientState, RateDecision]:
+    """
+    Check one request against every window and count it if allowed.
+
+    Args:
+        state: Client's stored state (None for a new client)
+        windows: Limits to enforce, first one reported as `remaining`
+        now: Monotonic time in seconds
+
+    Returns:
+        Tuple of (new state to store, decision)
+    """
+    indexes = [int(now // window.period) for window in windows]
+    if state is None or len(state) != len(windows):
+        rolled: ClientState = tuple((index, 0, 0) for index in indexes)
+    else:
+        rolled = tuple(_roll(window_state, index) for window_state, index in zip(state, indexes, strict=True))
+
+    for window_state, window in zip(rolled, windows, strict=True):
+        if _estimate(window_state, window, now) + 1 > window.limit:
+            return rolled, RateDecision(allowed=False, reason=f"{window.limit} requests per {window.label} exceeded")
+
+    recorded = tuple((index, current + 1, previous) for index, current, previous in rolled)
+    remaining = max(0, int(windows[0].limit - _estimate(recorded[0], windows[0], now)))
+    return recorded, RateDecision(allowed=True, remaining=remaining)
+
+
+def is_idle(state: ClientState, windows: Sequence[RateWindow], now: float) -> bool:
+    """True once every window's counts have aged out (the state can be dropped)."""
+    return all(int(now // window.period) - index >= 2 for (index, _, _), window in zip(state, windows, strict=True))
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage for per-client rate limit state.
+
+    hit() must be atomic with respect to other callers sharing the backend,
+    so concurrent workers can never both take the last request of a window.
+    """
+
+    @abstractmethod
+    def hit(self, client: str, windows: Sequence[RateWindow], now: float) -> RateDecision:
+        """Check and (if allowed) count one request from `client`."""
+
+    @abstractmethod
+    def sweep(self, windows: Sequence[RateWindow], now: float) -> int:
+        """Drop idle clients; returns how many were removed."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of clients with stored state."""
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Rate limit state in a dict, private to this process."""
+
+    def __init__(self) -> None:
+        self.clients: dict[str, ClientState] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, client: str, windows: Sequence[RateWindow], now: float) -> RateDecision:
+        with self._lock:
+            state, decision = apply_request(self.clients.get(client), windows, now)
+            self.clients[client] = state
+        return decision
+
+    def sweep(self, windows: Sequence[RateWindow], now: float) -> int:
+        with self._lock:
+            idle = [client for client, state in self.clients.items() if is_idle(state, windows, now)]
+            for client in idle:
+                del self.clients[client]
+        return len(idle)
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    Rate limit state in a SQLite file shared by every worker on the host.
+
+    Attributes:
+        db_path: Location of the SQLite database
+    """
+
+    def __init__(self, db_path: Path | str, timeout: float = 5.0):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limit (
+                client TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                last_seen REAL NOT NULL
+            )
+            """)
+
+    def hit(self, client: str, windows: Sequence[RateWindow], now: float) -> RateDecision:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT state FROM rate_limit WHERE client = ?", (client,)).fetchone()
+                stored = tuple(tuple(window) for window in json.loads(row[0])) if row else None
+                state, decision = apply_request(stored, windows, now)  # type: ignore[arg-type]
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_limit (client, state, last_seen) VALUES (?, ?, ?)",
+                    (client, json.dumps(state), now),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return decision
+
+    def sweep(self, windows: Sequence[RateWindow], now: float) -> int:
+        # Idle once the longest window and its predecessor have both passed
+        cutoff = now - 2 * max(window.period for window in windows)
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM rate_limit WHERE last_seen <= ?", (cutoff,))
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM rate_limit").fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
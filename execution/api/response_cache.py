@@ -0,0 +1,232 @@
+"""
+API Response Cache - Pre-serialized JSON with ETag/304 and compression
+
+The metrics endpoints answer from history files that change about once a
+week, yet every request used to reload the history, rebuild the payload and
+serialize it again. ResponseCache keeps the serialized JSON bytes per
+(endpoint, parameters) together with precomputed validators:
+
+- The entry is rebuilt only when one of its source histories changes
+  (mtime/size of the legacy document or the partition directory).
+- ETag (content hash) and Last-Modified (newest source) are sent with every
+  response; If-None-Match / If-Modified-Since revalidations get a 304.
+- gzip (and brotli, when the optional ``brotli`` package is installed)
+  variants are compressed once per entry, on first request.
+
+Usage:
+    cache = ResponseCache()
+
+    @app.get("/api/v1/metrics/quality/history")
+    async def get_quality_history(request: Request, weeks: int = 12):
+        return cache.respond(request, ("quality_history", weeks), [QUALITY_HISTORY], lambda: build(weeks))
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from pathlib import Path
+from typing import Any
+
+from fastapi import Request, Response, status
+
+from execution.core import get_logger
+from execution.core.history_store import HistoryStore
+
+try:
+    import brotli
+except ImportError:  # optional - gzip is always available
+    brotli = None
+
+logger = get_logger(__name__)
+
+# Payloads smaller than this are sent uncompressed (headers would outweigh the savings)
+MIN_COMPRESS_BYTES = 512
+
+# Distinct (endpoint, parameters) entries kept before the least recently used is dropped
+DEFAULT_MAX_ENTRIES = 256
+
+
+def _source_signature(sources: Sequence[Path | str]) -> tuple[tuple[str, int, int], ...]:
+    """(path, mtime_ns, size) of each source history's data path ((path, 0, 0) if missing)."""
+    signature = []
+    for source in sources:
+        data_path = HistoryStore(source).data_path
+        try:
+            stat = data_path.stat()
+        except FileNotFoundError:
+            signature.append((str(data_path), 0, 0))
+            continue
+        signature.append((str(data_path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def serialize_json(payload: Any) -> bytes:
+    """Serialize like FastAPI's JSONResponse (compact, UTF-8, no NaN)."""
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+@dataclass
+class CachedResponse:
+    """
+    One serialized response and its validators.
+
+    Attributes:
+        body: Serialized JSON
+        etag: Strong ETag of the body (quoted)
+        last_modified: Newest source modification time (None if no source exists)
+        signature: Source signature the body was built from
+    """
+
+    body: bytes
+    etag: str
+    last_modified: datetime | None
+    signature: tuple[tuple[str, int, int], ...]
+    _encoded: dict[str, bytes] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, payload: Any, signature: tuple[tuple[str, int, int], ...]) -> "CachedResponse":
+        body = serialize_json(payload)
+        newest = max((mtime_ns for _, mtime_ns, _ in signature), default=0)
+        return cls(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            last_modified=datetime.fromtimestamp(newest // 1_000_000_000, tz=UTC) if newest else None,
+            signature=signature,
+        )
+
+    def encoded(self, encoding: str) -> bytes:
+        """Body compressed with `encoding` ("gzip" or "br"), compressed once and kept."""
+        if encoding not in self._encoded:
+            if encoding == "br":
+                self._encoded[encoding] = brotli.compress(self.body)
+            else:
+                self._encoded[encoding] = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._encoded[encoding]
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """RFC 9110 weak comparison of an If-None-Match header against our ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime | None) -> bool:
+    if last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return since.tzinfo is not None and last_modified <= since
+
+
+def _negotiate_encoding(accept_encoding: str) -> str | None:
+    """Preferred supported content coding the client accepts (q=0 excluded)."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+class ResponseCache:
+    """
+    Serialized API responses keyed by (endpoint, parameters), invalidated by their source histories.
+
+    Attributes:
+        enabled: False rebuilds every response (validators and compression still apply)
+        hits: Responses served from a cached body
+        misses: Responses whose body had to be built
+    """
+
+    def __init__(self, enabled: bool = True, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, CachedResponse] = OrderedDict()
+
+    def get(self, key: tuple, sources: Sequence[Path | str], build: Callable[[], Any]) -> CachedResponse:
+        """
+        Cached response for `key`, rebuilt if any source changed.
+
+        Args:
+            key: Endpoint name and parameters
+            sources: History files the payload is derived from
+            build: Produces the JSON payload; exceptions propagate and nothing is cached
+
+        Returns:
+            CachedResponse
+        """
+        signature = _source_signature(sources)
+        with self._lock:
+            entry = self._entries.get(key) if self.enabled else None
+            if entry is not None and entry.signature == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = CachedResponse.build(build(), signature)
+        with self._lock:
+            self.misses += 1
+            if self.enabled:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def respond(
+        self, request: Request, key: tuple, sources: Sequence[Path | str], build: Callable[[], Any]
+    ) -> Response:
+        """
+        Serve `key` for `request`: 304 if the client's copy is current, else the (compressed) body.
+
+        Args:
+            request: Incoming request (conditional and Accept-Encoding headers are honoured)
+            key: Endpoint name and parameters
+            sources: History files the payload is derived from
+            build: Produces the JSON payload on a cache miss
+
+        Returns:
+            Response with ETag, Last-Modified and Vary headers
+        """
+        entry = self.get(key, sources, build)
+        headers = {"ETag": entry.etag, "Vary": "Accept-Encoding"}
+        if entry.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(entry.last_modified, usegmt=True)
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            not_modified = _etag_matches(if_none_match, entry.etag)
+        else:
+            not_modified = _not_modified_since(request.headers.get("if-modified-since", ""), entry.last_modified)
+        if not_modified:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        body = entry.body
+        encoding = _negotiate_encoding(request.headers.get("accept-encoding", ""))
+        if encoding is not None and len(body) >= MIN_COMPRESS_BYTES:
+            body = entry.encoded(encoding)
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
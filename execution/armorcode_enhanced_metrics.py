@@ -15,7 +15,6 @@ Matches existing report counts exactly.
 
 import json
 import logging
-import os
 import sys
 import time
 from datetime import datetime
@@ -24,6 +23,7 @@ from pathlib import Path
 # Load environment variables
 from dotenv import load_dotenv
 
+from execution.collectors.aql_count_cache import use_aql_count_cache
 from execution.collectors.armorcode_vulnerability_loader import ArmorCodeVulnerabilityLoader
 from execution.secure_config import get_config
 
@@ -81,9 +81,10 @@ def query_current_vulnerabilities_aql(
 
     loader = ArmorCodeVulnerabilityLoader()
 
-    # Two AQL calls — each returns {product_id_str: count} for all products
-    critical_by_id = loader.count_by_severity_aql("Critical", hierarchy, environment="Production")
-    high_by_id = loader.count_by_severity_aql("High", hierarchy, environment="Production")
+    # Two AQL calls (sent together) — each returns {product_id_str: count} for all products
+    counts = loader.count_matrix_aql(["Critical", "High"], hierarchy, environment="Production").get("all", {})
+    critical_by_id = counts.get("Critical", {})
+    high_by_id = counts.get("High", {})
 
     product_breakdown: dict = {}
     accurate_critical = 0
@@ -341,10 +342,10 @@ def save_security_metrics(metrics: dict, output_file: str = ".tmp/observatory/se
     """
     Save enhanced security metrics to history file.
 
-    Appends to existing history or creates new file.
+    Appends one week to the history store (see execution/core/history_store.py).
     Validates data before saving to prevent persisting collection failures.
     """
-    from utils_atomic_json import atomic_json_save, load_json_with_recovery
+    from execution.core.history_store import HistoryStore, load_weeks
 
     # Validate that we have actual data before saving
     metrics_data = metrics.get("metrics", {})
@@ -360,14 +361,14 @@ def save_security_metrics(metrics: dict, output_file: str = ".tmp/observatory/se
         logger.warning("Not persisting this data to avoid corrupting trend history")
         return False
 
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-
-    # Load existing history
-    history = load_json_with_recovery(output_file, default_value={"weeks": []})
+    store = HistoryStore(output_file)
 
     # Sanity check: reject implausibly low counts vs last known value (catches transient
     # API partial-response failures like the 646 and 1017 incidents)
-    prior_weeks = history.get("weeks", [])
+    try:
+        prior_weeks = list(load_weeks(output_file, last_n=1)) if store.exists() else []
+    except (OSError, ValueError, AttributeError):
+        prior_weeks = []
     if prior_weeks:
         prev_total = prior_weeks[-1].get("metrics", {}).get("current_total", 0)
         if prev_total > 2000 and current_total < prev_total * 0.3:
@@ -377,22 +378,11 @@ def save_security_metrics(metrics: dict, output_file: str = ".tmp/observatory/se
             )
             return False
 
-    # Add validation if structure check exists
-    if not isinstance(history, dict) or "weeks" not in history:
-        logger.warning("Existing history file has invalid structure - recreating")
-        history = {"weeks": []}
-
-    # Add new week entry
-    history["weeks"].append(metrics)
-
-    # Keep only last 52 weeks (12 months) for quarter/annual analysis
-    history["weeks"] = history["weeks"][-52:]
-
-    # Save updated history
+    # Append new week, keeping only last 52 weeks (12 months) for quarter/annual analysis
     try:
-        atomic_json_save(history, output_file)
+        week_count = store.append(metrics, retain=52)
         logger.info(f"Security metrics saved to: {output_file}")
-        logger.info(f"History now contains {len(history['weeks'])} week(s)")
+        logger.info(f"History now contains {week_count} week(s)")
         return True
     except Exception as e:
         logger.error(f"Failed to save Security metrics: {e}")
@@ -435,7 +425,8 @@ if __name__ == "__main__":
     logger.info("=" * 60)
 
     try:
-        metrics = collect_enhanced_security_metrics(config, baseline)
+        with use_aql_count_cache():
+            metrics = collect_enhanced_security_metrics(config, baseline)
 
         # Add baseline reference
         if baseline:
@@ -16,10 +16,57 @@ Security Features:
     - Default 30-second timeout on all requests
     - Connection pooling for efficient concurrent requests
     - HTTP/2 support for better performance
+    - Optional per-host connection reuse reporting (on_connection callback)
+    - Pluggable transport (use_transport) for offline record/replay, see execution/http_replay.py
 """
 
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from typing import Any
+from urllib.parse import urlsplit
+
 import httpx
 
+# Callback signature: (host, reused) -> None
+ConnectionObserver = Callable[[str, bool], None]
+
+# Factory signature: (limits, http2) -> transport used by each new client
+TransportFactory = Callable[[httpx.Limits, bool], httpx.AsyncBaseTransport]
+
+# Transport factory for clients opened in the current process (set by use_transport)
+_transport_factory: TransportFactory | None = None
+
+
+def get_current_transport_factory() -> TransportFactory | None:
+    """
+    Get the transport factory installed for new clients.
+
+    Returns:
+        Active TransportFactory or None when clients talk to the network directly
+    """
+    return _transport_factory
+
+
+@contextmanager
+def use_transport(factory: TransportFactory) -> Generator[None, None, None]:
+    """
+    Route every AsyncSecureHTTPClient opened inside the block through a custom transport.
+
+    Used by the benchmark harness to record real responses or replay them from
+    a local server. Clients that are already open keep their transport.
+
+    Args:
+        factory: Called with (limits, http2) once per client
+    """
+    global _transport_factory
+
+    previous = _transport_factory
+    _transport_factory = factory
+    try:
+        yield
+    finally:
+        _transport_factory = previous
+
 
 class AsyncSecureHTTPClient:
     """
@@ -31,6 +78,7 @@ class AsyncSecureHTTPClient:
     - HTTP/2 support for multiplexing
     - Enforced SSL verification
     - Request timeouts
+    - Per-host connection reuse statistics (new vs reused connections)
     """
 
     DEFAULT_TIMEOUT = 30  # seconds
@@ -43,6 +91,7 @@ class AsyncSecureHTTPClient:
         max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE,
         timeout: float = DEFAULT_TIMEOUT,
         http2: bool = True,
+        on_connection: ConnectionObserver | None = None,
     ):
         """
         Initialize async HTTP client.
@@ -52,20 +101,27 @@ class AsyncSecureHTTPClient:
             max_keepalive_connections: Max persistent connections (default: 20)
             timeout: Default timeout in seconds (default: 30)
             http2: Enable HTTP/2 support (default: True)
+            on_connection: Optional callback invoked after every request with
+                (host, reused) so callers can report connection reuse
         """
         self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
         self.timeout = httpx.Timeout(timeout)
         self.http2 = http2
+        self.on_connection = on_connection
         self.client: httpx.AsyncClient | None = None
+        # Per-host counters: {"dev.azure.com": {"requests": 10, "new_connections": 1}}
+        self.connection_stats: dict[str, dict[str, int]] = {}
 
     async def __aenter__(self) -> "AsyncSecureHTTPClient":
         """Context manager entry - create async client"""
+        factory = _transport_factory
         self.client = httpx.AsyncClient(
             limits=self.limits,
             timeout=self.timeout,
             verify=True,  # CRITICAL: Force SSL verification
             http2=self.http2,
             follow_redirects=True,
+            transport=factory(self.limits, self.http2) if factory is not None else None,
         )
         return self
 
@@ -73,6 +129,46 @@ class AsyncSecureHTTPClient:
         """Context manager exit - close connections"""
         if self.client:
             await self.client.aclose()
+            self.client = None
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request through the pooled client and record connection reuse.
+
+        httpcore emits a "connection.connect_tcp" trace event only when a new
+        connection has to be opened, so a request that completes without it
+        was served from the keep-alive pool (or multiplexed over HTTP/2).
+        """
+        if not self.client:
+            raise RuntimeError("Client not initialized. Use 'async with AsyncSecureHTTPClient()' context manager")
+
+        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
+
+        opened_connection = False
+        extensions = dict(kwargs.pop("extensions", None) or {})
+        caller_trace = extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal opened_connection
+            if event_name == "connection.connect_tcp.complete":
+                opened_connection = True
+            if caller_trace is not None:
+                await caller_trace(event_name, info)
+
+        extensions["trace"] = trace
+        response = await self.client.request(method, url, extensions=extensions, **kwargs)
+
+        self._record_connection(urlsplit(url).hostname or "", reused=not opened_connection)
+        return response
+
+    def _record_connection(self, host: str, reused: bool) -> None:
+        """Update per-host connection counters and notify the observer."""
+        stats = self.connection_stats.setdefault(host, {"requests": 0, "new_connections": 0})
+        stats["requests"] += 1
+        if not reused:
+            stats["new_connections"] += 1
+        if self.on_connection:
+            self.on_connection(host, reused)
 
     async def get(self, url: str, **kwargs) -> httpx.Response:
         """
@@ -90,11 +186,7 @@ class AsyncSecureHTTPClient:
             - Uses default timeout if not provided
             - Connection pooling for efficiency
         """
-        if not self.client:
-            raise RuntimeError("Client not initialized. Use 'async with AsyncSecureHTTPClient()' context manager")
-
-        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
-        return await self.client.get(url, **kwargs)
+        return await self._request("GET", url, **kwargs)
 
     async def post(self, url: str, **kwargs) -> httpx.Response:
         """
@@ -111,11 +203,7 @@ class AsyncSecureHTTPClient:
             - Forces verify=True (SSL verification)
             - Uses default timeout if not provided
         """
-        if not self.client:
-            raise RuntimeError("Client not initialized. Use 'async with AsyncSecureHTTPClient()' context manager")
-
-        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
-        return await self.client.post(url, **kwargs)
+        return await self._request("POST", url, **kwargs)
 
     async def put(self, url: str, **kwargs) -> httpx.Response:
         """
@@ -128,11 +216,7 @@ class AsyncSecureHTTPClient:
         Returns:
             httpx.Response: HTTP response
         """
-        if not self.client:
-            raise RuntimeError("Client not initialized. Use 'async with AsyncSecureHTTPClient()' context manager")
-
-        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
-        return await self.client.put(url, **kwargs)
+        return await self._request("PUT", url, **kwargs)
 
     async def delete(self, url: str, **kwargs) -> httpx.Response:
         """
@@ -145,11 +229,7 @@ class AsyncSecureHTTPClient:
         Returns:
             httpx.Response: HTTP response
         """
-        if not self.client:
-            raise RuntimeError("Client not initialized. Use 'async with AsyncSecureHTTPClient()' context manager")
-
-        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
-        return await self.client.delete(url, **kwargs)
+        return await self._request("DELETE", url, **kwargs)
 
     async def patch(self, url: str, **kwargs) -> httpx.Response:
         """
@@ -162,11 +242,7 @@ class AsyncSecureHTTPClient:
         Returns:
             httpx.Response: HTTP response
         """
-        if not self.client:
-            raise RuntimeError("Client not initialized. Use 'async with AsyncSecureHTTPClient()' context manager")
-
-        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
-        return await self.client.patch(url, **kwargs)
+        return await self._request("PATCH", url, **kwargs)
 
 
 # Self-test when run directly
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+In-Process Load Benchmark for the Metrics REST API
+
+Drives the FastAPI app through httpx's ASGI transport (no server, no network)
+and reports requests/second per endpoint with the response cache disabled
+(every request reloads and re-serializes the history) and enabled, plus the
+304 revalidation path.
+
+--rate-limiter instead times RateLimitMiddleware's per-request check for one
+IP at increasing request rates (simulated clock, limits set out of reach), for
+the in-process and the SQLite backend. Overhead stays flat as the rate grows.
+
+Rate limiting is removed from the benchmarked app so the numbers measure the
+handlers rather than the 60 requests/minute limit.
+
+Usage:
+    python execution/benchmark_api.py
+    python execution/benchmark_api.py --requests 2000 --concurrency 16
+    python execution/benchmark_api.py --rate-limiter
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from execution.api.app import create_app
+from execution.api.middleware import RateLimitMiddleware
+from execution.api.rate_limit import MemoryRateLimitBackend, RateLimitBackend, SQLiteRateLimitBackend
+from execution.core import get_logger, setup_logging
+
+setup_logging(level="INFO", json_output=False)
+logger = get_logger(__name__)
+
+# One INFO line per client request would dominate the timings
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+ENDPOINTS = [
+    "/api/v1/metrics/quality/history?weeks=12",
+    "/api/v1/metrics/quality/latest",
+    "/api/v1/metrics/security/latest",
+    "/api/v1/metrics/flow/latest",
+]
+
+
+def _benchmark_app(cache_enabled: bool):
+    app = create_app()
+    app.user_middleware = [m for m in app.user_middleware if m.cls is not RateLimitMiddleware]
+    app.state.response_cache.enabled = cache_enabled
+    return app
+
+
+async def _run(
+    app, path: str, requests: int, concurrency: int, headers: dict[str, str], conditional: bool = False
+) -> dict[str, Any]:
+    """Issue `requests` GETs for `path` from `concurrency` workers; returns throughput and status counts."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", headers=headers) as client:
+        warmup = await client.get(path)
+        if warmup.status_code != 200:
+            return {"path": path, "status": warmup.status_code, "skipped": True}
+        if conditional:
+            client.headers["If-None-Match"] = warmup.headers.get("etag", "")
+
+        statuses: dict[int, int] = {}
+        per_worker = max(1, requests // concurrency)
+
+        async def worker() -> None:
+            for _ in range(per_worker):
+                response = await client.get(path)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    total = per_worker * concurrency
+    return {
+        "path": path,
+        "requests": total,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(total / elapsed, 1),
+        "statuses": statuses,
+        "body_bytes": len(warmup.content),
+    }
+
+
+async def run_benchmark(requests: int, concurrency: int, username: str, password: str) -> dict[str, Any]:
+    token = base64.b64encode(f"{username}:{password}".encode()).decode()
+    headers = {"Authorization": f"Basic {token}", "Accept-Encoding": "gzip"}
+
+    results: dict[str, Any] = {"timestamp": datetime.now().isoformat(), "endpoints": []}
+    for path in ENDPOINTS:
+        uncached = await _run(_benchmark_app(False), path, requests, concurrency, headers)
+        if uncached.get("skipped"):
+            logger.warning(f"Skipping {path} (HTTP {uncached['status']})")
+            continue
+        cached = await _run(_benchmark_app(True), path, requests, concurrency, headers)
+        revalidated = await _run(_benchmark_app(True), path, requests, concurrency, headers, conditional=True)
+
+        speedup = cached["requests_per_second"] / uncached["requests_per_second"]
+        logger.info(
+            f"{path}: {uncached['requests_per_second']:.0f} -> {cached['requests_per_second']:.0f} req/s "
+            f"({speedup:.1f}x), 304 path {revalidated['requests_per_second']:.0f} req/s"
+        )
+        results["endpoints"].append(
+            {"path": path, "uncached": uncached, "cached": cached, "not_modified": revalidated, "speedup": speedup}
+        )
+    return results
+
+
+class _SimulatedClock:
+    """Clock the rate limiter benchmark advances by hand (one simulated minute per rate)."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def benchmark_rate_limiter(rates: tuple[int, ...] = (100, 1_000, 10_000)) -> dict[str, Any]:
+    """
+    Mean per-request cost of the rate limit check for one IP over one simulated minute per rate.
+
+    Returns:
+        {backend: {requests_per_minute: microseconds_per_request}}
+    """
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backends: dict[str, RateLimitBackend] = {
+            "memory": MemoryRateLimitBackend(),
+            "sqlite": SQLiteRateLimitBackend(Path(tmp_dir) / "rate_limit.db"),
+        }
+        for name, backend in backends.items():
+            results[name] = {}
+            for octet, rate in enumerate(rates, start=1):
+                clock = _SimulatedClock()
+                middleware = RateLimitMiddleware(
+                    None,
+                    requests_per_minute=10**9,
+                    requests_per_hour=10**9,
+                    backend=backend,
+                    clock=clock,
+                )
+                step = 60.0 / rate
+                start = time.perf_counter()
+                for _ in range(rate):
+                    middleware._acquire(f"203.0.113.{octet}")
+                    clock.now += step
+                micros = (time.perf_counter() - start) / rate * 1e6
+                results[name][rate] = round(micros, 2)
+                logger.info(f"Rate limiter ({name}): {rate:>6} req/min from one IP -> {micros:.2f} us/request")
+        backends["sqlite"].close()  # type: ignore[attr-defined]
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="In-process load benchmark for the metrics API")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per endpoint and mode")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent client workers")
+    parser.add_argument("--username", default="admin", help="API username (API_USERNAME)")
+    parser.add_argument("--password", default="changeme", help="API password (API_PASSWORD)")
+    parser.add_argument("--rate-limiter", action="store_true", help="Benchmark the rate limit check instead")
+    parser.add_argument(
+        "--output", type=Path, default=Path(".tmp/observatory/api_benchmark.json"), help="Results JSON path"
+    )
+    args = parser.parse_args()
+
+    if args.rate_limiter:
+        benchmark_rate_limiter()
+        return
+
+    results = asyncio.run(run_benchmark(args.requests, args.concurrency, args.username, args.password))
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    logger.info(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,27 +17,57 @@ Expected Results:
 - Ownership/Collaboration: 20-50x speedup (intensive work item queries)
 - Risk: 5-10x speedup (complex WIQL queries)
 
+Offline Replay:
+    --record captures every collector's real responses (secrets scrubbed) into a
+    cassette; --replay re-runs all collectors against a local stand-in server
+    serving that cassette (see execution/http_replay.py). Replay runs report exact
+    request counts, p50/p95 latency, throughput and peak memory, and need no
+    credentials or network, so before/after numbers are reproducible in CI.
+
 Usage:
     python execution/benchmark_collectors_enhanced.py --full  # All collectors
     python execution/benchmark_collectors_enhanced.py --quick # Subset only
+    python execution/benchmark_collectors_enhanced.py --full --record .tmp/observatory/benchmark_cassette.json
+    python execution/benchmark_collectors_enhanced.py --full --replay .tmp/observatory/benchmark_cassette.json \\
+        --latency-ms 80 --jitter-ms 20 --rate-limit-every 50
 """
 
 import argparse
 import asyncio
 import json
+import os
+import random
 import sys
 import time
 import tracemalloc
+from collections.abc import Generator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from execution.async_http_client import get_current_transport_factory, use_transport
 from execution.core import get_logger, setup_logging
+from execution.http_replay import (
+    Cassette,
+    ReplayServer,
+    RequestMetrics,
+    measure_requests,
+    recording_transport,
+    replay_transport,
+)
 
 setup_logging(level="INFO", json_output=False)
 logger = get_logger(__name__)
 
+# PR sampling is random; record and replay seed it identically so they send the same requests
+BENCHMARK_SEED = 1234
+
+# Credentials used while replaying: format-valid, never sent anywhere but the local server
+REPLAY_PAT = "replay-pat-0000000000000000000000"
+REPLAY_ARMORCODE_API_KEY = "00000000-0000-0000-0000-000000000000"
+
 
 @dataclass
 class CollectorMetrics:
@@ -50,6 +80,10 @@ class CollectorMetrics:
     success: bool = True
     error_message: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    api_calls_exact: bool = False  # True when counted at the transport, False when estimated
+    latency_p50_ms: float = 0.0
+    latency_p95_ms: float = 0.0
+    requests_by_status: dict[str, int] = field(default_factory=dict)
 
     @property
     def throughput(self) -> float:
@@ -99,6 +133,10 @@ class BenchmarkResults:
                     "name": c.name,
                     "duration_seconds": round(c.duration_seconds, 2),
                     "api_calls_made": c.api_calls_made,
+                    "api_calls_exact": c.api_calls_exact,
+                    "latency_p50_ms": c.latency_p50_ms,
+                    "latency_p95_ms": c.latency_p95_ms,
+                    "requests_by_status": c.requests_by_status,
                     "throughput_per_sec": round(c.throughput, 2),
                     "memory_peak_mb": round(c.memory_peak_mb, 2),
                     "success": c.success,
@@ -124,8 +162,20 @@ class EnhancedCollectorBenchmark:
         ]
         self.quick_subset = ["quality", "flow", "deployment"]  # Representative sample
 
+    @staticmethod
+    def _apply_request_metrics(metrics: CollectorMetrics, requests: RequestMetrics) -> CollectorMetrics:
+        """Replace estimated API calls with the counts measured at the transport."""
+        if get_current_transport_factory() is None:
+            return metrics
+        metrics.api_calls_made = requests.count
+        metrics.api_calls_exact = True
+        metrics.latency_p50_ms = round(requests.percentile(50), 2)
+        metrics.latency_p95_ms = round(requests.percentile(95), 2)
+        metrics.requests_by_status = requests.summary()["by_status"]
+        return metrics
+
     async def _benchmark_single_ado_collector(
-        self, collector_type: str, projects: list[dict], config: dict
+        self, collector_type: str, projects: list[dict], config: dict, rest_client: Any = None
     ) -> CollectorMetrics:
         """
         Benchmark a single ADO collector with detailed metrics.
@@ -134,9 +184,11 @@ class EnhancedCollectorBenchmark:
             collector_type: Collector type (quality, flow, deployment, etc.)
             projects: List of projects to collect from
             config: Collection configuration
+            rest_client: REST client to use (default: get_ado_rest_client())
 
         Returns:
-            CollectorMetrics with performance data
+            CollectorMetrics with performance data (exact request counts when a
+            recording/replay transport is installed, estimates otherwise)
         """
         logger.info(f"Benchmarking {collector_type} collector...")
 
@@ -149,13 +201,14 @@ class EnhancedCollectorBenchmark:
             from execution.collectors.async_ado_collector import AsyncADOCollector
 
             # Create collector with REST client
-            rest_client = get_ado_rest_client()
-            collector = AsyncADOCollector(rest_client)
+            collector = AsyncADOCollector(rest_client or get_ado_rest_client())
 
             # Collect metrics
-            result_metrics = await collector.collect_all_projects(
-                projects=projects, config=config, collector_type=collector_type
-            )
+            random.seed(BENCHMARK_SEED)
+            with measure_requests() as requests:
+                result_metrics = await collector.collect_all_projects(
+                    projects=projects, config=config, collector_type=collector_type
+                )
 
             duration = time.time() - start_time
             current_mem, peak_mem = tracemalloc.get_traced_memory()
@@ -164,7 +217,7 @@ class EnhancedCollectorBenchmark:
             # Estimate API calls made (varies by collector type)
             api_calls_estimate = self._estimate_api_calls(collector_type, len(projects), len(result_metrics))
 
-            return CollectorMetrics(
+            metrics = CollectorMetrics(
                 name=f"ADO {collector_type.title()}",
                 duration_seconds=duration,
                 api_calls_made=api_calls_estimate,
@@ -176,6 +229,7 @@ class EnhancedCollectorBenchmark:
                     "config": config,
                 },
             )
+            return self._apply_request_metrics(metrics, requests)
 
         except Exception as e:
             duration = time.time() - start_time
@@ -213,8 +267,8 @@ class EnhancedCollectorBenchmark:
         multiplier = call_multipliers.get(collector_type, 5)
         return successful_projects * multiplier
 
-    async def _benchmark_armorcode_collector(self) -> CollectorMetrics:
-        """Benchmark ArmorCode async collector"""
+    async def _benchmark_armorcode_collector(self, baseline: dict | None = None) -> CollectorMetrics:
+        """Benchmark ArmorCode async collector (baseline: default load_existing_baseline())"""
         logger.info("Benchmarking ArmorCode collector...")
 
         tracemalloc.start()
@@ -224,12 +278,13 @@ class EnhancedCollectorBenchmark:
             from execution.armorcode_enhanced_metrics import load_existing_baseline
             from execution.collectors.async_armorcode_collector import AsyncArmorCodeCollector
 
-            baseline = load_existing_baseline()
+            baseline = baseline or load_existing_baseline()
             if not baseline:
                 raise ValueError("ArmorCode baseline not found")
 
             collector = AsyncArmorCodeCollector()
-            metrics = await collector.collect_metrics(baseline)
+            with measure_requests() as requests:
+                metrics = await collector.collect_metrics(baseline)
 
             duration = time.time() - start_time
             current_mem, peak_mem = tracemalloc.get_traced_memory()
@@ -238,7 +293,7 @@ class EnhancedCollectorBenchmark:
             # ArmorCode makes 1 API call per product (async concurrent)
             api_calls = len(metrics) if metrics else 0
 
-            return CollectorMetrics(
+            result = CollectorMetrics(
                 name="ArmorCode Security",
                 duration_seconds=duration,
                 api_calls_made=api_calls,
@@ -246,6 +301,7 @@ class EnhancedCollectorBenchmark:
                 success=True,
                 metadata={"products_collected": len(metrics) if metrics else 0},
             )
+            return self._apply_request_metrics(result, requests)
 
         except Exception as e:
             duration = time.time() - start_time
@@ -315,7 +371,13 @@ class EnhancedCollectorBenchmark:
         return results
 
     async def benchmark_all_collectors_sequential(
-        self, collector_types: list[str], projects: list[dict], config: dict
+        self,
+        collector_types: list[str],
+        projects: list[dict],
+        config: dict,
+        rest_client: Any = None,
+        armorcode_baseline: dict | None = None,
+        execution_mode: str = "sequential",
     ) -> BenchmarkResults:
         """
         Benchmark all collectors running sequentially (baseline comparison).
@@ -324,6 +386,9 @@ class EnhancedCollectorBenchmark:
             collector_types: List of collector types to benchmark
             projects: ADO projects to collect from
             config: Collection configuration
+            rest_client: ADO REST client (default: get_ado_rest_client())
+            armorcode_baseline: ArmorCode baseline (default: load_existing_baseline())
+            execution_mode: Label for the results ("sequential", "record" or "replay")
 
         Returns:
             BenchmarkResults with all collector metrics
@@ -342,11 +407,11 @@ class EnhancedCollectorBenchmark:
 
         # Run ADO collectors sequentially
         for ctype in collector_types:
-            metrics = await self._benchmark_single_ado_collector(ctype, projects, config)
+            metrics = await self._benchmark_single_ado_collector(ctype, projects, config, rest_client=rest_client)
             collector_metrics.append(metrics)
 
         # Run ArmorCode
-        armorcode_metrics = await self._benchmark_armorcode_collector()
+        armorcode_metrics = await self._benchmark_armorcode_collector(armorcode_baseline)
         collector_metrics.append(armorcode_metrics)
 
         total_duration = time.time() - start_time
@@ -355,7 +420,7 @@ class EnhancedCollectorBenchmark:
             benchmark_date=datetime.now().isoformat(),
             total_duration_seconds=total_duration,
             collectors=collector_metrics,
-            execution_mode="sequential",
+            execution_mode=execution_mode,
             platform=sys.platform,
             python_version=sys.version.split()[0],
         )
@@ -378,14 +443,20 @@ class EnhancedCollectorBenchmark:
         logger.info("")
         logger.info("Individual Collector Performance:")
         logger.info("-" * 80)
-        logger.info(f"{'Collector':<30} {'Time (s)':>10} {'API Calls':>12} {'Throughput':>12} {'Status':>10}")
+        logger.info(
+            f"{'Collector':<30} {'Time (s)':>10} {'API Calls':>12} {'Throughput':>12} "
+            f"{'p50 ms':>9} {'p95 ms':>9} {'Peak MB':>9} {'Status':>10}"
+        )
         logger.info("-" * 80)
 
         for collector in sorted(results.collectors, key=lambda c: c.duration_seconds, reverse=True):
             status = "✓ SUCCESS" if collector.success else "✗ FAILED"
+            calls = f"{collector.api_calls_made:d}" if collector.api_calls_exact else f"~{collector.api_calls_made:d}"
             logger.info(
                 f"{collector.name:<30} {collector.duration_seconds:>10.2f} "
-                f"{collector.api_calls_made:>12d} {collector.throughput:>12.2f} {status:>10}"
+                f"{calls:>12} {collector.throughput:>12.2f} "
+                f"{collector.latency_p50_ms:>9.1f} {collector.latency_p95_ms:>9.1f} "
+                f"{collector.memory_peak_mb:>9.1f} {status:>10}"
             )
 
         logger.info("=" * 80)
@@ -511,6 +582,111 @@ class EnhancedCollectorBenchmark:
             },
         }
 
+    async def record_cassette(self, collector_types: list[str], cassette_path: Path) -> BenchmarkResults:
+        """
+        Run the collectors against the live services and record every response.
+
+        Args:
+            collector_types: ADO collector types to record (ArmorCode is always included)
+            cassette_path: Where to save the cassette
+
+        Returns:
+            BenchmarkResults of the live run (exact request counts)
+        """
+        from execution.armorcode_enhanced_metrics import load_existing_baseline
+        from execution.secure_config import get_config
+
+        projects = self._load_projects()
+        config = {"lookback_days": 90, "aging_threshold_days": 30}
+        baseline = load_existing_baseline()
+        cassette = Cassette(
+            meta={
+                "recorded_at": datetime.now().isoformat(),
+                "collector_types": collector_types,
+                "projects": projects,
+                "config": config,
+                "organization_url": get_config().get_ado_config().organization_url,
+                "armorcode_base_url": os.getenv("ARMORCODE_BASE_URL", "https://api.armorcode.com"),
+                "armorcode_baseline": baseline,
+            }
+        )
+
+        with use_transport(recording_transport(cassette)):
+            results = await self.benchmark_all_collectors_sequential(
+                collector_types, projects, config, armorcode_baseline=baseline, execution_mode="record"
+            )
+
+        cassette.save(cassette_path)
+        return results
+
+    async def benchmark_replay(
+        self,
+        collector_types: list[str],
+        cassette_path: Path,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        rate_limit_every: int = 0,
+    ) -> tuple[BenchmarkResults, dict[str, int]]:
+        """
+        Run the collectors offline against a local server replaying a cassette.
+
+        Args:
+            collector_types: ADO collector types to run
+            cassette_path: Cassette written by record_cassette()
+            latency_ms: Simulated server latency per request
+            jitter_ms: Uniform +/- variation of the latency
+            rate_limit_every: Inject HTTP 429 on every Nth request (0 disables)
+
+        Returns:
+            (BenchmarkResults with exact request counts, replay server statistics)
+        """
+        from execution.collectors.ado_rate_limiter import get_org_rate_limiter
+        from execution.collectors.ado_rest_client import AzureDevOpsRESTClient
+
+        cassette = Cassette.load(cassette_path)
+        meta = cassette.meta
+        organization_url = meta["organization_url"]
+
+        server = ReplayServer(cassette, latency_ms=latency_ms, jitter_ms=jitter_ms, rate_limit_every=rate_limit_every)
+        with _replay_credentials(meta), server, use_transport(replay_transport(server.url)):
+            rest_client = AzureDevOpsRESTClient(
+                organization_url, REPLAY_PAT, rate_limiter=get_org_rate_limiter(organization_url)
+            )
+            results = await self.benchmark_all_collectors_sequential(
+                collector_types,
+                meta.get("projects", []),
+                meta.get("config", {"lookback_days": 90, "aging_threshold_days": 30}),
+                rest_client=rest_client,
+                armorcode_baseline=meta.get("armorcode_baseline"),
+                execution_mode="replay",
+            )
+
+        server_stats = {"requests": server.requests, "throttled": server.throttled, "misses": server.misses}
+        if server.misses:
+            logger.warning(f"{server.misses} requests had no recorded response - re-record the cassette")
+        return results, server_stats
+
+
+@contextmanager
+def _replay_credentials(meta: dict) -> Generator[None, None, None]:
+    """Set format-valid credentials for the replayed services, restoring the environment afterwards."""
+    replay_env = {
+        "AZURE_DEVOPS_ORG_URL": meta["organization_url"],
+        "AZURE_DEVOPS_PAT": REPLAY_PAT,
+        "ARMORCODE_API_KEY": REPLAY_ARMORCODE_API_KEY,
+        "ARMORCODE_BASE_URL": meta.get("armorcode_base_url", "https://api.armorcode.com"),
+    }
+    previous = {name: os.environ.get(name) for name in replay_env}
+    os.environ.update(replay_env)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
 
 async def main():
     """Main entry point"""
@@ -518,6 +694,11 @@ async def main():
     parser.add_argument("--full", action="store_true", help="Benchmark all 6 ADO collectors (slower)")
     parser.add_argument("--quick", action="store_true", help="Benchmark subset only (faster, default)")
     parser.add_argument("--collectors", nargs="+", help="Specific collectors to benchmark")
+    parser.add_argument("--record", type=Path, metavar="PATH", help="Run live and record a replay cassette")
+    parser.add_argument("--replay", type=Path, metavar="PATH", help="Run offline against a recorded cassette")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Replay: simulated latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Replay: +/- latency variation")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="Replay: answer every Nth request with 429")
     args = parser.parse_args()
 
     # Set UTF-8 encoding for Windows console
@@ -540,13 +721,32 @@ async def main():
 
     logger.info(f"Benchmarking collectors: {', '.join(collector_types)}")
 
-    # Run full comparison
-    results = await benchmark.run_full_comparison(collector_types)
-
-    # Save results
     output_dir = Path(".tmp/observatory")
     output_dir.mkdir(parents=True, exist_ok=True)
-    output_file = output_dir / "benchmark_results_enhanced.json"
+
+    if args.record:
+        recorded = await benchmark.record_cassette(collector_types, args.record)
+        logger.info(f"Cassette saved to: {args.record}")
+        results = recorded.to_dict()
+        output_file = output_dir / "benchmark_results_record.json"
+    elif args.replay:
+        replayed, server_stats = await benchmark.benchmark_replay(
+            collector_types,
+            args.replay,
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            rate_limit_every=args.rate_limit_every,
+        )
+        logger.info(
+            f"Replay server: {server_stats['requests']} requests, "
+            f"{server_stats['throttled']} throttled, {server_stats['misses']} misses"
+        )
+        results = {**replayed.to_dict(), "replay_server": server_stats}
+        output_file = output_dir / "benchmark_results_replay.json"
+    else:
+        # Run full comparison
+        results = await benchmark.run_full_comparison(collector_types)
+        output_file = output_dir / "benchmark_results_enhanced.json"
 
     with open(output_file, "w", encoding="utf-8") as f:
         json.dump(results, f, indent=2)
@@ -8,20 +8,103 @@ Performance:
 - Sequential: 7 collectors × 30-60s = 3-7 minutes
 - Concurrent: max(30-60s) = 30-60 seconds
 - Speedup: 3-7x
+- In-process ADO collectors share one AzureDevOpsRESTClient session
+  (single connection pool, TLS handshakes paid once per host)
+- Work items requested by several collectors are downloaded once per run
+  (see execution/collectors/work_item_fetch_planner.py)
+- All collectors run on one event loop by default; pass
+  --subprocess-collectors to isolate the ownership, risk, deployment and
+  collaboration collectors in separate processes
+- Collectors write their full payloads (plus the ArmorCode data of the
+  security and target dashboards) to the run snapshot, so the dashboard
+  generators render without querying ADO or ArmorCode again
+  (see execution/collectors/run_snapshot.py)
 """
 
+import argparse
 import asyncio
+import functools
+import importlib
 import sys
 from datetime import datetime
 
+from execution.collectors.aql_count_cache import use_aql_count_cache
+from execution.collectors.detail_cache import use_detail_cache
+from execution.collectors.git_activity_index import use_git_activity_index
+from execution.collectors.run_snapshot import get_run_snapshot, save_snapshot_section
+from execution.collectors.work_item_fetch_planner import use_work_item_fetch_planner
+from execution.collectors.work_item_store import use_work_item_store
 from execution.core import get_logger
 
 logger = get_logger(__name__)
 
 
+# ADO collectors that were historically run as separate scripts:
+# (display name, script path, module, collector class)
+ADO_COLLECTORS = [
+    (
+        "Ownership Metrics",
+        "execution/collectors/ado_ownership_metrics.py",
+        "execution.collectors.ado_ownership_metrics",
+        "OwnershipCollector",
+    ),
+    (
+        "Risk Metrics",
+        "execution/collectors/ado_risk_metrics.py",
+        "execution.collectors.ado_risk_metrics",
+        "RiskCollector",
+    ),
+    (
+        "Deployment Metrics (DORA)",
+        "execution/collectors/ado_deployment_metrics.py",
+        "execution.collectors.ado_deployment_metrics",
+        "DeploymentCollector",
+    ),
+    (
+        "Collaboration Metrics (PR Analysis)",
+        "execution/collectors/ado_collaboration_metrics.py",
+        "execution.collectors.ado_collaboration_metrics",
+        "CollaborationCollector",
+    ),
+]
+
+
+def collect_dashboard_snapshot() -> None:
+    """
+    Query the ArmorCode data of the security, security infrastructure and
+    target dashboards once and store it in the run snapshot.
+
+    The ADO dashboards need no extra queries: their sections are written by
+    the collectors' save functions.
+    """
+    from execution.dashboards import security, security_enhanced, targets
+
+    if get_run_snapshot() is None:
+        logger.info("No run ID set - dashboards will query ArmorCode themselves")
+        return
+
+    with use_aql_count_cache():
+        save_snapshot_section(security.SNAPSHOT_SECTION, security.collect_security_snapshot())
+        enhanced = security_enhanced.collect_security_snapshot()
+        if enhanced is not None:
+            save_snapshot_section(security_enhanced.SNAPSHOT_SECTION, enhanced)
+        save_snapshot_section(targets.SNAPSHOT_SECTION, targets.collect_targets_snapshot())
+
+
 class AsyncMetricsOrchestrator:
     """Orchestrates concurrent metrics collection"""
 
+    def __init__(self, use_subprocesses: bool = False):
+        """
+        Initialize orchestrator.
+
+        Args:
+            use_subprocesses: Run the ownership, risk, deployment and collaboration
+                collectors as separate Python processes (isolation fallback) instead
+                of on this event loop with the shared REST client
+        """
+        self.use_subprocesses = use_subprocesses
+
     async def _run_collector_async(self, collector_name: str, collector_func) -> tuple[str, bool, float]:
         """
         Run async collector and track duration.
@@ -90,23 +173,86 @@ class AsyncMetricsOrchestrator:
             logger.error(f"[FAILED] {collector_name} error after {duration:.2f}s: {e}")
             return (collector_name, False, duration)
 
+    async def _run_collector_in_process(self, module_name: str, class_name: str, rest_client) -> None:
+        """
+        Run a collector's run() workflow on this event loop.
+
+        Args:
+            module_name: Collector module (e.g., "execution.collectors.ado_risk_metrics")
+            class_name: Collector class within the module (e.g., "RiskCollector")
+            rest_client: Shared AzureDevOpsRESTClient (None to let the collector create its own)
+
+        Raises:
+            RuntimeError: If the collector reports failure or exits
+        """
+        module = importlib.import_module(module_name)
+        collector = getattr(module, class_name)(rest_client=rest_client)
+
+        try:
+            success = await collector.run()
+        except SystemExit as e:
+            # Collectors call sys.exit() on fatal setup errors when run as scripts
+            raise RuntimeError(f"{class_name} exited with code {e.code}") from e
+
+        if not success:
+            raise RuntimeError(f"{class_name} did not save metrics")
+
     async def collect_all_metrics(self) -> dict:
         """
         Collect all metrics concurrently.
 
         Strategy:
         1. Run async collectors directly (ArmorCode, ADO Quality, ADO Flow)
-        2. Run sync collectors via subprocess (non-blocking)
+        2. Run ownership, risk, deployment and collaboration collectors on the
+           same event loop (or via subprocess when use_subprocesses is set)
         3. Wait for all to complete
         4. Return summary
 
+        The in-process ADO collectors share one REST client whose pooled
+        HTTP/2 session and request budget (rate limiter) cover the whole run,
+        one work item fetch planner so overlapping work items are
+        downloaded once, one detail cache for PR/commit/build details, and
+        one git activity index so ownership and risk read each repository's
+        commit log once.
+
         Returns:
             Summary dictionary with results and timings
         """
+        from execution.collectors.ado_rest_client import get_ado_rest_client
+
         logger.info("=" * 60)
         logger.info("Starting concurrent metrics collection")
         logger.info("=" * 60)
 
+        try:
+            rest_client = get_ado_rest_client()
+        except ValueError as e:
+            # ADO credentials missing - ArmorCode and subprocess collectors can still run
+            logger.error(f"ADO REST client unavailable: {e}")
+            return await self._collect_with_client(None)
+
+        async with rest_client:
+            with (
+                use_work_item_store(),
+                use_work_item_fetch_planner() as planner,
+                use_detail_cache(),
+                use_git_activity_index(),
+            ):
+                summary = await self._collect_with_client(rest_client)
+                summary["work_item_fetch"] = planner.stats()
+                return summary
+
+    async def _collect_with_client(self, rest_client) -> dict:
+        """
+        Run every collector against the shared REST client session.
+
+        Args:
+            rest_client: Open AzureDevOpsRESTClient shared by in-process ADO collectors
+                (None if ADO credentials are not configured)
+
+        Returns:
+            Summary dictionary with results and timings
+        """
         start_time = datetime.now()
 
         # Async collectors (direct execution)
@@ -138,18 +284,26 @@ class AsyncMetricsOrchestrator:
 
         async_tasks.append(self._run_collector_async("Security Metrics (ArmorCode)", collect_armorcode))
 
+        # ArmorCode detail for the security and target dashboards (blocking loader, own thread)
+        async def collect_armorcode_dashboard_snapshot():
+            await asyncio.to_thread(collect_dashboard_snapshot)
+
+        async_tasks.append(
+            self._run_collector_async("Dashboard Snapshot (ArmorCode)", collect_armorcode_dashboard_snapshot)
+        )
+
         # ADO Quality (async via REST API)
         async def collect_ado_quality():
             import json
 
             from execution.collectors.ado_quality_metrics import save_quality_metrics
-            from execution.collectors.ado_rest_client import get_ado_rest_client
             from execution.collectors.async_ado_collector import AsyncADOCollector
 
             with open(".tmp/observatory/ado_structure.json", encoding="utf-8") as f:
                 projects = json.load(f)["projects"]
 
-            rest_client = get_ado_rest_client()
+            if rest_client is None:
+                raise RuntimeError("ADO REST client not configured")
             collector = AsyncADOCollector(rest_client)
 
             config = {"lookback_days": 90}
@@ -171,13 +325,13 @@ class AsyncMetricsOrchestrator:
             import json
 
             from execution.collectors.ado_flow_metrics import save_flow_metrics
-            from execution.collectors.ado_rest_client import get_ado_rest_client
             from execution.collectors.async_ado_collector import AsyncADOCollector
 
             with open(".tmp/observatory/ado_structure.json", encoding="utf-8") as f:
                 projects = json.load(f)["projects"]
 
-            rest_client = get_ado_rest_client()
+            if rest_client is None:
+                raise RuntimeError("ADO REST client not configured")
             collector = AsyncADOCollector(rest_client)
 
             config = {"lookback_days": 90, "aging_threshold_days": 30}
@@ -194,18 +348,22 @@ class AsyncMetricsOrchestrator:
 
         async_tasks.append(self._run_collector_async("Flow Metrics", collect_ado_flow))
 
-        # Sync collectors (subprocess - these run concurrently too)
-        sync_collectors = [
-            ("Ownership Metrics", "execution/collectors/ado_ownership_metrics.py"),
-            ("Risk Metrics", "execution/collectors/ado_risk_metrics.py"),
-            ("Deployment Metrics (DORA)", "execution/collectors/ado_deployment_metrics.py"),
-            ("Collaboration Metrics (PR Analysis)", "execution/collectors/ado_collaboration_metrics.py"),
-        ]
-
-        subprocess_tasks = [self._run_sync_collector_subprocess(name, path) for name, path in sync_collectors]
+        # Remaining ADO collectors - in-process on the shared client, or subprocess fallback
+        if self.use_subprocesses:
+            collector_tasks = [
+                self._run_sync_collector_subprocess(name, path) for name, path, _module, _cls in ADO_COLLECTORS
+            ]
+        else:
+            collector_tasks = [
+                self._run_collector_async(
+                    name,
+                    functools.partial(self._run_collector_in_process, module_name, class_name, rest_client),
+                )
+                for name, _path, module_name, class_name in ADO_COLLECTORS
+            ]
 
         # Run all collectors concurrently
-        all_tasks = async_tasks + subprocess_tasks
+        all_tasks = async_tasks + collector_tasks
         results = await asyncio.gather(*all_tasks)
 
         # Calculate summary
@@ -261,7 +419,15 @@ async def main():
     logger.info(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     logger.info("")
 
-    orchestrator = AsyncMetricsOrchestrator()
+    parser = argparse.ArgumentParser(description="Collect all Director Observatory metrics")
+    parser.add_argument(
+        "--subprocess-collectors",
+        action="store_true",
+        help="Run ownership/risk/deployment/collaboration collectors as separate processes (isolation fallback)",
+    )
+    args = parser.parse_args()
+
+    orchestrator = AsyncMetricsOrchestrator(use_subprocesses=args.subprocess_collectors)
     summary = await orchestrator.collect_all_metrics()
 
     logger.info("")
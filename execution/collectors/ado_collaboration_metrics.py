@@ -17,7 +17,6 @@ Migrated to Azure DevOps REST API v7.1 (replaces SDK).
 import asyncio
 import json
 import logging
-import os
 import random
 import statistics
 import sys
@@ -28,7 +27,10 @@ from dotenv import load_dotenv
 
 from execution.collectors.ado_rest_client import AzureDevOpsRESTClient, get_ado_rest_client
 from execution.collectors.ado_rest_transformers import GitTransformer
+from execution.collectors.detail_cache import detail_limit, fetch_detail, use_detail_cache
+from execution.collectors.run_snapshot import save_snapshot_section
 from execution.core.collector_metrics import track_collector_performance
+from execution.core.history_store import HistoryStore
 from execution.domain.constants import flow_metrics, sampling_config
 from execution.secure_config import get_config
 from execution.utils.datetime_utils import parse_ado_timestamp
@@ -41,20 +43,51 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
-def sample_prs(prs: list[dict], sample_size: int = sampling_config.PR_SAMPLE_SIZE) -> list[dict]:
+def sample_prs(prs: list[dict], sample_size: int | None = None) -> list[dict]:
     """
     Sample PRs for analysis to reduce API calls.
 
     Args:
         prs: List of PR data
-        sample_size: Number of PRs to sample
+        sample_size: Number of PRs to sample (default: PR_SAMPLE_SIZE, or
+            CACHED_PR_SAMPLE_SIZE while the detail cache is active)
 
     Returns:
         Sampled list of PRs
     """
+    if sample_size is None:
+        sample_size = detail_limit(sampling_config.PR_SAMPLE_SIZE, sampling_config.CACHED_PR_SAMPLE_SIZE)
     return random.sample(prs, min(sample_size, len(prs)))
 
 
+async def _fetch_pr_detail(rest_client: AzureDevOpsRESTClient, kind: str, project_name: str, pr: dict) -> dict:
+    """
+    Fetch threads, iterations or commits of a merged PR (served from the detail cache when active).
+
+    Args:
+        rest_client: Azure DevOps REST API client
+        kind: "pr_threads", "pr_iterations" or "pr_commits"
+        project_name: ADO project name
+        pr: PR data dict
+
+    Returns:
+        REST response
+    """
+    methods = {
+        "pr_threads": rest_client.get_pull_request_threads,
+        "pr_iterations": rest_client.get_pull_request_iterations,
+        "pr_commits": rest_client.get_pull_request_commits,
+    }
+    method = methods[kind]
+    return await fetch_detail(  # type: ignore[no-any-return]
+        kind,
+        project_name,
+        pr["repository_id"],
+        pr["pr_id"],
+        lambda: method(project=project_name, repository_id=pr["repository_id"], pull_request_id=pr["pr_id"]),
+    )
+
+
 async def query_pull_requests(
     rest_client: AzureDevOpsRESTClient, project_name: str, repo_id: str, days: int = flow_metrics.LOOKBACK_DAYS
 ) -> list[dict]:
@@ -166,9 +199,7 @@ async def calculate_single_pr_review_time(
     """
     try:
         # Get PR threads (comments) via REST API
-        response = await rest_client.get_pull_request_threads(
-            project=project_name, repository_id=pr["repository_id"], pull_request_id=pr["pr_id"]
-        )
+        response = await _fetch_pr_detail(rest_client, "pr_threads", project_name, pr)
 
         # Transform to simplified format
         threads = GitTransformer.transform_threads_response(response)
@@ -217,7 +248,7 @@ async def calculate_pr_review_time(rest_client: AzureDevOpsRESTClient, project_n
     Returns:
         PR review time metrics
     """
-    # Random sample of 10 PRs for statistical validity with reduced API calls
+    # Random PR sample (larger when PR details are cached) to bound API calls
     sampled_prs = sample_prs(prs)
 
     # Get review times concurrently (PARALLEL EXECUTION)
@@ -300,15 +331,13 @@ async def calculate_review_iteration_count(
     Returns:
         Review iteration count metrics
     """
-    # Random sample of 10 PRs for statistical validity with reduced API calls
+    # Random PR sample (larger when PR details are cached) to bound API calls
     sampled_prs = sample_prs(prs)
 
     # Get iterations concurrently (PARALLEL EXECUTION)
     async def get_iteration_count(pr: dict) -> int | None:
         try:
-            response = await rest_client.get_pull_request_iterations(
-                project=project_name, repository_id=pr["repository_id"], pull_request_id=pr["pr_id"]
-            )
+            response = await _fetch_pr_detail(rest_client, "pr_iterations", project_name, pr)
             iterations = response.get("value", [])
             return len(iterations) if iterations else None
         except Exception as e:
@@ -347,15 +376,13 @@ async def calculate_pr_size_loc(rest_client: AzureDevOpsRESTClient, project_name
     Returns:
         PR size metrics
     """
-    # Random sample of 10 PRs for statistical validity with reduced API calls
+    # Random PR sample (larger when PR details are cached) to bound API calls
     sampled_prs = sample_prs(prs)
 
     # Get PR commits concurrently (PARALLEL EXECUTION)
     async def get_pr_commit_count(pr: dict) -> int | None:
         try:
-            response = await rest_client.get_pull_request_commits(
-                project=project_name, repository_id=pr["repository_id"], pull_request_id=pr["pr_id"]
-            )
+            response = await _fetch_pr_detail(rest_client, "pr_commits", project_name, pr)
             commits = response.get("value", [])
             # Use commit count as proxy for PR size (hard data)
             # Avoids expensive get_changes() API calls that don't provide line counts anyway
@@ -490,11 +517,9 @@ def save_collaboration_metrics(metrics: dict, output_file: str = ".tmp/observato
     """
     Save collaboration metrics to history file.
 
-    Appends to existing history or creates new file.
+    Appends one week to the history store (see execution/core/history_store.py).
     Validates data before saving to prevent persisting collection failures.
     """
-    from execution.utils_atomic_json import atomic_json_save, load_json_with_recovery
-
     # Validate that we have actual data before saving
     projects = metrics.get("projects", [])
 
@@ -502,6 +527,9 @@ def save_collaboration_metrics(metrics: dict, output_file: str = ".tmp/observato
         print("\n[SKIPPED] No project data to save - collection may have failed")
         return False
 
+    # Full payload, detail lists included, for this run's dashboard generators
+    save_snapshot_section("collaboration", metrics)
+
     # Check if this looks like a failed collection (all zeros)
     total_prs = sum(p.get("total_prs_analyzed", 0) for p in projects)
     total_repos = sum(p.get("repository_count", 0) for p in projects)
@@ -511,27 +539,11 @@ def save_collaboration_metrics(metrics: dict, output_file: str = ".tmp/observato
         print("          Not persisting this data to avoid corrupting trend history")
         return False
 
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-
-    # Load existing history
-    history = load_json_with_recovery(output_file, default_value={"weeks": []})
-
-    # Add validation if structure check exists
-    if not isinstance(history, dict) or "weeks" not in history:
-        print("\n[WARNING] Existing history file has invalid structure - recreating")
-        history = {"weeks": []}
-
-    # Add new week entry
-    history["weeks"].append(metrics)
-
-    # Keep only last 52 weeks (12 months) for quarter/annual analysis
-    history["weeks"] = history["weeks"][-52:]
-
-    # Save updated history
+    # Append new week, keeping only last 52 weeks (12 months) for quarter/annual analysis
     try:
-        atomic_json_save(history, output_file)
+        week_count = HistoryStore(output_file).append(metrics, retain=52)
         print(f"\n[SAVED] Collaboration metrics saved to: {output_file}")
-        print(f"        History now contains {len(history['weeks'])} week(s)")
+        print(f"        History now contains {week_count} week(s)")
         return True
     except OSError as e:
         logger.error(f"File system error saving collaboration metrics: {e}")
@@ -655,7 +667,7 @@ class CollaborationCollector:
     Note: Uses composition to leverage BaseCollector's utility methods.
     """
 
-    def __init__(self):
+    def __init__(self, rest_client: AzureDevOpsRESTClient | None = None):
         # Import locally to avoid circular dependency
         from execution.collectors.base import BaseCollector
 
@@ -669,7 +681,7 @@ class CollaborationCollector:
             def save_metrics(self, results):
                 pass  # Not used - CollaborationCollector has custom save logic
 
-        self._base = _BaseHelper(name="collaboration", lookback_days=90)
+        self._base = _BaseHelper(name="collaboration", lookback_days=90, rest_client=rest_client)
         self.config = self._base.config
 
     async def run(self) -> bool:
@@ -700,7 +712,9 @@ class CollaborationCollector:
             ]
 
             # Execute all collections concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            async with rest_client:  # one pooled HTTP session for the whole run
+                with use_detail_cache():
+                    results = await asyncio.gather(*tasks, return_exceptions=True)
 
             # Filter successful results
             project_metrics: list[dict] = []
@@ -17,7 +17,6 @@ Migrated to Azure DevOps REST API v7.1 (replaces SDK).
 import asyncio
 import json
 import logging
-import os
 import statistics
 import sys
 from collections import defaultdict
@@ -29,7 +28,11 @@ from dotenv import load_dotenv
 
 from execution.collectors.ado_rest_client import AzureDevOpsRESTClient, get_ado_rest_client
 from execution.collectors.ado_rest_transformers import BuildTransformer, GitTransformer
+from execution.collectors.detail_cache import detail_limit, fetch_detail, use_detail_cache
+from execution.collectors.run_snapshot import save_snapshot_section
 from execution.core.collector_metrics import track_collector_performance
+from execution.core.history_store import HistoryStore
+from execution.domain.constants import sampling_config
 from execution.secure_config import get_config
 from execution.utils.datetime_utils import parse_ado_timestamp
 from execution.utils.error_handling import log_and_continue, log_and_raise, log_and_return_default
@@ -251,8 +254,14 @@ async def _get_commit_timestamp_from_build(
         if not build["finish_time"] or not build["source_version"]:
             return None
 
-        # Get build changes (commits) via REST API
-        response = await rest_client.get_build_changes(project=project_name, build_id=build["build_id"])
+        # Get build changes (commits) via REST API (finished builds are immutable - cached when active)
+        response = await fetch_detail(
+            "build_changes",
+            project_name,
+            "",
+            build["build_id"],
+            lambda: rest_client.get_build_changes(project=project_name, build_id=build["build_id"]),
+        )
 
         # Transform response
         changes = BuildTransformer.transform_build_changes_response(response)
@@ -329,8 +338,9 @@ async def calculate_lead_time_for_changes(
     """
     lead_times = []
 
-    # Sample recent successful builds (limit to 50 for performance)
-    successful_builds = [b for b in builds if b["result"] == "succeeded"][:50]
+    # Sample recent successful builds (limited for performance; higher cap while build changes are cached)
+    build_cap = detail_limit(sampling_config.BUILD_DETAIL_LIMIT, sampling_config.CACHED_BUILD_DETAIL_LIMIT)
+    successful_builds = [b for b in builds if b["result"] == "succeeded"][:build_cap]
 
     # Get commit timestamps concurrently for all builds
     commit_time_tasks = [
@@ -474,32 +484,23 @@ def save_deployment_metrics(metrics: dict, output_file: str = ".tmp/observatory/
     """
     Save deployment metrics to history file.
 
-    Appends to existing history or creates new file.
+    Appends one week to the history store (see execution/core/history_store.py).
     Validates data before saving to prevent persisting collection failures.
     """
-    from execution.utils_atomic_json import atomic_json_save, load_json_with_recovery
+    # Full payload, detail lists included, for this run's dashboard generators
+    if metrics.get("projects"):
+        save_snapshot_section("deployment", metrics)
 
     if not _validate_deployment_data(metrics):
         return False
 
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-
-    history = load_json_with_recovery(output_file, default_value={"weeks": []})
-
-    if not isinstance(history, dict) or "weeks" not in history:
-        print("\n[WARNING] Existing history file has invalid structure - recreating")
-        history = {"weeks": []}
-
     stripped_projects = [_strip_pipeline_names_for_history(p) for p in metrics.get("projects", [])]
     history_entry = {**metrics, "projects": stripped_projects}
 
-    history["weeks"].append(history_entry)
-    history["weeks"] = history["weeks"][-52:]
-
     try:
-        atomic_json_save(history, output_file)
+        week_count = HistoryStore(output_file).append(history_entry, retain=52)
         print(f"\n[SAVED] Deployment metrics saved to: {output_file}")
-        print(f"        History now contains {len(history['weeks'])} week(s)")
+        print(f"        History now contains {week_count} week(s)")
         return True
     except OSError as e:
         logger.error(f"File I/O error saving deployment metrics to {output_file}: {e}")
@@ -509,7 +510,7 @@ def save_deployment_metrics(metrics: dict, output_file: str = ".tmp/observatory/
         log_and_return_default(
             logger,
             e,
-            context={"output_file": output_file, "weeks_count": len(history.get("weeks", []))},
+            context={"output_file": output_file},
             default_value=False,
             error_type="JSON serialization",
         )
@@ -520,7 +521,7 @@ def save_deployment_metrics(metrics: dict, output_file: str = ".tmp/observatory/
 class DeploymentCollector:
     """Deployment metrics collector using BaseCollector infrastructure"""
 
-    def __init__(self):
+    def __init__(self, rest_client: AzureDevOpsRESTClient | None = None):
         from execution.collectors.base import BaseCollector
 
         class _BaseHelper(BaseCollector):
@@ -530,7 +531,7 @@ class DeploymentCollector:
             def save_metrics(self, results):
                 pass
 
-        self._base = _BaseHelper(name="deployment", lookback_days=90)
+        self._base = _BaseHelper(name="deployment", lookback_days=90, rest_client=rest_client)
         self.config = self._base.config
 
     async def run(self) -> bool:
@@ -556,7 +557,9 @@ class DeploymentCollector:
             print("=" * 60)
 
             tasks = [collect_deployment_metrics_for_project(rest_client, project, self.config) for project in projects]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            async with rest_client:  # one pooled HTTP session for the whole run
+                with use_detail_cache():
+                    results = await asyncio.gather(*tasks, return_exceptions=True)
 
             project_metrics: list[dict] = []
             for project, result in zip(projects, results, strict=True):
@@ -15,14 +15,14 @@ Migrated to Azure DevOps REST API v7.1 (replaces SDK).
 
 import asyncio
 import json
-import os
 import sys
 from datetime import datetime
 
 # Load environment variables
 from dotenv import load_dotenv
 
-from execution.collectors.ado_rest_client import get_ado_rest_client
+from execution.collectors.ado_rest_client import AzureDevOpsRESTClient, get_ado_rest_client
+from execution.collectors.ado_rest_transformers import WorkItemTransformer
 from execution.collectors.flow_metrics_calculations import (
     calculate_aging_items,
     calculate_cycle_time_variance,
@@ -31,7 +31,11 @@ from execution.collectors.flow_metrics_calculations import (
     calculate_throughput,
 )
 from execution.collectors.flow_metrics_queries import query_work_items_for_flow
+from execution.collectors.run_snapshot import save_snapshot_section
+from execution.collectors.work_item_fetch_planner import use_work_item_fetch_planner
+from execution.collectors.work_item_store import use_work_item_store
 from execution.core.collector_metrics import track_collector_performance
+from execution.core.history_store import HistoryStore
 from execution.domain.constants import flow_metrics, history_retention
 
 load_dotenv()
@@ -75,8 +79,9 @@ async def collect_flow_metrics_for_project(rest_client, project: dict, config: d
 
     for work_type in ["Bug", "User Story", "Task"]:
         type_data = work_items.get(work_type, {})
-        open_items = type_data.get("open_items", [])
-        closed_items = type_data.get("closed_items", [])
+        # Columnar frames: timestamps are parsed once and shared by every calculation below
+        open_items = WorkItemTransformer.to_frame(type_data.get("open_items", []))
+        closed_items = WorkItemTransformer.to_frame(type_data.get("closed_items", []))
         open_count = type_data.get("open_count", 0)
         closed_count = type_data.get("closed_count", 0)
 
@@ -154,11 +159,9 @@ def save_flow_metrics(metrics: dict, output_file: str = ".tmp/observatory/flow_h
     """
     Save flow metrics to history file.
 
-    Appends to existing history or creates new file.
+    Appends one week to the history store (see execution/core/history_store.py).
     Validates data before saving to prevent persisting collection failures.
     """
-    from execution.utils_atomic_json import atomic_json_save, load_json_with_recovery
-
     # Validate that we have actual data before saving
     projects = metrics.get("projects", [])
 
@@ -166,6 +169,9 @@ def save_flow_metrics(metrics: dict, output_file: str = ".tmp/observatory/flow_h
         print("\n[SKIPPED] No project data to save - collection may have failed")
         return False
 
+    # Full payload, detail lists included, for this run's dashboard generators
+    save_snapshot_section("flow", metrics)
+
     # Check if this looks like a failed collection (all zeros)
     total_open = sum(p.get("total_open", 0) for p in projects)
     total_closed = sum(p.get("total_closed_90d", 0) for p in projects)
@@ -175,31 +181,15 @@ def save_flow_metrics(metrics: dict, output_file: str = ".tmp/observatory/flow_h
         print("          Not persisting this data to avoid corrupting trend history")
         return False
 
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-
-    # Load existing history
-    history = load_json_with_recovery(output_file, default_value={"weeks": []})
-
-    # Add validation if structure check exists
-    if not isinstance(history, dict) or "weeks" not in history:
-        print("\n[WARNING] Existing history file has invalid structure - recreating")
-        history = {"weeks": []}
-
     # Strip detail lists before persisting — history is for trend sparklines only
     stripped_projects = [_strip_detail_lists_for_history(p) for p in metrics.get("projects", [])]
     history_entry = {**metrics, "projects": stripped_projects}
 
-    # Add new week entry
-    history["weeks"].append(history_entry)
-
-    # Keep only last N weeks for quarter/annual analysis
-    history["weeks"] = history["weeks"][-history_retention.WEEKS_TO_RETAIN :]
-
-    # Save updated history
+    # Append new week, keeping only last N weeks for quarter/annual analysis
     try:
-        atomic_json_save(history, output_file)
+        week_count = HistoryStore(output_file).append(history_entry, retain=history_retention.WEEKS_TO_RETAIN)
         print(f"\n[SAVED] Flow metrics saved to: {output_file}")
-        print(f"        History now contains {len(history['weeks'])} week(s)")
+        print(f"        History now contains {week_count} week(s)")
         return True
     except Exception as e:
         print(f"\n[ERROR] Failed to save Flow metrics: {e}")
@@ -209,7 +199,7 @@ def save_flow_metrics(metrics: dict, output_file: str = ".tmp/observatory/flow_h
 class FlowCollector:
     """Flow metrics collector using BaseCollector infrastructure"""
 
-    def __init__(self):
+    def __init__(self, rest_client: AzureDevOpsRESTClient | None = None):
         from execution.collectors.base import BaseCollector
 
         class _BaseHelper(BaseCollector):
@@ -219,7 +209,7 @@ class FlowCollector:
             def save_metrics(self, results):
                 pass
 
-        self._base = _BaseHelper(name="flow", lookback_days=90)
+        self._base = _BaseHelper(name="flow", lookback_days=90, rest_client=rest_client)
         self.config = {
             "lookback_days": flow_metrics.LOOKBACK_DAYS,
             "aging_threshold_days": flow_metrics.AGING_THRESHOLD_DAYS,
@@ -243,7 +233,10 @@ class FlowCollector:
             print("=" * 60)
 
             tasks = [collect_flow_metrics_for_project(rest_client, project, self.config) for project in projects]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # one pooled HTTP session, work item cache and fetch planner for the whole run
+            async with rest_client:
+                with use_work_item_store(), use_work_item_fetch_planner():
+                    results = await asyncio.gather(*tasks, return_exceptions=True)
 
             project_metrics: list[dict] = []
             for project, result in zip(projects, results, strict=True):
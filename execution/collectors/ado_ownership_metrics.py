@@ -17,15 +17,27 @@ import asyncio
 import json
 import sys
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any
 
+import numpy as np
 from dotenv import load_dotenv
 
 from execution.collectors.ado_rest_client import AzureDevOpsRESTClient, get_ado_rest_client
-from execution.collectors.ado_rest_transformers import GitTransformer, WorkItemTransformer
+from execution.collectors.ado_rest_transformers import WorkItemTransformer
+from execution.collectors.git_activity_index import list_repositories, load_repo_commits, use_git_activity_index
+from execution.collectors.run_snapshot import save_snapshot_section
+from execution.collectors.work_item_fetch_planner import (
+    fetch_work_items_shared,
+    register_collector_fields,
+    shared_fetch_enabled,
+    use_work_item_fetch_planner,
+)
+from execution.collectors.work_item_frame import WorkItemFrame, group_counts
+from execution.collectors.work_item_store import use_work_item_store
 from execution.core import get_logger
 from execution.core.collector_metrics import track_collector_performance
+from execution.core.history_store import HistoryStore
 from execution.secure_config import get_config
 from execution.security import WIQLValidator
 from execution.utils.ado_batch_utils import batch_fetch_work_items_rest
@@ -105,13 +117,30 @@ async def _execute_wiql_query(
     return [item.id for item in result] if result else []
 
 
-async def _fetch_work_item_details(rest_client: AzureDevOpsRESTClient, item_ids: list[int]) -> list[dict]:
+_WORK_ITEM_FIELDS = [
+    "System.Id",
+    "System.Title",
+    "System.State",
+    "System.CreatedDate",
+    "System.WorkItemType",
+    "System.AssignedTo",
+    "System.AreaPath",
+    "System.ChangedDate",
+]
+
+register_collector_fields("ownership", _WORK_ITEM_FIELDS)
+
+
+async def _fetch_work_item_details(
+    rest_client: AzureDevOpsRESTClient, item_ids: list[int], project: str | None = None
+) -> list[dict]:
     """
     Fetch full work item details using batch utility (REST API).
 
     Args:
         rest_client: Azure DevOps REST API client
         item_ids: List of work item IDs
+        project: ADO project name; enables shared/incremental fetching when active for the run
 
     Returns:
         List of work item field dictionaries
@@ -122,16 +151,16 @@ async def _fetch_work_item_details(rest_client: AzureDevOpsRESTClient, item_ids:
     if not item_ids:
         return []
 
-    fields = [
-        "System.Id",
-        "System.Title",
-        "System.State",
-        "System.CreatedDate",
-        "System.WorkItemType",
-        "System.AssignedTo",
-        "System.AreaPath",
-        "System.ChangedDate",
-    ]
+    fields = _WORK_ITEM_FIELDS
+
+    if project and shared_fetch_enabled():
+        # Reuse items other collectors fetched this run / unchanged items from the local store
+        items, failed_ids = await fetch_work_items_shared(
+            rest_client, project, item_ids, fields, collector="ownership", logger=logger
+        )
+        if failed_ids:
+            logger.warning(f"Failed to fetch {len(failed_ids)} work items")
+        return items
 
     items_raw, failed_ids = await batch_fetch_work_items_rest(
         rest_client,
@@ -179,68 +208,58 @@ async def query_work_items_for_ownership(
     logger.info(f"  Found {len(item_ids)} actionable items")
 
     # Fetch full details
-    items = await _fetch_work_item_details(rest_client, item_ids)
+    items = await _fetch_work_item_details(rest_client, item_ids, project=project_name)
     logger.info(f"  Fetched {len(items)} items for analysis")
 
     return {"open_items": items, "total_count": len(items)}
 
 
-def _is_unassigned(assigned_to: object) -> bool:
-    """Return True if the AssignedTo field indicates an unassigned item."""
-    if not assigned_to:
-        return True
-    if isinstance(assigned_to, dict) and not assigned_to.get("displayName"):
-        return True
-    return False
-
-
-def _count_unassigned_by_type(unassigned_items: list[dict]) -> dict:
+def _count_unassigned_by_type(unassigned_types: np.ndarray) -> dict:
     """Return counts of unassigned items bucketed into bugs/features/tasks."""
     return {
-        "bugs": sum(1 for item in unassigned_items if item["type"] == "Bug"),
-        "features": sum(1 for item in unassigned_items if item["type"] in ["Feature", "User Story"]),
-        "tasks": sum(1 for item in unassigned_items if item["type"] == "Task"),
+        "bugs": int(np.count_nonzero(unassigned_types == "Bug")),
+        "features": int(np.count_nonzero(np.isin(unassigned_types, ["Feature", "User Story"]))),
+        "tasks": int(np.count_nonzero(unassigned_types == "Task")),
     }
 
 
-def calculate_unassigned_items(open_items: list[dict]) -> dict:
+def calculate_unassigned_items(open_items: list[dict] | WorkItemFrame) -> dict:
     """
     Calculate count and details of unassigned work items.
 
     Args:
-        open_items: List of open work items
+        open_items: List of open work items (or a WorkItemFrame over them)
 
     Returns:
         Unassigned items metrics
     """
-    unassigned_items = []
-
-    for item in open_items:
-        assigned_to = item.get("System.AssignedTo")
-
-        # Check if item is unassigned (no AssignedTo or empty)
-        if _is_unassigned(assigned_to):
-            unassigned_items.append(
-                {
-                    "id": item.get("System.Id"),
-                    "title": item.get("System.Title"),
-                    "type": item.get("System.WorkItemType"),
-                    "state": item.get("System.State"),
-                    "area_path": item.get("System.AreaPath"),
-                    "created_date": item.get("System.CreatedDate"),
-                }
-            )
-
-    total_items = len(open_items)
-    unassigned_count = len(unassigned_items)
+    frame = WorkItemFrame.of(open_items)
+    unassigned_idx = np.flatnonzero(frame.unassigned)
+
+    top_items = []
+    for i in unassigned_idx[:20]:  # Top 20 for reference
+        item = frame.items[i]
+        top_items.append(
+            {
+                "id": item.get("System.Id"),
+                "title": item.get("System.Title"),
+                "type": item.get("System.WorkItemType"),
+                "state": item.get("System.State"),
+                "area_path": item.get("System.AreaPath"),
+                "created_date": item.get("System.CreatedDate"),
+            }
+        )
+
+    total_items = len(frame)
+    unassigned_count = len(unassigned_idx)
     unassigned_pct = (unassigned_count / total_items * 100) if total_items > 0 else 0
 
     return {
         "unassigned_count": unassigned_count,
         "total_items": total_items,
         "unassigned_pct": round(unassigned_pct, 1),
-        "items": unassigned_items[:20],  # Top 20 for reference
-        "by_type": _count_unassigned_by_type(unassigned_items),
+        "items": top_items,
+        "by_type": _count_unassigned_by_type(frame.field("System.WorkItemType")[unassigned_idx]),
     }
 
 
@@ -255,30 +274,22 @@ def _build_segmentation_entry(total: int, unassigned: int) -> dict[str, Any]:
     }
 
 
-def calculate_work_type_segmentation(open_items: list[dict]) -> dict[str, Any]:
+def calculate_work_type_segmentation(open_items: list[dict] | WorkItemFrame) -> dict[str, Any]:
     """
     Calculate detailed work type breakdown with assignment rates.
 
     Shows: How many Bugs/Stories/Tasks exist and what % are unassigned for each.
 
     Args:
-        open_items: List of open work items
+        open_items: List of open work items (or a WorkItemFrame over them)
 
     Returns:
         Work type segmentation with assignment rates
     """
-    type_totals: defaultdict[str, int] = defaultdict(int)
-    type_unassigned: defaultdict[str, int] = defaultdict(int)
-
-    for item in open_items:
-        work_type = item.get("System.WorkItemType", "Unknown")
-        assigned_to = item.get("System.AssignedTo")
-
-        type_totals[work_type] += 1
-
-        # Check if unassigned
-        if _is_unassigned(assigned_to):
-            type_unassigned[work_type] += 1
+    frame = WorkItemFrame.of(open_items)
+    types, totals, unassigned = group_counts(frame.work_item_type, frame.unassigned)
+    type_totals = dict(zip(types, totals.tolist(), strict=True))
+    type_unassigned = dict(zip(types, unassigned.tolist(), strict=True))
 
     # Build segmentation for primary work types
     segmentation: dict[str, dict[str, Any]] = {}
@@ -286,8 +297,8 @@ def calculate_work_type_segmentation(open_items: list[dict]) -> dict[str, Any]:
 
     for wtype in primary_types:
         total = type_totals.get(wtype, 0)
-        unassigned = type_unassigned.get(wtype, 0)
-        segmentation[wtype] = _build_segmentation_entry(total, unassigned)
+        unassigned_count = type_unassigned.get(wtype, 0)
+        segmentation[wtype] = _build_segmentation_entry(total, unassigned_count)
 
     # Add "Other" category for all other types
     other_types = [t for t in type_totals.keys() if t not in primary_types]
@@ -300,15 +311,6 @@ def calculate_work_type_segmentation(open_items: list[dict]) -> dict[str, Any]:
     return segmentation
 
 
-def _extract_assignee_name(assigned_to: object) -> str:
-    """Extract a display name string from an AssignedTo field value."""
-    if assigned_to:
-        if isinstance(assigned_to, dict):
-            return str(assigned_to.get("displayName", "Unassigned"))
-        return str(assigned_to)
-    return "Unassigned"
-
-
 def _calculate_load_imbalance(sorted_assignees: list) -> float | None:
     """Calculate max/min load ratio from a sorted list of (name, count) pairs.
 
@@ -325,40 +327,31 @@ def _calculate_load_imbalance(sorted_assignees: list) -> float | None:
     return max_load / min_load if min_load > 0 else None
 
 
-def calculate_assignment_distribution(open_items: list[dict]) -> dict:
+def calculate_assignment_distribution(open_items: list[dict] | WorkItemFrame) -> dict:
     """
     Calculate how work is distributed across assignees.
 
     Args:
-        open_items: List of open work items
+        open_items: List of open work items (or a WorkItemFrame over them)
 
     Returns:
         Assignment distribution metrics
     """
-    assignee_counts: dict[str, int] = {}
-
-    for item in open_items:
-        assigned_to = item.get("System.AssignedTo")
-        assignee_name = _extract_assignee_name(assigned_to)
-
-        if assignee_name not in assignee_counts:
-            assignee_counts[assignee_name] = 0
-
-        assignee_counts[assignee_name] += 1
+    names, counts, _ = group_counts(WorkItemFrame.of(open_items).assignee_name)
 
     # Sort by count (descending)
-    sorted_assignees = sorted(assignee_counts.items(), key=lambda x: x[1], reverse=True)
+    sorted_assignees = sorted(zip(names, counts.tolist(), strict=True), key=lambda x: x[1], reverse=True)
 
     load_imbalance_ratio = _calculate_load_imbalance(sorted_assignees)
 
     return {
-        "assignee_count": len(assignee_counts) - (1 if "Unassigned" in assignee_counts else 0),
+        "assignee_count": len(names) - (1 if "Unassigned" in names else 0),
         "top_assignees": sorted_assignees[:10],  # Top 10 loaded
         "load_imbalance_ratio": round(load_imbalance_ratio, 2) if load_imbalance_ratio else None,
     }
 
 
-def calculate_area_unassigned_stats(open_items: list[dict]) -> dict:
+def calculate_area_unassigned_stats(open_items: list[dict] | WorkItemFrame) -> dict:
     """
     Calculate unassigned work statistics by area path.
 
@@ -366,36 +359,24 @@ def calculate_area_unassigned_stats(open_items: list[dict]) -> dict:
     Just raw counts and percentages.
 
     Args:
-        open_items: List of open work items
+        open_items: List of open work items (or a WorkItemFrame over them)
 
     Returns:
         Area unassigned statistics (raw data)
     """
-    area_stats = {}
-
-    for item in open_items:
-        area_path = item.get("System.AreaPath", "Unknown")
-        assigned_to = item.get("System.AssignedTo")
-
-        is_assigned = assigned_to and (not isinstance(assigned_to, dict) or assigned_to.get("displayName"))
-
-        if area_path not in area_stats:
-            area_stats[area_path] = {"total": 0, "unassigned": 0}
-
-        area_stats[area_path]["total"] += 1
-        if not is_assigned:
-            area_stats[area_path]["unassigned"] += 1
+    frame = WorkItemFrame.of(open_items)
+    areas, totals, unassigned = group_counts(frame.area_path, frame.unassigned)
 
     # Convert to list with percentages (NO FILTERING, NO THRESHOLDS)
     area_list = []
-    for area, stats in area_stats.items():
-        unassigned_pct = (stats["unassigned"] / stats["total"] * 100) if stats["total"] > 0 else 0
+    for area, total, unassigned_count in zip(areas, totals.tolist(), unassigned.tolist(), strict=True):
+        unassigned_pct = (unassigned_count / total * 100) if total > 0 else 0
 
         area_list.append(
             {
                 "area_path": area,
-                "total_items": stats["total"],
-                "unassigned_items": stats["unassigned"],
+                "total_items": total,
+                "unassigned_items": unassigned_count,
                 "unassigned_pct": round(unassigned_pct, 1),
             }
         )
@@ -451,20 +432,12 @@ async def calculate_developer_active_days(
     Returns:
         Developer active days metrics
     """
-    lookback_date = datetime.now() - timedelta(days=days)
-
     try:
-        # Get all repositories (REST API)
-        repos_response = await rest_client.get_repositories(project=project_name)
-        repos = GitTransformer.transform_repositories_response(repos_response)
+        # Get all repositories (shared with the risk collector via the git activity index)
+        repos = await list_repositories(rest_client, project_name)
 
         # Get commits concurrently for all repos (PARALLEL EXECUTION)
-        commit_tasks = [
-            rest_client.get_commits(
-                project=project_name, repository_id=repo["id"], from_date=lookback_date.isoformat() + "Z"
-            )
-            for repo in repos
-        ]
+        commit_tasks = [load_repo_commits(rest_client, project_name, repo["id"], days) for repo in repos]
 
         # Execute all commit queries concurrently
         commit_responses = await asyncio.gather(*commit_tasks, return_exceptions=True)
@@ -482,9 +455,7 @@ async def calculate_developer_active_days(
                 )
                 continue
 
-            # Transform REST response to simplified format
-            commits = GitTransformer.transform_commits_response(response)  # type: ignore[arg-type]
-            total_commits += _accumulate_repo_commits(commits, developer_dates)
+            total_commits += _accumulate_repo_commits(response, developer_dates)  # type: ignore[arg-type]
 
         developer_stats = _build_developer_stats(developer_dates, total_commits)
 
@@ -533,7 +504,8 @@ async def _calculate_all_metrics(
     Returns:
         Dictionary with all calculated metrics
     """
-    open_items = work_items["open_items"]
+    # One frame shared by every calculation below
+    open_items = WorkItemTransformer.to_frame(work_items["open_items"])
 
     # Get developer activity concurrently (async)
     developer_activity = await calculate_developer_active_days(rest_client, ado_project_name, lookback_days)
@@ -644,12 +616,10 @@ def save_ownership_metrics(metrics: dict, output_file: str = ".tmp/observatory/o
     """
     Save ownership metrics to history file using atomic writes.
 
-    Appends to existing history or creates new file.
+    Appends one week to the history store (see execution/core/history_store.py).
     Validates data before saving to prevent persisting collection failures.
     Uses atomic file operations to prevent corruption.
     """
-    from execution.utils_atomic_json import atomic_json_save, load_json_with_recovery
-
     # Validate that we have actual data before saving
     projects = metrics.get("projects", [])
 
@@ -666,31 +636,17 @@ def save_ownership_metrics(metrics: dict, output_file: str = ".tmp/observatory/o
         logger.warning("          Not persisting this data to avoid corrupting trend history")
         return False
 
-    # Load existing history (with automatic corruption recovery)
-    history = load_json_with_recovery(output_file, default_value={"weeks": []})
-
-    # Validate structure
-    if not isinstance(history, dict) or "weeks" not in history:
-        logger.warning("[WARNING] Existing history file has invalid structure - recreating")
-        history = {"weeks": []}
-
-    # Add new week entry
-    history["weeks"].append(metrics)
-
-    # Keep only last 52 weeks (12 months) for quarter/annual analysis
-    history["weeks"] = history["weeks"][-52:]
-
-    # Save using atomic write to prevent corruption
+    # Append new week (atomic write), keeping only last 52 weeks (12 months)
     try:
-        atomic_json_save(history, output_file)
+        week_count = HistoryStore(output_file).append(metrics, retain=52)
         logger.info(f"[SAVED] Ownership metrics saved to: {output_file}")
-        logger.info(f"        History now contains {len(history['weeks'])} week(s)")
+        logger.info(f"        History now contains {week_count} week(s)")
         return True
     except OSError as e:
         log_and_return_default(
             logger,
             e,
-            context={"output_file": output_file, "weeks_count": len(history["weeks"])},
+            context={"output_file": output_file},
             default_value=False,
             error_type="Ownership metrics save",
         )
@@ -710,7 +666,7 @@ class OwnershipCollector:
     while still leveraging BaseCollector's utility methods.
     """
 
-    def __init__(self):
+    def __init__(self, rest_client: AzureDevOpsRESTClient | None = None):
         # Import locally to avoid circular dependency
         from execution.collectors.base import BaseCollector
 
@@ -725,7 +681,7 @@ class OwnershipCollector:
             def save_metrics(self, results):
                 pass  # Not used - OwnershipCollector has custom save logic
 
-        self._base = _BaseHelper(name="ownership", lookback_days=90)
+        self._base = _BaseHelper(name="ownership", lookback_days=90, rest_client=rest_client)
         self.config = self._base.config
         self.logger = logger
 
@@ -755,7 +711,10 @@ class OwnershipCollector:
             tasks = [collect_ownership_metrics_for_project(rest_client, project, self.config) for project in projects]
 
             # Execute all collections concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # one pooled HTTP session, work item cache and fetch planner for the whole run
+            async with rest_client:
+                with use_work_item_store(), use_work_item_fetch_planner(), use_git_activity_index():
+                    results = await asyncio.gather(*tasks, return_exceptions=True)
 
             # Filter successful results
             project_metrics: list[dict] = []
@@ -773,6 +732,17 @@ class OwnershipCollector:
                 else:
                     project_metrics.append(result)  # type: ignore[arg-type]
 
+            # Full payload, detail lists included, for this run's dashboard generators
+            if project_metrics:
+                save_snapshot_section(
+                    "ownership",
+                    {
+                        "week_date": datetime.now().strftime("%Y-%m-%d"),
+                        "week_number": datetime.now().isocalendar()[1],
+                        "projects": project_metrics,
+                    },
+                )
+
             # Save results — strip PII/detail lists before persisting to history
             week_metrics = {
                 "week_date": datetime.now().strftime("%Y-%m-%d"),
@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import Optional
 
 from execution.core import get_logger
+from execution.core.history_store import history_exists, load_history
 from execution.domain.quality import QualityMetrics
 
 logger = get_logger(__name__)
@@ -41,13 +42,12 @@ class ADOQualityLoader:
             FileNotFoundError: If history file doesn't exist
             ValueError: If history data is invalid
         """
-        if not self.history_file.exists():
+        if not history_exists(self.history_file):
             logger.error("Quality history file not found", extra={"file_path": str(self.history_file)})
             raise FileNotFoundError(f"Quality history not found: {self.history_file}")
 
         try:
-            with open(self.history_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_history(self.history_file, last_n=1)
 
             if not data.get("weeks"):
                 raise ValueError("No weeks data in history file")
@@ -17,20 +17,31 @@ Migrated to Azure DevOps REST API v7.1 (replaces SDK).
 import asyncio
 import json
 import logging
-import os
 import statistics
 import sys
 from datetime import UTC, datetime, timedelta
+from typing import cast
 
+import numpy as np
 from dotenv import load_dotenv
 
 from execution.collectors.ado_rest_client import AzureDevOpsRESTClient, get_ado_rest_client
 from execution.collectors.ado_rest_transformers import TestTransformer, WorkItemTransformer
+from execution.collectors.run_snapshot import save_snapshot_section
 from execution.collectors.security_bug_filter import filter_security_bugs
+from execution.collectors.work_item_fetch_planner import (
+    fetch_work_items_shared,
+    register_collector_fields,
+    shared_fetch_enabled,
+    use_work_item_fetch_planner,
+)
+from execution.collectors.work_item_frame import WorkItemFrame
+from execution.collectors.work_item_store import use_work_item_store
+from execution.core.history_store import HistoryStore
 from execution.secure_config import get_config
 from execution.security import WIQLValidator
 from execution.utils.ado_batch_utils import batch_fetch_work_items_rest
-from execution.utils.datetime_utils import calculate_age_days, calculate_lead_time_days, parse_ado_timestamp
+from execution.utils.datetime_utils import parse_ado_timestamp
 from execution.utils.error_handling import log_and_continue, log_and_return_default
 from execution.utils.statistics import calculate_percentile
 
@@ -69,7 +80,9 @@ def _build_area_filter_clause(area_path_filter: str | None) -> str:
     return ""
 
 
-async def _fetch_bug_details(rest_client: AzureDevOpsRESTClient, bug_ids: list[int], fields: list[str]) -> list[dict]:
+async def _fetch_bug_details(
+    rest_client: AzureDevOpsRESTClient, bug_ids: list[int], fields: list[str], project: str | None = None
+) -> list[dict]:
     """
     Fetch full bug details using batch utility (REST API).
 
@@ -77,6 +90,7 @@ async def _fetch_bug_details(rest_client: AzureDevOpsRESTClient, bug_ids: list[i
         rest_client: Azure DevOps REST API client
         bug_ids: List of bug IDs to fetch
         fields: List of fields to retrieve
+        project: ADO project name; enables shared/incremental fetching when active for the run
 
     Returns:
         List of bug field dictionaries
@@ -88,16 +102,22 @@ async def _fetch_bug_details(rest_client: AzureDevOpsRESTClient, bug_ids: list[i
         return []
 
     try:
-        # Use REST batch fetching (concurrent)
-        bugs_raw, failed_ids = await batch_fetch_work_items_rest(
-            rest_client, item_ids=bug_ids, fields=fields, logger=logger
-        )
+        if project and shared_fetch_enabled():
+            # Reuse items other collectors fetched this run / unchanged items from the local store
+            bugs, failed_ids = await fetch_work_items_shared(
+                rest_client, project, bug_ids, fields, collector="quality", logger=logger
+            )
+        else:
+            # Use REST batch fetching (concurrent)
+            bugs_raw, failed_ids = await batch_fetch_work_items_rest(
+                rest_client, item_ids=bug_ids, fields=fields, logger=logger
+            )
+            # Transform to SDK format
+            bugs = WorkItemTransformer.transform_work_items_response({"value": bugs_raw})
 
         if failed_ids:
             logger.warning(f"Failed to fetch {len(failed_ids)} out of {len(bug_ids)} bugs")
 
-        # Transform to SDK format
-        bugs = WorkItemTransformer.transform_work_items_response({"value": bugs_raw})
         return bugs
 
     except Exception as e:
@@ -131,11 +151,14 @@ _OPEN_BUG_FIELDS = [
     "System.CreatedBy",
 ]
 
+register_collector_fields("quality", _ALL_BUG_FIELDS, _OPEN_BUG_FIELDS)
+
 
 def _build_bug_fetch_tasks(
     rest_client: "AzureDevOpsRESTClient",
     all_bugs_result: list | None,
     open_bugs_result: list | None,
+    project: str | None = None,
 ) -> tuple:
     """
     Build coroutine tasks for fetching full bug details.
@@ -146,11 +169,11 @@ def _build_bug_fetch_tasks(
 
     if all_bugs_result:
         all_bug_ids = [item.id for item in all_bugs_result]
-        all_bug_task = _fetch_bug_details(rest_client, all_bug_ids, fields=_ALL_BUG_FIELDS)
+        all_bug_task = _fetch_bug_details(rest_client, all_bug_ids, fields=_ALL_BUG_FIELDS, project=project)
 
     if open_bugs_result:
         open_bug_ids = [item.id for item in open_bugs_result]
-        open_bug_task = _fetch_bug_details(rest_client, open_bug_ids, fields=_OPEN_BUG_FIELDS)
+        open_bug_task = _fetch_bug_details(rest_client, open_bug_ids, fields=_OPEN_BUG_FIELDS, project=project)
 
     return all_bug_task, open_bug_task
 
@@ -261,7 +284,9 @@ async def query_bugs_for_quality(
     open_bugs: list = []
 
     # Create tasks for concurrent fetching
-    all_bug_task, open_bug_task = _build_bug_fetch_tasks(rest_client, all_bugs_result, open_bugs_result)
+    all_bug_task, open_bug_task = _build_bug_fetch_tasks(
+        rest_client, all_bugs_result, open_bugs_result, project=safe_project
+    )
 
     # Execute fetches concurrently
     tasks = []
@@ -295,42 +320,36 @@ async def query_bugs_for_quality(
 # Cannot reliably distinguish customer-found bugs from internally-found production bugs.
 
 
-def _build_ages_distribution(ages: list[float]) -> dict:
-    """Build the 4-bucket age distribution dict from a list of ages in days."""
+def _build_ages_distribution(ages: np.ndarray) -> dict:
+    """Build the 4-bucket age distribution dict from an array of ages in days."""
     return {
-        "0-7_days": sum(1 for age in ages if age <= 7),
-        "8-30_days": sum(1 for age in ages if 7 < age <= 30),
-        "31-90_days": sum(1 for age in ages if 30 < age <= 90),
-        "90+_days": sum(1 for age in ages if age > 90),
+        "0-7_days": int(np.count_nonzero(ages <= 7)),
+        "8-30_days": int(np.count_nonzero((ages > 7) & (ages <= 30))),
+        "31-90_days": int(np.count_nonzero((ages > 30) & (ages <= 90))),
+        "90+_days": int(np.count_nonzero(ages > 90)),
     }
 
 
-def _collect_bug_ages(open_bugs: list[dict]) -> tuple[list[float], int]:
+def _collect_bug_ages(open_bugs: WorkItemFrame) -> tuple[np.ndarray, int]:
     """
-    Parse age in days for each open bug.
+    Age in days for each open bug with a usable created date.
     Returns (ages, parse_error_count).
     """
-    now = datetime.now(UTC)
-    ages: list[float] = []
-    parse_errors = 0
-    for bug in open_bugs:
-        created = bug.get("System.CreatedDate")
-        age = calculate_age_days(created, reference_time=now)
-        if age is not None:
-            ages.append(age)
-        elif created:
-            parse_errors += 1
-            if parse_errors <= 3:
-                logger.warning(f"Could not parse date for bug {bug.get('System.Id')}: {created}")
-    return ages, parse_errors
-
-
-def calculate_bug_age_distribution(open_bugs: list[dict]) -> dict:
+    ages = open_bugs.age_days(reference_time=datetime.now(UTC))
+    valid = ~np.isnan(ages)
+    errors = np.flatnonzero(open_bugs.has_created & ~valid)
+    for i in errors[:3]:
+        bug = open_bugs.items[i]
+        logger.warning(f"Could not parse date for bug {bug.get('System.Id')}: {bug.get('System.CreatedDate')}")
+    return ages[valid], len(errors)
+
+
+def calculate_bug_age_distribution(open_bugs: list[dict] | WorkItemFrame) -> dict:
     """
     Calculate bug age distribution: How long bugs have been open.
 
     Args:
-        open_bugs: List of open bug field dictionaries
+        open_bugs: List of open bug field dictionaries (or a WorkItemFrame over them)
 
     Returns:
         Age distribution metrics dictionary
@@ -338,12 +357,12 @@ def calculate_bug_age_distribution(open_bugs: list[dict]) -> dict:
     Raises:
         ValueError: If date parsing fails for all bugs
     """
-    ages, parse_errors = _collect_bug_ages(open_bugs)
+    ages, parse_errors = _collect_bug_ages(WorkItemFrame.of(open_bugs))
 
     if parse_errors > 0:
         logger.warning(f"Failed to parse {parse_errors} out of {len(open_bugs)} open bug dates")
 
-    if not ages:
+    if not len(ages):
         return {
             "median_age_days": None,
             "p85_age_days": None,
@@ -352,10 +371,11 @@ def calculate_bug_age_distribution(open_bugs: list[dict]) -> dict:
             "ages_distribution": {"0-7_days": 0, "8-30_days": 0, "31-90_days": 0, "90+_days": 0},
         }
 
+    p50, p85, p95 = np.percentile(ages, [50, 85, 95])
     return {
-        "median_age_days": round(calculate_percentile(ages, 50), 1),
-        "p85_age_days": round(calculate_percentile(ages, 85), 1),
-        "p95_age_days": round(calculate_percentile(ages, 95), 1),
+        "median_age_days": round(float(p50), 1),
+        "p85_age_days": round(float(p85), 1),
+        "p95_age_days": round(float(p95), 1),
         "sample_size": len(ages),
         "ages_distribution": _build_ages_distribution(ages),
     }
@@ -367,43 +387,33 @@ def calculate_bug_age_distribution(open_bugs: list[dict]) -> dict:
 # Weights and formula are speculation, not based on actual business impact.
 
 
-def _parse_repair_times(all_bugs: list[dict]) -> list[float]:
+def _parse_repair_times(all_bugs: WorkItemFrame) -> np.ndarray:
     """
-    Parse repair times from bug data.
+    Repair times (created -> closed) for bugs that have been closed.
 
     Args:
-        all_bugs: List of bug field dictionaries
+        all_bugs: Frame over the bug field dictionaries
 
     Returns:
-        List of repair times in days
+        Array of repair times in days
     """
-    repair_times = []
-
-    for bug in all_bugs:
-        created_date = bug.get("System.CreatedDate")
-        closed_date = bug.get("Microsoft.VSTS.Common.ClosedDate")
-
-        # Only calculate for bugs that have been closed
-        repair_time = calculate_lead_time_days(created_date, closed_date)
-        if repair_time is not None:
-            repair_times.append(repair_time)
+    repair_times = all_bugs.lead_time_days
+    return cast(np.ndarray, repair_times[~np.isnan(repair_times)])
 
-    return repair_times
 
-
-def calculate_mttr(all_bugs: list[dict]) -> dict:
+def calculate_mttr(all_bugs: list[dict] | WorkItemFrame) -> dict:
     """
     Calculate MTTR (Mean Time To Repair): Average time from bug creation to closure.
 
     Args:
-        all_bugs: List of all bug field dictionaries
+        all_bugs: List of all bug field dictionaries (or a WorkItemFrame over them)
 
     Returns:
         MTTR metrics dictionary in days
     """
-    repair_times = _parse_repair_times(all_bugs)
+    repair_times = _parse_repair_times(WorkItemFrame.of(all_bugs))
 
-    if not repair_times:
+    if not len(repair_times):
         return {
             "mttr_days": None,
             "median_mttr_days": None,
@@ -413,19 +423,18 @@ def calculate_mttr(all_bugs: list[dict]) -> dict:
             "mttr_distribution": {"0-1_days": 0, "1-7_days": 0, "7-30_days": 0, "30+_days": 0},
         }
 
-    mean_mttr = sum(repair_times) / len(repair_times)
-
+    p50, p85, p95 = np.percentile(repair_times, [50, 85, 95])
     return {
-        "mttr_days": round(mean_mttr, 1),
-        "median_mttr_days": round(calculate_percentile(repair_times, 50), 1),
-        "p85_mttr_days": round(calculate_percentile(repair_times, 85), 1),
-        "p95_mttr_days": round(calculate_percentile(repair_times, 95), 1),
+        "mttr_days": round(float(repair_times.mean()), 1),
+        "median_mttr_days": round(float(p50), 1),
+        "p85_mttr_days": round(float(p85), 1),
+        "p95_mttr_days": round(float(p95), 1),
         "sample_size": len(repair_times),
         "mttr_distribution": {
-            "0-1_days": sum(1 for t in repair_times if t <= 1),
-            "1-7_days": sum(1 for t in repair_times if 1 < t <= 7),
-            "7-30_days": sum(1 for t in repair_times if 7 < t <= 30),
-            "30+_days": sum(1 for t in repair_times if t > 30),
+            "0-1_days": int(np.count_nonzero(repair_times <= 1)),
+            "1-7_days": int(np.count_nonzero((repair_times > 1) & (repair_times <= 7))),
+            "7-30_days": int(np.count_nonzero((repair_times > 7) & (repair_times <= 30))),
+            "30+_days": int(np.count_nonzero(repair_times > 30)),
         },
     }
 
@@ -554,9 +563,9 @@ async def collect_quality_metrics_for_project(rest_client: AzureDevOpsRESTClient
             f"    Excluded {excluded_open} open security bugs and {excluded_all} total security bugs from quality metrics"
         )
 
-    # Calculate metrics - ONLY HARD DATA (synchronous calculations)
-    age_distribution = calculate_bug_age_distribution(bugs["open_bugs"])
-    mttr = calculate_mttr(bugs["all_bugs"])
+    # Calculate metrics - ONLY HARD DATA (synchronous calculations on parsed columns)
+    age_distribution = calculate_bug_age_distribution(WorkItemTransformer.to_frame(bugs["open_bugs"]))
+    mttr = calculate_mttr(WorkItemTransformer.to_frame(bugs["all_bugs"]))
 
     _print_metrics_summary(age_distribution, mttr, test_execution)
 
@@ -577,7 +586,7 @@ def save_quality_metrics(metrics: dict, output_file: str = ".tmp/observatory/qua
     """
     Save quality metrics to history file.
 
-    Appends to existing history or creates new file.
+    Appends one week to the history store (see execution/core/history_store.py).
     Validates data before saving to prevent persisting collection failures.
 
     Args:
@@ -587,8 +596,6 @@ def save_quality_metrics(metrics: dict, output_file: str = ".tmp/observatory/qua
     Returns:
         True if saved successfully, False otherwise
     """
-    from execution.utils_atomic_json import atomic_json_save, load_json_with_recovery
-
     # Validate that we have actual data before saving
     projects = metrics.get("projects", [])
 
@@ -596,6 +603,9 @@ def save_quality_metrics(metrics: dict, output_file: str = ".tmp/observatory/qua
         logger.warning("No project data to save - collection may have failed")
         return False
 
+    # Full payload, detail lists included, for this run's dashboard generators
+    save_snapshot_section("quality", metrics)
+
     # Check if this looks like a failed collection (all zeros)
     total_bugs = sum(p.get("total_bugs_analyzed", 0) for p in projects)
     total_open = sum(p.get("open_bugs_count", 0) for p in projects)
@@ -605,27 +615,11 @@ def save_quality_metrics(metrics: dict, output_file: str = ".tmp/observatory/qua
         logger.warning("Not persisting this data to avoid corrupting trend history")
         return False
 
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-
-    # Load existing history
-    history = load_json_with_recovery(output_file, default_value={"weeks": []})
-
-    # Add validation if structure check exists
-    if not isinstance(history, dict) or "weeks" not in history:
-        logger.warning("Existing history file has invalid structure - recreating")
-        history = {"weeks": []}
-
-    # Add new week entry
-    history["weeks"].append(metrics)
-
-    # Keep only last 52 weeks (12 months) for quarter/annual analysis
-    history["weeks"] = history["weeks"][-52:]
-
-    # Save updated history
+    # Append new week, keeping only last 52 weeks (12 months) for quarter/annual analysis
     try:
-        atomic_json_save(history, output_file)
+        week_count = HistoryStore(output_file).append(metrics, retain=52)
         logger.info(f"Quality metrics saved to: {output_file}")
-        logger.info(f"History now contains {len(history['weeks'])} week(s)")
+        logger.info(f"History now contains {week_count} week(s)")
         return True
     except OSError as e:
         logger.error(f"Failed to save Quality metrics: {e}")
@@ -635,7 +629,7 @@ def save_quality_metrics(metrics: dict, output_file: str = ".tmp/observatory/qua
 class QualityCollector:
     """Quality metrics collector using BaseCollector infrastructure"""
 
-    def __init__(self):
+    def __init__(self, rest_client: AzureDevOpsRESTClient | None = None):
         from execution.collectors.base import BaseCollector
 
         class _BaseHelper(BaseCollector):
@@ -645,7 +639,7 @@ class QualityCollector:
             def save_metrics(self, results):
                 pass
 
-        self._base = _BaseHelper(name="quality", lookback_days=90)
+        self._base = _BaseHelper(name="quality", lookback_days=90, rest_client=rest_client)
         self.config = self._base.config
 
     async def run(self) -> bool:
@@ -669,7 +663,10 @@ class QualityCollector:
             print("=" * 60)
 
             tasks = [collect_quality_metrics_for_project(rest_client, project, self.config) for project in projects]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # one pooled HTTP session, work item cache and fetch planner for the whole run
+            async with rest_client:
+                with use_work_item_store(), use_work_item_fetch_planner():
+                    results = await asyncio.gather(*tasks, return_exceptions=True)
 
             project_metrics: list[dict] = []
             for project, result in zip(projects, results, strict=True):
@@ -0,0 +1,312 @@
+"""
+Adaptive Rate Limiter for Azure DevOps REST Calls
+
+Org-wide concurrency limiter and token bucket shared by every request an
+AzureDevOpsRESTClient makes. Collectors can keep firing unbounded
+asyncio.gather() fan-outs; requests simply queue here until a slot and a
+token are available.
+
+Behaviour:
+    - Concurrency limit adapts with AIMD (additive increase, multiplicative decrease)
+    - Decrease on 429s, slow responses, low X-RateLimit-Remaining or a Retry-After header
+    - A 429/Retry-After pauses ALL callers together until the deadline passes
+    - Token bucket caps the sustained request rate (requests/second)
+
+Usage:
+    from execution.collectors.ado_rate_limiter import AdaptiveRateLimiter
+
+    limiter = AdaptiveRateLimiter()
+    async with limiter.slot() as slot:
+        response = await client.get(url)
+        if response.status_code == 429:
+            limiter.throttle(float(response.headers.get("Retry-After", 60)))
+        else:
+            slot.observe(response.headers)
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from typing import Any
+
+from execution.core import get_logger
+
+logger = get_logger(__name__)
+
+
+def _header_float(headers: Mapping[str, Any] | None, name: str) -> float | None:
+    """Parse a numeric response header, returning None if missing or malformed."""
+    if not headers:
+        return None
+    try:
+        value = headers.get(name)
+        return float(value) if value is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+class _SlotObserver:
+    """Handed to callers inside AdaptiveRateLimiter.slot() to report the outcome."""
+
+    def __init__(self, limiter: "AdaptiveRateLimiter"):
+        self._limiter = limiter
+        self._start = time.monotonic()
+
+    def observe(self, headers: Mapping[str, Any] | None = None) -> None:
+        """Feed a successful response's headers and measured latency into the limiter."""
+        self._limiter.record_success(time.monotonic() - self._start, headers)
+
+
+class AdaptiveRateLimiter:
+    """
+    AIMD concurrency limiter with a token bucket and a global pause.
+
+    Attributes:
+        limit: Current concurrency limit (adapts between min_limit and max_limit)
+        in_flight: Requests currently holding a slot
+        queue_depth: Callers waiting for a slot or for a pause to end
+        peak_queue_depth: Highest queue depth observed
+        throttle_events: Number of 429/Retry-After signals received
+    """
+
+    DEFAULT_INITIAL_LIMIT = 16
+    DEFAULT_MIN_LIMIT = 2
+    DEFAULT_MAX_LIMIT = 64
+    DEFAULT_RATE_PER_SECOND = 50.0
+    DEFAULT_LATENCY_TARGET = 5.0  # seconds - slower responses count as congestion
+    DECREASE_FACTOR = 0.5
+    DECREASE_COOLDOWN = 1.0  # seconds - one decrease per burst of congestion signals
+    LOW_REMAINING_RATIO = 0.1  # X-RateLimit-Remaining below 10% of X-RateLimit-Limit
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        latency_target: float = DEFAULT_LATENCY_TARGET,
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            initial_limit: Starting concurrency limit (default: 16)
+            min_limit: Floor for multiplicative decrease (default: 2)
+            max_limit: Ceiling for additive increase (default: 64)
+            rate_per_second: Sustained token bucket rate; burst equals one second of tokens
+            latency_target: Response time above which the limit is decreased
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+
+        self.limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.rate_per_second = rate_per_second
+        self.burst = max(1.0, rate_per_second)
+        self.latency_target = latency_target
+
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.peak_queue_depth = 0
+        self.throttle_events = 0
+
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._pause_until = 0.0
+        self._increase_credit = 0.0
+        self._last_decrease = 0.0
+        self._waiters: list[asyncio.Future[None]] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    # ------------------------------------------------------------------
+    # Acquire / release
+    # ------------------------------------------------------------------
+
+    def _bind_loop(self) -> None:
+        """Reset loop-bound state when reused from a new event loop (e.g. a second asyncio.run)."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._waiters = []
+            self.in_flight = 0
+            self.queue_depth = 0
+
+    async def acquire(self) -> None:
+        """
+        Wait for a concurrency slot, any active pause and a token.
+
+        Each pause deadline is waited out once per caller, so a caller is never
+        held longer than the most recent Retry-After.
+        """
+        self._bind_loop()
+        self.queue_depth += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            waited_pause = 0.0
+            while True:
+                pause_remaining = self._pause_until - time.monotonic()
+                if pause_remaining > 0 and self._pause_until != waited_pause:
+                    waited_pause = self._pause_until
+                    await asyncio.sleep(pause_remaining)
+                    continue
+                if self.in_flight < self.limit:
+                    break
+                await self._wait_for_release()
+            self.in_flight += 1
+        finally:
+            self.queue_depth -= 1
+
+        delay = self._reserve_token()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def release(self) -> None:
+        """Return a concurrency slot and wake the next waiter."""
+        self.in_flight = max(0, self.in_flight - 1)
+        self._wake(self.limit - self.in_flight)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[_SlotObserver]:
+        """
+        Hold a concurrency slot for the duration of one request.
+
+        Yields:
+            Observer whose observe(headers) feeds a successful response to the AIMD controller
+        """
+        await self.acquire()
+        observer = _SlotObserver(self)
+        try:
+            yield observer
+        finally:
+            self.release()
+
+    async def _wait_for_release(self) -> None:
+        """Park until release() or a limit increase wakes this caller."""
+        assert self._loop is not None
+        waiter: asyncio.Future[None] = self._loop.create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def _wake(self, count: int) -> None:
+        """Wake up to `count` parked callers."""
+        while count > 0 and self._waiters:
+            waiter = self._waiters.pop(0)
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
+    def _reserve_token(self) -> float:
+        """
+        Take one token from the bucket, going into debt if empty.
+
+        Returns:
+            Seconds the caller must wait before sending (0 if a token was available)
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate_per_second)
+        self._last_refill = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate_per_second
+
+    # ------------------------------------------------------------------
+    # AIMD controller
+    # ------------------------------------------------------------------
+
+    def record_success(self, latency: float, headers: Mapping[str, Any] | None = None) -> None:
+        """
+        Adapt the concurrency limit from one successful response.
+
+        Args:
+            latency: Request duration in seconds
+            headers: Response headers (Retry-After, X-RateLimit-Remaining, X-RateLimit-Limit)
+        """
+        retry_after = _header_float(headers, "Retry-After")
+        if retry_after is not None and retry_after > 0:
+            # ADO sends Retry-After on successful responses once it starts delaying requests
+            self.throttle(retry_after)
+            return
+
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        quota = _header_float(headers, "X-RateLimit-Limit")
+        if remaining is not None and quota and remaining / quota < self.LOW_REMAINING_RATIO:
+            self._decrease("low X-RateLimit-Remaining")
+            return
+
+        if latency > self.latency_target:
+            self._decrease(f"latency {latency:.1f}s above target")
+            return
+
+        self._increase()
+
+    def throttle(self, retry_after: float) -> None:
+        """
+        Pause every caller until now + retry_after and cut the limit.
+
+        Args:
+            retry_after: Seconds to pause all new requests
+        """
+        self.throttle_events += 1
+        self._pause_until = max(self._pause_until, time.monotonic() + retry_after)
+        self._decrease(f"throttled for {retry_after:.0f}s")
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.DECREASE_COOLDOWN:
+            return
+        self._last_decrease = now
+        new_limit = max(self.min_limit, int(self.limit * self.DECREASE_FACTOR))
+        if new_limit != self.limit:
+            logger.info(f"ADO concurrency limit {self.limit} -> {new_limit} ({reason})")
+        self.limit = new_limit
+        self._increase_credit = 0.0
+
+    def _increase(self) -> None:
+        # +1 slot per `limit` successful responses (one "window")
+        self._increase_credit += 1.0 / self.limit
+        if self._increase_credit >= 1.0 and self.limit < self.max_limit:
+            self._increase_credit = 0.0
+            self.limit += 1
+            self._wake(1)
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Current limiter state for performance tracking.
+
+        Returns:
+            Dictionary with limit, in-flight, queue depth and throttle counters
+        """
+        return {
+            "concurrency_limit": self.limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "throttle_events": self.throttle_events,
+        }
+
+
+# One limiter per ADO organization, shared by every client created via get_ado_rest_client()
+_org_limiters: dict[str, AdaptiveRateLimiter] = {}
+
+
+def get_org_rate_limiter(organization_url: str) -> AdaptiveRateLimiter:
+    """
+    Get the process-wide limiter for an Azure DevOps organization.
+
+    Args:
+        organization_url: Organization URL (e.g., https://dev.azure.com/myorg)
+
+    Returns:
+        Shared AdaptiveRateLimiter for that organization
+    """
+    key = organization_url.rstrip("/").lower()
+    if key not in _org_limiters:
+        _org_limiters[key] = AdaptiveRateLimiter()
+    return _org_limiters[key]
@@ -9,17 +9,17 @@ This module replaces azure-devops==7.1.0b4 SDK with maintained REST API v7.1.
 Usage:
     from execution.collectors.ado_rest_client import get_ado_rest_client
 
-    # Get authenticated client
-    client = get_ado_rest_client()
-
-    # Query work items
-    result = await client.query_by_wiql(project="MyProject", wiql_query="SELECT [System.Id] FROM WorkItems")
+    # Get authenticated client; the context manager keeps one pooled HTTP/2
+    # session open for every call made inside the block
+    async with get_ado_rest_client() as client:
+        # Query work items
+        result = await client.query_by_wiql(project="MyProject", wiql_query="SELECT [System.Id] FROM WorkItems")
 
-    # Get work items by IDs
-    items = await client.get_work_items(ids=[1001, 1002], fields=["System.Title", "System.State"])
+        # Get work items by IDs
+        items = await client.get_work_items(ids=[1001, 1002], fields=["System.Title", "System.State"])
 
-    # Get builds
-    builds = await client.get_builds(project="MyProject", min_time="2026-01-01T00:00:00Z")
+        # Get builds
+        builds = await client.get_builds(project="MyProject", min_time="2026-01-01T00:00:00Z")
 
 API Documentation:
     https://learn.microsoft.com/en-us/rest/api/azure/devops/?view=azure-devops-rest-7.1
@@ -34,6 +34,7 @@ from urllib.parse import urlencode
 import httpx
 
 from execution.async_http_client import AsyncSecureHTTPClient
+from execution.collectors.ado_rate_limiter import AdaptiveRateLimiter, get_org_rate_limiter
 from execution.core import get_logger
 
 # Import collector metrics tracker for performance monitoring
@@ -55,17 +56,27 @@ class AzureDevOpsRESTClient:
     - Base64-encoded PAT authentication
     - Retry logic for rate limiting and server errors
     - Comprehensive error handling
+    - Long-lived pooled session when used as an async context manager
+    - Adaptive (AIMD) concurrency limit and token bucket across all calls
+
+    Use ``async with client:`` to share one connection pool (keep-alive and
+    HTTP/2 multiplexing) across every request. Entering is re-entrant, so a
+    collector can wrap its own work in ``async with`` while an orchestrator
+    holds the outer session open. Calls made outside a session fall back to a
+    short-lived HTTP client per request.
     """
 
     API_VERSION = "7.1"
 
-    def __init__(self, organization_url: str, pat: str):
+    def __init__(self, organization_url: str, pat: str, rate_limiter: AdaptiveRateLimiter | None = None):
         """
         Initialize Azure DevOps REST client.
 
         Args:
             organization_url: Azure DevOps organization URL (e.g., https://dev.azure.com/myorg)
             pat: Personal Access Token for authentication
+            rate_limiter: Limiter shared by all requests (default: a new limiter for this client;
+                get_ado_rest_client() passes the org-wide limiter)
 
         Raises:
             ValueError: If organization_url or pat is empty
@@ -76,6 +87,39 @@ class AzureDevOpsRESTClient:
         self.organization_url = organization_url.rstrip("/")
         self.pat = pat
         self.auth_header = self._build_auth_header(pat)
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self._session: AsyncSecureHTTPClient | None = None
+        self._session_depth = 0
+
+    async def __aenter__(self) -> "AzureDevOpsRESTClient":
+        """Open the shared HTTP session (re-entrant)."""
+        if self._session is None:
+            session = AsyncSecureHTTPClient(on_connection=self._record_connection)
+            await session.__aenter__()
+            self._session = session
+            logger.debug(f"Opened pooled ADO session for {self.organization_url}")
+        self._session_depth += 1
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Close the shared HTTP session once the outermost context exits."""
+        self._session_depth = max(0, self._session_depth - 1)
+        if self._session_depth == 0 and self._session is not None:
+            session, self._session = self._session, None
+            await session.__aexit__(*args)
+            logger.debug(f"Closed pooled ADO session ({session.connection_stats})")
+
+    @property
+    def connection_stats(self) -> dict[str, dict[str, int]]:
+        """Per-host request/new-connection counters for the open session."""
+        return self._session.connection_stats if self._session else {}
+
+    @staticmethod
+    def _record_connection(host: str, reused: bool) -> None:
+        """Forward connection reuse events to the active collector tracker."""
+        tracker = get_current_tracker()
+        if tracker:
+            tracker.record_connection(host, reused)
 
     def _build_auth_header(self, pat: str) -> dict[str, str]:
         """
@@ -146,7 +190,7 @@ class AzureDevOpsRESTClient:
         if status_code == 429:
             if tracker:
                 tracker.record_rate_limit_hit()
-            retry_after = int(e.response.headers.get("Retry-After", 60))
+            retry_after = int(float(e.response.headers.get("Retry-After", 60)))
             logger.warning(f"Rate limited, retrying after {retry_after}s (attempt {attempt + 1}/{max_retries})")
             return float(retry_after)
 
@@ -167,11 +211,14 @@ class AzureDevOpsRESTClient:
         Execute API call with retry logic and error handling.
 
         Handles:
-        - Rate limiting (429) with exponential backoff
+        - Rate limiting (429) by pausing every caller on the shared limiter
         - Server errors (500, 502, 503) with retry
         - Network errors with retry
         - Authentication errors (401, 403) fail fast
 
+        Every attempt first takes a slot from self.rate_limiter, which bounds
+        concurrency (AIMD) and request rate for all coroutines using this client.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             url: Full API URL
@@ -186,6 +233,8 @@ class AzureDevOpsRESTClient:
             httpx.RequestError: For network errors after retries exhausted
         """
         last_error: Exception | None = None
+        # Merge auth headers with any provided headers (once, so retries keep them)
+        headers = {**self.auth_header, **kwargs.pop("headers", {})}
 
         for attempt in range(max_retries):
             try:
@@ -194,27 +243,31 @@ class AzureDevOpsRESTClient:
                 if tracker:
                     tracker.record_api_call()
 
-                async with AsyncSecureHTTPClient() as client:
-                    # Merge auth headers with any provided headers
-                    headers = {**self.auth_header, **kwargs.pop("headers", {})}
+                async with self.rate_limiter.slot() as slot:
+                    if tracker:
+                        tracker.record_rate_limiter(self.rate_limiter.snapshot())
 
-                    # Make HTTP request
-                    if method.upper() == "GET":
-                        response = await client.get(url, headers=headers, **kwargs)
-                    elif method.upper() == "POST":
-                        response = await client.post(url, headers=headers, **kwargs)
+                    if self._session is not None:
+                        response = await self._send(self._session, method, url, headers, **kwargs)
                     else:
-                        raise ValueError(f"Unsupported HTTP method: {method}")
+                        async with AsyncSecureHTTPClient(on_connection=self._record_connection) as client:
+                            response = await self._send(client, method, url, headers, **kwargs)
 
                     response.raise_for_status()
-                    return response.json()  # type: ignore[no-any-return]
+                    slot.observe(response.headers)
+
+                return response.json()  # type: ignore[no-any-return]
 
             except httpx.HTTPStatusError as e:
                 sleep_secs = self._classify_http_error(e, attempt, tracker, max_retries)
                 if sleep_secs is None:
                     raise
-                await asyncio.sleep(sleep_secs)
                 last_error = e
+                if e.response.status_code == 429:
+                    # Pause all in-flight work together; the next acquire() waits it out
+                    self.rate_limiter.throttle(sleep_secs)
+                else:
+                    await asyncio.sleep(sleep_secs)
                 continue
 
             except (httpx.TimeoutException, httpx.RequestError) as e:
@@ -231,6 +284,17 @@ class AzureDevOpsRESTClient:
 
         raise RuntimeError("Unexpected: No error but retries exhausted")
 
+    @staticmethod
+    async def _send(
+        client: AsyncSecureHTTPClient, method: str, url: str, headers: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        """Dispatch a single request on the given HTTP client."""
+        if method.upper() == "GET":
+            return await client.get(url, headers=headers, **kwargs)
+        if method.upper() == "POST":
+            return await client.post(url, headers=headers, **kwargs)
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
     # ==============================
     # Work Item Tracking APIs
     # ==============================
@@ -541,6 +605,7 @@ class AzureDevOpsRESTClient:
         from_date: str | None = None,
         to_date: str | None = None,
         top: int = 1000,
+        skip: int = 0,
     ) -> dict[str, Any]:
         """
         Get commits for repository.
@@ -553,6 +618,7 @@ class AzureDevOpsRESTClient:
             from_date: Optional start date filter (ISO 8601)
             to_date: Optional end date filter (ISO 8601)
             top: Maximum commits to return (default 1000; ADO default is 100)
+            skip: Number of commits to skip (for paging through long histories)
 
         Returns:
             Commits response:
@@ -572,6 +638,8 @@ class AzureDevOpsRESTClient:
             params["searchCriteria.fromDate"] = from_date
         if to_date:
             params["searchCriteria.toDate"] = to_date
+        if skip:
+            params["$skip"] = skip
 
         url = self._build_url(project, f"git/repositories/{repository_id}/commits", **params)
         return await self._handle_api_call("GET", url)
@@ -640,7 +708,8 @@ def get_ado_rest_client() -> AzureDevOpsRESTClient:
     """
     Get Azure DevOps REST client with credentials from config.
 
-    Loads credentials from environment variables via secure_config.
+    Loads credentials from environment variables via secure_config. All clients
+    for the same organization share one AdaptiveRateLimiter.
 
     Returns:
         AzureDevOpsRESTClient: Authenticated REST client
@@ -649,8 +718,12 @@ def get_ado_rest_client() -> AzureDevOpsRESTClient:
         ValueError: If AZURE_DEVOPS_ORG_URL or AZURE_DEVOPS_PAT are not set
 
     Example:
-        client = get_ado_rest_client()
-        result = await client.query_by_wiql(project="MyProject", wiql_query="SELECT [System.Id] FROM WorkItems")
+        async with get_ado_rest_client() as client:
+            result = await client.query_by_wiql(project="MyProject", wiql_query="SELECT [System.Id] FROM WorkItems")
     """
     ado_config = get_config().get_ado_config()
-    return AzureDevOpsRESTClient(organization_url=ado_config.organization_url, pat=ado_config.pat)
+    return AzureDevOpsRESTClient(
+        organization_url=ado_config.organization_url,
+        pat=ado_config.pat,
+        rate_limiter=get_org_rate_limiter(ado_config.organization_url),
+    )
@@ -19,9 +19,12 @@ Usage:
     # Result: [{"System.Id": 1001, ...}]
 """
 
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
+from execution.collectors.work_item_frame import WorkItemFrame
+
 
 class WorkItemReference:
     """
@@ -175,6 +178,39 @@ class WorkItemTransformer:
             items.append(fields)
         return items
 
+    @staticmethod
+    def to_frame(items: Sequence[dict[str, Any]]) -> WorkItemFrame:
+        """
+        Wrap transformed work items in a columnar WorkItemFrame.
+
+        Timestamp columns are parsed once, on first use, and shared by every
+        calculation the frame is passed to.
+
+        Args:
+            items: Work item field dicts (output of transform_work_items_response)
+
+        Returns:
+            WorkItemFrame over items
+
+        Example:
+            frame = WorkItemTransformer.to_frame(closed_items)
+            lead_time = calculate_lead_time(frame)
+        """
+        return WorkItemFrame(items)
+
+    @staticmethod
+    def transform_work_items_frame(rest_response: dict[str, Any]) -> WorkItemFrame:
+        """
+        Transform a work items REST response straight to a WorkItemFrame.
+
+        Args:
+            rest_response: Raw REST API response dict
+
+        Returns:
+            WorkItemFrame over the transformed field dicts
+        """
+        return WorkItemFrame(WorkItemTransformer.transform_work_items_response(rest_response))
+
 
 class BuildTransformer:
     """
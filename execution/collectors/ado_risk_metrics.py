@@ -15,17 +15,24 @@ Migrated to Azure DevOps REST API v7.1 (replaces SDK).
 
 import asyncio
 import json
-import os
 import sys
 from collections import Counter, defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # Load environment variables
 from dotenv import load_dotenv
 
 from execution.collectors.ado_rest_client import AzureDevOpsRESTClient, get_ado_rest_client
-from execution.collectors.ado_rest_transformers import GitTransformer
+from execution.collectors.detail_cache import detail_limit, fetch_detail, use_detail_cache
+from execution.collectors.git_activity_index import (
+    get_current_git_activity_index,
+    list_repositories,
+    load_repo_commits,
+    use_git_activity_index,
+)
+from execution.collectors.run_snapshot import save_snapshot_section
 from execution.core.collector_metrics import track_collector_performance
+from execution.core.history_store import HistoryStore
 from execution.core.logging_config import get_logger
 from execution.domain.constants import flow_metrics, sampling_config
 from execution.secure_config import get_config
@@ -100,13 +107,27 @@ async def _fetch_commit_changes(
         Tuple of (change_count, file_paths)
         Returns (0, []) on any error
     """
+    index = get_current_git_activity_index()
+    if index is not None:
+        indexed = index.get_changes(project_name, repo_id, commit_id)
+        if indexed is not None:
+            return indexed
+
     try:
-        # Get changes via REST API
-        changes = await rest_client.get_changes(project=project_name, repository_id=repo_id, commit_id=commit_id)
+        # Get changes via REST API (commits are immutable - served from the detail cache when active)
+        changes = await fetch_detail(
+            "commit_changes",
+            project_name,
+            repo_id,
+            commit_id,
+            lambda: rest_client.get_changes(project=project_name, repository_id=repo_id, commit_id=commit_id),
+        )
 
         change_count = len(changes.get("changes", [])) if changes else 0
         file_paths = _extract_file_paths_from_changes(changes)
 
+        if index is not None:
+            index.put_changes(project_name, repo_id, commit_id, change_count, file_paths)
         return change_count, file_paths
 
     except Exception as e:
@@ -136,20 +157,15 @@ async def query_recent_commits(
     Returns:
         List of commits with file changes
     """
-    since_date = datetime.now() - timedelta(days=days)
-
     try:
-        # Query commits via REST API
-        response = await rest_client.get_commits(
-            project=project_name, repository_id=repo_id, from_date=since_date.isoformat() + "Z"
-        )
-
-        # Transform to simplified format
-        commits = GitTransformer.transform_commits_response(response)
+        # Commit log for the period (shared with the ownership collector via the git activity index)
+        commits = await load_repo_commits(rest_client, project_name, repo_id, days)
 
         # Fetch file changes concurrently for sample commits (PARALLEL EXECUTION)
-        # Note: COMMIT_DETAIL_LIMIT (line below) limits expensive file-detail API calls
-        sample_limit = min(sampling_config.COMMIT_DETAIL_LIMIT, len(commits))
+        # Note: COMMIT_DETAIL_LIMIT (line below) limits expensive file-detail API calls;
+        # the cap is higher while the detail cache makes repeat fetches free
+        detail_cap = detail_limit(sampling_config.COMMIT_DETAIL_LIMIT, sampling_config.CACHED_COMMIT_DETAIL_LIMIT)
+        sample_limit = min(detail_cap, len(commits))
 
         # Create tasks for commits that need file details
         change_tasks = [
@@ -355,8 +371,7 @@ async def collect_risk_metrics_for_project(rest_client: AzureDevOpsRESTClient, p
 
     # Get repositories via REST API
     try:
-        repos_response = await rest_client.get_repositories(project=ado_project_name)
-        repos = GitTransformer.transform_repositories_response(repos_response)
+        repos = await list_repositories(rest_client, ado_project_name)
         logger.info(f"Found {len(repos)} repositories", extra={"project_name": project_name, "repo_count": len(repos)})
         print(f"    Found {len(repos)} repositories")
     except Exception as e:
@@ -478,33 +493,24 @@ def save_risk_metrics(metrics: dict, output_file: str = ".tmp/observatory/risk_h
     """
     Save risk metrics to history file.
 
-    Appends to existing history or creates new file.
+    Appends one week to the history store (see execution/core/history_store.py).
     Validates data before saving to prevent persisting collection failures.
     """
-    from execution.utils_atomic_json import atomic_json_save, load_json_with_recovery
+    # Full payload, detail lists included, for this run's dashboard generators
+    if metrics.get("projects"):
+        save_snapshot_section("risk", metrics)
 
     if _validate_risk_data(metrics) is None:
         return False
 
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-
-    history = load_json_with_recovery(output_file, default_value={"weeks": []})
-
-    if not isinstance(history, dict) or "weeks" not in history:
-        print("\n[WARNING] Existing history file has invalid structure - recreating")
-        history = {"weeks": []}
-
     stripped_projects = [_strip_detail_lists_for_history(p) for p in metrics.get("projects", [])]
     history_entry = {**metrics, "projects": stripped_projects}
 
-    history["weeks"].append(history_entry)
-    history["weeks"] = history["weeks"][-52:]
-
     try:
-        atomic_json_save(history, output_file)
-        logger.info("Risk metrics saved", extra={"file": output_file, "week_count": len(history["weeks"])})
+        week_count = HistoryStore(output_file).append(history_entry, retain=52)
+        logger.info("Risk metrics saved", extra={"file": output_file, "week_count": week_count})
         print(f"\n[SAVED] Risk metrics saved to: {output_file}")
-        print(f"        History now contains {len(history['weeks'])} week(s)")
+        print(f"        History now contains {week_count} week(s)")
         return True
     except (OSError, PermissionError) as e:
         print(f"\n[ERROR] Failed to save Risk metrics: {e}")
@@ -522,7 +528,7 @@ def save_risk_metrics(metrics: dict, output_file: str = ".tmp/observatory/risk_h
 class RiskCollector:
     """Risk metrics collector using BaseCollector infrastructure"""
 
-    def __init__(self):
+    def __init__(self, rest_client: AzureDevOpsRESTClient | None = None):
         from execution.collectors.base import BaseCollector
 
         class _BaseHelper(BaseCollector):
@@ -532,7 +538,7 @@ class RiskCollector:
             def save_metrics(self, results):
                 pass
 
-        self._base = _BaseHelper(name="risk", lookback_days=90)
+        self._base = _BaseHelper(name="risk", lookback_days=90, rest_client=rest_client)
         self.config = self._base.config
 
     async def run(self) -> bool:
@@ -553,7 +559,9 @@ class RiskCollector:
             print("=" * 60)
 
             tasks = [collect_risk_metrics_for_project(rest_client, project, self.config) for project in projects]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            async with rest_client:  # one pooled HTTP session for the whole run
+                with use_detail_cache(), use_git_activity_index():
+                    results = await asyncio.gather(*tasks, return_exceptions=True)
 
             project_metrics: list[dict] = []
             for project, result in zip(projects, results, strict=True):
@@ -0,0 +1,177 @@
+"""
+Run Cache for ArmorCode AQL count queries
+
+The security collector, the exploitable collector and the security dashboard
+builders all ask the AQL count endpoint for the same per-product matrices
+(Critical/High in Production, per source bucket, ...). Within one refresh
+the answers cannot meaningfully change, so each distinct AQL query is sent
+once per run and its {product_id: count} result is shared.
+
+Collectors and dashboard builders run as separate processes, so the cache is
+a small JSON file stamped with a run ID. refresh_all_dashboards.py exports
+OBSERVATORY_RUN_ID to every step it launches; entries written under another
+run ID are ignored. Without a run ID the cache only lives in memory for the
+current process.
+
+The cache is opt-in, like the detail cache: entry points enable it with
+use_aql_count_cache(). Without an active cache every count goes to the API.
+
+Usage:
+    from execution.collectors.aql_count_cache import use_aql_count_cache
+
+    with use_aql_count_cache():
+        counts = loader.count_matrix_aql(["Critical", "High"], hierarchy)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+
+from execution.core import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_PATH = Path(".tmp/observatory/aql_count_cache.json")
+
+# Environment variable carrying the refresh run ID (set by refresh_all_dashboards.py)
+RUN_ID_ENV = "OBSERVATORY_RUN_ID"
+
+
+def aql_key(aql: str) -> str:
+    """
+    Cache key of one count query.
+
+    Args:
+        aql: Complete AQL filter string (includes severity, scope and hierarchy)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(aql.encode("utf-8")).hexdigest()
+
+
+class AqlCountCache:
+    """
+    Per-run cache of AQL count results, optionally persisted for other processes.
+
+    Attributes:
+        path: JSON file shared by the processes of one run
+        run_id: Run the entries belong to (None: in-memory only)
+        hits: Queries answered from the cache during this process
+        misses: Queries sent to the API during this process
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_CACHE_PATH, run_id: str | None = None):
+        """
+        Open the cache, loading entries written earlier in the same run.
+
+        Args:
+            path: JSON file path (default: .tmp/observatory/aql_count_cache.json)
+            run_id: Run ID; entries from other runs are discarded
+        """
+        self.path = Path(path)
+        self.run_id = run_id
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, int]] = self._read_entries()
+
+    def _read_entries(self) -> dict[str, dict[str, int]]:
+        """Entries on disk for this run ({} if none, unreadable or from another run)."""
+        if self.run_id is None or not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable AQL count cache {self.path}: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("run_id") != self.run_id:
+            return {}
+        entries = data.get("entries", {})
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, aql: str) -> dict[str, int] | None:
+        """
+        Return the cached counts for a query (None if not cached).
+
+        Args:
+            aql: AQL filter string
+        """
+        with self._lock:
+            counts = self._entries.get(aql_key(aql))
+        return dict(counts) if counts is not None else None
+
+    def put_many(self, results: dict[str, dict[str, int]]) -> None:
+        """
+        Store results and, when a run ID is set, merge them into the run file.
+
+        Args:
+            results: AQL filter string -> {product_id: count}
+        """
+        if not results:
+            return
+        with self._lock:
+            self._entries.update({aql_key(aql): dict(counts) for aql, counts in results.items()})
+            if self.run_id is not None:
+                self._save()
+
+    def _save(self) -> None:
+        """Merge entries with those other processes wrote and replace the file atomically."""
+        merged = {**self._read_entries(), **self._entries}
+        self._entries = merged
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"run_id": self.run_id, "entries": merged}), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+# Active cache for the current run (set by use_aql_count_cache)
+_current_cache: AqlCountCache | None = None
+
+
+def get_current_aql_count_cache() -> AqlCountCache | None:
+    """
+    Get the cache enabled for the current run.
+
+    Returns:
+        Active AqlCountCache or None if count caching is not enabled
+    """
+    return _current_cache
+
+
+@contextmanager
+def use_aql_count_cache(
+    path: Path | str = DEFAULT_CACHE_PATH, run_id: str | None = None
+) -> Generator[AqlCountCache, None, None]:
+    """
+    Enable the AQL count cache for the duration of a collector or dashboard run.
+
+    Re-entrant: nested calls reuse the already active cache.
+
+    Args:
+        path: JSON file path
+        run_id: Run ID (default: $OBSERVATORY_RUN_ID; unset means in-memory only)
+
+    Yields:
+        Active AqlCountCache
+    """
+    global _current_cache
+
+    if _current_cache is not None:
+        yield _current_cache
+        return
+
+    cache = AqlCountCache(path, run_id=run_id if run_id is not None else os.environ.get(RUN_ID_ENV))
+    _current_cache = cache
+    try:
+        yield cache
+    finally:
+        logger.info(
+            "AQL count cache run summary",
+            extra={"hits": cache.hits, "misses": cache.misses, "run_id": cache.run_id, "path": str(cache.path)},
+        )
+        _current_cache = None
@@ -11,7 +11,8 @@ Products are resolved from data/armorcode_id_map.json (written from ARMORCODE_ID
 GitHub secret). No GraphQL calls required.
 
 Uses POST /user/findings/groups/count with aggField=product — returns exact counts
-per product in a single API call per severity. No pagination required.
+per product in a single API call per severity. No pagination required. The three
+severity calls are sent together through ArmorCodeVulnerabilityLoader.count_matrix_aql().
 
 Saves results to .tmp/observatory/exploitable_history.json as weekly snapshots.
 
@@ -21,15 +22,16 @@ Usage:
 
 import json
 import logging
-import time
 from datetime import datetime
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+from execution.collectors.aql_count_cache import use_aql_count_cache
+from execution.collectors.armorcode_vulnerability_loader import AqlCountScope, ArmorCodeVulnerabilityLoader
 from execution.core import get_logger
+from execution.core.history_store import HistoryStore
 from execution.domain.security import SOURCE_BUCKET_MAP
-from execution.http_client import post
 from execution.secure_config import get_config
 
 load_dotenv()
@@ -42,17 +44,6 @@ ID_MAP_PATH = Path("data/armorcode_id_map.json")
 SEVERITIES = ["Critical", "High", "Medium"]
 
 
-def _get_headers() -> dict:
-    """Build ArmorCode API auth headers."""
-    api_key = get_config().get_armorcode_config().api_key
-    return {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-
-
-def _get_count_url() -> str:
-    base_url = get_config().get_armorcode_config().base_url
-    return f"{base_url.rstrip('/')}/user/findings/groups/count"
-
-
 def _load_id_map() -> dict[str, str]:
     """
     Load product name → ID mapping from data/armorcode_id_map.json.
@@ -70,59 +61,31 @@ def _load_id_map() -> dict[str, str]:
     return result
 
 
-def _count_by_severity(severity: str, hierarchy: str) -> dict[str, int]:
+def _count_by_severity(hierarchy: str) -> dict[str, dict[str, int]]:
     """
-    Fetch exploitable (isCISAKEV=true) counts grouped by product for one severity.
+    Fetch exploitable (isCISAKEV=true) counts grouped by product for every severity.
 
-    Uses POST /user/findings/groups/count with aggField=product.
-    Returns a single result per product — no pagination required.
+    Uses POST /user/findings/groups/count with aggField=product via the
+    vulnerability loader: one request per severity, sent together, and answered
+    from the run's AQL count cache when another step already asked.
 
     Args:
-        severity: "Critical", "High", or "Medium"
         hierarchy: ArmorCode hierarchy value (e.g. "access group/legal")
 
     Returns:
-        Dict mapping product_id_str -> count
+        Dict mapping severity -> product_id_str -> count
     """
-    url = _get_count_url()
-    headers = _get_headers()
-    sources = ",".join(f"'{s}'" if " " in s or "-" in s else s for s in SOURCE_BUCKET_MAP.keys())
-    aql = (
-        f"source IN ({sources})"
-        f" AND severity = {severity} AND isCISAKEV = true"
-        f" AND assetCloudProviders IN (aws,azure)"
-        f" AND status IN (Open,Confirm)"
-        f" AND hierarchy = 'armorcode.group:{hierarchy}'"
-    )
-    payload = {
-        "aggField": "product",
-        "filters": {"aqlQuery": [aql]},
-        "ignoreDuplicate": True,
-        "ignoreMitigated": None,
-    }
-
-    while True:
-        try:
-            resp = post(url, headers=headers, json=payload, timeout=30)
-        except Exception as e:
-            logger.error(f"  [{severity}] Request failed: {e}")
-            return {}
-
-        if resp.status_code == 429:
-            retry_after = int(resp.headers.get("Retry-After", 60))
-            logger.warning(f"  Rate limited — waiting {retry_after}s")
-            time.sleep(retry_after)
-            continue
-
-        if resp.status_code != 200:
-            logger.error(f"  [{severity}] HTTP {resp.status_code}: {resp.text[:200]}")
-            return {}
-
-        data = resp.json()
-        counts = {k: v.get("count", 0) for k, v in data.items() if isinstance(v, dict)}
-        total = sum(counts.values())
-        logger.info(f"  {severity}: {total} exploitable (across {len(counts)} products)")
-        return counts
+    scope = AqlCountScope(sources=list(SOURCE_BUCKET_MAP.keys()), asset_cloud_providers=["aws", "azure"], cisa_kev=True)
+    loader = ArmorCodeVulnerabilityLoader()
+    counts = loader.count_matrix_aql(SEVERITIES, hierarchy, environment=None, scopes={"exploitable": scope})
+    by_severity = counts.get("exploitable", {})
+
+    for severity in SEVERITIES:
+        severity_counts = by_severity.get(severity, {})
+        logger.info(
+            f"  {severity}: {sum(severity_counts.values())} exploitable (across {len(severity_counts)} products)"
+        )
+    return {severity: by_severity.get(severity, {}) for severity in SEVERITIES}
 
 
 def collect_exploitable_metrics() -> dict:
@@ -151,9 +114,10 @@ def collect_exploitable_metrics() -> dict:
     id_to_name = {v: k for k, v in name_to_id.items()}
     logger.info(f"Loaded {len(name_to_id)} products from {ID_MAP_PATH}")
 
-    critical_counts = _count_by_severity("Critical", hierarchy)
-    high_counts = _count_by_severity("High", hierarchy)
-    medium_counts = _count_by_severity("Medium", hierarchy)
+    counts = _count_by_severity(hierarchy)
+    critical_counts = counts["Critical"]
+    high_counts = counts["High"]
+    medium_counts = counts["Medium"]
 
     product_breakdown: dict[str, dict] = {}
     total_critical = 0
@@ -197,17 +161,7 @@ def collect_exploitable_metrics() -> dict:
 
 def _save_to_history(week_data: dict) -> None:
     """Save week_data to exploitable_history.json, replacing any existing entry for the same week_date."""
-    HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
-
-    if HISTORY_PATH.exists():
-        history = json.loads(HISTORY_PATH.read_text(encoding="utf-8"))
-    else:
-        history = {"weeks": []}
-
-    week_date = week_data["week_date"]
-    history["weeks"] = [w for w in history["weeks"] if w["week_date"] != week_date]
-    history["weeks"].append(week_data)
-    HISTORY_PATH.write_text(json.dumps(history, indent=2), encoding="utf-8")
+    HistoryStore(HISTORY_PATH).append(week_data, replace_same_week=True)
     logger.info(f"Saved exploitable history to {HISTORY_PATH}")
 
 
@@ -221,7 +175,8 @@ def main() -> None:
     logger.info("Exploitable Vulnerability Collector (AQL/CISA KEV)")
     logger.info("=" * 60)
 
-    week_data = collect_exploitable_metrics()
+    with use_aql_count_cache():
+        week_data = collect_exploitable_metrics()
     _save_to_history(week_data)
 
     sev = week_data["metrics"]["severity_breakdown"]
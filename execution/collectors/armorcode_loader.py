@@ -15,12 +15,12 @@ Usage:
         logger.info("Product metrics", extra={"product": product_name, "critical_high": metrics.critical_high_count})
 """
 
-import json
 import pathlib
 from datetime import datetime
 from typing import Optional
 
 # Structured logging
+from execution.core.history_store import history_exists, load_history
 from execution.core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -89,15 +89,14 @@ class ArmorCodeLoader:
                 if metric.has_critical:
                     print(f"ALERT: {product} has {metric.critical} critical vulns")
         """
-        if not self.history_file.exists():
+        if not history_exists(self.history_file):
             raise FileNotFoundError(
                 f"Security history file not found: {self.history_file}\n"
                 f"Run armorcode_weekly_query.py first to collect data."
             )
 
-        # Load JSON data
-        with open(self.history_file, encoding="utf-8") as f:
-            data = json.load(f)
+        # Load JSON data (latest week only)
+        data = load_history(self.history_file, last_n=1)
 
         # Validate structure
         if not data.get("weeks") or len(data["weeks"]) == 0:
@@ -143,11 +142,10 @@ class ArmorCodeLoader:
             weeks = loader.load_all_weeks()
             print(f"Loaded {len(weeks)} weeks of history")
         """
-        if not self.history_file.exists():
+        if not history_exists(self.history_file):
             raise FileNotFoundError(f"History file not found: {self.history_file}")
 
-        with open(self.history_file, encoding="utf-8") as f:
-            data: dict = json.load(f)
+        data: dict = load_history(self.history_file)
 
         weeks: list[dict] = data.get("weeks", [])
         return weeks
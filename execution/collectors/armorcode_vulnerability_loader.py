@@ -10,17 +10,30 @@ Usage:
 
     loader = ArmorCodeVulnerabilityLoader()
     vulnerabilities = loader.load_vulnerabilities_for_products(['Product1', 'Product2'])
+
+    # Per-product counts for a severity × scope matrix in one concurrent batch
+    counts = loader.count_matrix_aql(['Critical', 'High'], hierarchy, scopes={'code': AqlCountScope(sources=[...])})
+
+    # Findings for many (product, bucket) scopes, fetched concurrently under one rate budget
+    records = loader.fetch_findings_batch_aql(hierarchy, {('Product1', 'CODE'): AqlFindingsScope(product_id='1')})
 """
 
+import asyncio
 import logging
 import os
 import time
+from collections.abc import Hashable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 
 import httpx
 from dotenv import load_dotenv
 
+from execution.async_http_client import AsyncSecureHTTPClient
+from execution.collectors.ado_rate_limiter import AdaptiveRateLimiter
+from execution.collectors.aql_count_cache import get_current_aql_count_cache
+from execution.domain.constants import api_config
 from execution.http_client import post
 from execution.secure_config import get_config
 from execution.utils.datetime_utils import parse_ado_timestamp
@@ -66,6 +79,24 @@ class VulnerabilityDetail:
         return bool(self.environment and self.environment.upper() == "PRODUCTION")
 
 
+@dataclass(frozen=True)
+class AqlCountScope:
+    """Filter scope of one row of an AQL count matrix (see count_matrix_aql)"""
+
+    sources: list[str] | None = None  # Source tools (AND source IN (...))
+    asset_cloud_providers: list[str] | None = None  # e.g. ["aws", "azure"]
+    cisa_kev: bool = False  # Only CISA known-exploited findings
+
+
+@dataclass(frozen=True)
+class AqlFindingsScope:
+    """Filter scope of one findings fetch in a batch (see fetch_findings_batch_aql)"""
+
+    product_id: str | None = None  # Single ArmorCode product (AND product = ...)
+    sources: list[str] | None = None  # Source tools (default: every source in SOURCE_BUCKET_MAP)
+    cisa_kev: bool = False  # Only CISA known-exploited findings
+
+
 class ArmorCodeVulnerabilityLoader:
     """
     Loads detailed vulnerability information from ArmorCode GraphQL API.
@@ -125,7 +156,6 @@ class ArmorCodeVulnerabilityLoader:
                 continue
             product_id = product_id_map[product_name]
             print(f"[INFO] Querying findings for: {product_name}")
-            time.sleep(1)
             fetched, _ = self._fetch_product_pages(product_id, product_name, max_pages=100)
             all_vulnerabilities.extend(fetched)
 
@@ -342,7 +372,6 @@ class ArmorCodeVulnerabilityLoader:
 
             product_id = product_id_map[product_name]
             print(f"[INFO] Querying findings for: {product_name}")
-            time.sleep(1)
 
             bucket_counts_by_product[product_name] = None  # Computed by caller via AQL
 
@@ -453,8 +482,13 @@ class ArmorCodeVulnerabilityLoader:
             f" AND hierarchy = 'armorcode.group:{hierarchy}'"
         )
 
-    def _execute_count_aql(self, aql: str, error_context: str) -> dict[str, int]:
-        """Execute an AQL count query and return product_id -> count mapping."""
+    def _post_count_aql(self, aql: str, error_context: str, max_retries: int = 3) -> dict[str, int] | None:
+        """
+        POST one AQL count query, retrying on HTTP 429.
+
+        Returns:
+            product_id -> count mapping, or None if the request failed
+        """
         count_url = f"{(self.base_url or '').rstrip('/')}/user/findings/groups/count"
         headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
         payload = {
@@ -463,15 +497,146 @@ class ArmorCodeVulnerabilityLoader:
             "ignoreDuplicate": True,
             "ignoreMitigated": None,
         }
-        try:
-            resp = post(count_url, headers=headers, json=payload, timeout=30)
+        retry_count = 0
+        while True:
+            try:
+                resp = post(count_url, headers=headers, json=payload, timeout=30)
+            except Exception as e:
+                print(f"[ERROR] {error_context}: {e}")
+                return None
+            if resp.status_code == 429:
+                retry_count += 1
+                if self._handle_rate_limit(resp, retry_count, max_retries, "AQL count"):
+                    continue
+                return None
             if resp.status_code == 200:
                 data = resp.json()
                 return {k: v.get("count", 0) for k, v in data.items() if isinstance(v, dict)}
             print(f"[ERROR] AQL count HTTP {resp.status_code}: {resp.text[:200]}")
-        except Exception as e:
-            print(f"[ERROR] {error_context}: {e}")
-        return {}
+            return None
+
+    def _execute_count_aql(self, aql: str, error_context: str) -> dict[str, int]:
+        """Execute an AQL count query and return product_id -> count mapping ({} on failure)."""
+        return self._execute_count_queries({aql: aql}, {aql: error_context})[aql]
+
+    def _execute_count_queries(
+        self, queries: dict[Hashable, str], error_contexts: dict[Hashable, str] | None = None
+    ) -> dict[Hashable, dict[str, int]]:
+        """
+        Execute a batch of AQL count queries concurrently, once per distinct query.
+
+        Queries already answered in this run (see aql_count_cache) are not sent
+        again; successful answers are added to the run cache. Failed queries
+        yield {} and are not cached.
+
+        Args:
+            queries: Cell key -> AQL filter string
+            error_contexts: Optional cell key -> message prefix for failures
+
+        Returns:
+            Cell key -> {product_id: count}
+        """
+        cache = get_current_aql_count_cache()
+        context_by_aql = {queries[key]: context for key, context in (error_contexts or {}).items()}
+        answers: dict[str, dict[str, int]] = {}
+        to_fetch: list[str] = []
+        for aql in dict.fromkeys(queries.values()):
+            cached = cache.get(aql) if cache is not None else None
+            if cache is not None and cached is not None:
+                cache.hits += 1
+                answers[aql] = cached
+            else:
+                to_fetch.append(aql)
+
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=min(len(to_fetch), api_config.ARMORCODE_MAX_CONCURRENCY)) as pool:
+                fetched = list(
+                    pool.map(
+                        lambda aql: self._post_count_aql(aql, context_by_aql.get(aql, "AQL count query failed")),
+                        to_fetch,
+                    )
+                )
+            succeeded = {aql: counts for aql, counts in zip(to_fetch, fetched, strict=True) if counts is not None}
+            if cache is not None:
+                cache.misses += len(to_fetch)
+                cache.put_many(succeeded)
+            answers.update({aql: succeeded.get(aql, {}) for aql in to_fetch})
+
+        return {key: dict(answers[aql]) for key, aql in queries.items()}
+
+    def _severity_count_aql(
+        self,
+        severity: str,
+        hierarchy: str,
+        environment: str | None,
+        sources: list[str] | None = None,
+        asset_cloud_providers: list[str] | None = None,
+        cisa_kev: bool = False,
+    ) -> str:
+        """Build the AQL filter for one severity of a (sources, cloud providers, KEV) scope."""
+        source_clause = ""
+        if sources:
+            source_list = ",".join(self._fmt_aql_value(s) for s in sources)
+            source_clause = f" AND source IN ({source_list})"
+        cloud_clause = ""
+        if asset_cloud_providers:
+            cloud_clause = f" AND assetCloudProviders IN ({','.join(asset_cloud_providers)})"
+        kev_clause = " AND isCISAKEV = true" if cisa_kev else ""
+
+        return self._build_count_aql(
+            severity_clause=f"severity = {severity}{kev_clause}",
+            hierarchy=hierarchy,
+            environment=environment,
+            source_clause=source_clause,
+            cloud_clause=cloud_clause,
+        )
+
+    def count_matrix_aql(
+        self,
+        severities: list[str],
+        hierarchy: str,
+        environment: str | None = "Production",
+        scopes: dict[str, AqlCountScope] | None = None,
+    ) -> dict[str, dict[str, dict[str, int]]]:
+        """
+        Count findings by product for a whole scope × severity matrix.
+
+        The count endpoint aggregates on a single field (product), so each
+        matrix cell is one AQL request. All cells are sent concurrently in one
+        batch, identical cells are sent once, and cells already counted in this
+        run (by a collector or another dashboard builder) are taken from the
+        active aql_count_cache.
+
+        Args:
+            severities: Severities to count (e.g. ["Critical", "High"])
+            hierarchy: ArmorCode hierarchy value (from ARMORCODE_HIERARCHY env var)
+            environment: Environment filter (default "Production"); None for all environments
+            scopes: Scope name -> AqlCountScope (default: one unfiltered scope named "all")
+
+        Returns:
+            Dict mapping scope name -> severity -> {product_id_str: count}
+        """
+        if not self.api_key or not self.base_url:
+            print("[WARNING] ArmorCode API not configured")
+            return {}
+
+        scopes = scopes if scopes is not None else {"all": AqlCountScope()}
+        queries: dict[Hashable, str] = {}
+        error_contexts: dict[Hashable, str] = {}
+        for name, scope in scopes.items():
+            for severity in severities:
+                queries[(name, severity)] = self._severity_count_aql(
+                    severity,
+                    hierarchy,
+                    environment,
+                    sources=scope.sources,
+                    asset_cloud_providers=scope.asset_cloud_providers,
+                    cisa_kev=scope.cisa_kev,
+                )
+                error_contexts[(name, severity)] = f"AQL count query failed for scope={name} severity={severity}"
+
+        counts = self._execute_count_queries(queries, error_contexts)
+        return {name: {severity: counts[(name, severity)] for severity in severities} for name in scopes}
 
     def count_by_severity_aql(
         self,
@@ -485,7 +650,8 @@ class ArmorCodeVulnerabilityLoader:
         Count findings by product using the AQL count endpoint.
 
         Single API call per severity — no pagination, no per-product iteration.
-        Returns exact counts grouped by product ID.
+        Returns exact counts grouped by product ID. Prefer count_matrix_aql()
+        when several severities or scopes are needed.
 
         Args:
             severity: "Critical" or "High"
@@ -504,21 +670,7 @@ class ArmorCodeVulnerabilityLoader:
             print("[WARNING] ArmorCode API not configured")
             return {}
 
-        source_clause = ""
-        if sources:
-            source_list = ",".join(self._fmt_aql_value(s) for s in sources)
-            source_clause = f" AND source IN ({source_list})"
-        cloud_clause = ""
-        if asset_cloud_providers:
-            cloud_clause = f" AND assetCloudProviders IN ({','.join(asset_cloud_providers)})"
-
-        aql = self._build_count_aql(
-            severity_clause=f"severity = {severity}",
-            hierarchy=hierarchy,
-            environment=environment,
-            source_clause=source_clause,
-            cloud_clause=cloud_clause,
-        )
+        aql = self._severity_count_aql(severity, hierarchy, environment, sources, asset_cloud_providers)
         return self._execute_count_aql(aql, f"AQL count query failed for severity={severity}")
 
     def count_by_bucket_aql(
@@ -623,6 +775,34 @@ class ArmorCodeVulnerabilityLoader:
             )
         return items
 
+    @staticmethod
+    def _aql_page_payload(aql: str, page: int, page_size: int) -> dict:
+        """Request body for one page of the AQL findings endpoint."""
+        return {
+            "size": page_size,
+            "page": page,
+            "sortColumns": [],
+            "filters": {"aqlQuery": [aql]},
+            "filterOperations": {},
+            "ignoreDuplicate": True,
+            "ignoreMitigated": None,
+            "ticketStatusRequired": True,
+        }
+
+    def _parse_aql_page_response(
+        self, resp: httpx.Response, page: int, page_size: int
+    ) -> tuple[list[VulnerabilityDetail], bool]:
+        """Parse a non-429 AQL findings response into (parsed_records, should_stop)."""
+        if resp.status_code != 200:
+            print(f"[ERROR] AQL findings HTTP {resp.status_code}: {resp.text[:200]}")
+            return [], True
+        data = resp.json()
+        content = data.get("content", [])
+        total = data.get("totalElements", "?")
+        print(f"[INFO] AQL findings page {page}: {len(content)} records (total={total})")
+        is_last = data.get("last", True) or len(content) < page_size
+        return self._parse_findings_page(content), is_last
+
     def _fetch_aql_page(
         self,
         url: str,
@@ -630,37 +810,44 @@ class ArmorCodeVulnerabilityLoader:
         aql: str,
         page: int,
         page_size: int,
+        max_retries: int = 3,
     ) -> tuple[list[VulnerabilityDetail], bool]:
-        """Fetch one page from the AQL findings endpoint.
+        """Fetch one page from the AQL findings endpoint, retrying on HTTP 429.
 
         Returns (parsed_records, should_stop). should_stop=True when pagination
         is exhausted or a non-retriable error occurs.
         """
-        payload = {
-            "size": page_size,
-            "page": page,
-            "sortColumns": [],
-            "filters": {"aqlQuery": [aql]},
-            "filterOperations": {},
-            "ignoreDuplicate": True,
-            "ignoreMitigated": None,
-            "ticketStatusRequired": True,
-        }
+        payload = self._aql_page_payload(aql, page, page_size)
+        retry_count = 0
         try:
-            resp = post(url, headers=headers, json=payload, timeout=60)
-            if resp.status_code != 200:
-                print(f"[ERROR] AQL findings HTTP {resp.status_code}: {resp.text[:200]}")
-                return [], True
-            data = resp.json()
-            content = data.get("content", [])
-            total = data.get("totalElements", "?")
-            print(f"[INFO] AQL findings page {page}: {len(content)} records (total={total})")
-            is_last = data.get("last", True) or len(content) < page_size
-            return self._parse_findings_page(content), is_last
+            while True:
+                resp = post(url, headers=headers, json=payload, timeout=60)
+                if resp.status_code != 429:
+                    return self._parse_aql_page_response(resp, page, page_size)
+                retry_count += 1
+                if not self._handle_rate_limit(resp, retry_count, max_retries, "AQL findings"):
+                    return [], True
         except Exception as e:
             print(f"[ERROR] AQL findings query failed page={page}: {e}")
             return [], True
 
+    def _findings_aql_query(
+        self,
+        hierarchy: str,
+        environment: str | None,
+        page_size: int,
+        scope: AqlFindingsScope,
+        severities: list[str] | None,
+    ) -> tuple[str, bool]:
+        """Build (aql, display_only) for one findings fetch; display_only stops after the first page."""
+        sev_list = severities if severities is not None else ["High", "Critical"]
+        severity_clause = ",".join(sev_list)
+        aql = self._build_aql_filter(
+            hierarchy, environment, scope.sources, severity_clause, scope.product_id, scope.cisa_kev
+        )
+        display_only = page_size <= 50 and (scope.sources is not None or scope.cisa_kev)
+        return aql, display_only
+
     def fetch_findings_aql(
         self,
         hierarchy: str,
@@ -699,14 +886,12 @@ class ArmorCodeVulnerabilityLoader:
             print("[WARNING] ArmorCode API not configured")
             return []
 
-        sev_list = severities if severities is not None else ["High", "Critical"]
-        severity_clause = ",".join(sev_list)
-        aql = self._build_aql_filter(hierarchy, environment, sources, severity_clause, product_id, cisa_kev)
+        scope = AqlFindingsScope(product_id=product_id, sources=sources, cisa_kev=cisa_kev)
+        aql, display_only = self._findings_aql_query(hierarchy, environment, page_size, scope, severities)
         url = f"{self.base_url.rstrip('/')}/user/findings/"
         headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
         results: list[VulnerabilityDetail] = []
         page = 0
-        display_only = page_size <= 50 and (sources is not None or cisa_kev)
 
         while True:
             page_results, is_last = self._fetch_aql_page(url, headers, aql, page, page_size)
@@ -718,6 +903,157 @@ class ArmorCodeVulnerabilityLoader:
         print(f"[SUCCESS] fetch_findings_aql: {len(results)} records fetched")
         return results
 
+    # ------------------------------------------------------------------
+    # Batched (concurrent) findings fetch
+    # ------------------------------------------------------------------
+
+    async def _post_aql_async(
+        self, client: AsyncSecureHTTPClient, limiter: AdaptiveRateLimiter, url: str, headers: dict, payload: dict
+    ) -> httpx.Response:
+        """POST one AQL findings page under the shared concurrency/rate budget."""
+        async with limiter.slot() as slot:
+            response = await client.post(url, headers=headers, json=payload, timeout=60)
+            if response.status_code == 429:
+                # Pause every request in the batch instead of sleeping in this one
+                limiter.throttle(float(response.headers.get("Retry-After", 60)))
+            else:
+                slot.observe(response.headers)
+            return response
+
+    async def _fetch_aql_page_async(
+        self,
+        client: AsyncSecureHTTPClient,
+        limiter: AdaptiveRateLimiter,
+        url: str,
+        headers: dict,
+        aql: str,
+        page: int,
+        page_size: int,
+        max_retries: int = 3,
+    ) -> tuple[list[VulnerabilityDetail], bool]:
+        """Async _fetch_aql_page(): same retry count and stop rules, 429 waits handled by the limiter."""
+        payload = self._aql_page_payload(aql, page, page_size)
+        retry_count = 0
+        try:
+            while True:
+                resp = await self._post_aql_async(client, limiter, url, headers, payload)
+                if resp.status_code != 429:
+                    return self._parse_aql_page_response(resp, page, page_size)
+                retry_count += 1
+                if retry_count > max_retries:
+                    print("  [ERROR] HTTP 429 - max retries exceeded for AQL findings")
+                    return [], True
+                print(f"  [RATE LIMIT] HTTP 429 - batch paused ({retry_count}/{max_retries})...")
+        except Exception as e:
+            print(f"[ERROR] AQL findings query failed page={page}: {e}")
+            return [], True
+
+    async def _fetch_findings_async(
+        self,
+        client: AsyncSecureHTTPClient,
+        limiter: AdaptiveRateLimiter,
+        url: str,
+        headers: dict,
+        aql: str,
+        page_size: int,
+        display_only: bool,
+    ) -> list[VulnerabilityDetail]:
+        """Async fetch_findings_aql() pagination for one scope."""
+        results: list[VulnerabilityDetail] = []
+        page = 0
+        while True:
+            page_results, is_last = await self._fetch_aql_page_async(
+                client, limiter, url, headers, aql, page, page_size
+            )
+            results.extend(page_results)
+            if is_last or display_only:
+                break
+            page += 1
+        return results
+
+    async def fetch_findings_batch_aql_async(
+        self,
+        hierarchy: str,
+        scopes: dict[Hashable, AqlFindingsScope],
+        environment: str | None = "Production",
+        page_size: int = 1000,
+        severities: list[str] | None = None,
+        max_concurrency: int = api_config.ARMORCODE_MAX_CONCURRENCY,
+        rate_per_second: float = api_config.ARMORCODE_RATE_PER_SECOND,
+    ) -> dict[Hashable, list[VulnerabilityDetail]]:
+        """
+        Fetch findings for many scopes concurrently; see fetch_findings_batch_aql().
+
+        Every scope is fetched on one pooled AsyncSecureHTTPClient session and
+        queued on one AdaptiveRateLimiter, which caps the requests in flight and
+        the sustained rate. A 429 pauses the whole batch for its Retry-After and
+        the page is retried, with the same retry limit as fetch_findings_aql().
+        """
+        if not self.api_key or not self.base_url:
+            print("[WARNING] ArmorCode API not configured")
+            return {}
+        if not scopes:
+            return {}
+
+        url = f"{self.base_url.rstrip('/')}/user/findings/"
+        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        limiter = AdaptiveRateLimiter(
+            initial_limit=max_concurrency, min_limit=1, max_limit=max_concurrency, rate_per_second=rate_per_second
+        )
+        async with AsyncSecureHTTPClient(max_connections=max_concurrency) as client:
+            fetches = []
+            for scope in scopes.values():
+                aql, display_only = self._findings_aql_query(hierarchy, environment, page_size, scope, severities)
+                fetches.append(self._fetch_findings_async(client, limiter, url, headers, aql, page_size, display_only))
+            results: list[list[VulnerabilityDetail]] = await asyncio.gather(*fetches)
+
+        logger.info("ArmorCode findings batch finished", extra=limiter.snapshot())
+        print(f"[SUCCESS] fetch_findings_batch_aql: {sum(map(len, results))} records fetched for {len(scopes)} scopes")
+        return dict(zip(scopes, results, strict=True))
+
+    def fetch_findings_batch_aql(
+        self,
+        hierarchy: str,
+        scopes: dict[Hashable, AqlFindingsScope],
+        environment: str | None = "Production",
+        page_size: int = 1000,
+        severities: list[str] | None = None,
+        max_concurrency: int = api_config.ARMORCODE_MAX_CONCURRENCY,
+        rate_per_second: float = api_config.ARMORCODE_RATE_PER_SECOND,
+    ) -> dict[Hashable, list[VulnerabilityDetail]]:
+        """
+        Fetch findings for many scopes at once (one fetch_findings_aql() per scope).
+
+        Replaces per-product/per-bucket loops of fetch_findings_aql() calls:
+        the scopes are fetched concurrently under one concurrency and rate
+        budget, and each scope gets exactly the records fetch_findings_aql()
+        would return for it. Must not be called from a running event loop
+        (use fetch_findings_batch_aql_async there).
+
+        Args:
+            hierarchy: ArmorCode hierarchy value (from ARMORCODE_HIERARCHY env var)
+            scopes: Caller key -> AqlFindingsScope (product, sources, CISA KEV)
+            environment: Environment filter (default "Production"). Pass None for all.
+            page_size: Records per page; <= 50 with sources or cisa_kev fetches the first page only
+            severities: Severity levels to include (default ["High", "Critical"])
+            max_concurrency: Maximum requests in flight (default: api_config.ARMORCODE_MAX_CONCURRENCY)
+            rate_per_second: Sustained request rate (default: api_config.ARMORCODE_RATE_PER_SECOND)
+
+        Returns:
+            Caller key -> matching VulnerabilityDetail records, in scope order
+        """
+        return asyncio.run(
+            self.fetch_findings_batch_aql_async(
+                hierarchy,
+                scopes,
+                environment=environment,
+                page_size=page_size,
+                severities=severities,
+                max_concurrency=max_concurrency,
+                rate_per_second=rate_per_second,
+            )
+        )
+
     def group_by_product(self, vulnerabilities: list[VulnerabilityDetail]) -> dict[str, list[VulnerabilityDetail]]:
         """
         Group vulnerabilities by product name.
@@ -237,7 +237,8 @@ async def main_quality():
 
     # Collect quality metrics concurrently
     config = {"lookback_days": 90}
-    project_metrics = await collector.collect_all_projects(projects, config, collector_type="quality")
+    async with rest_client:
+        project_metrics = await collector.collect_all_projects(projects, config, collector_type="quality")
 
     # Save results
     week_metrics = {
@@ -299,7 +300,8 @@ async def main_flow():
 
     # Collect flow metrics concurrently
     config = {"lookback_days": 90, "aging_threshold_days": 30}
-    project_metrics = await collector.collect_all_projects(projects, config, collector_type="flow")
+    async with rest_client:
+        project_metrics = await collector.collect_all_projects(projects, config, collector_type="flow")
 
     # Save results
     week_metrics = {
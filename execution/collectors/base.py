@@ -41,16 +41,19 @@ class BaseCollector(ABC):
     - save_metrics(): Persistence logic for collected metrics
     """
 
-    def __init__(self, name: str, lookback_days: int = 90):
+    def __init__(self, name: str, lookback_days: int = 90, rest_client: AzureDevOpsRESTClient | None = None):
         """Initialize collector with common configuration
 
         Args:
             name: Collector name (e.g., "ownership", "quality")
             lookback_days: How many days of history to collect
+            rest_client: Shared REST client to use instead of creating one
+                (set when several collectors run in one process)
         """
         self.name = name
         self.config = {"lookback_days": lookback_days}
         self.logger = get_logger(name)
+        self._rest_client = rest_client
         self.setup_platform()
 
     @staticmethod
@@ -108,12 +111,17 @@ class BaseCollector(ABC):
     def get_rest_client(self) -> AzureDevOpsRESTClient:
         """Get configured ADO REST client
 
+        Returns the shared client passed to the constructor, if any.
+
         Returns:
             Initialized AzureDevOpsRESTClient instance
 
         Raises:
             SystemExit: If client initialization fails
         """
+        if self._rest_client is not None:
+            return self._rest_client
+
         self.logger.info("Connecting to Azure DevOps REST API...")
         try:
             rest_client = get_ado_rest_client()
@@ -214,8 +222,9 @@ class BaseCollector(ABC):
             # Get REST client
             rest_client = self.get_rest_client()
 
-            # Collect metrics
-            results = await self.run_concurrent_collection(projects, self.collect, rest_client)
+            # Collect metrics over one pooled HTTP session
+            async with rest_client:
+                results = await self.run_concurrent_collection(projects, self.collect, rest_client)
 
             # Save results
             save_success = self.save_metrics(results)
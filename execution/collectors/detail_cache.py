@@ -0,0 +1,300 @@
+"""
+Persistent Detail Cache for immutable ADO objects
+
+Collaboration, risk and deployment metrics spend most of their REST calls on
+per-object detail requests: threads/iterations/commits of merged PRs, the
+file changes of a commit and the changes of a finished build. None of these
+can change once the PR is merged, the commit exists or the build has
+finished, so every response is cached on disk and re-used across runs.
+
+Entries are content-addressed: the key is a hash of
+(kind, project, repository, object ID), so the same object is stored once
+whichever collector asks for it. Payloads are zlib-compressed JSON, and the
+database is kept under a size budget by evicting the least recently used
+entries.
+
+Because repeat runs are nearly free, collectors sample more objects while a
+cache is active (see detail_limit() and the CACHED_* sampling constants).
+
+The cache is opt-in, like the work item store: collectors enable it for a
+run with use_detail_cache(). Without an active cache fetch_detail() calls
+straight through to the REST API.
+
+Usage:
+    from execution.collectors.detail_cache import fetch_detail, use_detail_cache
+
+    with use_detail_cache():
+        changes = await fetch_detail(
+            "commit_changes", project, repo_id, commit_id,
+            lambda: rest_client.get_changes(project=project, repository_id=repo_id, commit_id=commit_id),
+        )
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+from collections.abc import Awaitable, Callable, Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from execution.core import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_DB_PATH = Path(".tmp/observatory/detail_cache.db")
+
+# Upper bound for the stored (compressed) payloads; a year of detail for a
+# large organisation fits comfortably.
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# When over budget, evict down to this fraction so eviction doesn't run on every put
+_EVICT_TARGET = 0.9
+
+
+def detail_key(kind: str, project: str, scope: str, item_id: str | int) -> str:
+    """
+    Content address of one detail object.
+
+    Args:
+        kind: Detail type (e.g., "pr_threads", "commit_changes", "build_changes")
+        project: ADO project name
+        scope: Repository ID ("" for project-scoped objects such as builds)
+        item_id: PR ID, commit SHA or build ID
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    raw = json.dumps([kind, project, scope, str(item_id)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class DetailCache:
+    """
+    SQLite-backed, size-bounded cache of immutable REST detail responses.
+
+    Attributes:
+        db_path: Location of the SQLite database
+        max_bytes: Budget for stored (compressed) payload bytes
+        hits: Lookups served from the cache during this run
+        misses: Lookups that went to the REST API during this run
+        evictions: Entries evicted during this run
+    """
+
+    def __init__(self, db_path: Path | str = DEFAULT_DB_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (and create if needed) the detail cache.
+
+        Args:
+            db_path: SQLite file path (default: .tmp/observatory/detail_cache.db)
+            max_bytes: Budget for stored payload bytes; least recently used entries are evicted beyond it
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM details").fetchone()[0]
+
+    def _create_schema(self) -> None:
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS details (
+                key       TEXT    PRIMARY KEY,
+                kind      TEXT    NOT NULL,
+                payload   BLOB    NOT NULL,
+                size      INTEGER NOT NULL,
+                last_used REAL    NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_details_last_used ON details (last_used);
+        """)
+        self.conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    @property
+    def total_bytes(self) -> int:
+        """Stored payload bytes."""
+        return int(self._total_bytes)
+
+    def get(self, kind: str, project: str, scope: str, item_id: str | int) -> Any | None:
+        """
+        Return the cached response for an object (None if not cached).
+
+        Args:
+            kind: Detail type
+            project: ADO project name
+            scope: Repository ID ("" for project-scoped objects)
+            item_id: PR ID, commit SHA or build ID
+        """
+        key = detail_key(kind, project, scope, item_id)
+        row = self.conn.execute("SELECT payload FROM details WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self.conn.execute("UPDATE details SET last_used = ? WHERE key = ?", (time.time(), key))
+        self.conn.commit()
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, kind: str, project: str, scope: str, item_id: str | int, response: Any) -> None:
+        """
+        Store a response, evicting least recently used entries if over budget.
+
+        Args:
+            kind: Detail type
+            project: ADO project name
+            scope: Repository ID ("" for project-scoped objects)
+            item_id: PR ID, commit SHA or build ID
+            response: JSON-serialisable REST response
+        """
+        key = detail_key(kind, project, scope, item_id)
+        payload = zlib.compress(json.dumps(response, separators=(",", ":")).encode("utf-8"))
+        previous = self.conn.execute("SELECT size FROM details WHERE key = ?", (key,)).fetchone()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO details (key, kind, payload, size, last_used) VALUES (?, ?, ?, ?, ?)",
+            (key, kind, payload, len(payload), time.time()),
+        )
+        self.conn.commit()
+        self._total_bytes += len(payload) - (previous[0] if previous else 0)
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self, target_bytes: int | None = None) -> int:
+        """
+        Delete least recently used entries until stored payloads fit the target.
+
+        Args:
+            target_bytes: Size to shrink to (default: 90% of max_bytes)
+
+        Returns:
+            Number of entries evicted
+        """
+        target = int(self.max_bytes * _EVICT_TARGET) if target_bytes is None else target_bytes
+        if self._total_bytes <= target:
+            return 0
+
+        victims: list[tuple[str]] = []
+        remaining = self._total_bytes
+        for key, size in self.conn.execute("SELECT key, size FROM details ORDER BY last_used"):
+            if remaining <= target:
+                break
+            victims.append((key,))
+            remaining -= size
+
+        self.conn.executemany("DELETE FROM details WHERE key = ?", victims)
+        self.conn.commit()
+        self._total_bytes = remaining
+        self.evictions += len(victims)
+        return len(victims)
+
+
+# Active cache for the current run (set by use_detail_cache)
+_current_cache: DetailCache | None = None
+
+
+def get_current_detail_cache() -> DetailCache | None:
+    """
+    Get the cache enabled for the current run.
+
+    Returns:
+        Active DetailCache or None if detail caching is not enabled
+    """
+    return _current_cache
+
+
+def detail_limit(uncached: int, cached: int) -> int:
+    """
+    Sampling cap for detail fetches: the larger cap applies while a cache is active.
+
+    Args:
+        uncached: Cap without a cache (every object costs a REST call per run)
+        cached: Cap with a cache (objects seen in earlier runs cost nothing)
+    """
+    return cached if _current_cache is not None else uncached
+
+
+@contextmanager
+def use_detail_cache(
+    db_path: Path | str = DEFAULT_DB_PATH, max_bytes: int = DEFAULT_MAX_BYTES
+) -> Generator[DetailCache, None, None]:
+    """
+    Enable the detail cache for the duration of a collector run.
+
+    Re-entrant: nested calls reuse the already active cache.
+
+    Args:
+        db_path: SQLite file path
+        max_bytes: Budget for stored payload bytes
+
+    Yields:
+        Active DetailCache
+    """
+    global _current_cache
+
+    if _current_cache is not None:
+        yield _current_cache
+        return
+
+    cache = DetailCache(db_path, max_bytes=max_bytes)
+    _current_cache = cache
+    try:
+        yield cache
+    finally:
+        logger.info(
+            "Detail cache run summary",
+            extra={
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "evictions": cache.evictions,
+                "size_mb": round(cache.total_bytes / 1024 / 1024, 1),
+                "db": str(cache.db_path),
+            },
+        )
+        _current_cache = None
+        cache.close()
+
+
+async def fetch_detail(
+    kind: str,
+    project: str,
+    scope: str,
+    item_id: str | int,
+    fetch: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    Return an immutable detail response, from the active cache if possible.
+
+    Only successful responses are cached; exceptions from fetch propagate.
+
+    Args:
+        kind: Detail type (e.g., "pr_threads", "commit_changes", "build_changes")
+        project: ADO project name
+        scope: Repository ID ("" for project-scoped objects such as builds)
+        item_id: PR ID, commit SHA or build ID
+        fetch: Coroutine factory performing the REST call
+
+    Returns:
+        REST response (JSON)
+    """
+    cache = _current_cache
+    if cache is None:
+        return await fetch()
+
+    cached = cache.get(kind, project, scope, item_id)
+    if cached is not None:
+        cache.hits += 1
+        return cached
+
+    cache.misses += 1
+    response = await fetch()
+    if response is not None:
+        cache.put(kind, project, scope, item_id, response)
+    return response
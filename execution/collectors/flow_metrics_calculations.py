@@ -4,15 +4,20 @@ Flow Metrics Calculation Functions
 
 Pure calculation functions for flow metrics (lead time, throughput, aging, etc.)
 These functions operate on work item data and return metric dictionaries.
+
+Work items can be passed as a list of field dicts or as a WorkItemFrame; the
+calculations themselves run on the frame's parsed datetime64 columns, so a
+frame shared by several functions parses each timestamp once.
 """
 
-import statistics
 from datetime import datetime
 from typing import cast
 
+import numpy as np
+
+from execution.collectors.work_item_frame import WorkItemFrame, sorted_percentile
 from execution.core import get_logger
 from execution.domain.constants import cleanup_indicators, flow_metrics
-from execution.utils.datetime_utils import calculate_age_days, calculate_lead_time_days
 from execution.utils.error_handling import log_and_return_default
 
 logger = get_logger(__name__)
@@ -64,14 +69,33 @@ def calculate_percentile(values: list[float], percentile: int) -> float | None:
         return cast(float | None, result)
 
 
-def calculate_lead_time(closed_items: list[dict]) -> dict:
+def _valid_lead_times(frame: WorkItemFrame) -> np.ndarray:
+    """Lead times in days for items with a valid created -> closed interval, in item order."""
+    lead_times = frame.lead_time_days
+    return cast(np.ndarray, lead_times[~np.isnan(lead_times)])
+
+
+def _round_percentiles(sorted_values: np.ndarray) -> dict:
+    """P50/P85/P95 of sorted values, rounded to one decimal (None when empty)."""
+    result = {}
+    for key, percentile in (
+        ("p50", flow_metrics.P50_PERCENTILE),
+        ("p85", flow_metrics.P85_PERCENTILE),
+        ("p95", flow_metrics.P95_PERCENTILE),
+    ):
+        value = sorted_percentile(sorted_values, percentile)
+        result[key] = round(value, 1) if value is not None else None
+    return result
+
+
+def calculate_lead_time(closed_items: list[dict] | WorkItemFrame) -> dict:
     """
     Calculate lead time percentiles from closed work items.
 
     Lead time is measured from work item creation date to closed date.
     Percentiles (P50, P85, P95) provide statistical distribution of lead times.
 
-    :param closed_items: List of closed work item dictionaries with System.CreatedDate and Microsoft.VSTS.Common.ClosedDate
+    :param closed_items: Closed work item dictionaries (or a WorkItemFrame over them) with System.CreatedDate and Microsoft.VSTS.Common.ClosedDate
     :returns: Dictionary with percentile metrics and sample size::
 
         {
@@ -91,73 +115,26 @@ def calculate_lead_time(closed_items: list[dict]) -> dict:
         >>> result["p50"]  # Median lead time
         6.5
     """
-    lead_times = []
-
-    for item in closed_items:
-        created = item.get("System.CreatedDate")
-        closed = item.get("Microsoft.VSTS.Common.ClosedDate")
-
-        lead_time = calculate_lead_time_days(created, closed)
-        if lead_time is not None:
-            lead_times.append(lead_time)
-
-    p50 = calculate_percentile(lead_times, flow_metrics.P50_PERCENTILE)
-    p85 = calculate_percentile(lead_times, flow_metrics.P85_PERCENTILE)
-    p95 = calculate_percentile(lead_times, flow_metrics.P95_PERCENTILE)
+    lead_times = _valid_lead_times(WorkItemFrame.of(closed_items))
 
     return {
-        "p50": round(p50, 1) if p50 is not None else None,
-        "p85": round(p85, 1) if p85 is not None else None,
-        "p95": round(p95, 1) if p95 is not None else None,
+        **_round_percentiles(np.sort(lead_times)),
         "sample_size": len(lead_times),
-        "raw_values": lead_times[:10],  # Keep first 10 for debugging
+        "raw_values": lead_times[:10].tolist(),  # Keep first 10 for debugging
     }
 
 
-def _classify_closed_items(
-    closed_items: list[dict], threshold_days: int
-) -> tuple[list[dict], list[float], list[dict], list[float]]:
-    """Partition closed items into operational vs cleanup buckets.
-
-    Returns (operational_items, operational_lead_times, cleanup_items, cleanup_lead_times).
-    """
-    operational_items: list[dict] = []
-    cleanup_items: list[dict] = []
-    operational_lead_times: list[float] = []
-    cleanup_lead_times: list[float] = []
-
-    for item in closed_items:
-        created = item.get("System.CreatedDate")
-        closed = item.get("Microsoft.VSTS.Common.ClosedDate")
-        lead_time = calculate_lead_time_days(created, closed)
-        if lead_time is None:
-            continue
-        if lead_time < threshold_days:
-            operational_items.append(item)
-            operational_lead_times.append(lead_time)
-        else:
-            cleanup_items.append(item)
-            cleanup_lead_times.append(lead_time)
-
-    return operational_items, operational_lead_times, cleanup_items, cleanup_lead_times
-
-
-def _build_percentile_metrics(lead_times: list[float], item_count: int) -> dict:
-    """Build a p50/p85/p95 metrics dict from a list of lead-time values."""
-    p50 = calculate_percentile(lead_times, flow_metrics.P50_PERCENTILE)
-    p85 = calculate_percentile(lead_times, flow_metrics.P85_PERCENTILE)
-    p95 = calculate_percentile(lead_times, flow_metrics.P95_PERCENTILE)
+def _build_percentile_metrics(lead_times: np.ndarray) -> dict:
+    """Build a p50/p85/p95 metrics dict from an array of lead-time values."""
     return {
-        "p50": round(p50, 1) if p50 is not None else None,
-        "p85": round(p85, 1) if p85 is not None else None,
-        "p95": round(p95, 1) if p95 is not None else None,
-        "closed_count": item_count,
+        **_round_percentiles(np.sort(lead_times)),
+        "closed_count": len(lead_times),
         "sample_size": len(lead_times),
     }
 
 
 def calculate_dual_metrics(
-    closed_items: list[dict], cleanup_threshold_days: int = flow_metrics.CLEANUP_THRESHOLD_DAYS
+    closed_items: list[dict] | WorkItemFrame, cleanup_threshold_days: int = flow_metrics.CLEANUP_THRESHOLD_DAYS
 ) -> dict:
     """
     Calculate separate metrics for operational work vs cleanup work.
@@ -168,29 +145,31 @@ def calculate_dual_metrics(
     This separation prevents cleanup initiatives from distorting operational performance metrics.
 
     Args:
-        closed_items: List of closed work items
+        closed_items: List of closed work items (or a WorkItemFrame over them)
         cleanup_threshold_days: Lead time threshold to classify as cleanup (default: 365 days)
 
     Returns:
         Dict with operational_metrics, cleanup_metrics, and cleanup_indicators
     """
-    operational_items, operational_lead_times, cleanup_items, cleanup_lead_times = _classify_closed_items(
-        closed_items, cleanup_threshold_days
-    )
+    lead_times = _valid_lead_times(WorkItemFrame.of(closed_items))
+    is_operational = lead_times < cleanup_threshold_days
+    operational_lead_times = lead_times[is_operational]
+    cleanup_lead_times = lead_times[~is_operational]
 
-    operational_metrics = _build_percentile_metrics(operational_lead_times, len(operational_items))
+    operational_metrics = _build_percentile_metrics(operational_lead_times)
 
-    cleanup_metrics = _build_percentile_metrics(cleanup_lead_times, len(cleanup_items))
+    cleanup_metrics = _build_percentile_metrics(cleanup_lead_times)
     cleanup_metrics["avg_age_years"] = (
-        round(sum(cleanup_lead_times) / len(cleanup_lead_times) / 365, 1) if cleanup_lead_times else None
+        round(float(cleanup_lead_times.mean()) / 365, 1) if len(cleanup_lead_times) else None
     )
 
     # Cleanup indicators - detect if metrics are being distorted
-    total_closed = len(operational_items) + len(cleanup_items)
-    cleanup_percentage = (len(cleanup_items) / total_closed * 100) if total_closed > 0 else 0
+    cleanup_count = len(cleanup_lead_times)
+    total_closed = len(lead_times)
+    cleanup_percentage = (cleanup_count / total_closed * 100) if total_closed > 0 else 0
 
     is_cleanup_effort = cleanup_percentage > cleanup_indicators.CLEANUP_PERCENTAGE_THRESHOLD
-    has_significant_cleanup = len(cleanup_items) > cleanup_indicators.SIGNIFICANT_CLEANUP_COUNT
+    has_significant_cleanup = cleanup_count > cleanup_indicators.SIGNIFICANT_CLEANUP_COUNT
 
     return {
         "operational": operational_metrics,
@@ -205,14 +184,14 @@ def calculate_dual_metrics(
     }
 
 
-def calculate_throughput(closed_items: list[dict], lookback_days: int = 90) -> dict:
+def calculate_throughput(closed_items: list[dict] | WorkItemFrame, lookback_days: int = 90) -> dict:
     """
     Calculate throughput - closed items per week.
 
     HARD DATA: Just count of closed items over time period.
 
     Args:
-        closed_items: List of closed work items
+        closed_items: List of closed work items (or a WorkItemFrame over them)
         lookback_days: Period analyzed
 
     Returns:
@@ -225,33 +204,25 @@ def calculate_throughput(closed_items: list[dict], lookback_days: int = 90) -> d
     return {"closed_count": closed_count, "lookback_days": lookback_days, "per_week": round(per_week, 1)}
 
 
-def calculate_cycle_time_variance(closed_items: list[dict]) -> dict:
+def calculate_cycle_time_variance(closed_items: list[dict] | WorkItemFrame) -> dict:
     """
     Calculate cycle time variance - standard deviation of lead times.
 
     HARD DATA: Statistical measure of lead time predictability.
 
     Args:
-        closed_items: List of closed work items
+        closed_items: List of closed work items (or a WorkItemFrame over them)
 
     Returns:
         Variance metrics
     """
-    lead_times = []
-
-    for item in closed_items:
-        created = item.get("System.CreatedDate")
-        closed = item.get("Microsoft.VSTS.Common.ClosedDate")
-
-        lead_time = calculate_lead_time_days(created, closed)
-        if lead_time is not None:
-            lead_times.append(lead_time)
+    lead_times = _valid_lead_times(WorkItemFrame.of(closed_items))
 
     if len(lead_times) < 2:  # Need at least 2 points for std dev
         return {"sample_size": len(lead_times), "std_dev_days": None, "coefficient_of_variation": None}
 
-    std_dev = statistics.stdev(lead_times)
-    mean = statistics.mean(lead_times)
+    std_dev = float(lead_times.std(ddof=1))
+    mean = float(lead_times.mean())
     cv = (std_dev / mean * 100) if mean > 0 else None
 
     return {
@@ -263,37 +234,36 @@ def calculate_cycle_time_variance(closed_items: list[dict]) -> dict:
 
 
 def calculate_aging_items(
-    open_items: list[dict], aging_threshold_days: int = flow_metrics.AGING_THRESHOLD_DAYS
+    open_items: list[dict] | WorkItemFrame, aging_threshold_days: int = flow_metrics.AGING_THRESHOLD_DAYS
 ) -> dict:
     """
     Calculate aging items: Items open > threshold days
 
     Returns count and list of aging items with details
     """
-    now = datetime.now()
-    aging_items = []
-
-    for item in open_items:
-        created = item.get("System.CreatedDate")
-
-        age_days = calculate_age_days(created, reference_time=now)
-        if age_days is not None and age_days > aging_threshold_days:
-            aging_items.append(
-                {
-                    "id": item.get("System.Id"),
-                    "title": item.get("System.Title"),
-                    "state": item.get("System.State"),
-                    "type": item.get("System.WorkItemType"),
-                    "age_days": round(age_days, 1),
-                    "created_date": created,
-                }
-            )
-
-    # Sort by age (oldest first)
-    aging_items.sort(key=lambda x: x["age_days"] or 0, reverse=True)
+    frame = WorkItemFrame.of(open_items)
+    ages = frame.age_days(reference_time=datetime.now())
+
+    aging_idx = np.flatnonzero(ages > aging_threshold_days)
+    # Oldest first by rounded age; stable, so ties keep item order
+    order = aging_idx[np.argsort(-np.round(ages[aging_idx], 1), kind="stable")]
+
+    top_items = []
+    for i in order[:20]:  # Top 20 oldest
+        item = frame.items[i]
+        top_items.append(
+            {
+                "id": item.get("System.Id"),
+                "title": item.get("System.Title"),
+                "state": item.get("System.State"),
+                "type": item.get("System.WorkItemType"),
+                "age_days": round(float(ages[i]), 1),
+                "created_date": item.get("System.CreatedDate"),
+            }
+        )
 
     return {
-        "count": len(aging_items),
+        "count": len(aging_idx),
         "threshold_days": aging_threshold_days,
-        "items": aging_items[:20],  # Top 20 oldest
+        "items": top_items,
     }
@@ -14,11 +14,39 @@ from datetime import datetime, timedelta
 from execution.collectors.ado_rest_client import AzureDevOpsRESTClient
 from execution.collectors.ado_rest_transformers import WorkItemTransformer
 from execution.collectors.security_bug_filter import filter_security_bugs
+from execution.collectors.work_item_fetch_planner import (
+    fetch_work_items_shared,
+    register_collector_fields,
+    shared_fetch_enabled,
+)
 from execution.core.logging_config import get_logger
 from execution.security_utils import WIQLValidator
 
 logger = get_logger(__name__)
 
+_OPEN_ITEM_FIELDS = [
+    "System.Id",
+    "System.Title",
+    "System.State",
+    "System.CreatedDate",
+    "System.WorkItemType",
+    "Microsoft.VSTS.Common.StateChangeDate",
+    "System.CreatedBy",
+]
+
+_CLOSED_ITEM_FIELDS = [
+    "System.Id",
+    "System.Title",
+    "System.State",
+    "System.CreatedDate",
+    "Microsoft.VSTS.Common.ClosedDate",
+    "System.WorkItemType",
+    "Microsoft.VSTS.Common.StateChangeDate",
+    "System.CreatedBy",
+]
+
+register_collector_fields("flow", _OPEN_ITEM_FIELDS, _CLOSED_ITEM_FIELDS)
+
 
 def _build_area_filter_clause(area_path_filter: str | None) -> str:
     """
@@ -71,19 +99,35 @@ async def _fetch_work_items_batched(
     fields: list[str],
     work_type: str,
     label: str,
+    project: str | None = None,
 ) -> list:
     """
     Fetch work item details in batches concurrently.
 
+    When a fetch planner or work item store is active for the run and the
+    project is known, items already fetched by another collector or unchanged
+    since the last run are not downloaded again.
+
     :param rest_client: ADO REST client
     :param item_ids: List of work item IDs to fetch
     :param fields: Field names to retrieve
     :param work_type: Work item type (for logging only)
     :param label: "open" or "closed" (for logging only)
+    :param project: ADO project name (enables shared/incremental fetching)
     :returns: List of work item dicts
     """
     if not item_ids:
         return []
+    if project and shared_fetch_enabled():
+        shared_items, failed_ids = await fetch_work_items_shared(
+            rest_client, project, item_ids, fields, collector="flow"
+        )
+        if failed_ids:
+            logger.warning(
+                f"Failed to fetch {len(failed_ids)} {label} work items",
+                extra={"work_type": work_type, "failed": len(failed_ids)},
+            )
+        return shared_items
     batch_tasks = []
     for i in range(0, len(item_ids), 200):
         batch_ids = item_ids[i : i + 200]
@@ -199,34 +243,19 @@ async def query_work_items_by_type(
         open_items = await _fetch_work_items_batched(
             rest_client,
             open_ids,
-            fields=[
-                "System.Id",
-                "System.Title",
-                "System.State",
-                "System.CreatedDate",
-                "System.WorkItemType",
-                "Microsoft.VSTS.Common.StateChangeDate",
-                "System.CreatedBy",
-            ],
+            fields=_OPEN_ITEM_FIELDS,
             work_type=work_type,
             label="open",
+            project=safe_project,
         )
 
         closed_items = await _fetch_work_items_batched(
             rest_client,
             closed_ids,
-            fields=[
-                "System.Id",
-                "System.Title",
-                "System.State",
-                "System.CreatedDate",
-                "Microsoft.VSTS.Common.ClosedDate",
-                "System.WorkItemType",
-                "Microsoft.VSTS.Common.StateChangeDate",
-                "System.CreatedBy",
-            ],
+            fields=_CLOSED_ITEM_FIELDS,
             work_type=work_type,
             label="closed",
+            project=safe_project,
         )
 
         # Filter out ArmorCode security bugs (ONLY for Bugs, not Stories/Tasks)
@@ -0,0 +1,413 @@
+"""
+Git Activity Index (shared, incremental commit log)
+
+Ownership (developer active days) and risk (churn, knowledge distribution,
+module coupling) metrics both read the last N days of commits for every
+repository. The index keeps one compact copy of each repository's commit
+log in SQLite - commit ID, author, dates, change count and touched paths -
+and serves both collectors from it.
+
+How a repository is synced (once per run, shared by concurrent callers):
+    1. First sync (or a longer lookback than is covered): page through the
+       commit log from the lookback start with $top/$skip
+    2. Later runs: page only from the last seen commit date (minus a small
+       overlap for commits pushed after they were authored)
+    3. Drop commits older than RETAIN_DAYS
+Change counts and paths are filled in lazily by the risk collector, once
+per commit; they never change, so they are never re-fetched.
+
+Repository listings are shared for the run as well.
+
+The index is opt-in, like the work item store: collectors enable it for a
+run with use_git_activity_index(). Without an active index
+list_repositories() and load_repo_commits() call the REST API directly.
+
+Usage:
+    from execution.collectors.git_activity_index import load_repo_commits, use_git_activity_index
+
+    with use_git_activity_index():
+        commits = await load_repo_commits(rest_client, "MyProject", repo_id, days=90)
+"""
+
+import asyncio
+import json
+import sqlite3
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from execution.collectors.ado_rest_transformers import GitTransformer
+from execution.core import get_logger
+from execution.utils.datetime_utils import parse_ado_timestamp
+
+logger = get_logger(__name__)
+
+DEFAULT_DB_PATH = Path(".tmp/observatory/git_activity.db")
+
+# Commits are kept this long; longer lookbacks re-page the older range
+RETAIN_DAYS = 400
+
+# Re-read this much before the last seen commit date, so commits authored
+# earlier but pushed since the last run are not missed
+_SYNC_OVERLAP = timedelta(days=3)
+
+_PAGE_SIZE = 1000
+
+
+def _to_utc(value: datetime) -> datetime:
+    """Naive datetimes are treated as UTC."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+async def fetch_commit_log(
+    rest_client: Any, project: str, repo_id: str, since: datetime, page_size: int = _PAGE_SIZE
+) -> list[dict[str, Any]]:
+    """
+    Fetch every commit since a date, following $skip paging.
+
+    Args:
+        rest_client: AzureDevOpsRESTClient
+        project: ADO project name
+        repo_id: Repository ID
+        since: Earliest commit date to fetch
+        page_size: Commits per request
+
+    Returns:
+        Raw REST commit dicts, newest first
+    """
+    from_date = _to_utc(since).strftime("%Y-%m-%dT%H:%M:%SZ")
+    commits: list[dict[str, Any]] = []
+    while True:
+        response = await rest_client.get_commits(
+            project=project, repository_id=repo_id, from_date=from_date, top=page_size, skip=len(commits)
+        )
+        page = response.get("value", []) if response else []
+        commits.extend(page)
+        if len(page) < page_size:
+            return commits
+
+
+def _commit_row(project: str, repo_id: str, commit: dict[str, Any]) -> tuple[Any, ...] | None:
+    """Compact index row for a raw REST commit (None if it has no usable date)."""
+    author = commit.get("author") or {}
+    committer = commit.get("committer") or {}
+    try:
+        committed = parse_ado_timestamp(committer.get("date") or author.get("date"))
+    except ValueError:
+        committed = None
+    if not commit.get("commitId") or committed is None:
+        return None
+    return (
+        project,
+        repo_id,
+        commit["commitId"],
+        author.get("name"),
+        author.get("date"),
+        _to_utc(committed).timestamp(),
+    )
+
+
+class GitActivityIndex:
+    """
+    SQLite-backed commit log per repository with incremental sync.
+
+    Attributes:
+        db_path: Location of the SQLite database
+        commits_fetched: Commits downloaded from the REST API during this run
+    """
+
+    def __init__(self, db_path: Path | str = DEFAULT_DB_PATH):
+        """
+        Open (and create if needed) the git activity index.
+
+        Args:
+            db_path: SQLite file path (default: .tmp/observatory/git_activity.db)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        self.commits_fetched = 0
+        self._syncs: dict[tuple[str, str], asyncio.Task[None]] = {}
+        self._repos: dict[str, asyncio.Task[list[dict[str, Any]]]] = {}
+
+    def _create_schema(self) -> None:
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS commits (
+                project      TEXT    NOT NULL,
+                repo_id      TEXT    NOT NULL,
+                commit_id    TEXT    NOT NULL,
+                author_name  TEXT,
+                author_date  TEXT,
+                committed_at REAL    NOT NULL,
+                changes      INTEGER,
+                files_json   TEXT,
+                PRIMARY KEY (project, repo_id, commit_id)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_commits_repo_time ON commits (project, repo_id, committed_at);
+
+            CREATE TABLE IF NOT EXISTS repo_state (
+                project     TEXT NOT NULL,
+                repo_id     TEXT NOT NULL,
+                synced_from REAL NOT NULL,
+                watermark   REAL NOT NULL,
+                PRIMARY KEY (project, repo_id)
+            );
+        """)
+        self.conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def _get_state(self, project: str, repo_id: str) -> tuple[float, float] | None:
+        row = self.conn.execute(
+            "SELECT synced_from, watermark FROM repo_state WHERE project = ? AND repo_id = ?", (project, repo_id)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    async def repositories(self, rest_client: Any, project: str) -> list[dict[str, Any]]:
+        """
+        List a project's repositories once per run (concurrent callers share the request).
+
+        Args:
+            rest_client: AzureDevOpsRESTClient
+            project: ADO project name
+
+        Returns:
+            Repositories in GitTransformer format
+        """
+        if project not in self._repos:
+
+            async def _list() -> list[dict[str, Any]]:
+                response = await rest_client.get_repositories(project=project)
+                return GitTransformer.transform_repositories_response(response)
+
+            self._repos[project] = asyncio.ensure_future(_list())
+        try:
+            return await self._repos[project]
+        except Exception:
+            # Let the next caller retry rather than share the failure
+            self._repos.pop(project, None)
+            raise
+
+    async def sync_repo(self, rest_client: Any, project: str, repo_id: str, since: datetime) -> None:
+        """
+        Bring a repository's commit log up to date (once per repository per run).
+
+        Args:
+            rest_client: AzureDevOpsRESTClient
+            project: ADO project name
+            repo_id: Repository ID
+            since: Earliest commit date the caller needs
+        """
+        key = (project, repo_id)
+        if key in self._syncs:
+            try:
+                await self._syncs[key]
+            except Exception:
+                self._syncs.pop(key, None)
+                raise
+            state = self._get_state(project, repo_id)
+            if state is not None and state[0] <= _to_utc(since).timestamp():
+                return
+
+        self._syncs[key] = asyncio.ensure_future(self._sync_repo(rest_client, project, repo_id, since))
+        try:
+            await self._syncs[key]
+        except Exception:
+            self._syncs.pop(key, None)
+            raise
+
+    async def _sync_repo(self, rest_client: Any, project: str, repo_id: str, since: datetime) -> None:
+        since_ts = _to_utc(since).timestamp()
+        state = self._get_state(project, repo_id)
+        if state is None or since_ts < state[0]:
+            fetch_from, synced_from = _to_utc(since), since_ts
+        else:
+            fetch_from = datetime.fromtimestamp(state[1], UTC) - _SYNC_OVERLAP
+            synced_from = state[0]
+
+        raw = await fetch_commit_log(rest_client, project, repo_id, fetch_from)
+        self.commits_fetched += len(raw)
+        rows = [row for row in (_commit_row(project, repo_id, c) for c in raw) if row is not None]
+
+        # Upsert without touching already fetched change details
+        self.conn.executemany(
+            "INSERT INTO commits (project, repo_id, commit_id, author_name, author_date, committed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(project, repo_id, commit_id) DO UPDATE SET "
+            "author_name = excluded.author_name, author_date = excluded.author_date, "
+            "committed_at = excluded.committed_at",
+            rows,
+        )
+
+        cutoff = (datetime.now(UTC) - timedelta(days=RETAIN_DAYS)).timestamp()
+        self.conn.execute(
+            "DELETE FROM commits WHERE project = ? AND repo_id = ? AND committed_at < ?", (project, repo_id, cutoff)
+        )
+        previous_watermark = state[1] if state else since_ts
+        watermark = max([previous_watermark, *(row[5] for row in rows)])
+        self.conn.execute(
+            "INSERT OR REPLACE INTO repo_state (project, repo_id, synced_from, watermark) VALUES (?, ?, ?, ?)",
+            (project, repo_id, max(synced_from, cutoff), watermark),
+        )
+        self.conn.commit()
+        logger.debug(
+            "Git activity index synced",
+            extra={"project": project, "repo_id": repo_id, "fetched": len(raw), "since": fetch_from.isoformat()},
+        )
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def commits(self, project: str, repo_id: str, since: datetime) -> list[dict[str, Any]]:
+        """
+        Indexed commits since a date, newest first.
+
+        Args:
+            project: ADO project name
+            repo_id: Repository ID
+            since: Earliest commit date
+
+        Returns:
+            Commit dicts with commit_id, author_name, author_date, and
+            changes/files (None until change details have been stored)
+        """
+        rows = self.conn.execute(
+            "SELECT commit_id, author_name, author_date, changes, files_json FROM commits "
+            "WHERE project = ? AND repo_id = ? AND committed_at >= ? "
+            "ORDER BY committed_at DESC, commit_id",
+            (project, repo_id, _to_utc(since).timestamp()),
+        ).fetchall()
+        return [
+            {
+                "commit_id": commit_id,
+                "author_name": author_name,
+                "author_date": author_date,
+                "changes": changes,
+                "files": json.loads(files_json) if files_json is not None else None,
+            }
+            for commit_id, author_name, author_date, changes, files_json in rows
+        ]
+
+    def get_changes(self, project: str, repo_id: str, commit_id: str) -> tuple[int, list[str]] | None:
+        """Stored (change_count, file_paths) for a commit (None if not fetched yet)."""
+        row = self.conn.execute(
+            "SELECT changes, files_json FROM commits WHERE project = ? AND repo_id = ? AND commit_id = ?",
+            (project, repo_id, commit_id),
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def put_changes(self, project: str, repo_id: str, commit_id: str, changes: int, files: list[str]) -> None:
+        """Store change details for an indexed commit."""
+        self.conn.execute(
+            "UPDATE commits SET changes = ?, files_json = ? WHERE project = ? AND repo_id = ? AND commit_id = ?",
+            (changes, json.dumps(files), project, repo_id, commit_id),
+        )
+        self.conn.commit()
+
+
+# Active index for the current run (set by use_git_activity_index)
+_current_index: GitActivityIndex | None = None
+
+
+def get_current_git_activity_index() -> GitActivityIndex | None:
+    """
+    Get the index enabled for the current run.
+
+    Returns:
+        Active GitActivityIndex or None if the index is not enabled
+    """
+    return _current_index
+
+
+@contextmanager
+def use_git_activity_index(db_path: Path | str = DEFAULT_DB_PATH) -> Generator[GitActivityIndex, None, None]:
+    """
+    Enable the shared git activity index for the duration of a collector run.
+
+    Re-entrant: nested calls reuse the already active index.
+
+    Args:
+        db_path: SQLite file path
+
+    Yields:
+        Active GitActivityIndex
+    """
+    global _current_index
+
+    if _current_index is not None:
+        yield _current_index
+        return
+
+    index = GitActivityIndex(db_path)
+    _current_index = index
+    try:
+        yield index
+    finally:
+        logger.info(
+            "Git activity index run summary",
+            extra={
+                "commits_fetched": index.commits_fetched,
+                "repos_synced": len(index._syncs),
+                "db": str(index.db_path),
+            },
+        )
+        _current_index = None
+        index.close()
+
+
+async def list_repositories(rest_client: Any, project: str) -> list[dict[str, Any]]:
+    """
+    List a project's repositories, shared for the run when the index is active.
+
+    Args:
+        rest_client: AzureDevOpsRESTClient
+        project: ADO project name
+
+    Returns:
+        Repositories in GitTransformer format
+    """
+    if _current_index is not None:
+        return await _current_index.repositories(rest_client, project)
+    response = await rest_client.get_repositories(project=project)
+    return GitTransformer.transform_repositories_response(response)
+
+
+async def load_repo_commits(rest_client: Any, project: str, repo_id: str, days: int) -> list[dict[str, Any]]:
+    """
+    Commits of the last `days` days for one repository, newest first.
+
+    Served from the active index (synced incrementally, once per run);
+    otherwise the full log for the period is paged from the REST API.
+
+    Args:
+        rest_client: AzureDevOpsRESTClient
+        project: ADO project name
+        repo_id: Repository ID
+        days: Lookback period
+
+    Returns:
+        Commit dicts with at least commit_id, author_name and author_date
+    """
+    since = datetime.now(UTC) - timedelta(days=days)
+    index = _current_index
+    if index is None:
+        raw = await fetch_commit_log(rest_client, project, repo_id, since)
+        return GitTransformer.transform_commits_response({"value": raw})
+
+    await index.sync_repo(rest_client, project, repo_id, since)
+    return index.commits(project, repo_id, since)
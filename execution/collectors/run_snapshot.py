@@ -0,0 +1,186 @@
+"""
+Per-Run Detail Snapshot shared by collectors and dashboard generators
+
+collect_all_metrics gathers every project's full metrics (work item lists,
+pipeline breakdowns, ArmorCode counts and findings) and the history files
+keep only the stripped aggregates. The dashboard generators used to query ADO
+and ArmorCode again for the same details a few minutes later.
+
+Collectors now also write their complete payload into a snapshot section
+(one gzip-compressed JSON file per section) stamped with the refresh run ID.
+Dashboard generators read their section from the snapshot and only query the
+APIs when it is missing. Like the AQL count cache, the snapshot is keyed on
+OBSERVATORY_RUN_ID (exported by refresh_all_dashboards.py): without a run ID
+nothing is written and every generator queries live; sections written by
+another run are ignored.
+
+With OBSERVATORY_SNAPSHOT_ONLY=1 a missing section raises
+SnapshotMissingError instead of falling back to the API, so a refresh
+renders without any network calls.
+
+Usage:
+    from execution.collectors.run_snapshot import load_snapshot_section, save_snapshot_section
+
+    save_snapshot_section("quality", week_metrics)          # collector
+    week_data = load_snapshot_section("quality")            # dashboard (None: query live)
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from execution.collectors.aql_count_cache import RUN_ID_ENV
+from execution.core import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_SNAPSHOT_DIR = Path(".tmp/observatory/run_snapshot")
+
+# Environment variable that forbids live API fallback in dashboard generators
+SNAPSHOT_ONLY_ENV = "OBSERVATORY_SNAPSHOT_ONLY"
+
+
+class SnapshotMissingError(RuntimeError):
+    """Raised in snapshot-only mode when a dashboard's section was not collected in this run."""
+
+
+class RunSnapshot:
+    """
+    Snapshot sections of one refresh run.
+
+    Attributes:
+        directory: Folder holding one <section>.json.gz file per section
+        run_id: Run the sections belong to
+    """
+
+    def __init__(self, run_id: str, directory: Path | str = DEFAULT_SNAPSHOT_DIR):
+        """
+        Args:
+            run_id: Run ID; sections stamped with another run are ignored
+            directory: Snapshot folder (default: .tmp/observatory/run_snapshot)
+        """
+        self.run_id = run_id
+        self.directory = Path(directory)
+
+    def path(self, section: str) -> Path:
+        """File holding one section."""
+        return self.directory / f"{section}.json.gz"
+
+    def save(self, section: str, payload: Any) -> Path:
+        """
+        Write a section atomically (concurrent readers never see a partial file).
+
+        Args:
+            section: Section name (e.g. "quality", "security_enhanced")
+            payload: JSON-serializable data
+
+        Returns:
+            Path of the written file
+        """
+        document = {
+            "run_id": self.run_id,
+            "section": section,
+            "saved_at": datetime.now().isoformat(),
+            "payload": payload,
+        }
+        path = self.path(section)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump(document, f, separators=(",", ":"), default=str)
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, section: str) -> Any:
+        """
+        Read a section written during this run.
+
+        Args:
+            section: Section name
+
+        Returns:
+            Stored payload, or None if missing, unreadable or from another run
+        """
+        path = self.path(section)
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                document = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable snapshot section {path}: {e}")
+            return None
+        if not isinstance(document, dict) or document.get("run_id") != self.run_id:
+            return None
+        return document.get("payload")
+
+
+def get_run_snapshot(directory: Path | str = DEFAULT_SNAPSHOT_DIR) -> RunSnapshot | None:
+    """
+    Snapshot of the current refresh run.
+
+    Returns:
+        RunSnapshot for $OBSERVATORY_RUN_ID, or None when no run ID is set
+    """
+    run_id = os.environ.get(RUN_ID_ENV)
+    return RunSnapshot(run_id, directory) if run_id else None
+
+
+def snapshot_only() -> bool:
+    """True when dashboard generators must not fall back to live API queries."""
+    return os.environ.get(SNAPSHOT_ONLY_ENV, "").lower() in ("1", "true", "yes")
+
+
+def save_snapshot_section(section: str, payload: Any) -> bool:
+    """
+    Store a collector's full payload for the dashboard generators of this run.
+
+    Failures are logged, never raised: the snapshot must not break collection.
+
+    Args:
+        section: Section name
+        payload: JSON-serializable data
+
+    Returns:
+        True if written, False without a run ID or on error
+    """
+    snapshot = get_run_snapshot()
+    if snapshot is None:
+        return False
+    try:
+        path = snapshot.save(section, payload)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write snapshot section '{section}': {e}")
+        return False
+    logger.info("Snapshot section saved", extra={"section": section, "bytes": path.stat().st_size})
+    return True
+
+
+def load_snapshot_section(section: str) -> Any:
+    """
+    Read a section for a dashboard generator.
+
+    Args:
+        section: Section name
+
+    Returns:
+        Payload collected earlier in this run, or None if the caller should query live
+
+    Raises:
+        SnapshotMissingError: In snapshot-only mode when the section is missing
+    """
+    snapshot = get_run_snapshot()
+    if snapshot is not None:
+        payload = snapshot.load(section)
+        if payload is not None:
+            logger.info("Rendering from run snapshot", extra={"section": section, "run_id": snapshot.run_id})
+            return payload
+    if snapshot_only():
+        raise SnapshotMissingError(
+            f"Snapshot section '{section}' was not collected in this run "
+            f"({RUN_ID_ENV}={os.environ.get(RUN_ID_ENV)!r}) and {SNAPSHOT_ONLY_ENV} forbids live queries"
+        )
+    return None
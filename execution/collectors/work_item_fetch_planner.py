@@ -0,0 +1,264 @@
+"""
+Work Item Fetch Planner (one download per item per run)
+
+The quality, flow and ownership collectors each query overlapping work item
+IDs with slightly different field lists. Within one run the planner:
+    - Fetches every (project, id) at most once, requesting the union of the
+      field lists registered by all collectors
+    - Coalesces concurrent requests for IDs another collector is already fetching
+    - Hands each collector a view containing only the fields it asked for
+    - Counts the duplicate fetches it avoided
+
+Collectors register their field lists at import time with
+register_collector_fields(). Fetches go through fetch_work_items_incremental(),
+so the persistent work item store still applies underneath.
+
+Usage:
+    from execution.collectors.work_item_fetch_planner import (
+        fetch_work_items_shared,
+        use_work_item_fetch_planner,
+    )
+
+    with use_work_item_fetch_planner() as planner:
+        items, failed = await fetch_work_items_shared(rest_client, "MyProject", ids, fields, collector="quality")
+        print(planner.stats()["duplicates_avoided"])
+"""
+
+import asyncio
+import logging
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any
+
+from execution.collectors.work_item_store import fetch_work_items_incremental, get_current_work_item_store
+from execution.core import get_logger
+
+logger = get_logger(__name__)
+
+# Fields every view carries regardless of what was requested
+_IDENTITY_FIELDS = ("System.Id", "System.Rev", "url")
+
+# Field lists each collector needs, registered by the collector modules at import
+_collector_fields: dict[str, set[str]] = {}
+
+
+def register_collector_fields(collector: str, *field_lists: list[str]) -> None:
+    """
+    Declare the work item fields a collector fetches.
+
+    Args:
+        collector: Collector name (e.g., "quality")
+        *field_lists: One or more field name lists used by the collector
+    """
+    fields = _collector_fields.setdefault(collector, set())
+    for field_list in field_lists:
+        fields.update(field_list)
+
+
+def get_registered_fields() -> set[str]:
+    """Union of the field lists registered by all collectors."""
+    return set().union(*_collector_fields.values())
+
+
+class WorkItemFetchPlanner:
+    """
+    Per-run work item fetch deduplication across collectors.
+
+    Attributes:
+        requested: Item IDs requested per collector
+        shared: Item IDs per collector served from another request's fetch
+        fetched: Item IDs actually sent to the REST API / work item store
+    """
+
+    def __init__(self) -> None:
+        self.requested: dict[str, int] = {}
+        self.shared: dict[str, int] = {}
+        self.fetched = 0
+        # (project, id) -> (fields fetched, future resolving to the item or None if it failed)
+        self._entries: dict[tuple[str, int], tuple[frozenset[str], asyncio.Future[dict[str, Any] | None]]] = {}
+
+    async def fetch(
+        self,
+        rest_client: Any,
+        project: str,
+        item_ids: list[int],
+        fields: list[str],
+        collector: str,
+        logger: logging.Logger | None = None,
+    ) -> tuple[list[dict[str, Any]], list[int]]:
+        """
+        Fetch work items, reusing any fetch already done or in flight this run.
+
+        Args:
+            rest_client: AzureDevOpsRESTClient
+            project: ADO project name
+            item_ids: Work item IDs to fetch
+            fields: Field names this collector needs
+            collector: Collector name (for stats)
+            logger: Optional logger for batch progress
+
+        Returns:
+            Tuple of (items in item_ids order with only the requested fields, failed IDs)
+        """
+        wanted = set(fields)
+        unique_ids = list(dict.fromkeys(item_ids))
+        self.requested[collector] = self.requested.get(collector, 0) + len(unique_ids)
+
+        futures: dict[int, asyncio.Future[dict[str, Any] | None]] = {}
+        to_fetch: list[int] = []
+        for item_id in unique_ids:
+            entry = self._entries.get((project, item_id))
+            if entry is not None and wanted <= entry[0]:
+                futures[item_id] = entry[1]
+            else:
+                to_fetch.append(item_id)
+
+        self.shared[collector] = self.shared.get(collector, 0) + len(futures)
+
+        if to_fetch:
+            fetch_fields = get_registered_fields() | wanted
+            loop = asyncio.get_running_loop()
+            own: dict[int, asyncio.Future[dict[str, Any] | None]] = {}
+            for item_id in to_fetch:
+                own[item_id] = loop.create_future()
+                self._entries[(project, item_id)] = (frozenset(fetch_fields), own[item_id])
+            futures.update(own)
+            self.fetched += len(to_fetch)
+            await self._fetch_into(rest_client, project, to_fetch, sorted(fetch_fields), own, logger)
+
+        items: list[dict[str, Any]] = []
+        failed_ids: list[int] = []
+        for item_id in item_ids:
+            item = await futures[item_id]
+            if item is None:
+                failed_ids.append(item_id)
+            else:
+                items.append({k: v for k, v in item.items() if k in wanted or k in _IDENTITY_FIELDS})
+        return items, failed_ids
+
+    async def _fetch_into(
+        self,
+        rest_client: Any,
+        project: str,
+        item_ids: list[int],
+        fields: list[str],
+        futures: dict[int, asyncio.Future[dict[str, Any] | None]],
+        logger: logging.Logger | None,
+    ) -> None:
+        """Fetch items and resolve their futures; failed IDs resolve to None and are forgotten."""
+        try:
+            items, _failed = await fetch_work_items_incremental(rest_client, project, item_ids, fields, logger=logger)
+        except Exception:
+            self._forget(project, item_ids, futures)
+            raise
+
+        by_id = {item.get("System.Id"): item for item in items}
+        for item_id, future in futures.items():
+            if not future.done():
+                future.set_result(by_id.get(item_id))
+        self._forget(project, [i for i in item_ids if i not in by_id], futures)
+
+    def _forget(
+        self, project: str, item_ids: list[int], futures: dict[int, asyncio.Future[dict[str, Any] | None]]
+    ) -> None:
+        """Resolve waiters with None and let later requests retry these IDs."""
+        for item_id in item_ids:
+            future = futures[item_id]
+            if not future.done():
+                future.set_result(None)
+            if self._entries.get((project, item_id), (None, None))[1] is future:
+                del self._entries[(project, item_id)]
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Fetch statistics for the run.
+
+        Returns:
+            Dictionary with requested, fetched and duplicates_avoided totals plus per-collector counts
+        """
+        requested = sum(self.requested.values())
+        return {
+            "requested": requested,
+            "fetched": self.fetched,
+            "duplicates_avoided": sum(self.shared.values()),
+            "by_collector": {
+                name: {"requested": count, "shared": self.shared.get(name, 0)}
+                for name, count in sorted(self.requested.items())
+            },
+        }
+
+
+# Active planner for the current run (set by use_work_item_fetch_planner)
+_current_planner: WorkItemFetchPlanner | None = None
+
+
+def get_current_fetch_planner() -> WorkItemFetchPlanner | None:
+    """
+    Get the planner enabled for the current run.
+
+    Returns:
+        Active WorkItemFetchPlanner or None if shared fetching is not enabled
+    """
+    return _current_planner
+
+
+@contextmanager
+def use_work_item_fetch_planner() -> Generator[WorkItemFetchPlanner, None, None]:
+    """
+    Share work item fetches between collectors for the duration of a run.
+
+    Re-entrant: nested calls reuse the already active planner.
+
+    Yields:
+        Active WorkItemFetchPlanner
+    """
+    global _current_planner
+
+    if _current_planner is not None:
+        yield _current_planner
+        return
+
+    planner = WorkItemFetchPlanner()
+    _current_planner = planner
+    try:
+        yield planner
+    finally:
+        stats = planner.stats()
+        logger.info(
+            f"Work item fetch planner: {stats['duplicates_avoided']} duplicate fetches avoided",
+            extra={"requested": stats["requested"], "fetched": stats["fetched"]},
+        )
+        _current_planner = None
+
+
+def shared_fetch_enabled() -> bool:
+    """True if a fetch planner or work item store is active for this run."""
+    return _current_planner is not None or get_current_work_item_store() is not None
+
+
+async def fetch_work_items_shared(
+    rest_client: Any,
+    project: str,
+    item_ids: list[int],
+    fields: list[str],
+    collector: str,
+    logger: logging.Logger | None = None,
+) -> tuple[list[dict[str, Any]], list[int]]:
+    """
+    Fetch work items through the active planner (or the work item store if none).
+
+    Args:
+        rest_client: AzureDevOpsRESTClient
+        project: ADO project name
+        item_ids: Work item IDs to fetch
+        fields: Field names to retrieve
+        collector: Collector name (for planner stats)
+        logger: Optional logger for batch progress
+
+    Returns:
+        Tuple of (SDK-format items in item_ids order, failed IDs)
+    """
+    planner = get_current_fetch_planner()
+    if planner is None:
+        return await fetch_work_items_incremental(rest_client, project, item_ids, fields, logger=logger)
+    return await planner.fetch(rest_client, project, item_ids, fields, collector, logger=logger)
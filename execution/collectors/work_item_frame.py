@@ -0,0 +1,214 @@
+"""
+Columnar Work Item Frame
+
+Flow, quality and ownership calculations all read the same few fields from
+lists of work item dicts, and each of them used to re-parse the same ISO
+timestamp strings item by item. WorkItemFrame wraps such a list once and
+exposes NumPy columns instead:
+
+- created / closed: datetime64[us] (UTC, NaT for missing or unparsable values),
+  parsed in one vectorised pass the first time they are used
+- work_item_type / area_path: object arrays of the raw field values
+- assignee_name / unassigned: AssignedTo normalised the way the ownership
+  metrics have always read it
+
+Columns are built lazily and cached, so a frame shared by several
+calculations parses each timestamp column exactly once. The original dicts
+stay available (frame.items) for the few per-item details that end up in
+reports.
+
+Usage:
+    from execution.collectors.ado_rest_transformers import WorkItemTransformer
+
+    frame = WorkItemTransformer.to_frame(closed_items)
+    lead_time = calculate_lead_time(frame)
+    variance = calculate_cycle_time_variance(frame)  # reuses the parsed columns
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from functools import cached_property
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+
+
+def is_unassigned(assigned_to: object) -> bool:
+    """Return True if the AssignedTo field indicates an unassigned item."""
+    if not assigned_to:
+        return True
+    if isinstance(assigned_to, dict) and not assigned_to.get("displayName"):
+        return True
+    return False
+
+
+def assignee_name(assigned_to: object) -> str:
+    """Extract a display name string from an AssignedTo field value."""
+    if assigned_to:
+        if isinstance(assigned_to, dict):
+            return str(assigned_to.get("displayName", "Unassigned"))
+        return str(assigned_to)
+    return "Unassigned"
+
+
+def parse_timestamps(values: Sequence[Any]) -> np.ndarray:
+    """
+    Parse ADO/ISO timestamp strings into a datetime64[us] UTC array.
+
+    Non-string, empty and unparsable values become NaT (the per-item helpers
+    return None for them). Naive timestamps are treated as UTC.
+
+    Args:
+        values: Raw field values, one per work item
+
+    Returns:
+        datetime64[us] array the same length as values
+    """
+    strings = pd.Series([v if isinstance(v, str) and v else None for v in values], dtype=object)
+    parsed = pd.to_datetime(strings, utc=True, format="ISO8601", errors="coerce")
+    return cast(np.ndarray, parsed.dt.tz_localize(None).to_numpy(dtype="datetime64[us]"))
+
+
+def to_utc_datetime64(reference_time: datetime | None) -> np.datetime64:
+    """Reference time as naive-UTC datetime64[us] (naive inputs are treated as UTC, default now)."""
+    if reference_time is None:
+        reference_time = datetime.now(UTC)
+    if reference_time.tzinfo is not None:
+        reference_time = reference_time.astimezone(UTC).replace(tzinfo=None)
+    return np.datetime64(reference_time, "us")
+
+
+def days_between(start: np.ndarray, end: np.ndarray | np.datetime64) -> np.ndarray:
+    """
+    Elapsed days from start to end, element-wise.
+
+    Matches calculate_lead_time_days()/calculate_age_days(): NaN where either
+    side is NaT or the interval is negative.
+    """
+    delta = (end - start).astype("timedelta64[us]")
+    valid = ~np.isnat(delta)
+    micros = np.where(valid, delta.astype(np.int64), 0).astype(np.float64)
+    # Same arithmetic as timedelta.total_seconds() / 86400
+    days = micros / 1e6 / 86400
+    valid &= days >= 0
+    return np.where(valid, days, np.nan)
+
+
+def sorted_percentile(sorted_values: np.ndarray, percentile: float) -> float | None:
+    """
+    Percentile of an already sorted array, interpolated like calculate_percentile().
+
+    Sorting once and reading several percentiles avoids re-sorting per percentile.
+    """
+    if len(sorted_values) == 0:
+        return None
+    index = (percentile / 100) * (len(sorted_values) - 1)
+    lower_index = int(index)
+    upper_index = min(lower_index + 1, len(sorted_values) - 1)
+    weight = index - lower_index
+    return float(sorted_values[lower_index] * (1 - weight) + sorted_values[upper_index] * weight)
+
+
+class WorkItemFrame:
+    """
+    Column view over a list of work item field dicts.
+
+    Attributes:
+        items: The wrapped work item dicts (not copied)
+    """
+
+    def __init__(self, items: Sequence[dict[str, Any]]):
+        """
+        Args:
+            items: Work item field dicts as returned by WorkItemTransformer.transform_work_items_response()
+        """
+        self.items = items
+
+    @classmethod
+    def of(cls, items: WorkItemFrame | Sequence[dict[str, Any]]) -> WorkItemFrame:
+        """Return items unchanged if it is already a frame, otherwise wrap it."""
+        return items if isinstance(items, WorkItemFrame) else cls(items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def field(self, name: str, default: Any = None) -> np.ndarray:
+        """Raw values of one field as an object array (item.get(name, default))."""
+        column = np.empty(len(self.items), dtype=object)
+        column[:] = [item.get(name, default) for item in self.items]
+        return column
+
+    # ------------------------------------------------------------------
+    # Timestamp columns
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def created(self) -> np.ndarray:
+        """System.CreatedDate as datetime64[us] UTC (NaT when missing/invalid)."""
+        return parse_timestamps([item.get("System.CreatedDate") for item in self.items])
+
+    @cached_property
+    def closed(self) -> np.ndarray:
+        """Microsoft.VSTS.Common.ClosedDate as datetime64[us] UTC (NaT when missing/invalid)."""
+        return parse_timestamps([item.get("Microsoft.VSTS.Common.ClosedDate") for item in self.items])
+
+    @cached_property
+    def has_created(self) -> np.ndarray:
+        """True where System.CreatedDate is present (truthy), parsable or not."""
+        return np.fromiter((bool(item.get("System.CreatedDate")) for item in self.items), bool, len(self.items))
+
+    @cached_property
+    def lead_time_days(self) -> np.ndarray:
+        """Created -> closed in days (NaN if either is missing or the interval is negative)."""
+        return days_between(self.created, self.closed)
+
+    def age_days(self, reference_time: datetime | None = None) -> np.ndarray:
+        """Created -> reference_time in days (NaN if missing or created in the future)."""
+        return days_between(self.created, to_utc_datetime64(reference_time))
+
+    # ------------------------------------------------------------------
+    # Categorical columns
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def work_item_type(self) -> np.ndarray:
+        """System.WorkItemType ("Unknown" when the key is absent)."""
+        return self.field("System.WorkItemType", "Unknown")
+
+    @cached_property
+    def area_path(self) -> np.ndarray:
+        """System.AreaPath ("Unknown" when the key is absent)."""
+        return self.field("System.AreaPath", "Unknown")
+
+    @cached_property
+    def unassigned(self) -> np.ndarray:
+        """True where System.AssignedTo is empty or has no displayName."""
+        return np.fromiter((is_unassigned(item.get("System.AssignedTo")) for item in self.items), bool, len(self))
+
+    @cached_property
+    def assignee_name(self) -> np.ndarray:
+        """Assignee display name ("Unassigned" when empty)."""
+        column = np.empty(len(self.items), dtype=object)
+        column[:] = [assignee_name(item.get("System.AssignedTo")) for item in self.items]
+        return column
+
+
+def group_counts(keys: np.ndarray, mask: np.ndarray | None = None) -> tuple[list[Any], np.ndarray, np.ndarray]:
+    """
+    Count items per key, keeping keys in first-appearance order (like a dict built in a loop).
+
+    Args:
+        keys: Object array of group keys (None is a key like any other)
+        mask: Optional boolean array; masked counts are returned alongside totals
+
+    Returns:
+        (unique keys, total count per key, count of mask=True per key)
+    """
+    index: dict[Any, int] = {}
+    codes = np.fromiter((index.setdefault(key, len(index)) for key in keys), np.int64, len(keys))
+    totals = np.bincount(codes, minlength=len(index))
+    masked = np.bincount(codes[mask], minlength=len(index)) if mask is not None else totals
+    return list(index), totals, masked
@@ -0,0 +1,345 @@
+"""
+Persistent Work Item Store (incremental sync)
+
+SQLite cache of Azure DevOps work item fields keyed by (project, id) with the
+revision number, so weekly collector runs only download items that are new
+or have changed since the last sync.
+
+How a sync works (once per project per run):
+    1. Run one WIQL query for IDs with [System.ChangedDate] >= last watermark
+    2. Invalidate those IDs in the cache
+    3. Advance the watermark to the start of this run
+Collectors still run their membership WIQL queries (IDs only, one call each),
+then fetch_work_items_incremental() serves cached items and downloads only
+IDs that are missing, invalidated, or lack a requested field.
+
+The store is opt-in: collectors enable it for a run with use_work_item_store(),
+mirroring track_collector_performance(). Without an active store every fetch
+goes straight to the REST API as before.
+
+Usage:
+    from execution.collectors.work_item_store import fetch_work_items_incremental, use_work_item_store
+
+    with use_work_item_store():
+        items, failed = await fetch_work_items_incremental(rest_client, "MyProject", ids, fields)
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from execution.collectors.ado_rest_transformers import WorkItemTransformer
+from execution.core import get_logger
+from execution.security import WIQLValidator
+from execution.utils.ado_batch_utils import batch_fetch_work_items_rest
+
+logger = get_logger(__name__)
+
+DEFAULT_DB_PATH = Path(".tmp/observatory/work_item_cache.db")
+
+# WIQL compares ChangedDate at day precision; re-checking the watermark day
+# itself means edits made later on the same day are never missed.
+_WATERMARK_OVERLAP = timedelta(days=1)
+
+# Fields every cached record carries regardless of what was requested
+_IDENTITY_FIELDS = ("System.Id", "System.Rev", "url")
+
+
+class WorkItemStore:
+    """
+    SQLite-backed work item cache with per-project ChangedDate watermarks.
+
+    Attributes:
+        db_path: Location of the SQLite database
+        cache_hits: Items served from the cache during this run
+        cache_misses: Items downloaded from the REST API during this run
+    """
+
+    def __init__(self, db_path: Path | str = DEFAULT_DB_PATH):
+        """
+        Open (and create if needed) the work item store.
+
+        Args:
+            db_path: SQLite file path (default: .tmp/observatory/work_item_cache.db)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._run_started = datetime.now(UTC)
+        self._syncs: dict[str, asyncio.Task[None]] = {}
+
+    def _create_schema(self) -> None:
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS work_items (
+                project        TEXT    NOT NULL,
+                id             INTEGER NOT NULL,
+                rev            INTEGER,
+                fields_json    TEXT    NOT NULL,
+                fetched_fields TEXT    NOT NULL,
+                synced_at      TEXT    NOT NULL,
+                PRIMARY KEY (project, id)
+            );
+
+            CREATE TABLE IF NOT EXISTS sync_state (
+                project   TEXT PRIMARY KEY,
+                watermark TEXT NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Watermarks
+    # ------------------------------------------------------------------
+
+    def get_watermark(self, project: str) -> datetime | None:
+        """Return the last successful sync time for a project (None if never synced)."""
+        row = self.conn.execute("SELECT watermark FROM sync_state WHERE project = ?", (project,)).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def _set_watermark(self, project: str, watermark: datetime) -> None:
+        self.conn.execute(
+            "INSERT INTO sync_state (project, watermark) VALUES (?, ?) "
+            "ON CONFLICT(project) DO UPDATE SET watermark = excluded.watermark",
+            (project, watermark.isoformat()),
+        )
+        self.conn.commit()
+
+    async def sync_project(self, rest_client: Any, project: str) -> None:
+        """
+        Invalidate items changed since the last watermark (once per project per run).
+
+        Concurrent callers for the same project share one sync.
+
+        Args:
+            rest_client: AzureDevOpsRESTClient
+            project: ADO project name
+        """
+        if project not in self._syncs:
+            self._syncs[project] = asyncio.ensure_future(self._sync_project(rest_client, project))
+        await self._syncs[project]
+
+    async def _sync_project(self, rest_client: Any, project: str) -> None:
+        watermark = self.get_watermark(project)
+        if watermark is None:
+            self.invalidate_project(project)
+        else:
+            since = (watermark - _WATERMARK_OVERLAP).strftime("%Y-%m-%d")
+            try:
+                changed_ids = await self._query_changed_ids(rest_client, project, since)
+            except Exception as e:
+                # Can't tell what changed - start this project from scratch
+                logger.warning(f"Changed-items query failed for {project}, invalidating cache: {e}")
+                self.invalidate_project(project)
+            else:
+                self.invalidate(project, changed_ids)
+                logger.info(f"Work item store: {len(changed_ids)} items changed in {project} since {since}")
+
+        self._set_watermark(project, self._run_started)
+
+    @staticmethod
+    async def _query_changed_ids(rest_client: Any, project: str, since: str) -> list[int]:
+        safe_project = WIQLValidator.validate_project_name(project)
+        safe_since = WIQLValidator.validate_date_iso8601(since)
+        wiql_query = f"""SELECT [System.Id]
+            FROM WorkItems
+            WHERE [System.TeamProject] = '{safe_project}'
+              AND [System.ChangedDate] >= '{safe_since}'
+            """  # nosec B608 - Inputs validated by WIQLValidator
+        response = await rest_client.query_by_wiql(project=safe_project, wiql_query=wiql_query)
+        wiql_result = WorkItemTransformer.transform_wiql_response(response)
+        return [item.id for item in wiql_result.work_items]
+
+    # ------------------------------------------------------------------
+    # Item cache
+    # ------------------------------------------------------------------
+
+    def invalidate(self, project: str, item_ids: list[int]) -> None:
+        """Drop cached records for the given IDs."""
+        self.conn.executemany("DELETE FROM work_items WHERE project = ? AND id = ?", [(project, i) for i in item_ids])
+        self.conn.commit()
+
+    def invalidate_project(self, project: str) -> None:
+        """Drop every cached record for a project."""
+        self.conn.execute("DELETE FROM work_items WHERE project = ?", (project,))
+        self.conn.commit()
+
+    def _load_records(self, project: str, item_ids: list[int]) -> dict[int, tuple[Any, str, str]]:
+        """Return {id: (rev, fields_json, fetched_fields)} for cached IDs."""
+        records: dict[int, tuple[Any, str, str]] = {}
+        # Chunk to stay under SQLite's bound-parameter limit
+        for i in range(0, len(item_ids), 500):
+            chunk = item_ids[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                "SELECT id, rev, fields_json, fetched_fields FROM work_items "
+                f"WHERE project = ? AND id IN ({placeholders})",  # nosec B608 - placeholders only
+                (project, *chunk),
+            ).fetchall()
+            records.update({row[0]: row[1:] for row in rows})
+        return records
+
+    def get_items(self, project: str, item_ids: list[int], fields: list[str]) -> dict[int, dict[str, Any]]:
+        """
+        Return cached items that were fetched with at least the requested fields.
+
+        Args:
+            project: ADO project name
+            item_ids: Work item IDs to look up
+            fields: Field names the caller needs
+
+        Returns:
+            Mapping of ID to SDK-format field dict (requested fields + identity fields)
+        """
+        wanted = set(fields)
+        found: dict[int, dict[str, Any]] = {}
+        for item_id, (_rev, fields_json, fetched_fields) in self._load_records(project, item_ids).items():
+            if not wanted.issubset(json.loads(fetched_fields)):
+                continue
+            record = json.loads(fields_json)
+            found[item_id] = {k: v for k, v in record.items() if k in wanted or k in _IDENTITY_FIELDS}
+        return found
+
+    def put_items(self, project: str, items: list[dict[str, Any]], fields: list[str]) -> None:
+        """
+        Insert or update cached items.
+
+        Same-revision records are merged so field lists requested by different
+        collectors accumulate; a newer revision replaces the record.
+
+        Args:
+            project: ADO project name
+            items: SDK-format field dicts (must include System.Id)
+            fields: Field names that were requested for these items
+        """
+        now = datetime.now(UTC).isoformat()
+        existing = self._load_records(project, [item["System.Id"] for item in items if "System.Id" in item])
+        rows = []
+        for item in items:
+            item_id = item.get("System.Id")
+            if item_id is None:
+                continue
+            rev = item.get("System.Rev")
+            record = dict(item)
+            fetched = set(fields)
+            if item_id in existing:
+                old_rev, old_json, old_fetched = existing[item_id]
+                if rev is None or old_rev is None or rev == old_rev:
+                    record = {**json.loads(old_json), **item}
+                    fetched |= set(json.loads(old_fetched))
+            rows.append((project, item_id, rev, json.dumps(record), json.dumps(sorted(fetched)), now))
+
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO work_items (project, id, rev, fields_json, fetched_fields, synced_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self.conn.commit()
+
+
+# Active store for the current run (set by use_work_item_store)
+_current_store: WorkItemStore | None = None
+
+
+def get_current_work_item_store() -> WorkItemStore | None:
+    """
+    Get the store enabled for the current run.
+
+    Returns:
+        Active WorkItemStore or None if incremental sync is not enabled
+    """
+    return _current_store
+
+
+@contextmanager
+def use_work_item_store(db_path: Path | str = DEFAULT_DB_PATH) -> Generator[WorkItemStore, None, None]:
+    """
+    Enable incremental work item sync for the duration of a collector run.
+
+    Re-entrant: nested calls reuse the already active store.
+
+    Args:
+        db_path: SQLite file path
+
+    Yields:
+        Active WorkItemStore
+    """
+    global _current_store
+
+    if _current_store is not None:
+        yield _current_store
+        return
+
+    store = WorkItemStore(db_path)
+    _current_store = store
+    try:
+        yield store
+    finally:
+        logger.info(
+            "Work item store run summary",
+            extra={"cache_hits": store.cache_hits, "cache_misses": store.cache_misses, "db": str(store.db_path)},
+        )
+        _current_store = None
+        store.close()
+
+
+async def fetch_work_items_incremental(
+    rest_client: Any,
+    project: str,
+    item_ids: list[int],
+    fields: list[str],
+    logger: logging.Logger | None = None,
+) -> tuple[list[dict[str, Any]], list[int]]:
+    """
+    Fetch work items, serving unchanged ones from the active store.
+
+    Falls back to a plain batched REST fetch when no store is active.
+
+    Args:
+        rest_client: AzureDevOpsRESTClient
+        project: ADO project name (cache partition and watermark key)
+        item_ids: Work item IDs to fetch
+        fields: Field names to retrieve
+        logger: Optional logger for batch progress
+
+    Returns:
+        Tuple of (SDK-format items in item_ids order, failed IDs)
+    """
+    if not item_ids:
+        return [], []
+
+    store = get_current_work_item_store()
+    if store is None:
+        items_raw, failed_ids = await batch_fetch_work_items_rest(rest_client, item_ids, fields=fields, logger=logger)
+        return WorkItemTransformer.transform_work_items_response({"value": items_raw}), failed_ids
+
+    await store.sync_project(rest_client, project)
+
+    cached = store.get_items(project, item_ids, fields)
+    missing = [i for i in item_ids if i not in cached]
+    failed_ids = []
+
+    if missing:
+        items_raw, failed_ids = await batch_fetch_work_items_rest(rest_client, missing, fields=fields, logger=logger)
+        fetched = WorkItemTransformer.transform_work_items_response({"value": items_raw})
+        store.put_items(project, fetched, fields)
+        cached.update({item["System.Id"]: item for item in fetched})
+
+    store.cache_hits += len(item_ids) - len(missing)
+    store.cache_misses += len(missing)
+
+    return [cached[i] for i in item_ids if i in cached], failed_ids
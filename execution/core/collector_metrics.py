@@ -14,6 +14,7 @@ import json
 import time
 from collections.abc import Generator
 from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import UTC, datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -23,8 +24,9 @@ from execution.core.observability import capture_exception, track_performance
 
 logger = get_logger(__name__)
 
-# Global tracker instance for REST client access
-_current_tracker: "CollectorMetricsTracker | None" = None
+# Active tracker for REST client access. A ContextVar so collectors running
+# concurrently on one event loop (one asyncio task each) keep separate trackers.
+_current_tracker: ContextVar["CollectorMetricsTracker | None"] = ContextVar("current_collector_tracker", default=None)
 
 
 class CollectorMetricsTracker:
@@ -44,6 +46,10 @@ class CollectorMetricsTracker:
         rate_limit_hits: Number of 429 rate limit responses
         retry_count: Number of transient error retries
         errors: Number of projects that failed collection
+        connection_reuse: Per-host counters {"requests", "reused", "new"} from the pooled HTTP session
+        concurrency_limit: Adaptive concurrency limit at the last request (None if never sampled)
+        min_concurrency_limit: Lowest concurrency limit seen during the run
+        peak_queue_depth: Most requests waiting on the limiter at once
         error_message: Error text if failed (None if successful)
         error_type: Exception class name if failed (None if successful)
 
@@ -73,6 +79,10 @@ class CollectorMetricsTracker:
         self.rate_limit_hits: int = 0
         self.retry_count: int = 0
         self.errors: int = 0
+        self.connection_reuse: dict[str, dict[str, int]] = {}
+        self.concurrency_limit: int | None = None
+        self.min_concurrency_limit: int | None = None
+        self.peak_queue_depth: int = 0
         self.error_message: str | None = None
         self.error_type: str | None = None
 
@@ -181,6 +191,49 @@ class CollectorMetricsTracker:
         """
         self.retry_count += 1
 
+    def record_connection(self, host: str, reused: bool) -> None:
+        """
+        Record whether a request reused a pooled connection.
+
+        Called automatically by REST client after every HTTP response.
+
+        Args:
+            host: Hostname the request was sent to
+            reused: True if the request ran on an existing keep-alive/HTTP/2 connection
+
+        Example:
+            >>> tracker = CollectorMetricsTracker("quality")
+            >>> tracker.record_connection("dev.azure.com", reused=False)
+            >>> tracker.record_connection("dev.azure.com", reused=True)
+            >>> tracker.connection_reuse["dev.azure.com"]
+            {'requests': 2, 'reused': 1, 'new': 1}
+        """
+        stats = self.connection_reuse.setdefault(host, {"requests": 0, "reused": 0, "new": 0})
+        stats["requests"] += 1
+        stats["reused" if reused else "new"] += 1
+
+    def record_rate_limiter(self, snapshot: dict[str, Any]) -> None:
+        """
+        Record the shared rate limiter's state.
+
+        Called automatically by REST client each time a request gets a slot.
+
+        Args:
+            snapshot: AdaptiveRateLimiter.snapshot() (concurrency_limit, queue_depth, ...)
+
+        Example:
+            >>> tracker = CollectorMetricsTracker("quality")
+            >>> tracker.record_rate_limiter({"concurrency_limit": 8, "queue_depth": 40})
+            >>> tracker.concurrency_limit, tracker.peak_queue_depth
+            (8, 40)
+        """
+        limit = snapshot.get("concurrency_limit")
+        if limit is not None:
+            self.concurrency_limit = limit
+            if self.min_concurrency_limit is None or limit < self.min_concurrency_limit:
+                self.min_concurrency_limit = limit
+        self.peak_queue_depth = max(self.peak_queue_depth, snapshot.get("queue_depth", 0))
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert metrics to dictionary for JSON serialization.
@@ -207,6 +260,10 @@ class CollectorMetricsTracker:
             "api_call_count": self.api_call_count,
             "rate_limit_hits": self.rate_limit_hits,
             "retry_count": self.retry_count,
+            "connection_reuse": self.connection_reuse,
+            "concurrency_limit": self.concurrency_limit,
+            "min_concurrency_limit": self.min_concurrency_limit,
+            "peak_queue_depth": self.peak_queue_depth,
             "error_message": self.error_message,
             "error_type": self.error_type,
         }
@@ -316,7 +373,7 @@ def get_current_tracker() -> "CollectorMetricsTracker | None":
         >>> if tracker:
         ...     tracker.record_api_call()
     """
-    return _current_tracker
+    return _current_tracker.get()
 
 
 @contextmanager
@@ -345,10 +402,8 @@ def track_collector_performance(collector_name: str) -> Generator["CollectorMetr
         ...         # ... save results ...
         ...     # Metrics auto-saved on exit
     """
-    global _current_tracker
-
     tracker = CollectorMetricsTracker(collector_name)
-    _current_tracker = tracker
+    token = _current_tracker.set(tracker)
 
     # Integrate with Sentry performance tracking (120s threshold = critical)
     with track_performance(f"collector_{collector_name}", alert_threshold_ms=120000) as perf_ctx:
@@ -368,6 +423,9 @@ def track_collector_performance(collector_name: str) -> Generator["CollectorMetr
                     "rate_limit_hits": tracker.rate_limit_hits,
                     "retry_count": tracker.retry_count,
                     "project_count": tracker.project_count,
+                    "connection_reuse": tracker.connection_reuse,
+                    "concurrency_limit": tracker.concurrency_limit,
+                    "peak_queue_depth": tracker.peak_queue_depth,
                 },
             )
 
@@ -401,5 +459,5 @@ def track_collector_performance(collector_name: str) -> Generator["CollectorMetr
             history_file = Path(".tmp/observatory/collector_performance_history.json")
             tracker.save(history_file)
 
-            # Clear global tracker
-            _current_tracker = None
+            # Restore the previous tracker for this context
+            _current_tracker.reset(token)
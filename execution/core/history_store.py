@@ -0,0 +1,507 @@
+"""
+Week-Partitioned History Store
+
+Metric history used to live in one ``*_history.json`` document per metric
+({"weeks": [...]}) that every save loaded, appended to and rewrote in full.
+A migrated history keeps one small JSON file per week instead:
+
+    .tmp/observatory/flow_history.json              <- legacy document (compat export)
+    .tmp/observatory/history/flow/000001_2026-01-05.json
+    .tmp/observatory/history/flow/000002_2026-01-12.json
+
+Appends write a single partition (O(1)), and readers asking for the last N
+weeks only parse N files. Partition names sort in append order, which is the
+order the legacy "weeks" list had.
+
+A history stays in legacy mode (single document, same behaviour as before)
+until it is migrated with scripts/migrate_history_to_partitions.py. Deleting
+the partition directory reverts to the legacy document.
+
+Readers call load_history() and always get the {"weeks": [...]} view,
+whichever mode the history is in, or load_weeks() for a typed view of the
+last N weeks.
+
+Parsed files are kept in a process-wide cache keyed by path and validated
+against (mtime, size, inode) on every read, so a refresh run that builds many
+dashboards from the same histories parses each file once. A file is parsed
+lazily, on the first read after it changed. Cached weeks are shared between
+readers and must be treated as read-only; writes go through HistoryStore,
+which invalidates the files it replaces.
+
+Usage:
+    from execution.core.history_store import HistoryStore, load_history, load_weeks
+
+    HistoryStore(".tmp/observatory/flow_history.json").append(week_entry, retain=52)
+    recent = load_history(".tmp/observatory/flow_history.json", last_n=12)["weeks"]
+    latest = load_weeks(".tmp/observatory/flow_history.json", last_n=1).latest
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from execution.core.logging_config import get_logger
+from execution.utils_atomic_json import atomic_json_save, load_json_with_recovery
+
+logger = get_logger(__name__)
+
+# History documents handled by the migration tool (collector_performance_history.json is not a metric history)
+METRIC_HISTORY_FILES = [
+    "quality_history.json",
+    "security_history.json",
+    "flow_history.json",
+    "deployment_history.json",
+    "ownership_history.json",
+    "risk_history.json",
+    "collaboration_history.json",
+    "exploitable_history.json",
+]
+
+_UNDATED = "undated"
+
+# Parsed files kept by the read cache (a full set of partitioned histories is ~8 x 52 files)
+HISTORY_CACHE_MAX_FILES = 2048
+
+
+def _write_json_atomic(data: Any, path: Path, indent: int | None = None) -> None:
+    """Write JSON via temp file + rename so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(suffix=".json", dir=path.parent, text=True)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+# ---------------------------------------------------------------------------
+# Process-wide read cache
+# ---------------------------------------------------------------------------
+
+
+class HistoryCache:
+    """
+    Parsed JSON files keyed by path, revalidated by (mtime, size, inode) on every read.
+
+    Attributes:
+        max_files: Parsed files kept before the least recently read is dropped
+        hits: Reads served from memory
+        misses: Reads that parsed the file
+    """
+
+    def __init__(self, max_files: int = HISTORY_CACHE_MAX_FILES):
+        self.max_files = max_files
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[tuple[int, int, int], Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def read_json(self, path: Path) -> Any:
+        """
+        Parsed content of a JSON file, parsing only if it changed since the last read.
+
+        Args:
+            path: JSON file
+
+        Returns:
+            Cached parsed value (shared - do not mutate)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            json.JSONDecodeError: If the file is corrupt (nothing is cached)
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+
+        with open(key, encoding="utf-8") as f:
+            value = json.load(f)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (signature, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_files:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, path: Path | str) -> None:
+        """Drop a file (called by writers so a rewrite within the same mtime tick is never missed)."""
+        with self._lock:
+            self._entries.pop(os.path.abspath(path), None)
+
+    def clear(self) -> None:
+        """Drop every cached file and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_history_cache = HistoryCache()
+
+
+def get_history_cache() -> HistoryCache:
+    """
+    Get the process-wide history read cache.
+
+    Returns:
+        HistoryCache shared by every HistoryStore in this process
+    """
+    return _history_cache
+
+
+def _content_key(week: Any) -> str:
+    """Stable key for a legacy-mode week (partitioned weeks are keyed by file name)."""
+    return hashlib.sha256(json.dumps(week, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+class HistoryStore:
+    """
+    Weekly metric history in legacy (single document) or partitioned mode.
+
+    Attributes:
+        legacy_file: Path of the {"weeks": [...]} document (e.g., flow_history.json)
+        partition_dir: Directory holding one file per week once migrated
+    """
+
+    def __init__(self, history_file: Path | str):
+        """
+        Args:
+            history_file: Legacy history path; the partition directory is derived from it
+                (``<dir>/flow_history.json`` -> ``<dir>/history/flow/``)
+        """
+        self.legacy_file = Path(history_file)
+        metric = self.legacy_file.stem.removesuffix("_history")
+        self.partition_dir = self.legacy_file.parent / "history" / metric
+
+    @property
+    def partitioned(self) -> bool:
+        """True once the history has been migrated to week partitions."""
+        return self.partition_dir.is_dir()
+
+    def exists(self) -> bool:
+        """True if there is any history (partitioned or legacy)."""
+        return self.partitioned or self.legacy_file.exists()
+
+    @property
+    def data_path(self) -> Path:
+        """Path whose mtime reflects the last write (partition directory or legacy file), for freshness checks."""
+        return self.partition_dir if self.partitioned else self.legacy_file
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _partition_files(self) -> list[Path]:
+        return sorted(self.partition_dir.glob("*.json"))
+
+    def load(self, last_n: int | None = None) -> dict[str, Any]:
+        """
+        Load the history as a {"weeks": [...]} document.
+
+        Args:
+            last_n: Only return the most recent N weeks (None = all)
+
+        Returns:
+            History document; in partitioned mode only the needed weeks are parsed
+
+        Raises:
+            FileNotFoundError: If the history does not exist
+            json.JSONDecodeError: If the legacy document or a partition is corrupt
+        """
+        if self.partitioned:
+            files = self._partition_files()
+            if last_n is not None:
+                files = files[-last_n:] if last_n > 0 else []
+            return {"weeks": [_history_cache.read_json(path) for path in files]}
+
+        cached = _history_cache.read_json(self.legacy_file)
+        if not isinstance(cached, dict):
+            return cached  # type: ignore[no-any-return]
+        # Fresh top-level dict and weeks list, so callers slicing or reassigning never touch the cache
+        data = dict(cached)
+        if isinstance(data.get("weeks"), list):
+            weeks = data["weeks"]
+            if last_n is not None:
+                weeks = weeks[-last_n:] if last_n > 0 else []
+            data["weeks"] = list(weeks)
+        return data
+
+    def load_new(self, seen: Collection[str]) -> tuple[list[str], list[tuple[str, dict[str, Any]]]]:
+        """
+        Load only the weeks an incremental consumer has not processed yet.
+
+        Every week has a stable key: its partition name once migrated (so only
+        unseen partitions are parsed), otherwise a hash of its content.
+
+        Args:
+            seen: Keys the consumer has already processed
+
+        Returns:
+            Tuple of (keys of all weeks in history order, [(key, week)] for weeks not in seen)
+
+        Raises:
+            FileNotFoundError: If the history does not exist
+            ValueError: If the legacy document has no "weeks" list
+        """
+        if self.partitioned:
+            files = self._partition_files()
+            new = [(path.stem, _history_cache.read_json(path)) for path in files if path.stem not in seen]
+            return [path.stem for path in files], new
+
+        data = self.load()
+        weeks = data.get("weeks") if isinstance(data, dict) else None
+        if not isinstance(weeks, list):
+            raise ValueError(f"No weeks list in {self.legacy_file}")
+        keyed = [(_content_key(week), week) for week in weeks]
+        return [key for key, _ in keyed], [(key, week) for key, week in keyed if key not in seen]
+
+    def _load_legacy_for_update(self) -> dict[str, Any]:
+        """Legacy document for a read-modify-write, recovering from corruption like the old savers."""
+        history = load_json_with_recovery(str(self.legacy_file), default_value={"weeks": []})
+        if not isinstance(history, dict) or not isinstance(history.get("weeks"), list):
+            logger.warning(
+                "Existing history file has invalid structure - recreating", extra={"file": str(self.legacy_file)}
+            )
+            history = {"weeks": []}
+        return history
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, entry: dict[str, Any], retain: int | None = None, replace_same_week: bool = False) -> int:
+        """
+        Append one week.
+
+        Args:
+            entry: Week document (normally carries "week_date")
+            retain: Keep only the most recent N weeks (None = keep all)
+            replace_same_week: Drop existing weeks with the same week_date first
+
+        Returns:
+            Number of weeks in the history after the append
+        """
+        if not self.partitioned:
+            history = self._load_legacy_for_update()
+            weeks = history["weeks"]
+            if replace_same_week:
+                weeks = [w for w in weeks if w.get("week_date") != entry.get("week_date")]
+            weeks.append(entry)
+            if retain is not None:
+                weeks = weeks[-retain:]
+            history["weeks"] = weeks
+            atomic_json_save(history, str(self.legacy_file))
+            _history_cache.invalidate(self.legacy_file)
+            return len(weeks)
+
+        files = self._partition_files()
+        week_date = str(entry.get("week_date") or _UNDATED)
+        if replace_same_week:
+            for path in [p for p in files if p.stem.split("_", 1)[1] == week_date]:
+                path.unlink()
+                _history_cache.invalidate(path)
+                files.remove(path)
+
+        next_seq = int(files[-1].stem.split("_", 1)[0]) + 1 if files else 1
+        path = self.partition_dir / f"{next_seq:06d}_{week_date}.json"
+        _write_json_atomic(entry, path)
+        files.append(path)
+
+        if retain is not None and len(files) > retain:
+            for path in files[:-retain]:
+                path.unlink()
+                _history_cache.invalidate(path)
+            files = files[-retain:]
+        return len(files)
+
+    def update_latest(self, update: Callable[[list[dict[str, Any]]], bool]) -> bool:
+        """
+        Modify the most recent week in place.
+
+        Args:
+            update: Called with the last two weeks (oldest first); mutates weeks[-1]
+                and returns True to persist the change
+
+        Returns:
+            True if the latest week was rewritten
+        """
+        if not self.partitioned:
+            history = self._load_legacy_for_update()
+            if not history["weeks"] or not update(history["weeks"][-2:]):
+                return False
+            _write_json_atomic(history, self.legacy_file, indent=2)
+            _history_cache.invalidate(self.legacy_file)
+            return True
+
+        files = self._partition_files()[-2:]
+        if not files:
+            return False
+        weeks = [json.loads(path.read_text(encoding="utf-8")) for path in files]
+        if not update(weeks):
+            return False
+        _write_json_atomic(weeks[-1], files[-1])
+        _history_cache.invalidate(files[-1])
+        return True
+
+    # ------------------------------------------------------------------
+    # Migration / compatibility export
+    # ------------------------------------------------------------------
+
+    def migrate(self, force: bool = False) -> int:
+        """
+        Split the legacy document into week partitions.
+
+        Args:
+            force: Replace existing partitions (e.g., after the legacy file was regenerated elsewhere)
+
+        Returns:
+            Number of weeks written (0 if already migrated and not forced)
+
+        Raises:
+            FileNotFoundError: If there is no legacy document to migrate
+            ValueError: If the legacy document has no "weeks" list
+        """
+        if self.partitioned and not force:
+            return 0
+
+        with open(self.legacy_file, encoding="utf-8") as f:
+            data = json.load(f)
+        weeks = data.get("weeks") if isinstance(data, dict) else None
+        if not isinstance(weeks, list):
+            raise ValueError(f"No weeks list in {self.legacy_file}")
+
+        # Build next to the target and swap in, so a failed migration leaves nothing half-written
+        staging = Path(tempfile.mkdtemp(prefix=f".{self.partition_dir.name}-", dir=self.legacy_file.parent))
+        try:
+            for seq, week in enumerate(weeks, start=1):
+                week_date = str(week.get("week_date") or _UNDATED) if isinstance(week, dict) else _UNDATED
+                _write_json_atomic(week, staging / f"{seq:06d}_{week_date}.json")
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        if self.partition_dir.is_dir():
+            for path in self.partition_dir.glob("*.json"):
+                path.unlink()
+            self.partition_dir.rmdir()
+        self.partition_dir.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(staging, self.partition_dir)
+        return len(weeks)
+
+    def export(self, output_file: Path | str | None = None) -> Path:
+        """
+        Write the {"weeks": [...]} compatibility document (for CI artifacts and external tools).
+
+        Args:
+            output_file: Destination (default: the legacy history path)
+
+        Returns:
+            Path written
+        """
+        target = Path(output_file) if output_file else self.legacy_file
+        _write_json_atomic(self.load(), target, indent=2)
+        _history_cache.invalidate(target)
+        return target
+
+
+def load_history(history_file: Path | str, last_n: int | None = None) -> dict[str, Any]:
+    """
+    Load a metric history as {"weeks": [...]}, partitioned or legacy.
+
+    Args:
+        history_file: Legacy history path (e.g., .tmp/observatory/flow_history.json)
+        last_n: Only return the most recent N weeks (None = all)
+
+    Returns:
+        History document
+
+    Raises:
+        FileNotFoundError: If the history does not exist
+        json.JSONDecodeError: If the history is corrupt
+    """
+    return HistoryStore(history_file).load(last_n=last_n)
+
+
+def history_exists(history_file: Path | str) -> bool:
+    """True if the history exists in either mode."""
+    return HistoryStore(history_file).exists()
+
+
+@dataclass(frozen=True)
+class HistoryWeeks:
+    """
+    Read-only view of the most recent weeks of one metric history.
+
+    Attributes:
+        metric: Metric name derived from the file (e.g., "flow" for flow_history.json)
+        weeks: Weeks in history order, oldest first (shared with the read cache - do not mutate)
+    """
+
+    metric: str
+    weeks: tuple[dict[str, Any], ...]
+
+    def __len__(self) -> int:
+        return len(self.weeks)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self.weeks)
+
+    def __bool__(self) -> bool:
+        return bool(self.weeks)
+
+    @property
+    def latest(self) -> dict[str, Any] | None:
+        """Most recent week (None if the history has no weeks)."""
+        return self.weeks[-1] if self.weeks else None
+
+    @property
+    def week_dates(self) -> list[str]:
+        """week_date of every week ("" where missing)."""
+        return [str(week.get("week_date", "")) for week in self.weeks]
+
+
+def load_weeks(history_file: Path | str, last_n: int | None = None) -> HistoryWeeks:
+    """
+    Load the last N weeks of a metric history as a typed view.
+
+    A document without a "weeks" list yields an empty view, like
+    load_history(...).get("weeks", []) did.
+
+    Args:
+        history_file: Legacy history path (e.g., .tmp/observatory/flow_history.json)
+        last_n: Only return the most recent N weeks (None = all)
+
+    Returns:
+        HistoryWeeks view
+
+    Raises:
+        FileNotFoundError: If the history does not exist
+        json.JSONDecodeError: If the history is corrupt
+    """
+    data = load_history(history_file, last_n=last_n)
+    weeks = data.get("weeks") if isinstance(data, dict) else None
+    if not isinstance(weeks, list):
+        logger.warning("History has no weeks list", extra={"file": str(history_file)})
+        weeks = []
+    return HistoryWeeks(metric=Path(history_file).stem.removesuffix("_history"), weeks=tuple(weeks))
@@ -0,0 +1,447 @@
+"""
+Dashboard Build Graph - parallel, incremental dashboard generation
+
+refresh_all_dashboards.py used to start one Python process per dashboard, one
+after another, each paying interpreter start-up, pandas/numpy imports and
+Jinja environment set-up again. The build graph instead imports each
+generator as a module and renders independent dashboards concurrently in a
+process pool whose workers set up the Jinja environments once and keep them
+for every dashboard they build.
+
+Each DashboardTarget declares its data inputs:
+- sections: run snapshot sections it renders from (execution/collectors/run_snapshot.py)
+- files: other files it reads (history files, data/*.json)
+- writes: files it patches besides its own output
+  (security_enhanced patches the latest week of security_history.json)
+- after: dashboards that write one of its inputs and must finish first
+  (the trends index reads the security history patches)
+
+A dashboard is skipped when its output exists and the content hash of its
+inputs (plus the dashboard code and templates) equals the one recorded at its
+last successful build. Two kinds of dashboard always rebuild:
+- one whose snapshot section is missing from the current run: it falls back
+  to live queries whose results cannot be hashed up front
+- one that writes files: the collector may have appended a week since the last
+  build, and skipping would leave that week without the dashboard's patches
+
+Every run writes a per-dashboard timing report (status, seconds, worker PID)
+to .tmp/observatory/dashboard_build_report.json.
+
+Usage:
+    from execution.dashboards.build_graph import DashboardBuildScheduler
+
+    report = DashboardBuildScheduler(workers=4).run()
+"""
+
+import asyncio
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import json
+import multiprocessing
+import os
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from execution.collectors.aql_count_cache import use_aql_count_cache
+from execution.collectors.run_snapshot import get_run_snapshot
+from execution.core import get_logger
+from execution.core.history_store import HistoryStore
+
+logger = get_logger(__name__)
+
+OBSERVATORY_DIR = Path(".tmp/observatory")
+DASHBOARD_DIR = OBSERVATORY_DIR / "dashboards"
+DEFAULT_STATE_PATH = OBSERVATORY_DIR / "dashboard_build_state.json"
+DEFAULT_REPORT_PATH = OBSERVATORY_DIR / "dashboard_build_report.json"
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Snapshot payload keys that differ between runs without changing what a dashboard shows
+VOLATILE_KEYS = frozenset({"collected_at"})
+
+# Code whose changes invalidate every dashboard (generators, components, framework assets, templates)
+CODE_ROOTS = (
+    PROJECT_ROOT / "execution" / "dashboards",
+    PROJECT_ROOT / "execution" / "framework",
+    PROJECT_ROOT / "templates",
+    PROJECT_ROOT / "execution" / "templates",
+)
+
+
+@dataclass(frozen=True)
+class DashboardTarget:
+    """
+    One dashboard in the build graph.
+
+    Attributes:
+        name: Display name (also the key in the build state and report)
+        entry: "module:function" generating the dashboard (sync or async)
+        output: Main HTML file the generator writes
+        argument: What the generator takes: "path" (output file), "dir" (output directory) or "none"
+        sections: Run snapshot sections the dashboard renders from
+        files: Other input files (history files are resolved through HistoryStore)
+        writes: Files the generator patches besides its output (never skipped)
+        after: Names of dashboards that must finish before this one starts
+    """
+
+    name: str
+    entry: str
+    output: Path
+    argument: str = "path"
+    sections: tuple[str, ...] = ()
+    files: tuple[str, ...] = ()
+    writes: tuple[str, ...] = ()
+    after: tuple[str, ...] = ()
+
+
+DASHBOARDS: list[DashboardTarget] = [
+    DashboardTarget(
+        "Quality Dashboard",
+        "execution.dashboards.quality:generate_quality_dashboard",
+        DASHBOARD_DIR / "quality_dashboard.html",
+        sections=("quality",),
+    ),
+    DashboardTarget(
+        "Flow Dashboard",
+        "execution.dashboards.flow:generate_flow_dashboard",
+        DASHBOARD_DIR / "flow_dashboard.html",
+        sections=("flow",),
+        files=(".tmp/observatory/flow_history.json",),
+    ),
+    DashboardTarget(
+        "Ownership Dashboard",
+        "execution.dashboards.ownership:generate_ownership_dashboard",
+        DASHBOARD_DIR / "ownership_dashboard.html",
+        sections=("ownership",),
+    ),
+    DashboardTarget(
+        "Risk Dashboard",
+        "execution.dashboards.risk:generate_risk_dashboard",
+        DASHBOARD_DIR / "risk_dashboard.html",
+        sections=("risk",),
+    ),
+    DashboardTarget(
+        "Deployment Dashboard",
+        "execution.dashboards.deployment:generate_deployment_dashboard",
+        DASHBOARD_DIR / "deployment_dashboard.html",
+        sections=("deployment",),
+        files=(".tmp/observatory/deployment_history.json",),
+    ),
+    DashboardTarget(
+        "Collaboration Dashboard",
+        "execution.dashboards.collaboration:generate_collaboration_dashboard",
+        DASHBOARD_DIR / "collaboration_dashboard.html",
+        sections=("collaboration",),
+    ),
+    DashboardTarget(
+        "Security Dashboard (Enhanced with drill-down)",
+        "execution.dashboards.security_enhanced:generate_security_dashboard_enhanced",
+        DASHBOARD_DIR / "security_dashboard.html",
+        argument="dir",
+        sections=("security_enhanced",),
+        files=("data/armorcode_id_map.json",),
+        writes=(".tmp/observatory/security_history.json",),
+    ),
+    DashboardTarget(
+        "Target Dashboard",
+        "execution.dashboards.targets:generate_targets_dashboard",
+        DASHBOARD_DIR / "target_dashboard.html",
+        sections=("targets", "quality"),
+        files=("data/security_targets.json", "data/baseline.json"),
+    ),
+    DashboardTarget(
+        "Executive Trends (index.html)",
+        "execution.generate_trends_dashboard:main",
+        DASHBOARD_DIR / "index.html",
+        argument="none",
+        files=(
+            ".tmp/observatory/quality_history.json",
+            ".tmp/observatory/security_history.json",
+            ".tmp/observatory/flow_history.json",
+            ".tmp/observatory/deployment_history.json",
+            ".tmp/observatory/collaboration_history.json",
+            ".tmp/observatory/ownership_history.json",
+            ".tmp/observatory/risk_history.json",
+            ".tmp/observatory/exploitable_history.json",
+            "data/security_targets.json",
+            "data/baseline.json",
+        ),
+        after=("Security Dashboard (Enhanced with drill-down)",),
+    ),
+]
+
+
+def _hash_file_into(digest: Any, path: Path, name: str | None = None) -> None:
+    digest.update((name or path.as_posix()).encode("utf-8"))
+    digest.update(path.read_bytes())
+
+
+def _hash_history_into(digest: Any, history_file: Path) -> bool:
+    """Hash a history in either storage mode; False if it does not exist."""
+    store = HistoryStore(history_file)
+    if store.partitioned:
+        for partition in sorted(store.partition_dir.glob("*.json")):
+            _hash_file_into(digest, partition)
+        return True
+    if history_file.exists():
+        _hash_file_into(digest, history_file)
+        return True
+    return False
+
+
+def _without_timestamps(value: Any) -> Any:
+    """Copy of a snapshot payload without "collected_at" keys (they change every run)."""
+    if isinstance(value, dict):
+        return {k: _without_timestamps(v) for k, v in value.items() if k not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [_without_timestamps(v) for v in value]
+    return value
+
+
+def code_fingerprint(roots: Iterable[Path] = CODE_ROOTS) -> str:
+    """
+    Content hash of the dashboard generators and templates.
+
+    Args:
+        roots: Directories whose files (*.py, *.html, *.css, *.js) are hashed
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for root in roots:
+        for path in sorted(root.rglob("*")):
+            if path.is_file() and path.suffix in (".py", ".html", ".css", ".js"):
+                _hash_file_into(digest, path, path.relative_to(root.parent).as_posix())
+    return digest.hexdigest()
+
+
+def input_fingerprint(target: DashboardTarget, code_hash: str) -> str | None:
+    """
+    Content hash of everything a dashboard is rendered from.
+
+    Snapshot sections are hashed by payload (not file bytes) without their
+    collection timestamps, so a new run that collected identical data
+    produces the same hash.
+
+    Args:
+        target: Dashboard to fingerprint
+        code_hash: code_fingerprint() of this run
+
+    Returns:
+        Hex SHA-256 digest, or None if a snapshot section is missing (must rebuild)
+    """
+    digest = hashlib.sha256(code_hash.encode("utf-8"))
+    digest.update(target.entry.encode("utf-8"))
+    spec = importlib.util.find_spec(target.entry.split(":")[0])
+    if spec is not None and spec.origin:
+        _hash_file_into(digest, Path(spec.origin), "entry")
+
+    snapshot = get_run_snapshot() if target.sections else None
+    for section in target.sections:
+        payload = snapshot.load(section) if snapshot is not None else None
+        if payload is None:
+            return None
+        digest.update(section.encode("utf-8"))
+        digest.update(json.dumps(_without_timestamps(payload), sort_keys=True, default=str).encode("utf-8"))
+
+    for name in target.files:
+        path = Path(name)
+        if name.endswith("_history.json"):
+            found = _hash_history_into(digest, path)
+        else:
+            found = path.exists()
+            if found:
+                _hash_file_into(digest, path)
+        digest.update(b"+" if found else b"-")
+    return digest.hexdigest()
+
+
+def warm_worker() -> None:
+    """
+    Process pool initializer: build the Jinja environments once per worker.
+
+    Every dashboard rendered by this worker reuses them (and their compiled
+    template cache) instead of paying set-up per dashboard.
+    """
+    from execution.dashboards.renderer import get_jinja_environment
+    from execution.template_engine import get_template_engine
+
+    get_jinja_environment()
+    get_template_engine()
+
+
+def build_dashboard(target: DashboardTarget) -> dict[str, Any]:
+    """
+    Generate one dashboard in the current process.
+
+    Args:
+        target: Dashboard to build
+
+    Returns:
+        Report entry: {name, status ("built" or "failed"), seconds, worker_pid, error}
+    """
+    start = time.perf_counter()
+    entry: dict[str, Any] = {"name": target.name, "worker_pid": os.getpid()}
+    try:
+        module_name, function_name = target.entry.split(":")
+        generate = getattr(importlib.import_module(module_name), function_name)
+        if target.argument == "path":
+            args: tuple[Path, ...] = (target.output,)
+        elif target.argument == "dir":
+            args = (target.output.parent,)
+        else:
+            args = ()
+
+        with use_aql_count_cache():
+            result = generate(*args)
+            if inspect.isawaitable(result):
+                asyncio.run(result)  # type: ignore[arg-type]
+        entry["status"] = "built"
+    except (Exception, SystemExit) as e:
+        logger.error(f"[FAIL] {target.name}: {e}", exc_info=not isinstance(e, SystemExit))
+        entry["status"] = "failed"
+        entry["error"] = f"{type(e).__name__}: {e}"
+    entry["seconds"] = round(time.perf_counter() - start, 3)
+    return entry
+
+
+def _check_acyclic(targets: Sequence[DashboardTarget]) -> None:
+    """Raise ValueError if the `after` dependencies contain a cycle."""
+    remaining = {target.name: set(target.after) for target in targets}
+    while remaining:
+        free = [name for name, deps in remaining.items() if not deps & remaining.keys()]
+        if not free:
+            raise ValueError(f"Dashboard dependency cycle between: {sorted(remaining)}")
+        for name in free:
+            del remaining[name]
+
+
+class DashboardBuildScheduler:
+    """
+    Builds the dashboard graph: dependencies first, independent dashboards in parallel.
+
+    Attributes:
+        targets: Dashboards to consider
+        workers: Worker processes (1 builds in this process, serially)
+        force: Rebuild even when inputs are unchanged
+        state_path: Input hashes of the last successful build per dashboard
+        report_path: Timing report written after every run
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[DashboardTarget] = DASHBOARDS,
+        workers: int | None = None,
+        force: bool = False,
+        state_path: Path | str = DEFAULT_STATE_PATH,
+        report_path: Path | str = DEFAULT_REPORT_PATH,
+    ):
+        names = {target.name for target in targets}
+        for target in targets:
+            unknown = set(target.after) - names
+            if unknown:
+                raise ValueError(f"{target.name} depends on unknown dashboards: {sorted(unknown)}")
+        _check_acyclic(targets)
+        self.targets = list(targets)
+        self.workers = workers if workers is not None else min(len(self.targets), os.cpu_count() or 1)
+        self.force = force
+        self.state_path = Path(state_path)
+        self.report_path = Path(report_path)
+
+    def _load_state(self) -> dict[str, str]:
+        if not self.state_path.exists():
+            return {}
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable build state {self.state_path}: {e}")
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _save_state(self, state: dict[str, str]) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        self.state_path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+
+    def run(self) -> dict[str, Any]:
+        """
+        Build every dashboard whose inputs changed.
+
+        Returns:
+            Report: {started_at, workers, total_seconds, dashboards: [entry, ...]}
+            (entry status is "built", "skipped" or "failed")
+        """
+        started_at = datetime.now().isoformat()
+        start = time.perf_counter()
+        state = self._load_state()
+        code_hash = code_fingerprint()
+        entries: dict[str, dict[str, Any]] = {}
+        fingerprints: dict[str, str | None] = {}
+
+        pending = {target.name: target for target in self.targets}
+        running: dict[Future[dict[str, Any]], DashboardTarget] = {}
+
+        def ready() -> list[DashboardTarget]:
+            return [t for t in pending.values() if all(dep in entries for dep in t.after)]
+
+        def finish(target: DashboardTarget, entry: dict[str, Any]) -> None:
+            entries[target.name] = entry
+            fingerprint = fingerprints.get(target.name)
+            if entry["status"] == "built" and fingerprint is not None:
+                state[target.name] = fingerprint
+            elif entry["status"] == "failed":
+                state.pop(target.name, None)
+            logger.info(f"[{entry['status'].upper()}] {target.name} ({entry['seconds']:.2f}s)")
+
+        def start_ready(submit) -> None:
+            for target in ready():
+                del pending[target.name]
+                # Hashed once its dependencies are done, since they may have rewritten its inputs
+                fingerprint = input_fingerprint(target, code_hash)
+                fingerprints[target.name] = fingerprint
+                unchanged = fingerprint is not None and state.get(target.name) == fingerprint
+                if unchanged and target.output.exists() and not target.writes and not self.force:
+                    finish(target, {"name": target.name, "status": "skipped", "seconds": 0.0})
+                else:
+                    submit(target)
+
+        if self.workers <= 1:
+            while pending:
+                start_ready(lambda target: finish(target, build_dashboard(target)))
+        else:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=context, initializer=warm_worker) as pool:
+
+                def submit(target: DashboardTarget) -> None:
+                    running[pool.submit(build_dashboard, target)] = target
+
+                start_ready(submit)
+                while running or pending:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        target = running.pop(future)
+                        try:
+                            entry = future.result()
+                        except Exception as e:  # worker process died
+                            entry = {"name": target.name, "status": "failed", "seconds": 0.0, "error": str(e)}
+                        finish(target, entry)
+                    start_ready(submit)
+
+        self._save_state(state)
+        report = {
+            "started_at": started_at,
+            "workers": self.workers,
+            "total_seconds": round(time.perf_counter() - start, 3),
+            "dashboards": [entries[target.name] for target in self.targets],
+        }
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        self.report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        logger.info(f"Dashboard build report saved to {self.report_path}")
+        return report
@@ -25,6 +25,7 @@ from pathlib import Path
 
 from execution.collectors.ado_collaboration_metrics import collect_collaboration_metrics_for_project
 from execution.collectors.ado_rest_client import get_ado_rest_client
+from execution.collectors.run_snapshot import load_snapshot_section
 from execution.core import get_logger
 from execution.dashboards.components.cards import metric_card
 from execution.dashboards.renderer import render_dashboard
@@ -95,13 +96,21 @@ async def _load_collaboration_data() -> dict:
     """
     Load collaboration metrics by querying Azure DevOps API directly.
 
+    The metrics collected earlier in this refresh run are used instead when
+    the run snapshot has them.
+
     Returns:
         Fresh collaboration data with projects
 
     Raises:
         SystemExit: If discovery file not found
+        SnapshotMissingError: In snapshot-only mode when collaboration was not collected
         ValueError: If ADO REST client initialization fails
     """
+    snapshot: dict | None = load_snapshot_section("collaboration")
+    if snapshot is not None:
+        return snapshot
+
     # Load discovery data to get project list
     discovery_file = Path(".tmp/observatory/ado_structure.json")
 
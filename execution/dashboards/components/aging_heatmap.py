@@ -10,6 +10,8 @@ Usage:
     heatmap_html = generate_aging_heatmap(vulnerabilities)
 """
 
+from bisect import bisect_right
+
 from execution.core import get_logger
 
 logger = get_logger(__name__)
@@ -45,20 +47,26 @@ def _compute_cell_bg_color(severity_type: str, intensity: float) -> str:
 
 
 def _count_by_severity_and_bucket(vulnerabilities: list, age_buckets: list[dict]) -> dict[str, dict[str, int]]:
-    """Count Critical/High vulnerabilities by age bucket."""
+    """
+    Count Critical/High vulnerabilities by age bucket.
+
+    Single pass: each age is placed with a binary search over the bucket
+    lower bounds instead of scanning every bucket.
+    """
     heatmap_data: dict[str, dict[str, int]] = {
         "CRITICAL": {bucket["label"]: 0 for bucket in age_buckets},
         "HIGH": {bucket["label"]: 0 for bucket in age_buckets},
     }
+    ordered = sorted(age_buckets, key=lambda bucket: bucket["min"])
+    lower_bounds = [bucket["min"] for bucket in ordered]
     for vuln in vulnerabilities:
         severity = vuln.severity if hasattr(vuln, "severity") else vuln.get("severity", "")
-        age_days = vuln.age_days if hasattr(vuln, "age_days") else vuln.get("age_days", 0)
-        if severity not in ["CRITICAL", "HIGH"]:
+        if severity not in heatmap_data:
             continue
-        for bucket in age_buckets:
-            if bucket["min"] <= age_days <= bucket["max"]:
-                heatmap_data[severity][bucket["label"]] += 1
-                break
+        age_days = vuln.age_days if hasattr(vuln, "age_days") else vuln.get("age_days", 0)
+        index = bisect_right(lower_bounds, age_days) - 1
+        if index >= 0 and age_days <= ordered[index]["max"]:
+            heatmap_data[severity][ordered[index]["label"]] += 1
     return heatmap_data
 
 
@@ -34,6 +34,7 @@ from execution.collectors.ado_deployment_metrics import (
     query_builds,
 )
 from execution.collectors.ado_rest_client import get_ado_rest_client
+from execution.collectors.run_snapshot import load_snapshot_section
 from execution.core import get_logger
 from execution.dashboards.deployment_helpers import load_deployment_trend_chart
 from execution.dashboards.renderer import render_dashboard
@@ -101,12 +102,21 @@ async def _query_deployment_data() -> tuple[list[DeploymentMetrics], list[dict],
     """
     Query fresh deployment metrics from Azure DevOps API.
 
+    The metrics collected earlier in this refresh run are used instead when
+    the run snapshot has them.
+
     Returns:
         Tuple of (metrics_list, raw_project_data, collection_date)
 
     Raises:
         FileNotFoundError: If discovery data (ado_structure.json) doesn't exist
+        SnapshotMissingError: In snapshot-only mode when deployment was not collected
     """
+    snapshot: dict | None = load_snapshot_section("deployment")
+    if snapshot is not None:
+        snapshot_projects: list[dict[Any, Any]] = snapshot.get("projects", [])
+        return [from_json(project) for project in snapshot_projects], snapshot_projects, snapshot["week_date"]
+
     # Load discovery data to get project list
     discovery_file = Path(".tmp/observatory/ado_structure.json")
 
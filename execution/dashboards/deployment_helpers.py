@@ -5,10 +5,10 @@ Extracted helper functions to keep deployment.py under 500 lines.
 Contains trend chart loading logic for historical deployment metrics.
 """
 
-import json
 from pathlib import Path
 
 from execution.core import get_logger
+from execution.core.history_store import history_exists, load_weeks
 from execution.dashboards.components.forecast_chart import build_trend_chart
 
 logger = get_logger(__name__)
@@ -52,17 +52,15 @@ def load_deployment_trend_chart() -> str:
         HTML string for the trend chart, or empty string if history unavailable.
     """
     history_path = Path(".tmp/observatory/deployment_history.json")
-    if not history_path.exists():
+    if not history_exists(history_path):
         return ""
 
     try:
-        with open(history_path, encoding="utf-8") as fh:
-            data = json.load(fh)
+        weeks = list(load_weeks(history_path))
     except (ValueError, OSError) as e:
         logger.warning("Could not load deployment_history.json for trend chart: %s", e)
         return ""
 
-    weeks = data.get("weeks", [])
     if not weeks:
         return ""
 
@@ -13,14 +13,17 @@ Usage:
 
 import json
 import logging
+from collections.abc import Hashable, Sequence
 from datetime import datetime
 from pathlib import Path
 
 from execution.collectors.armorcode_vulnerability_loader import (
+    AqlFindingsScope,
     ArmorCodeVulnerabilityLoader,
     VulnerabilityDetail,
 )
 from execution.core import get_logger
+from execution.core.history_store import history_exists, load_weeks
 from execution.dashboards.components.cards import metric_card
 from execution.dashboards.components.charts import sparkline
 from execution.dashboards.renderer import render_dashboard
@@ -101,7 +104,7 @@ def _fetch_product_records(
         logger.warning("ArmorCode API not configured — child records will be empty")
         return {}
 
-    records_by_product: dict[str, list[VulnerabilityDetail]] = {}
+    scopes: dict[Hashable, AqlFindingsScope] = {}
     for m in metrics:
         if m.total == 0:
             continue  # nothing to fetch for this product
@@ -109,17 +112,19 @@ def _fetch_product_records(
         if not pid:
             logger.warning(f"No ArmorCode ID for product {m.product!r} — skipping")
             continue
-        logger.info(f"Fetching CISA KEV records for {m.product} (id={pid})")
-        records = loader.fetch_findings_aql(
-            hierarchy=hierarchy,
-            cisa_kev=True,
-            severities=["Critical", "High", "Medium"],
-            page_size=_MAX_RECORDS_PER_PRODUCT,
-            product_id=pid,
-        )
-        records_by_product[m.product] = records
+        scopes[m.product] = AqlFindingsScope(product_id=pid, cisa_kev=True)
+    if not scopes:
+        return {}
 
-    return records_by_product
+    logger.info(f"Fetching CISA KEV records for {len(scopes)} products")
+    records_by_scope = loader.fetch_findings_batch_aql(
+        hierarchy,
+        scopes,
+        environment="Production",
+        severities=["Critical", "High", "Medium"],
+        page_size=_MAX_RECORDS_PER_PRODUCT,
+    )
+    return {str(product): records for product, records in records_by_scope.items()}
 
 
 def _build_severity_filter_bar(records: list[VulnerabilityDetail]) -> str:
@@ -201,7 +206,7 @@ def _generate_expanded_html(
     return truncation_note + search_bar + table
 
 
-def _build_product_trends(weeks: list[dict]) -> dict[str, list[int]]:
+def _build_product_trends(weeks: Sequence[dict]) -> dict[str, list[int]]:
     """Build per-product total counts across all weeks for sparkline rendering."""
     all_products = {p for w in weeks for p in w["metrics"].get("product_breakdown", {})}
     trends: dict[str, list[int]] = {p: [] for p in all_products}
@@ -225,17 +230,16 @@ def _load_data() -> tuple[list[ExploitableMetrics], dict[str, list[int]], dict[s
         Tuple of (list of ExploitableMetrics, product trend data, name→id map)
         The name→id map is used by _fetch_product_records to look up ArmorCode product IDs.
     """
-    if not HISTORY_PATH.exists():
+    if not history_exists(HISTORY_PATH):
         logger.warning(f"History file not found: {HISTORY_PATH}")
         return [], {}, {}
 
-    history = json.loads(HISTORY_PATH.read_text(encoding="utf-8"))
-    weeks = history.get("weeks", [])
-    if not weeks:
+    weeks = load_weeks(HISTORY_PATH)
+    latest = weeks.latest
+    if latest is None:
         logger.warning("No weeks found in exploitable history")
         return [], {}, {}
 
-    latest = weeks[-1]
     timestamp_str = latest["metrics"].get("collected_at", latest.get("week_date", ""))
     try:
         timestamp = datetime.fromisoformat(timestamp_str)
@@ -258,7 +262,7 @@ def _load_data() -> tuple[list[ExploitableMetrics], dict[str, list[int]], dict[s
         metrics.append(ExploitableMetrics.from_json(product_name, data, timestamp))
 
     logger.info(f"Loaded {len(metrics)} products from {latest.get('week_date', '?')}")
-    raw_trends = _build_product_trends(weeks)
+    raw_trends = _build_product_trends(weeks.weeks)
     trends = {id_to_name.get(k, k): v for k, v in raw_trends.items()}
     return metrics, trends, id_map
 
@@ -25,7 +25,9 @@ from typing import Any
 
 from execution.collectors.ado_flow_metrics import collect_flow_metrics_for_project
 from execution.collectors.ado_rest_client import get_ado_rest_client
+from execution.collectors.run_snapshot import load_snapshot_section
 from execution.core import get_logger
+from execution.core.history_store import history_exists, load_weeks
 from execution.dashboards.components.forecast_chart import build_trend_chart
 from execution.dashboards.flow_helpers import (
     build_project_tables,
@@ -46,15 +48,22 @@ async def _collect_flow_data() -> dict[str, Any]:
     """
     Collect flow metrics from Azure DevOps API.
 
-    Queries ADO directly for all projects and work types.
+    Uses the metrics collected earlier in this refresh run when the run
+    snapshot has them; otherwise queries ADO directly for all projects and
+    work types.
 
     Returns:
         Dictionary with structure: {week_date, week_number, projects[...]}
 
     Raises:
         FileNotFoundError: If discovery data (ado_structure.json) doesn't exist
+        SnapshotMissingError: In snapshot-only mode when flow was not collected
         Exception: If ADO API calls fail
     """
+    snapshot: dict[str, Any] | None = load_snapshot_section("flow")
+    if snapshot is not None:
+        return snapshot
+
     logger.info("Collecting flow data from Azure DevOps API")
 
     # Load discovery data to get project list
@@ -203,13 +212,12 @@ def _load_flow_trend_chart() -> str:
         HTML string for the trend chart, or empty string if history unavailable.
     """
     history_path = Path(".tmp/observatory/flow_history.json")
-    if not history_path.exists():
+    if not history_exists(history_path):
         logger.info("flow_history.json not found — skipping trend chart")
         return ""
 
     try:
-        data = load_json_with_recovery(str(history_path))
-        weeks = data.get("weeks", [])
+        weeks = list(load_weeks(history_path))
     except (ValueError, OSError) as e:
         logger.warning("Could not load flow_history.json for trend chart: %s", e)
         return ""
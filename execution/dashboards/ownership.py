@@ -25,8 +25,9 @@ from typing import Any
 
 from execution.collectors.ado_ownership_metrics import collect_ownership_metrics_for_project
 from execution.collectors.ado_rest_client import get_ado_rest_client
+from execution.collectors.run_snapshot import load_snapshot_section
 from execution.core import get_logger
-from execution.dashboards.renderer import render_dashboard
+from execution.dashboards.renderer import LazyHTML, render_dashboard, stream_dashboard
 from execution.framework import get_dashboard_framework
 from execution.template_engine import render_template
 from execution.utils.error_handling import log_and_continue, log_and_raise
@@ -45,10 +46,11 @@ def generate_ownership_dashboard(output_path: Path | None = None) -> str:
     4. Render HTML template
 
     Args:
-        output_path: Optional path to write HTML file
+        output_path: Optional path to write HTML file (the page is streamed to it
+            while rendering instead of being built in memory)
 
     Returns:
-        Generated HTML string
+        Generated HTML string, or "" when the page was streamed to output_path
 
     Raises:
         FileNotFoundError: If discovery_data.json doesn't exist
@@ -56,10 +58,9 @@ def generate_ownership_dashboard(output_path: Path | None = None) -> str:
 
     Example:
         from pathlib import Path
-        html = generate_ownership_dashboard(
+        generate_ownership_dashboard(
             Path('.tmp/observatory/dashboards/ownership_dashboard.html')
         )
-        logger.info("Dashboard generated", extra={"html_size": len(html)})
     """
     logger.info("Generating ownership dashboard")
 
@@ -76,16 +77,16 @@ def generate_ownership_dashboard(output_path: Path | None = None) -> str:
     logger.info("Preparing dashboard components")
     context = _build_context(ownership_data, summary_stats)
 
-    # Step 4: Render template
+    # Step 4: Render template (streamed straight to the file when one is given)
+    if output_path:
+        logger.info("Streaming HTML template to file")
+        written = stream_dashboard("dashboards/ownership_dashboard.html", context, output_path)
+        logger.info("Dashboard written to file", extra={"path": str(output_path), "html_size": written})
+        return ""
+
     logger.info("Rendering HTML template")
     html = render_dashboard("dashboards/ownership_dashboard.html", context)
 
-    # Write to file if specified
-    if output_path:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html, encoding="utf-8")
-        logger.info("Dashboard written to file", extra={"path": str(output_path)})
-
     logger.info("Ownership dashboard generated", extra={"html_size": len(html)})
     return html
 
@@ -117,13 +118,21 @@ async def _collect_ownership_metrics() -> dict[str, Any]:
     """
     Query Azure DevOps API directly for ownership metrics across all projects.
 
+    The metrics collected earlier in this refresh run are used instead when
+    the run snapshot has them.
+
     Returns:
         Dictionary with current ownership data for all projects
 
     Raises:
         FileNotFoundError: If discovery data doesn't exist
+        SnapshotMissingError: In snapshot-only mode when ownership was not collected
         httpx.HTTPStatusError: If ADO API calls fail
     """
+    snapshot: dict[str, Any] | None = load_snapshot_section("ownership")
+    if snapshot is not None:
+        return snapshot
+
     logger.info("Loading discovery data")
     discovery_data = _load_discovery_data()
     projects = discovery_data.get("projects", [])
@@ -288,8 +297,8 @@ def _build_project_rows(projects: list[dict[str, Any]]) -> list[dict[str, Any]]:
         # Determine status
         status_info = _calculate_ownership_status(unassigned_pct)
 
-        # Generate drill-down content
-        drilldown_html = _generate_ownership_drilldown_html(project)
+        # Drill-down content, rendered when the template reaches this row
+        drilldown_html = LazyHTML(_generate_ownership_drilldown_html, project)
 
         projects_with_status.append(
             {
@@ -432,11 +441,9 @@ if __name__ == "__main__":
 
     try:
         output_path = Path(".tmp/observatory/dashboards/ownership_dashboard.html")
-        html = generate_ownership_dashboard(output_path)
+        generate_ownership_dashboard(output_path)
 
-        logger.info(
-            "Ownership dashboard generated successfully", extra={"output": str(output_path), "html_size": len(html)}
-        )
+        logger.info("Ownership dashboard generated successfully", extra={"output": str(output_path)})
 
         # Verify output
         if output_path.exists():
@@ -17,7 +17,8 @@ Usage:
     from pathlib import Path
 
     output_path = Path('.tmp/observatory/dashboards/quality_dashboard.html')
-    html = await generate_quality_dashboard(output_path)
+    await generate_quality_dashboard(output_path)   # streamed to the file
+    html = await generate_quality_dashboard()        # returned as a string
 """
 
 import asyncio
@@ -28,9 +29,10 @@ from typing import Any
 
 from execution.collectors.ado_quality_metrics import collect_quality_metrics_for_project
 from execution.collectors.ado_rest_client import get_ado_rest_client
+from execution.collectors.run_snapshot import load_snapshot_section
 from execution.core import get_logger
 from execution.dashboards.quality_legacy import build_summary_cards, generate_distribution_section
-from execution.dashboards.renderer import render_dashboard
+from execution.dashboards.renderer import LazyHTML, render_dashboard, stream_dashboard
 
 # Import infrastructure
 from execution.framework import get_dashboard_framework
@@ -48,10 +50,11 @@ async def generate_quality_dashboard(output_path: Path | None = None) -> str:
     It queries ADO API for fresh data, processes it, and renders the HTML template.
 
     Args:
-        output_path: Optional path to write HTML file
+        output_path: Optional path to write HTML file (the page is streamed to it
+            while rendering instead of being built in memory)
 
     Returns:
-        Generated HTML string
+        Generated HTML string, or "" when the page was streamed to output_path
 
     Raises:
         FileNotFoundError: If discovery data doesn't exist
@@ -59,10 +62,9 @@ async def generate_quality_dashboard(output_path: Path | None = None) -> str:
 
     Example:
         from pathlib import Path
-        html = await generate_quality_dashboard(
+        await generate_quality_dashboard(
             Path('.tmp/observatory/dashboards/quality_dashboard.html')
         )
-        logger.info("Dashboard generated", extra={"html_size": len(html)})
     """
     logger.info("Generating quality dashboard")
 
@@ -82,16 +84,16 @@ async def generate_quality_dashboard(output_path: Path | None = None) -> str:
     logger.info("Preparing dashboard components")
     context = _build_context(quality_data, summary_stats)
 
-    # Step 4: Render template
+    # Step 4: Render template (streamed straight to the file when one is given)
+    if output_path:
+        logger.info("Streaming HTML template to file")
+        written = stream_dashboard("dashboards/quality_dashboard.html", context, output_path)
+        logger.info("Dashboard written to file", extra={"path": str(output_path), "html_size": written})
+        return ""
+
     logger.info("Rendering HTML template")
     html = render_dashboard("dashboards/quality_dashboard.html", context)
 
-    # Write to file if specified
-    if output_path:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html, encoding="utf-8")
-        logger.info("Dashboard written to file", extra={"path": str(output_path)})
-
     logger.info("Quality dashboard generated", extra={"html_size": len(html)})
     return html
 
@@ -100,16 +102,22 @@ async def _query_quality_data() -> dict[str, Any]:
     """
     Query quality metrics from Azure DevOps API.
 
-    Queries fresh data from ADO for all discovered projects and returns
-    metrics in the format expected by the dashboard.
+    Uses the metrics collected earlier in this refresh run when the run
+    snapshot has them; otherwise queries fresh data from ADO for all
+    discovered projects. Returns metrics in the format expected by the dashboard.
 
     Returns:
         Dictionary with week data and projects
 
     Raises:
         FileNotFoundError: If discovery data doesn't exist
+        SnapshotMissingError: In snapshot-only mode when quality was not collected
         Exception: If API query fails
     """
+    snapshot: dict[str, Any] | None = load_snapshot_section("quality")
+    if snapshot is not None:
+        return snapshot
+
     # Load discovery data
     discovery_path = Path(".tmp/observatory/ado_structure.json")
     if not discovery_path.exists():
@@ -266,8 +274,8 @@ def _build_project_rows(projects: list[dict[str, Any]]) -> list[dict[str, Any]]:
         median_age_str = f"{median_age:.0f} days" if median_age else "N/A"
         mttr_str = f"{mttr:.1f} days" if mttr else "N/A"
 
-        # Generate drill-down content
-        details_html = _generate_drilldown_html(project)
+        # Drill-down content, rendered when the template reaches this row
+        details_html = LazyHTML(_generate_drilldown_html, project)
 
         projects_with_status.append(
             {
@@ -450,11 +458,9 @@ if __name__ == "__main__":
     async def test_main() -> None:
         try:
             output_path = Path(".tmp/observatory/dashboards/quality_dashboard.html")
-            html = await generate_quality_dashboard(output_path)
+            await generate_quality_dashboard(output_path)
 
-            logger.info(
-                "Quality dashboard generated successfully", extra={"output": str(output_path), "html_size": len(html)}
-            )
+            logger.info("Quality dashboard generated successfully", extra={"output": str(output_path)})
 
             # Verify output
             if output_path.exists():
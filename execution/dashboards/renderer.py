@@ -5,6 +5,7 @@ Provides Jinja2-based template rendering for dashboards with:
     - Auto-escaping (XSS protection)
     - Custom filters
     - Template inheritance
+    - Streaming render straight to a file (stream_dashboard)
 
 Usage:
     from execution.dashboards.renderer import render_dashboard
@@ -15,18 +16,28 @@ Usage:
     }
 
     html = render_dashboard('dashboards/security_dashboard.html', context)
+
+    # Large pages: write while rendering, without building the full string
+    stream_dashboard('dashboards/quality_dashboard.html', context, output_path)
 """
 
+import os
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment
 
 from execution.core import get_logger
+from execution.framework.assets import externalize_framework
+from execution.template_cache import create_environment
 
 logger = get_logger(__name__)
 
+# Write buffer for streamed pages (chunks from Template.generate() are small)
+STREAM_BUFFER_SIZE = 256 * 1024
+
 # Initialize Jinja2 environment (singleton)
 _jinja_env: Environment | None = None
 
@@ -39,9 +50,9 @@ def get_jinja_environment() -> Environment:
     - Auto-escaping enabled for HTML/XML to prevent XSS
     - Custom filters for number/date formatting
     - Trim blocks and lstrip for clean output
+    - Templates loaded from the precompiled module cache
 
     :returns: Configured Jinja2 Environment with custom filters registered
-    :raises FileNotFoundError: If templates directory doesn't exist
 
     Example:
         >>> env = get_jinja_environment()
@@ -50,23 +61,16 @@ def get_jinja_environment() -> Environment:
     global _jinja_env
 
     if _jinja_env is None:
-        # Find templates directory (relative to this file)
-        template_dir = Path(__file__).parent.parent.parent / "templates"
-
-        # Create environment with auto-escaping for security
-        _jinja_env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(["html", "xml"]),
-            trim_blocks=True,
-            lstrip_blocks=True,
+        # Templates are compiled once into a shared module cache (see execution/template_cache.py)
+        _jinja_env = create_environment(
+            filters={
+                "format_number": format_number,
+                "format_percent": format_percent,
+                "format_date": format_date,
+                "trend_arrow": trend_arrow,
+            }
         )
 
-        # Add custom filters
-        _jinja_env.filters["format_number"] = format_number
-        _jinja_env.filters["format_percent"] = format_percent
-        _jinja_env.filters["format_date"] = format_date
-        _jinja_env.filters["trend_arrow"] = trend_arrow
-
     return _jinja_env
 
 
@@ -75,7 +79,9 @@ def render_dashboard(template_name: str, context: dict[str, Any], inject_default
     Render a dashboard template with context data.
 
     Main entry point for dashboard generation. Loads Jinja2 template,
-    merges context with defaults, and returns rendered HTML.
+    merges context with defaults, and returns rendered HTML. When a framework
+    asset directory is configured, the framework CSS/JS blocks are linked as
+    shared static files instead of being inlined.
 
     :param template_name: Template file name relative to templates/ directory
         (e.g., 'dashboards/security_dashboard.html')
@@ -93,9 +99,13 @@ def render_dashboard(template_name: str, context: dict[str, Any], inject_default
         >>> len(html) > 0
         True
     """
-    env = get_jinja_environment()
-    template = env.get_template(template_name)
+    template = get_jinja_environment().get_template(template_name)
+    rendered: str = template.render(**_prepare_context(context, inject_defaults))
+    return rendered
 
+
+def _prepare_context(context: dict[str, Any], inject_defaults: bool) -> dict[str, Any]:
+    """Merge default variables into a template context and link shared framework assets."""
     # Inject default variables if requested
     if inject_defaults:
         defaults = {
@@ -107,8 +117,84 @@ def render_dashboard(template_name: str, context: dict[str, Any], inject_default
     else:
         final_context = context
 
-    rendered: str = template.render(**final_context)
-    return rendered
+    return externalize_framework(final_context)
+
+
+def write_html_chunks(chunks: Iterable[str], output_path: Path) -> int:
+    """
+    Write an HTML document from an iterable of chunks through a buffered file.
+
+    Chunks are written as they are produced, so memory stays bounded by the
+    largest chunk rather than the whole page. The file is written under a
+    temporary name and renamed into place: readers never see a partial page.
+
+    :param chunks: HTML fragments in document order
+    :param output_path: File to write (parent directories are created)
+    :returns: Number of characters written
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    written = 0
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=STREAM_BUFFER_SIZE) as f:
+            for chunk in chunks:
+                written += f.write(chunk)
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return written
+
+
+def stream_dashboard(
+    template_name: str, context: dict[str, Any], output_path: Path, inject_defaults: bool = True
+) -> int:
+    """
+    Render a dashboard template straight to a file.
+
+    Same template and context handling as :func:`render_dashboard`, but uses
+    ``Template.generate()`` so the page is written while it renders and is
+    never held in memory as one string. Combine with :class:`LazyHTML` for
+    per-row drill-down content so it is also rendered only when reached.
+
+    :param template_name: Template file name relative to templates/ directory
+    :param context: Dictionary of template variables
+    :param output_path: HTML file to write
+    :param inject_defaults: Whether to inject default variables like generation_date (default: True)
+    :returns: Number of characters written
+
+    Example:
+        >>> stream_dashboard('dashboards/quality_dashboard.html', context,
+        ...                  Path('.tmp/observatory/dashboards/quality_dashboard.html'))
+    """
+    template = get_jinja_environment().get_template(template_name)
+    return write_html_chunks(template.generate(**_prepare_context(context, inject_defaults)), output_path)
+
+
+class LazyHTML:
+    """
+    Pre-escaped HTML fragment rendered only when a template outputs it.
+
+    Streaming templates consume a row's fragment as soon as the row is reached,
+    so only one drill-down is materialized at a time instead of all of them
+    being built up front into the context.
+
+    Example:
+        >>> row = {"details_html": LazyHTML(_generate_drilldown_html, project)}
+        >>> str(row["details_html"]).startswith('<div')
+        True
+    """
+
+    __slots__ = ("_render", "_args")
+
+    def __init__(self, render: Callable[..., str], *args: Any):
+        self._render = render
+        self._args = args
+
+    def __html__(self) -> str:
+        return self._render(*self._args)
+
+    def __str__(self) -> str:
+        return self._render(*self._args)
 
 
 # Custom Jinja2 filters
@@ -27,6 +27,7 @@ from pathlib import Path
 from typing import Any
 
 from execution.collectors.ado_risk_metrics import collect_risk_metrics_for_project
+from execution.collectors.run_snapshot import load_snapshot_section
 from execution.core import get_logger
 from execution.dashboards.components.cards import metric_card
 from execution.dashboards.renderer import render_dashboard
@@ -140,12 +141,20 @@ async def _query_risk_data() -> dict:
     """
     Query Azure DevOps API for fresh risk metrics data.
 
+    The metrics collected earlier in this refresh run are used instead when
+    the run snapshot has them.
+
     Returns:
         Dictionary with current week's risk data
 
     Raises:
         FileNotFoundError: If project discovery file doesn't exist
+        SnapshotMissingError: In snapshot-only mode when risk was not collected
     """
+    snapshot: dict | None = load_snapshot_section("risk")
+    if snapshot is not None:
+        return snapshot
+
     from execution.collectors.ado_rest_client import get_ado_rest_client
     from execution.domain.constants import flow_metrics
 
@@ -6,7 +6,9 @@ Generates security vulnerability dashboard using:
     - Reusable components (cards, tables)
     - Jinja2 templates (XSS-safe)
 
-Queries ArmorCode API directly for fresh Production-only vulnerability data.
+Renders the per-product counts collected earlier in the refresh run (run
+snapshot section "security"), or queries the ArmorCode API directly when the
+snapshot does not have them.
 
 Usage:
     from execution.dashboards.security import generate_security_dashboard
@@ -20,7 +22,9 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from execution.collectors.aql_count_cache import use_aql_count_cache
 from execution.collectors.armorcode_vulnerability_loader import ArmorCodeVulnerabilityLoader
+from execution.collectors.run_snapshot import load_snapshot_section
 from execution.core import get_logger
 from execution.dashboards.components.cards import metric_card, summary_card
 from execution.dashboards.renderer import render_dashboard
@@ -34,6 +38,9 @@ logger = get_logger(__name__)
 
 ID_MAP_PATH = Path("data/armorcode_id_map.json")
 
+# Run snapshot section holding this dashboard's counts (see execution/collectors/run_snapshot.py)
+SNAPSHOT_SECTION = "security"
+
 
 def _load_id_map() -> dict[str, str]:
     """
@@ -64,7 +71,7 @@ def generate_security_dashboard(output_path: Path | None = None) -> str:
     Generate security vulnerabilities dashboard HTML.
 
     Main entry point for security dashboard generation. Follows 4-stage pipeline:
-    1. Query ArmorCode API directly for fresh Production-only data
+    1. Load per-product counts from the run snapshot (or query ArmorCode API)
     2. Calculate summary statistics
     3. Build template context
     4. Render HTML template
@@ -84,21 +91,16 @@ def generate_security_dashboard(output_path: Path | None = None) -> str:
     """
     logger.info("Generating security dashboard")
 
-    # Step 1: Query ArmorCode API — 2 AQL count calls regardless of product count
+    # Step 1: Counts from the run snapshot, else ArmorCode API (2 AQL count calls)
     logger.info("Loading product ID map")
     product_id_map = _load_id_map()  # {name -> id}
     id_to_name = {v: k for k, v in product_id_map.items()}
 
-    hierarchy = get_config().get_optional_env("ARMORCODE_HIERARCHY")
-    if not hierarchy:
-        raise RuntimeError(
-            "ARMORCODE_HIERARCHY env var not set. Add it as a GitHub secret and to your local .env file."
-        )
-
-    logger.info("Querying ArmorCode API for Production Critical + High counts (2 API calls)")
-    loader = ArmorCodeVulnerabilityLoader()
-    critical_counts = loader.count_by_severity_aql("Critical", hierarchy)
-    high_counts = loader.count_by_severity_aql("High", hierarchy)
+    counts = load_snapshot_section(SNAPSHOT_SECTION)
+    if counts is None:
+        counts = collect_security_snapshot()
+    critical_counts = counts.get("Critical", {})
+    high_counts = counts.get("High", {})
 
     # Build metrics for products appearing in AQL results (hierarchy-scoped)
     metrics_by_product: dict[str, SecurityMetrics] = {}
@@ -139,6 +141,31 @@ def generate_security_dashboard(output_path: Path | None = None) -> str:
     return html
 
 
+def collect_security_snapshot() -> dict[str, dict[str, int]]:
+    """
+    Query the per-product Critical + High counts this dashboard shows (2 AQL calls).
+
+    Called by collect_all_metrics to fill the run snapshot, and by the
+    dashboard itself when the snapshot has no "security" section.
+
+    Returns:
+        {"Critical": {product_id: count}, "High": {product_id: count}}
+
+    Raises:
+        RuntimeError: If ARMORCODE_HIERARCHY env var is not configured
+    """
+    hierarchy = get_config().get_optional_env("ARMORCODE_HIERARCHY")
+    if not hierarchy:
+        raise RuntimeError(
+            "ARMORCODE_HIERARCHY env var not set. Add it as a GitHub secret and to your local .env file."
+        )
+
+    logger.info("Querying ArmorCode API for Production Critical + High counts (2 API calls)")
+    loader = ArmorCodeVulnerabilityLoader()
+    counts: dict[str, dict[str, int]] = loader.count_matrix_aql(["Critical", "High"], hierarchy).get("all", {})
+    return counts
+
+
 def _sum_severity_totals(
     metrics_list: list[SecurityMetrics],
 ) -> tuple[int, int, int, int, int]:
@@ -517,7 +544,8 @@ if __name__ == "__main__":
 
     try:
         output_path = Path(".tmp/observatory/dashboards/security.html")
-        html = generate_security_dashboard(output_path)
+        with use_aql_count_cache():
+            html = generate_security_dashboard(output_path)
 
         logger.info(
             "Security dashboard generated successfully", extra={"output": str(output_path), "html_size": len(html)}
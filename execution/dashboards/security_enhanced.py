@@ -6,7 +6,7 @@ Complete security dashboard with:
 - Main summary table with VIEW buttons for drill-down
 - Individual product detail pages
 - Aging heatmap per product
-- Live ArmorCode API queries
+- ArmorCode data from the refresh run snapshot (live API queries as fallback)
 - Search, filter, and Excel export
 
 This replaces the archived generate_security_dashboard_original.py with a
@@ -21,9 +21,19 @@ Usage:
 """
 
 import json
+from collections.abc import Hashable
+from dataclasses import asdict
 from pathlib import Path
-
-from execution.collectors.armorcode_vulnerability_loader import ArmorCodeVulnerabilityLoader
+from typing import Any
+
+from execution.collectors.aql_count_cache import use_aql_count_cache
+from execution.collectors.armorcode_vulnerability_loader import (
+    AqlCountScope,
+    AqlFindingsScope,
+    ArmorCodeVulnerabilityLoader,
+    VulnerabilityDetail,
+)
+from execution.collectors.run_snapshot import load_snapshot_section
 from execution.core import get_logger
 from execution.dashboards.security_content_builder import (
     _generate_bucket_expanded_content,  # noqa: F401 — re-exported for test backward compat
@@ -45,6 +55,9 @@ logger = get_logger(__name__)
 
 ID_MAP_PATH = Path("data/armorcode_id_map.json")
 
+# Run snapshot section holding this dashboard's data (see execution/collectors/run_snapshot.py)
+SNAPSHOT_SECTION = "security_enhanced"
+
 
 def _load_id_map() -> dict[str, str]:
     """
@@ -76,13 +89,12 @@ def _collect_aql_totals(
     hierarchy: str,
 ) -> dict[str, dict]:
     """Fetch per-product Critical/High counts via AQL and map to product names."""
-    crit_by_pid = vuln_loader.count_by_severity_aql("Critical", hierarchy, environment="Production")
-    high_by_pid = vuln_loader.count_by_severity_aql("High", hierarchy, environment="Production")
+    counts = vuln_loader.count_matrix_aql(["Critical", "High"], hierarchy, environment="Production").get("all", {})
     aql_by_product: dict[str, dict] = {}
-    for pid, c in crit_by_pid.items():
+    for pid, c in counts.get("Critical", {}).items():
         name = id_to_name.get(pid, pid)
         aql_by_product.setdefault(name, {"critical": 0, "high": 0})["critical"] = c
-    for pid, h in high_by_pid.items():
+    for pid, h in counts.get("High", {}).items():
         name = id_to_name.get(pid, pid)
         aql_by_product.setdefault(name, {"critical": 0, "high": 0})["high"] = h
     return aql_by_product
@@ -110,27 +122,21 @@ def _collect_bucket_counts(
     id_to_name: dict[str, str],
     hierarchy: str,
 ) -> dict[str, dict]:
-    """Fetch per-bucket Critical/High counts via AQL for each non-Other bucket."""
+    """Fetch per-bucket Critical/High counts via AQL for each non-Other bucket (one concurrent batch)."""
     _infra_cloud_providers = ["aws", "azure"]
-    bucket_counts_by_product: dict[str, dict] = {}
-    for bucket_name, bucket_sources in BUCKET_SOURCE_MAP.items():
-        if bucket_name == "Other":
-            continue
-        cloud_providers = _infra_cloud_providers if bucket_name == "INFRASTRUCTURE" else None
-        b_crit = vuln_loader.count_by_severity_aql(
-            "Critical",
-            hierarchy,
-            environment="Production",
+    scopes = {
+        bucket_name: AqlCountScope(
             sources=bucket_sources,
-            asset_cloud_providers=cloud_providers,
-        )
-        b_high = vuln_loader.count_by_severity_aql(
-            "High",
-            hierarchy,
-            environment="Production",
-            sources=bucket_sources,
-            asset_cloud_providers=cloud_providers,
+            asset_cloud_providers=_infra_cloud_providers if bucket_name == "INFRASTRUCTURE" else None,
         )
+        for bucket_name, bucket_sources in BUCKET_SOURCE_MAP.items()
+        if bucket_name != "Other"
+    }
+    counts = vuln_loader.count_matrix_aql(["Critical", "High"], hierarchy, environment="Production", scopes=scopes)
+    bucket_counts_by_product: dict[str, dict] = {}
+    for bucket_name, by_severity in counts.items():
+        b_crit = by_severity.get("Critical", {})
+        b_high = by_severity.get("High", {})
         for pid in set(b_crit) | set(b_high):
             name = id_to_name.get(pid, pid)
             c = b_crit.get(pid, 0)
@@ -149,8 +155,9 @@ def _collect_display_records(
     hierarchy: str,
     bucket_counts_by_product: dict[str, dict],
 ) -> dict[str, list]:
-    """Fetch display records per product per bucket (up to 50 per combination)."""
-    vulns_by_product: dict[str, list] = {}
+    """Fetch display records per product per bucket (up to 50 per combination, one concurrent batch)."""
+    scopes: dict[Hashable, AqlFindingsScope] = {}
+    scopes_in_order: list[tuple[str, str]] = []
     for product_name, pid in product_id_map.items():
         for bucket_name, bucket_sources in BUCKET_SOURCE_MAP.items():
             if bucket_name == "Other":
@@ -158,18 +165,88 @@ def _collect_display_records(
             bucket_total = bucket_counts_by_product.get(product_name, {}).get(bucket_name, {}).get("total", 0)
             if bucket_total == 0:
                 continue
-            records = vuln_loader.fetch_findings_aql(
-                hierarchy,
-                environment="Production",
-                sources=bucket_sources,
-                page_size=50,
-                product_id=pid,
-            )
-            for record in records:
-                vulns_by_product.setdefault(product_name, []).append(record)
+            scopes[(product_name, bucket_name)] = AqlFindingsScope(product_id=pid, sources=bucket_sources)
+            scopes_in_order.append((product_name, bucket_name))
+    if not scopes:
+        return {}
+
+    records_by_scope = vuln_loader.fetch_findings_batch_aql(hierarchy, scopes, environment="Production", page_size=50)
+    vulns_by_product: dict[str, list] = {}
+    for product_name, bucket_name in scopes_in_order:
+        for record in records_by_scope.get((product_name, bucket_name), []):
+            vulns_by_product.setdefault(product_name, []).append(record)
     return vulns_by_product
 
 
+def _collect_security_data(
+    vuln_loader: ArmorCodeVulnerabilityLoader,
+    product_id_map: dict[str, str],
+    hierarchy: str,
+) -> tuple[dict[str, dict], dict[str, dict], dict[str, list]]:
+    """
+    Query everything the main and infrastructure dashboards show (Production only).
+
+    Returns:
+        Tuple of (aql_by_product, bucket_counts_by_product, vulns_by_product)
+    """
+    id_to_name: dict[str, str] = {v: k for k, v in product_id_map.items()}
+
+    # Per-product Critical/High counts via AQL (2 calls).
+    logger.info("Fetching per-product Critical/High counts via AQL (Production only)")
+    aql_by_product = _collect_aql_totals(vuln_loader, id_to_name, hierarchy)
+
+    # Per-bucket Critical/High counts via AQL (6 calls: 2 sev × 3 buckets).
+    logger.info("Fetching per-bucket Critical/High counts via AQL (Production only)")
+    bucket_counts_by_product = _collect_bucket_counts(vuln_loader, id_to_name, hierarchy)
+
+    # Display records per product per bucket (up to 50/combination).
+    logger.info("Fetching display records per product per bucket (up to 50 each, Production only)")
+    vulns_by_product = _collect_display_records(vuln_loader, product_id_map, hierarchy, bucket_counts_by_product)
+
+    return aql_by_product, bucket_counts_by_product, vulns_by_product
+
+
+def collect_security_snapshot() -> dict[str, Any] | None:
+    """
+    Query this dashboard's ArmorCode data once for the run snapshot.
+
+    Called by collect_all_metrics; the dashboard renders from the stored
+    section instead of repeating the AQL queries.
+
+    Returns:
+        JSON-serializable {aql_by_product, bucket_counts_by_product, vulns_by_product},
+        or None when the ID map or ARMORCODE_HIERARCHY is not configured
+    """
+    try:
+        product_id_map = _load_id_map()
+    except FileNotFoundError as e:
+        logger.warning(f"ArmorCode ID map not found, security snapshot skipped: {e}")
+        return None
+
+    hierarchy = get_config().get_optional_env("ARMORCODE_HIERARCHY")
+    if not hierarchy:
+        logger.warning("ARMORCODE_HIERARCHY not set — security snapshot skipped")
+        return None
+
+    aql_by_product, bucket_counts_by_product, vulns_by_product = _collect_security_data(
+        ArmorCodeVulnerabilityLoader(), product_id_map, hierarchy
+    )
+    return {
+        "aql_by_product": aql_by_product,
+        "bucket_counts_by_product": bucket_counts_by_product,
+        "vulns_by_product": {product: [asdict(vuln) for vuln in vulns] for product, vulns in vulns_by_product.items()},
+    }
+
+
+def _security_data_from_snapshot(snapshot: dict[str, Any]) -> tuple[dict[str, dict], dict[str, dict], dict[str, list]]:
+    """Rebuild the collected data (VulnerabilityDetail records included) from a snapshot section."""
+    vulns_by_product = {
+        product: [VulnerabilityDetail(**record) for record in records]
+        for product, records in snapshot.get("vulns_by_product", {}).items()
+    }
+    return snapshot.get("aql_by_product", {}), snapshot.get("bucket_counts_by_product", {}), vulns_by_product
+
+
 def generate_security_dashboard_enhanced(output_dir: Path | None = None) -> tuple[str, int]:
     """
     Generate enhanced security dashboard with expandable rows.
@@ -207,30 +284,24 @@ def generate_security_dashboard_enhanced(output_dir: Path | None = None) -> tupl
         return "", 0
 
     known_products = list(product_id_map.keys())
-    id_to_name: dict[str, str] = {v: k for k, v in product_id_map.items()}
-
-    hierarchy = get_config().get_optional_env("ARMORCODE_HIERARCHY")
-    if not hierarchy:
-        logger.warning("ARMORCODE_HIERARCHY not set — cannot load Production-only security data")
-        return "", 0
 
-    vuln_loader = ArmorCodeVulnerabilityLoader()
+    # Stage 1b: Counts and display records collected earlier in this run, else query ArmorCode.
+    snapshot = load_snapshot_section(SNAPSHOT_SECTION)
+    if snapshot is not None:
+        aql_by_product, bucket_counts_by_product, vulns_by_product = _security_data_from_snapshot(snapshot)
+    else:
+        hierarchy = get_config().get_optional_env("ARMORCODE_HIERARCHY")
+        if not hierarchy:
+            logger.warning("ARMORCODE_HIERARCHY not set — cannot load Production-only security data")
+            return "", 0
+        aql_by_product, bucket_counts_by_product, vulns_by_product = _collect_security_data(
+            ArmorCodeVulnerabilityLoader(), product_id_map, hierarchy
+        )
 
-    # Stage 1c: Per-product Critical/High counts via AQL (2 calls).
-    logger.info("Fetching per-product Critical/High counts via AQL (Production only)")
-    aql_by_product = _collect_aql_totals(vuln_loader, id_to_name, hierarchy)
     metrics_by_product = _metrics_from_aql_counts(aql_by_product)
     _zero_pad_metrics(metrics_by_product, known_products)
     logger.info("Security data loaded", extra={"product_count": len(metrics_by_product)})
 
-    # Stage 1d: Per-bucket Critical/High counts via AQL (6 calls: 2 sev × 3 buckets).
-    logger.info("Fetching per-bucket Critical/High counts via AQL (Production only)")
-    bucket_counts_by_product = _collect_bucket_counts(vuln_loader, id_to_name, hierarchy)
-
-    # Stage 1e: Display records per product per bucket (up to 50/combination).
-    logger.info("Fetching display records per product per bucket (up to 50 each, Production only)")
-    vulns_by_product = _collect_display_records(vuln_loader, product_id_map, hierarchy, bucket_counts_by_product)
-
     acc_c = sum(d.get("critical", 0) for d in aql_by_product.values())
     acc_h = sum(d.get("high", 0) for d in aql_by_product.values())
 
@@ -261,7 +332,8 @@ def generate_security_dashboard_enhanced(output_dir: Path | None = None) -> tupl
 def main() -> None:
     """Command-line entry point"""
     output_dir = Path(".tmp/observatory/dashboards")
-    generate_security_dashboard_enhanced(output_dir)
+    with use_aql_count_cache():
+        generate_security_dashboard_enhanced(output_dir)
 
 
 if __name__ == "__main__":
@@ -9,13 +9,13 @@ Contains: grouping, counting, history patching, and summary calculation.
 
 from __future__ import annotations
 
-import json
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
 from execution.collectors.armorcode_vulnerability_loader import VulnerabilityDetail
 from execution.core import get_logger
+from execution.core.history_store import HistoryStore
 from execution.domain.security import SOURCE_BUCKET_MAP, SecurityMetrics
 
 logger = get_logger(__name__)
@@ -97,34 +97,34 @@ def _metrics_from_aql_counts(aql_by_product: dict[str, dict]) -> dict[str, Secur
 
 def _update_history_current_total(history_path: Path, critical: int, high: int) -> None:
     """Patch the latest history entry with the live-computed accurate total."""
-    if not history_path.exists():
+    store = HistoryStore(history_path)
+    if not store.exists():
         return
-    try:
-        d = json.loads(history_path.read_text(encoding="utf-8"))
-        if not d.get("weeks"):
-            return
-
-        new_total = critical + high
+    new_total = critical + high
 
+    def _patch(weeks: list[dict]) -> bool:
         # Sanity check: reject implausibly low counts to prevent transient API failures
         # corrupting the history (same issue as the 646 transient count from 2026-02-19)
-        if len(d["weeks"]) >= 2:
-            prev_total = d["weeks"][-2].get("metrics", {}).get("current_total", 0)
+        if len(weeks) >= 2:
+            prev_total = weeks[-2].get("metrics", {}).get("current_total", 0)
             if prev_total > 2000 and new_total < prev_total * 0.3:
                 logger.warning(
                     "Security history patch REJECTED - count looks like transient API failure",
                     extra={"new_total": new_total, "prev_total": prev_total, "threshold": prev_total * 0.3},
                 )
-                return
+                return False
 
-        m = d["weeks"][-1].setdefault("metrics", {})
+        m = weeks[-1].setdefault("metrics", {})
         m["current_total"] = new_total
         m.setdefault("severity_breakdown", {}).update({"critical": critical, "high": high, "total": new_total})
-        history_path.write_text(json.dumps(d, indent=2), encoding="utf-8")
-        logger.info(
-            "Security history patched with live count",
-            extra={"critical": critical, "high": high, "total": new_total},
-        )
+        return True
+
+    try:
+        if store.update_latest(_patch):
+            logger.info(
+                "Security history patched with live count",
+                extra={"critical": critical, "high": high, "total": new_total},
+            )
     except Exception as e:
         logger.warning("History patch skipped: %s", e)
 
@@ -142,25 +142,23 @@ def _patch_history_bucket_breakdown(
 
     Historical weeks without this key are left untouched (callers handle gracefully).
     """
-    if not history_path.exists():
+    store = HistoryStore(history_path)
+    if not store.exists():
         return
-    try:
-        d = json.loads(history_path.read_text(encoding="utf-8"))
-        if not d.get("weeks"):
-            return
-
-        cc_critical, cc_high = 0, 0
-        infra_critical, infra_high = 0, 0
-        for product_buckets in bucket_counts_by_product.values():
-            for bucket_name, counts in product_buckets.items():
-                if bucket_name in ("CODE", "CLOUD"):
-                    cc_critical += counts.get("critical", 0)
-                    cc_high += counts.get("high", 0)
-                elif bucket_name == "INFRASTRUCTURE":
-                    infra_critical += counts.get("critical", 0)
-                    infra_high += counts.get("high", 0)
-
-        m = d["weeks"][-1].setdefault("metrics", {})
+
+    cc_critical, cc_high = 0, 0
+    infra_critical, infra_high = 0, 0
+    for product_buckets in bucket_counts_by_product.values():
+        for bucket_name, counts in product_buckets.items():
+            if bucket_name in ("CODE", "CLOUD"):
+                cc_critical += counts.get("critical", 0)
+                cc_high += counts.get("high", 0)
+            elif bucket_name == "INFRASTRUCTURE":
+                infra_critical += counts.get("critical", 0)
+                infra_high += counts.get("high", 0)
+
+    def _patch(weeks: list[dict]) -> bool:
+        m = weeks[-1].setdefault("metrics", {})
         m["bucket_breakdown"] = {
             "code_cloud": {
                 "critical": cc_critical,
@@ -173,14 +171,17 @@ def _patch_history_bucket_breakdown(
                 "total": infra_critical + infra_high,
             },
         }
-        history_path.write_text(json.dumps(d, indent=2), encoding="utf-8")
-        logger.info(
-            "Security history patched with bucket breakdown",
-            extra={
-                "code_cloud_total": cc_critical + cc_high,
-                "infra_total": infra_critical + infra_high,
-            },
-        )
+        return True
+
+    try:
+        if store.update_latest(_patch):
+            logger.info(
+                "Security history patched with bucket breakdown",
+                extra={
+                    "code_cloud_total": cc_critical + cc_high,
+                    "infra_total": infra_critical + infra_high,
+                },
+            )
     except Exception as e:  # noqa: BLE001
         logger.warning("Bucket breakdown patch skipped: %s", e)
 
@@ -3,7 +3,7 @@ Target Dashboard Generator - Refactored
 
 Generates 70% reduction target tracking dashboard using:
     - Jinja2 templates (XSS-safe)
-    - Direct API queries for current metrics (no stale history files)
+    - Current metrics from the refresh run snapshot (direct API queries as fallback)
     - Clean separation of data loading and presentation
     - Reusable metric calculation functions
 
@@ -27,7 +27,9 @@ from typing import Any
 
 from execution.collectors.ado_rest_client import AzureDevOpsRESTClient, get_ado_rest_client
 from execution.collectors.ado_rest_transformers import WorkItemTransformer
-from execution.collectors.armorcode_vulnerability_loader import ArmorCodeVulnerabilityLoader
+from execution.collectors.aql_count_cache import use_aql_count_cache
+from execution.collectors.armorcode_vulnerability_loader import AqlCountScope, ArmorCodeVulnerabilityLoader
+from execution.collectors.run_snapshot import load_snapshot_section
 from execution.collectors.security_bug_filter import filter_security_bugs
 from execution.core import get_logger
 from execution.dashboards.renderer import render_dashboard
@@ -38,6 +40,9 @@ from execution.utils.error_handling import log_and_raise
 
 logger = get_logger(__name__)
 
+# Run snapshot section holding the target's vulnerability count (see execution/collectors/run_snapshot.py)
+SNAPSHOT_SECTION = "targets"
+
 # Code+Cloud vulnerability sources — the scope of the 70% reduction target.
 # Infrastructure sources (Cortex XDR, Tenable, AppCheck, BitSight) are excluded.
 _CODE_CLOUD_SOURCES: list[str] = [
@@ -207,6 +212,39 @@ async def _query_current_state(baselines: dict[str, dict]) -> dict[str, int]:
 
 
 async def _query_current_armorcode_vulns() -> int:
+    """
+    Current Critical + High vulnerabilities (Production only).
+
+    Uses the count collected earlier in this refresh run when the run snapshot
+    has it; otherwise queries the ArmorCode API.
+
+    Returns:
+        Current Critical + High vulnerability count (Production only)
+
+    Raises:
+        RuntimeError: If ARMORCODE_HIERARCHY env var is not configured
+        SnapshotMissingError: In snapshot-only mode when the count was not collected
+    """
+    snapshot = load_snapshot_section(SNAPSHOT_SECTION)
+    if snapshot is not None:
+        return int(snapshot["security"])
+    return _count_target_vulns()
+
+
+def collect_targets_snapshot() -> dict[str, int]:
+    """
+    Query the target's Code+Cloud vulnerability count once for the run snapshot.
+
+    Called by collect_all_metrics. The target's bug count needs no section of
+    its own: it is read from the quality section (same open bug query).
+
+    Returns:
+        {"security": Critical + High count (Production only)}
+    """
+    return {"security": _count_target_vulns()}
+
+
+def _count_target_vulns() -> int:
     """
     Query current Critical + High vulnerabilities from ArmorCode API (Production only).
 
@@ -229,10 +267,14 @@ async def _query_current_armorcode_vulns() -> int:
     logger.info("Querying ArmorCode API for Code+Cloud Critical + High vulnerabilities (Production only, 2 AQL calls)")
 
     loader = ArmorCodeVulnerabilityLoader()
-    critical_counts = loader.count_by_severity_aql(
-        "Critical", hierarchy, environment="Production", sources=_CODE_CLOUD_SOURCES
-    )
-    high_counts = loader.count_by_severity_aql("High", hierarchy, environment="Production", sources=_CODE_CLOUD_SOURCES)
+    counts = loader.count_matrix_aql(
+        ["Critical", "High"],
+        hierarchy,
+        environment="Production",
+        scopes={"code_cloud": AqlCountScope(sources=_CODE_CLOUD_SOURCES)},
+    ).get("code_cloud", {})
+    critical_counts = counts.get("Critical", {})
+    high_counts = counts.get("High", {})
 
     total_critical = sum(critical_counts.values())
     total_high = sum(high_counts.values())
@@ -249,12 +291,23 @@ async def _query_current_ado_bugs() -> int:
     """
     Query current open bugs from ADO API across all projects.
 
+    The quality collector runs the same open bug query with the same security
+    bug filter, so its per-project counts from this run's snapshot are summed
+    instead when available.
+
     Returns:
         Current bug count (excluding security bugs)
 
     Raises:
+        SnapshotMissingError: In snapshot-only mode when quality was not collected
         Exception: If API query fails
     """
+    quality_snapshot = load_snapshot_section("quality")
+    if quality_snapshot is not None:
+        total_from_snapshot = sum(p.get("open_bugs_count", 0) for p in quality_snapshot.get("projects", []))
+        logger.info(f"Current ADO bugs (all projects, run snapshot): {total_from_snapshot}")
+        return int(total_from_snapshot)
+
     logger.info("Querying ADO API for open bugs across all projects")
 
     # Load discovery data to get project list
@@ -529,7 +582,8 @@ if __name__ == "__main__":
 
     try:
         output_path = Path(".tmp/observatory/dashboards/target_dashboard.html")
-        html = asyncio.run(generate_targets_dashboard(output_path))
+        with use_aql_count_cache():
+            html = asyncio.run(generate_targets_dashboard(output_path))
 
         logger.info(
             "Target dashboard generated successfully", extra={"output": str(output_path), "html_size": len(html)}
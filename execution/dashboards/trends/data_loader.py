@@ -9,6 +9,8 @@ import os
 from pathlib import Path
 from typing import Any, Union
 
+from execution.core.history_store import HistoryStore, load_history
+
 
 class TrendsDataLoader:
     """Loads historical data from observatory JSON files"""
@@ -32,21 +34,24 @@ class TrendsDataLoader:
             Dictionary with history data, or None if file not found/invalid
         """
         file_path = os.path.join(self.history_dir, filename)
+        store = HistoryStore(file_path)
 
-        if not os.path.exists(file_path):
+        if not store.partitioned and not os.path.exists(file_path):
             print(f"  ⚠️ {filename}: File not found")
             return None
 
         try:
-            # Check file size
-            file_size = os.path.getsize(file_path)
+            # Check file size (sum of week partitions once migrated)
+            if store.partitioned:
+                file_size = sum(path.stat().st_size for path in store.partition_dir.glob("*.json"))
+            else:
+                file_size = os.path.getsize(file_path)
             if file_size == 0:
                 print(f"  ⚠️ {filename}: File is empty")
                 return None
 
-            # Load and parse JSON
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
+            # Load and parse JSON (served from the shared history cache if unchanged)
+            data = load_history(file_path)
 
             # Validate structure
             if not isinstance(data, dict):
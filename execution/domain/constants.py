@@ -64,6 +64,8 @@ class APIConfig:
         ARMORCODE_PAGE_SIZE: ArmorCode GraphQL API page size (100 items per page)
         ARMORCODE_MAX_PAGES: Maximum pages to fetch from ArmorCode API (safety limit: 100 pages)
         ARMORCODE_TIMEOUT_SECONDS: Timeout for ArmorCode API calls (60 seconds)
+        ARMORCODE_MAX_CONCURRENCY: Concurrent ArmorCode AQL count and findings requests (8)
+        ARMORCODE_RATE_PER_SECOND: Sustained ArmorCode request rate for batched findings fetches (5/s)
         DEFAULT_TIMEOUT_SECONDS: Default HTTP timeout for API calls (30 seconds)
         LONG_TIMEOUT_SECONDS: Extended timeout for long-running operations (120 seconds)
 
@@ -84,6 +86,12 @@ class APIConfig:
     ARMORCODE_TIMEOUT_SECONDS: int = 60
     """Timeout for ArmorCode API calls"""
 
+    ARMORCODE_MAX_CONCURRENCY: int = 8
+    """Concurrent ArmorCode AQL count and findings requests"""
+
+    ARMORCODE_RATE_PER_SECOND: float = 5.0
+    """Sustained ArmorCode request rate for batched findings fetches"""
+
     DEFAULT_TIMEOUT_SECONDS: int = 30
     """Default HTTP timeout for API calls"""
 
@@ -130,6 +138,10 @@ class SamplingConfig:
     Attributes:
         PR_SAMPLE_SIZE: Pull request sample size for statistical validity (10 PRs)
         COMMIT_DETAIL_LIMIT: Number of commits to fetch detailed file changes for (20 commits)
+        BUILD_DETAIL_LIMIT: Number of successful builds to fetch changes for (50 builds)
+        CACHED_PR_SAMPLE_SIZE: PR sample size while the detail cache is active (200 PRs)
+        CACHED_COMMIT_DETAIL_LIMIT: Commit detail limit while the detail cache is active (500 commits)
+        CACHED_BUILD_DETAIL_LIMIT: Build detail limit while the detail cache is active (500 builds)
         TOP_ITEMS_LIMIT: Standard limit for top N items in reports (20 items)
         HOT_PATHS_LIMIT: Number of hot paths (frequently changed files) to track (20 files)
 
@@ -145,6 +157,18 @@ class SamplingConfig:
     COMMIT_DETAIL_LIMIT: int = 20
     """Number of commits to fetch detailed file changes for"""
 
+    BUILD_DETAIL_LIMIT: int = 50
+    """Number of successful builds to fetch changes for (lead time)"""
+
+    CACHED_PR_SAMPLE_SIZE: int = 200
+    """PR sample size when PR details come from the detail cache"""
+
+    CACHED_COMMIT_DETAIL_LIMIT: int = 500
+    """Commit detail limit when commit changes come from the detail cache"""
+
+    CACHED_BUILD_DETAIL_LIMIT: int = 500
+    """Build detail limit when build changes come from the detail cache"""
+
     TOP_ITEMS_LIMIT: int = 20
     """Standard limit for top N items in reports"""
 
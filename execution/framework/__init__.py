@@ -23,8 +23,15 @@ Usage::
         include_expandable_rows=True,
         include_glossary=True
     )
+
+The bundle is memoized per argument set (every dashboard calls this with one
+of a handful of combinations). Set OBSERVATORY_FRAMEWORK_ASSET_DIR to have
+render_dashboard() link it as shared static files instead of inlining it
+(see assets.py).
 """
 
+from functools import lru_cache
+
 from .base_styles import get_base_styles
 from .components import get_layout_components, get_metric_components, get_theme_toggle_styles
 from .javascript import get_dashboard_javascript
@@ -33,6 +40,7 @@ from .tables import get_collapsible_styles, get_table_styles
 from .theme import get_theme_variables
 
 
+@lru_cache(maxsize=64)
 def get_dashboard_framework(
     header_gradient_start="#667eea",
     header_gradient_end="#764ba2",
@@ -44,7 +52,7 @@ def get_dashboard_framework(
     Returns complete mobile-responsive CSS + JavaScript framework.
 
     This is the main entry point that coordinates all submodules to generate
-    a complete dashboard framework bundle.
+    a complete dashboard framework bundle. Results are cached per argument set.
 
     Args:
         header_gradient_start: Start color for header gradient (default: #667eea)
@@ -0,0 +1,109 @@
+"""
+Shared Framework Asset Files
+
+Every dashboard inlined the full framework CSS and JavaScript (tens of KB),
+so each HTML file carried its own copy of the same bundle. When a framework
+asset directory is configured, render_dashboard() writes each distinct
+bundle once as a content-hashed static file (framework-<hash>.css/.js) and
+the dashboard links to it instead. The hash in the file name means a changed
+framework never serves a stale cached copy and an unchanged one is never
+rewritten.
+
+The directory must sit next to the dashboards that link to it (links are
+"<directory name>/<file>"). refresh_all_dashboards.py sets
+OBSERVATORY_FRAMEWORK_ASSET_DIR=.tmp/observatory/dashboards/assets; without it
+dashboards inline the framework as before, so standalone generators and
+emailed reports stay self-contained.
+
+Usage:
+    from execution.framework.assets import externalize_framework
+
+    context = externalize_framework({"framework_css": css, "framework_js": js, ...})
+"""
+
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+# Environment variable naming the folder shared framework assets are written to
+FRAMEWORK_ASSET_DIR_ENV = "OBSERVATORY_FRAMEWORK_ASSET_DIR"
+
+# Context key -> (inline tag, file extension, link markup)
+_ASSET_KINDS = {
+    "framework_css": ("style", "css", '<link rel="stylesheet" href="{href}">'),
+    "framework_js": ("script", "js", '<script src="{href}"></script>'),
+}
+
+# (directory, inline block) -> link markup, so each bundle is hashed and written once per process
+_published: dict[tuple[str, str], str] = {}
+
+
+def framework_asset_dir() -> Path | None:
+    """Configured asset directory, or None to keep the framework inline."""
+    directory = os.environ.get(FRAMEWORK_ASSET_DIR_ENV)
+    return Path(directory) if directory else None
+
+
+def _inline_body(block: str, tag: str) -> str | None:
+    """Content of a single <style>/<script> block, or None if the markup is anything else."""
+    match = re.fullmatch(rf"\s*<{tag}>(.*)</{tag}>\s*", block, flags=re.DOTALL)
+    if match is None or f"<{tag}" in match.group(1) or f"</{tag}>" in match.group(1):
+        return None
+    return match.group(1)
+
+
+def publish_asset(body: str, extension: str, asset_dir: Path) -> str:
+    """
+    Write a framework bundle as a content-hashed file (skipped if it already exists).
+
+    Args:
+        body: CSS or JavaScript source
+        extension: "css" or "js"
+        asset_dir: Folder to write to
+
+    Returns:
+        Relative href ("<asset_dir name>/framework-<hash>.<extension>")
+    """
+    file_name = f"framework-{hashlib.sha256(body.encode('utf-8')).hexdigest()[:12]}.{extension}"
+    path = asset_dir / file_name
+    if not path.exists():
+        asset_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{file_name}.{os.getpid()}.tmp")
+        tmp_path.write_text(body, encoding="utf-8")
+        os.replace(tmp_path, path)
+    return f"{asset_dir.name}/{file_name}"
+
+
+def externalize_framework(context: dict[str, Any], asset_dir: Path | None = None) -> dict[str, Any]:
+    """
+    Replace inline framework CSS/JS in a template context with links to shared files.
+
+    Blocks that are not a single plain <style>/<script> element are left inline.
+
+    Args:
+        context: Template context (not modified)
+        asset_dir: Asset folder (default: $OBSERVATORY_FRAMEWORK_ASSET_DIR)
+
+    Returns:
+        Context with framework_css/framework_js as link markup, or the original
+        context when no asset directory is configured
+    """
+    asset_dir = asset_dir or framework_asset_dir()
+    if asset_dir is None:
+        return context
+
+    linked = dict(context)
+    for key, (tag, extension, markup) in _ASSET_KINDS.items():
+        block = context.get(key)
+        if not isinstance(block, str):
+            continue
+        cache_key = (str(asset_dir), block)
+        if cache_key not in _published:
+            body = _inline_body(block, tag)
+            _published[cache_key] = (
+                block if body is None else markup.format(href=publish_asset(body, extension, asset_dir))
+            )
+        linked[key] = _published[cache_key]
+    return linked
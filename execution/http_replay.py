@@ -0,0 +1,583 @@
+"""
+HTTP Record/Replay for offline collector benchmarks
+
+Captures the responses the collectors receive from Azure DevOps and ArmorCode
+into a cassette file, then serves them from a local HTTP server so the same
+collection can be re-run offline, in CI, with identical request counts.
+
+Recording and replay both hook in at the AsyncSecureHTTPClient level via
+use_transport(), so collectors run unmodified:
+
+- RecordingTransport forwards to the real service and stores each response.
+  Secrets are scrubbed before anything is written: credential headers are
+  never stored, and credential-like JSON fields and query parameters are
+  replaced with "[SCRUBBED]".
+- ReplayServer is a local HTTP stand-in serving a cassette with configurable
+  latency, jitter and HTTP 429 injection.
+- LocalRedirectTransport sends every request to the ReplayServer instead of
+  the real host.
+- MeteredTransport records each request's latency and status into the
+  RequestMetrics active for the calling task (see measure_requests()).
+
+Usage:
+    from execution.async_http_client import use_transport
+    from execution.http_replay import Cassette, ReplayServer, measure_requests, replay_transport
+
+    with ReplayServer(Cassette.load(path), latency_ms=50) as server, use_transport(replay_transport(server.url)):
+        with measure_requests() as metrics:
+            await collect()
+    print(metrics.summary())
+"""
+
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+
+from execution.async_http_client import TransportFactory
+from execution.core import get_logger
+
+logger = get_logger(__name__)
+
+SCRUBBED = "[SCRUBBED]"
+
+CASSETTE_VERSION = 1
+
+# Request/response headers that carry credentials; never written to a cassette
+_SECRET_HEADERS = frozenset(
+    {"authorization", "proxy-authorization", "cookie", "set-cookie", "x-api-key", "x-tfs-session", "x-vss-userdata"}
+)
+
+# Headers describing the wire encoding; recomputed when a response is served again
+_HOP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"})
+
+# JSON field / query parameter names holding credentials (continuation tokens are kept: replay needs them)
+_SECRET_NAME = re.compile(
+    r"^(access_?token|refresh_?token|id_?token|token|pat|password|secret|client_?secret|api_?key|apikey|authorization)$",
+    re.IGNORECASE,
+)
+
+# Dates/timestamps in queries and bodies (lookback windows move every day)
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?")
+
+
+# ---------------------------------------------------------------------------
+# Scrubbing and request keys
+# ---------------------------------------------------------------------------
+
+
+def scrub_json(value: Any) -> Any:
+    """
+    Replace credential-like fields anywhere in a JSON value.
+
+    Args:
+        value: Parsed JSON (dict, list or scalar)
+
+    Returns:
+        Copy with the values of secret-named keys replaced by SCRUBBED
+    """
+    if isinstance(value, dict):
+        return {k: SCRUBBED if _SECRET_NAME.match(str(k)) else scrub_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [scrub_json(v) for v in value]
+    return value
+
+
+def _scrub_body(content: bytes) -> bytes:
+    """Scrubbed, canonical form of a JSON body (other bodies are returned unchanged)."""
+    if not content:
+        return b""
+    try:
+        parsed = json.loads(content)
+    except ValueError:
+        return content
+    return json.dumps(scrub_json(parsed), sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _scrub_headers(headers: httpx.Headers | dict[str, str]) -> dict[str, str]:
+    """Response headers worth replaying: credentials and wire-encoding headers removed."""
+    return {k.lower(): v for k, v in headers.items() if k.lower() not in _SECRET_HEADERS | _HOP_HEADERS}
+
+
+def request_key(method: str, raw_path: str, content: bytes = b"") -> str:
+    """
+    Host-independent identity of a request.
+
+    The same request sent to the real service and to the ReplayServer gets the
+    same key: scheme and host are ignored, query parameters are sorted and
+    scrubbed, and the body is hashed in its scrubbed canonical form. Dates are
+    masked so a cassette recorded on one day replays on the next, when every
+    lookback window ("fromDate", WIQL date filters) has moved.
+
+    Args:
+        method: HTTP method
+        raw_path: Path and query string as sent (e.g. "/org/_apis/projects?api-version=7.1")
+        content: Request body
+
+    Returns:
+        "METHOD /path?sorted-query body-digest"
+    """
+    parts = urlsplit(raw_path)
+    params = sorted(
+        (name, SCRUBBED if _SECRET_NAME.match(name) else _DATE.sub("{date}", value))
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+    )
+    body = _DATE.sub("{date}", _scrub_body(content).decode("utf-8", "replace")).encode("utf-8")
+    digest = hashlib.sha256(body).hexdigest()[:16] if body else "-"
+    return f"{method.upper()} {parts.path}?{urlencode(params)} {digest}"
+
+
+# ---------------------------------------------------------------------------
+# Cassette
+# ---------------------------------------------------------------------------
+
+
+class Cassette:
+    """
+    Recorded responses keyed by request_key().
+
+    Repeated requests with the same key are answered in recorded order; once
+    the recorded responses run out, the last one is repeated.
+
+    Attributes:
+        meta: Free-form recording metadata (e.g. projects and base URLs needed to replay)
+    """
+
+    def __init__(self, interactions: list[dict] | None = None, meta: dict | None = None):
+        """
+        Create a cassette.
+
+        Args:
+            interactions: Recorded interactions (as produced by to_dict())
+            meta: Recording metadata
+        """
+        self.meta: dict = meta or {}
+        self._lock = threading.Lock()
+        self._responses: dict[str, list[dict]] = {}
+        self._served: dict[str, int] = {}
+        for interaction in interactions or []:
+            self._responses.setdefault(interaction["key"], []).append(interaction)
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._responses.values())
+
+    def record(self, method: str, raw_path: str, request_body: bytes, response: httpx.Response) -> None:
+        """
+        Store a response (scrubbed) for later replay.
+
+        Args:
+            method: HTTP method
+            raw_path: Path and query string of the request
+            request_body: Request body
+            response: Fully read response
+        """
+        content = _scrub_body(response.content) if "json" in response.headers.get("content-type", "") else None
+        interaction: dict[str, Any] = {
+            "key": request_key(method, raw_path, request_body),
+            "status": response.status_code,
+            "headers": _scrub_headers(response.headers),
+        }
+        if content is not None:
+            interaction["body"] = content.decode("utf-8")
+        else:
+            interaction["body_b64"] = base64.b64encode(response.content).decode("ascii")
+        with self._lock:
+            self._responses.setdefault(interaction["key"], []).append(interaction)
+
+    def response_for(self, key: str) -> dict | None:
+        """
+        Next recorded response for a request key (None if never recorded).
+
+        Args:
+            key: request_key() of the incoming request
+        """
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                return None
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+            return responses[min(index, len(responses) - 1)]
+
+    def to_dict(self) -> dict:
+        """JSON-serialisable cassette."""
+        return {
+            "version": CASSETTE_VERSION,
+            "recorded_at": self.meta.get("recorded_at", datetime.now().isoformat()),
+            "meta": self.meta,
+            "interactions": [i for responses in self._responses.values() for i in responses],
+        }
+
+    def save(self, path: Path | str) -> None:
+        """
+        Write the cassette to disk.
+
+        Args:
+            path: JSON file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=1), encoding="utf-8")
+        logger.info(f"Saved cassette with {len(self)} interactions to {path}")
+
+    @classmethod
+    def load(cls, path: Path | str) -> "Cassette":
+        """
+        Read a cassette written by save().
+
+        Args:
+            path: JSON file path
+
+        Raises:
+            ValueError: If the file is not a supported cassette
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version in {path}: {data.get('version')}")
+        return cls(data.get("interactions", []), data.get("meta", {}))
+
+
+def _response_body(interaction: dict) -> bytes:
+    """Body bytes of a recorded interaction."""
+    if "body" in interaction:
+        return str(interaction["body"]).encode("utf-8")
+    return base64.b64decode(interaction.get("body_b64", ""))
+
+
+# ---------------------------------------------------------------------------
+# Request metrics
+# ---------------------------------------------------------------------------
+
+
+class RequestMetrics:
+    """
+    Exact request count and latency distribution for one measured block.
+
+    Attributes:
+        latencies_ms: Latency of every completed request
+        by_status: Request count per HTTP status (0 for transport errors)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.latencies_ms: list[float] = []
+        self.by_status: dict[int, int] = {}
+
+    def observe(self, latency_ms: float, status: int) -> None:
+        """Record one request."""
+        with self._lock:
+            self.latencies_ms.append(latency_ms)
+            self.by_status[status] = self.by_status.get(status, 0) + 1
+
+    @property
+    def count(self) -> int:
+        """Requests sent (including retried and failed ones)."""
+        return len(self.latencies_ms)
+
+    def percentile(self, q: float) -> float:
+        """
+        Latency percentile (nearest rank).
+
+        Args:
+            q: Percentile in [0, 100]
+
+        Returns:
+            Latency in milliseconds (0.0 if no requests were made)
+        """
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        rank = max(1, int(-(-q * len(ordered) // 100)))  # ceil(q/100 * n)
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def summary(self) -> dict[str, Any]:
+        """Counts and p50/p95 latency as a JSON-serialisable dict."""
+        return {
+            "requests": self.count,
+            "by_status": {str(status): n for status, n in sorted(self.by_status.items())},
+            "latency_p50_ms": round(self.percentile(50), 2),
+            "latency_p95_ms": round(self.percentile(95), 2),
+        }
+
+
+# Metrics of the current task (set by measure_requests)
+_current_metrics: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+def get_current_request_metrics() -> RequestMetrics | None:
+    """
+    Get the metrics collecting requests for the current task.
+
+    Returns:
+        Active RequestMetrics or None if requests are not being measured
+    """
+    return _current_metrics.get()
+
+
+@contextmanager
+def measure_requests() -> Generator[RequestMetrics, None, None]:
+    """
+    Count and time every request sent through a MeteredTransport inside the block.
+
+    Scoped to the current asyncio task (context variable), so concurrently
+    benchmarked collectors each get their own numbers.
+
+    Yields:
+        RequestMetrics filled in as requests complete
+    """
+    metrics = RequestMetrics()
+    token = _current_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# Transports
+# ---------------------------------------------------------------------------
+
+
+class MeteredTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper reporting each request to the active RequestMetrics."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport):
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        metrics = _current_metrics.get()
+        start = time.perf_counter()
+        status = 0
+        try:
+            response = await self.inner.handle_async_request(request)
+            status = response.status_code
+            return response
+        finally:
+            if metrics is not None:
+                metrics.observe((time.perf_counter() - start) * 1000, status)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Transport forwarding to the real service and storing every response in a cassette."""
+
+    def __init__(self, cassette: Cassette, inner: httpx.AsyncBaseTransport):
+        self.cassette = cassette
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request_body = await request.aread()
+        response = await self.inner.handle_async_request(request)
+        content = await response.aread()
+        replayable = httpx.Response(
+            response.status_code, headers=_scrub_headers(response.headers), content=content, request=request
+        )
+        self.cassette.record(request.method, request.url.raw_path.decode("ascii"), request_body, replayable)
+        await response.aclose()
+        return httpx.Response(
+            response.status_code,
+            headers=[(k, v) for k, v in response.headers.items() if k.lower() not in _HOP_HEADERS],
+            content=content,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class LocalRedirectTransport(httpx.AsyncBaseTransport):
+    """Transport sending every request to a local server, keeping path, query, headers and body."""
+
+    def __init__(self, server_url: str, inner: httpx.AsyncBaseTransport):
+        target = httpx.URL(server_url)
+        self.scheme = target.scheme
+        self.host = target.host
+        self.port = target.port
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(scheme=self.scheme, host=self.host, port=self.port)
+        return await self.inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+def recording_transport(cassette: Cassette) -> TransportFactory:
+    """
+    Transport factory for use_transport(): real network, responses recorded and metered.
+
+    Args:
+        cassette: Cassette receiving the responses
+    """
+
+    def factory(limits: httpx.Limits, http2: bool) -> httpx.AsyncBaseTransport:
+        inner = httpx.AsyncHTTPTransport(limits=limits, http2=http2, verify=True)
+        return MeteredTransport(RecordingTransport(cassette, inner))
+
+    return factory
+
+
+def replay_transport(server_url: str) -> TransportFactory:
+    """
+    Transport factory for use_transport(): every request served by a ReplayServer and metered.
+
+    Args:
+        server_url: ReplayServer.url
+    """
+
+    def factory(limits: httpx.Limits, http2: bool) -> httpx.AsyncBaseTransport:
+        # The local stand-in speaks plain HTTP/1.1
+        return MeteredTransport(LocalRedirectTransport(server_url, httpx.AsyncHTTPTransport(limits=limits)))
+
+    return factory
+
+
+# ---------------------------------------------------------------------------
+# Local replay server
+# ---------------------------------------------------------------------------
+
+
+class ReplayServer:
+    """
+    Local HTTP stand-in for Azure DevOps and ArmorCode serving a cassette.
+
+    Attributes:
+        url: Base URL of the running server (e.g. "http://127.0.0.1:54321")
+        requests: Requests received
+        throttled: Requests answered with an injected HTTP 429
+        misses: Requests with no recorded response (answered with HTTP 404)
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        rate_limit_every: int = 0,
+        retry_after: int = 1,
+        seed: int = 0,
+    ):
+        """
+        Configure the server (call start() or use as a context manager).
+
+        Args:
+            cassette: Responses to serve
+            latency_ms: Added delay per request
+            jitter_ms: Uniform random +/- variation of the delay
+            rate_limit_every: Answer every Nth request with HTTP 429 (0 disables injection)
+            retry_after: Retry-After seconds sent with injected 429s
+            seed: Seed for the jitter, so runs are reproducible
+        """
+        self.cassette = cassette
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.requests = 0
+        self.throttled = 0
+        self.misses = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("ReplayServer is not running")
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode("ascii")
+        return f"http://{host}:{port}"
+
+    def _next_request(self) -> tuple[float, bool]:
+        """Delay (seconds) for the next request and whether to throttle it."""
+        with self._lock:
+            self.requests += 1
+            throttle = self.rate_limit_every > 0 and self.requests % self.rate_limit_every == 0
+            if throttle:
+                self.throttled += 1
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000, throttle
+
+    def _respond(self, handler: BaseHTTPRequestHandler) -> None:
+        """Answer one request from the cassette."""
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length else b""
+        delay, throttle = self._next_request()
+        if delay:
+            time.sleep(delay)
+
+        if throttle:
+            status, headers, content = 429, {"retry-after": str(self.retry_after)}, b'{"message":"Too Many Requests"}'
+        else:
+            interaction = self.cassette.response_for(request_key(handler.command, handler.path, body))
+            if interaction is None:
+                with self._lock:
+                    self.misses += 1
+                logger.warning(f"Replay miss: {handler.command} {handler.path}")
+                status, headers, content = 404, {"content-type": "application/json"}, b'{"message":"Not recorded"}'
+            else:
+                status, headers, content = interaction["status"], interaction["headers"], _response_body(interaction)
+
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(content)))
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def start(self) -> "ReplayServer":
+        """Start serving on a free localhost port in a background thread."""
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                replay._respond(self)
+
+            do_POST = do_PUT = do_PATCH = do_DELETE = do_GET  # noqa: N815
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - http.server signature
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        logger.info(f"Replay server listening on {self.url} ({len(self.cassette)} interactions)")
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        logger.info(
+            "Replay server stopped",
+            extra={"requests": self.requests, "throttled": self.throttled, "misses": self.misses},
+        )
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
@@ -6,23 +6,58 @@ Reads all *_history.json files and imports them into a normalised SQLite
 database at .tmp/observatory/observatory.db.  After importing raw metrics the
 script computes 8-week rolling statistics (mean, std, slope) and writes them
 to the rolling_stats table, which the anomaly detector then consumes.
+
+The import is incremental: each dashboard only re-reads weeks from its latest
+imported week_date onwards (that week is re-upserted, so a re-collected week
+replaces its earlier values), and rolling stats are recomputed only for the
+series those weeks touched.  Rows are written with executemany() in one
+transaction per dashboard and upserted on the unique
+(metric_date, dashboard, project_name, metric_name) index.
+
+Usage:
+    python -m execution.import_to_sqlite          # incremental
+    python -m execution.import_to_sqlite --full   # truncate and re-import everything
 """
 
+import argparse
 import json
-import os
 import sqlite3
+from datetime import datetime
+from itertools import groupby
 from pathlib import Path
-from typing import Any, Optional
+
+from execution.core.history_store import history_exists, load_weeks
 
 DB_PATH = Path(".tmp/observatory/observatory.db")
 HISTORY_DIR = Path(".tmp/observatory")
 
+# Rolling stats look at this many most recent weeks per series
+ROLLING_WINDOW_WEEKS = 52
+
+# (metric_date, dashboard, project_name, metric_name, metric_value, metric_unit)
+MetricRow = tuple[str, str, str, str, float, str]
+
+_UPSERT_METRIC_SQL = (
+    "INSERT INTO metrics (metric_date, dashboard, project_name, metric_name, metric_value, metric_unit) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(metric_date, dashboard, project_name, metric_name) DO UPDATE SET "
+    "metric_value=excluded.metric_value, metric_unit=excluded.metric_unit"
+)
+
 
 # ---------------------------------------------------------------------------
 # Schema
 # ---------------------------------------------------------------------------
 
 
+def configure_connection(conn: sqlite3.Connection) -> None:
+    """WAL journal and bulk-load pragmas (safe for a rebuildable metrics store)."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+
+
 def create_database(conn: sqlite3.Connection) -> None:
     """Create all tables and indexes (idempotent)."""
     cursor = conn.cursor()
@@ -42,6 +77,10 @@ def create_database(conn: sqlite3.Connection) -> None:
         CREATE INDEX IF NOT EXISTS idx_metrics_date      ON metrics (metric_date);
         CREATE INDEX IF NOT EXISTS idx_metrics_dashboard ON metrics (dashboard);
         CREATE INDEX IF NOT EXISTS idx_metrics_project   ON metrics (project_name, metric_name);
+        -- Per-series history in date order, covering metric_value: serves the latest-value
+        -- LIMIT 1 seeks in execution/ml (anomaly_detector.LATEST_VALUES_SQL) and the
+        -- rolling-stats window below
+        CREATE INDEX IF NOT EXISTS idx_metrics_latest    ON metrics (dashboard, metric_name, project_name, metric_date, metric_value);
 
         CREATE TABLE IF NOT EXISTS rolling_stats (
             dashboard    TEXT NOT NULL,
@@ -70,6 +109,19 @@ def create_database(conn: sqlite3.Connection) -> None:
         );
     """)
 
+    # Databases built before upserts may hold duplicate rows per week: keep the newest
+    has_unique = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_metrics_unique'"
+    ).fetchone()
+    if not has_unique:
+        cursor.execute(
+            "DELETE FROM metrics WHERE id NOT IN ("
+            "SELECT MAX(id) FROM metrics GROUP BY metric_date, dashboard, project_name, metric_name)"
+        )
+        cursor.execute(
+            "CREATE UNIQUE INDEX idx_metrics_unique ON metrics (metric_date, dashboard, project_name, metric_name)"
+        )
+
     conn.commit()
 
 
@@ -78,35 +130,76 @@ def create_database(conn: sqlite3.Connection) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _insert_metrics(
-    cursor: sqlite3.Cursor,
+def _metric_rows(
     week_date: str,
     dashboard: str,
     project_name: str,
     metrics: list[tuple[str, float | None, str]],
-) -> int:
-    """Bulk-insert a list of (metric_name, value, unit) rows. Returns count inserted."""
-    count = 0
-    for metric_name, metric_value, metric_unit in metrics:
-        if metric_value is not None:
-            cursor.execute(
-                "INSERT INTO metrics (metric_date, dashboard, project_name, metric_name, metric_value, metric_unit) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                (week_date, dashboard, project_name, metric_name, metric_value, metric_unit),
-            )
-            count += 1
-    return count
+) -> list[MetricRow]:
+    """Turn (metric_name, value, unit) tuples into metrics rows, dropping None values."""
+    return [
+        (week_date, dashboard, project_name, metric_name, metric_value, metric_unit)
+        for metric_name, metric_value, metric_unit in metrics
+        if metric_value is not None
+    ]
+
+
+def _write_metrics(conn: sqlite3.Connection, rows: list[MetricRow]) -> int:
+    """
+    Upsert rows in one transaction and remember their series for compute_rolling_stats.
+
+    Rows identical to what is already stored (the re-read latest week) are skipped.
+
+    Returns:
+        Number of rows written
+    """
+    stored: dict[tuple[str, str, str, str], tuple[float, str]] = {}
+    for metric_date, dashboard in {(row[0], row[1]) for row in rows}:
+        for project_name, metric_name, metric_value, metric_unit in conn.execute(
+            "SELECT project_name, metric_name, metric_value, metric_unit FROM metrics "
+            "WHERE metric_date = ? AND dashboard = ?",
+            (metric_date, dashboard),
+        ):
+            stored[(metric_date, dashboard, project_name, metric_name)] = (metric_value, metric_unit)
+    rows = [row for row in rows if stored.get(row[:4]) != row[4:]]
+
+    if not rows:
+        return 0
+    with conn:
+        conn.executemany(_UPSERT_METRIC_SQL, rows)
+        conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS changed_series ("
+            "dashboard TEXT, project_name TEXT, metric_name TEXT, "
+            "PRIMARY KEY (dashboard, project_name, metric_name))"
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO temp.changed_series VALUES (?, ?, ?)",
+            {(dashboard, project, metric) for _, dashboard, project, metric, _, _ in rows},
+        )
+    return len(rows)
 
 
 def _load_history(file_path: Path) -> list[dict]:
     """Load weeks list from a history JSON file. Returns [] if missing."""
-    if not file_path.exists():
+    if not history_exists(file_path):
         print(f"  ⚠  Skipping: {file_path.name} not found")
         return []
-    with open(file_path, encoding="utf-8") as fh:
-        data: dict[str, Any] = json.load(fh)
-    weeks: list[dict] = data.get("weeks", [])
-    return weeks
+    return list(load_weeks(file_path))
+
+
+def _load_new_weeks(conn: sqlite3.Connection, dashboard: str, file_path: Path) -> list[dict]:
+    """
+    Weeks of a history file not yet fully imported for `dashboard`.
+
+    The latest imported week is included again so a re-collected week replaces
+    its earlier values (rows are upserted).
+    """
+    weeks = _load_history(file_path)
+    row = conn.execute("SELECT MAX(metric_date) FROM metrics WHERE dashboard = ?", (dashboard,)).fetchone()
+    watermark = row[0] if row else None
+    if watermark is None:
+        return weeks
+    return [week for week in weeks if week["week_date"] >= watermark]
 
 
 # ---------------------------------------------------------------------------
@@ -116,9 +209,8 @@ def _load_history(file_path: Path) -> list[dict]:
 
 def import_quality_metrics(conn: sqlite3.Connection) -> int:
     """Import quality metrics (open bugs, bug age, MTTR)."""
-    weeks = _load_history(HISTORY_DIR / "quality_history.json")
-    cursor = conn.cursor()
-    total = 0
+    weeks = _load_new_weeks(conn, "quality", HISTORY_DIR / "quality_history.json")
+    batch: list[MetricRow] = []
 
     for week in weeks:
         week_date = week["week_date"]
@@ -136,18 +228,17 @@ def import_quality_metrics(conn: sqlite3.Connection) -> int:
                 ("mttr_median", mttr.get("median_mttr_days"), "days"),
                 ("test_execution_median_min", test_time.get("median_minutes"), "minutes"),
             ]
-            total += _insert_metrics(cursor, week_date, "quality", project_name, rows)
+            batch += _metric_rows(week_date, "quality", project_name, rows)
 
-    conn.commit()
+    total = _write_metrics(conn, batch)
     print(f"  ✓ quality: {total} rows")
     return total
 
 
 def import_deployment_metrics(conn: sqlite3.Connection) -> int:
     """Import deployment metrics (build success rate, frequency, duration, lead time)."""
-    weeks = _load_history(HISTORY_DIR / "deployment_history.json")
-    cursor = conn.cursor()
-    total = 0
+    weeks = _load_new_weeks(conn, "deployment", HISTORY_DIR / "deployment_history.json")
+    batch: list[MetricRow] = []
 
     for week in weeks:
         week_date = week["week_date"]
@@ -165,18 +256,17 @@ def import_deployment_metrics(conn: sqlite3.Connection) -> int:
                 ("lead_time_median_hours", lt.get("median_hours"), "hours"),
                 ("lead_time_p85_hours", lt.get("p85_hours"), "hours"),
             ]
-            total += _insert_metrics(cursor, week_date, "deployment", project_name, rows)
+            batch += _metric_rows(week_date, "deployment", project_name, rows)
 
-    conn.commit()
+    total = _write_metrics(conn, batch)
     print(f"  ✓ deployment: {total} rows")
     return total
 
 
 def import_flow_metrics(conn: sqlite3.Connection) -> int:
     """Import flow metrics (open count, throughput, lead time per work type)."""
-    weeks = _load_history(HISTORY_DIR / "flow_history.json")
-    cursor = conn.cursor()
-    total = 0
+    weeks = _load_new_weeks(conn, "flow", HISTORY_DIR / "flow_history.json")
+    batch: list[MetricRow] = []
 
     for week in weeks:
         week_date = week["week_date"]
@@ -197,18 +287,17 @@ def import_flow_metrics(conn: sqlite3.Connection) -> int:
                     (f"{wt_key}_throughput_per_week", tp.get("per_week"), "items"),
                 ]
 
-            total += _insert_metrics(cursor, week_date, "flow", project_name, rows)
+            batch += _metric_rows(week_date, "flow", project_name, rows)
 
-    conn.commit()
+    total = _write_metrics(conn, batch)
     print(f"  ✓ flow: {total} rows")
     return total
 
 
 def import_ownership_metrics(conn: sqlite3.Connection) -> int:
     """Import ownership metrics (unassigned pct, load imbalance, dev active days)."""
-    weeks = _load_history(HISTORY_DIR / "ownership_history.json")
-    cursor = conn.cursor()
-    total = 0
+    weeks = _load_new_weeks(conn, "ownership", HISTORY_DIR / "ownership_history.json")
+    batch: list[MetricRow] = []
 
     for week in weeks:
         week_date = week["week_date"]
@@ -225,18 +314,17 @@ def import_ownership_metrics(conn: sqlite3.Connection) -> int:
                 ("avg_active_days", dev_days.get("avg_active_days"), "days"),
                 ("total_commits", dev_days.get("total_commits"), "commits"),
             ]
-            total += _insert_metrics(cursor, week_date, "ownership", project_name, rows)
+            batch += _metric_rows(week_date, "ownership", project_name, rows)
 
-    conn.commit()
+    total = _write_metrics(conn, batch)
     print(f"  ✓ ownership: {total} rows")
     return total
 
 
 def import_risk_metrics(conn: sqlite3.Connection) -> int:
     """Import risk metrics (code churn, knowledge distribution, module coupling)."""
-    weeks = _load_history(HISTORY_DIR / "risk_history.json")
-    cursor = conn.cursor()
-    total = 0
+    weeks = _load_new_weeks(conn, "risk", HISTORY_DIR / "risk_history.json")
+    batch: list[MetricRow] = []
 
     for week in weeks:
         week_date = week["week_date"]
@@ -252,18 +340,17 @@ def import_risk_metrics(conn: sqlite3.Connection) -> int:
                 ("single_owner_pct", knowledge.get("single_owner_pct"), "pct"),
                 ("total_coupled_pairs", coupling.get("total_coupled_pairs"), "pairs"),
             ]
-            total += _insert_metrics(cursor, week_date, "risk", project_name, rows)
+            batch += _metric_rows(week_date, "risk", project_name, rows)
 
-    conn.commit()
+    total = _write_metrics(conn, batch)
     print(f"  ✓ risk: {total} rows")
     return total
 
 
 def import_collaboration_metrics(conn: sqlite3.Connection) -> int:
     """Import collaboration metrics (PR merge time, review iterations, PR size)."""
-    weeks = _load_history(HISTORY_DIR / "collaboration_history.json")
-    cursor = conn.cursor()
-    total = 0
+    weeks = _load_new_weeks(conn, "collaboration", HISTORY_DIR / "collaboration_history.json")
+    batch: list[MetricRow] = []
 
     for week in weeks:
         week_date = week["week_date"]
@@ -281,9 +368,9 @@ def import_collaboration_metrics(conn: sqlite3.Connection) -> int:
                 ("pr_size_median_commits", pr_size.get("median_commits"), "commits"),
                 ("total_prs_analyzed", project.get("total_prs_analyzed"), "prs"),
             ]
-            total += _insert_metrics(cursor, week_date, "collaboration", project_name, rows)
+            batch += _metric_rows(week_date, "collaboration", project_name, rows)
 
-    conn.commit()
+    total = _write_metrics(conn, batch)
     print(f"  ✓ collaboration: {total} rows")
     return total
 
@@ -303,9 +390,8 @@ def _load_armorcode_id_map() -> dict[str, str]:
 
 def import_security_metrics(conn: sqlite3.Connection) -> int:
     """Import security metrics (critical/high counts) per product."""
-    weeks = _load_history(HISTORY_DIR / "security_history.json")
-    cursor = conn.cursor()
-    total = 0
+    weeks = _load_new_weeks(conn, "security", HISTORY_DIR / "security_history.json")
+    batch: list[MetricRow] = []
 
     id_to_name = _load_armorcode_id_map()
 
@@ -321,18 +407,17 @@ def import_security_metrics(conn: sqlite3.Connection) -> int:
                 ("high_vulns", counts.get("high"), "vulns"),
                 ("total_vulnerabilities", counts.get("total"), "vulns"),
             ]
-            total += _insert_metrics(cursor, week_date, "security", product_name, rows)
+            batch += _metric_rows(week_date, "security", product_name, rows)
 
-    conn.commit()
+    total = _write_metrics(conn, batch)
     print(f"  ✓ security: {total} rows")
     return total
 
 
 def import_exploitable_metrics(conn: sqlite3.Connection) -> int:
     """Import CISA KEV exploitable metrics (critical/high/medium counts) per product."""
-    weeks = _load_history(HISTORY_DIR / "exploitable_history.json")
-    cursor = conn.cursor()
-    total = 0
+    weeks = _load_new_weeks(conn, "exploitable", HISTORY_DIR / "exploitable_history.json")
+    batch: list[MetricRow] = []
 
     id_to_name = _load_armorcode_id_map()
 
@@ -349,9 +434,9 @@ def import_exploitable_metrics(conn: sqlite3.Connection) -> int:
                 ("medium_vulns", counts.get("medium"), "vulns"),
                 ("total_vulnerabilities", counts.get("total"), "vulns"),
             ]
-            total += _insert_metrics(cursor, week_date, "exploitable", product_name, rows)
+            batch += _metric_rows(week_date, "exploitable", product_name, rows)
 
-    conn.commit()
+    total = _write_metrics(conn, batch)
     print(f"  ✓ exploitable: {total} rows")
     return total
 
@@ -361,69 +446,110 @@ def import_exploitable_metrics(conn: sqlite3.Connection) -> int:
 # ---------------------------------------------------------------------------
 
 
-def compute_rolling_stats(conn: sqlite3.Connection) -> int:
+def compute_rolling_stats(conn: sqlite3.Connection, changed_only: bool = False) -> int:
     """
     Compute 8-week rolling mean, std, trend slope for every
     (dashboard, project_name, metric_name) combination.
 
-    Upserts results into rolling_stats table.
+    The last 52 weeks of every series are read in one windowed query and
+    reduced with grouped NumPy operations.  Upserts results into
+    rolling_stats table.
+
+    Args:
+        conn: Database connection
+        changed_only: Only series written by this connection's imports
+
     Returns the number of stat rows written.
     """
     import numpy as np
 
-    cursor = conn.cursor()
-
-    # Fetch all distinct (dashboard, project_name, metric_name) series
-    cursor.execute("SELECT DISTINCT dashboard, project_name, metric_name FROM metrics ORDER BY dashboard, project_name")
-    series_keys = cursor.fetchall()
+    has_changes = conn.execute(
+        "SELECT 1 FROM sqlite_temp_master WHERE type='table' AND name='changed_series'"
+    ).fetchone()
+    if changed_only and not has_changes:
+        print("  ✓ rolling stats computed: 0 series (no new weeks)")
+        return 0
+
+    series_filter = (
+        "JOIN temp.changed_series c "
+        "ON c.dashboard = m.dashboard AND c.project_name = m.project_name AND c.metric_name = m.metric_name"
+        if changed_only
+        else ""
+    )
+    rows = conn.execute(
+        f"""
+        SELECT dashboard, project_name, metric_name, metric_value, rn FROM (
+            SELECT m.dashboard, m.project_name, m.metric_name, m.metric_value,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY m.dashboard, m.metric_name, m.project_name ORDER BY m.metric_date DESC
+                   ) AS rn
+            FROM metrics m {series_filter}
+            WHERE m.metric_value IS NOT NULL
+        )
+        WHERE rn <= ?
+        ORDER BY dashboard, project_name, metric_name, rn DESC
+        """,  # nosec B608 - series_filter is one of two constant strings
+        (ROLLING_WINDOW_WEEKS,),
+    ).fetchall()
+
+    # Group index per row; rows are sorted by series, oldest-first within each
+    keys = []
+    group_sizes = []
+    for key, group in groupby(rows, key=lambda r: r[:3]):
+        keys.append(key)
+        group_sizes.append(sum(1 for _ in group))
 
     count = 0
-    now_iso = __import__("datetime").datetime.now().isoformat()
-
-    for dashboard, project_name, metric_name in series_keys:
-        # Fetch last 52 weeks ordered by date
-        cursor.execute(
-            "SELECT metric_date, metric_value FROM metrics "
-            "WHERE dashboard=? AND project_name=? AND metric_name=? "
-            "ORDER BY metric_date DESC LIMIT 52",
-            (dashboard, project_name, metric_name),
-        )
-        rows = cursor.fetchall()
-        if not rows:
-            continue
-
-        values = np.array([r[1] for r in rows if r[1] is not None], dtype=float)
-        if len(values) < 2:
-            continue
-
-        # All-time stats
-        rolling_mean = float(np.mean(values))
-        rolling_std = float(np.std(values))
-
-        # Trend slope: reverse to oldest-first so positive slope = increasing over time.
-        # (values are newest-first from the DESC query; polyfit on DESC order gives inverted slope)
-        values_asc = values[::-1]
-        x_asc = np.arange(len(values_asc), dtype=float)
-        if len(values_asc) >= 2:
-            coeffs = np.polyfit(x_asc, values_asc, 1)
-            trend_slope = float(coeffs[0])
-        else:
-            trend_slope = 0.0
-
-        # 8-week average (most recent 8 — values[:8] since values are newest-first)
-        last_8w_avg = float(np.mean(values[:8]))
+    if keys:
+        sizes = np.array(group_sizes)
+        gid = np.repeat(np.arange(len(keys)), sizes)
+        values = np.array([r[3] for r in rows], dtype=float)
+        newest_rank = np.array([r[4] for r in rows])
+        # Oldest-first position within each series (x for the trend fit)
+        x = np.arange(len(rows)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+
+        n = sizes.astype(float)
+        rolling_mean = np.bincount(gid, weights=values) / n
+        deviation = values - rolling_mean[gid]
+        rolling_std = np.sqrt(np.bincount(gid, weights=deviation**2) / n)
+
+        # Least-squares slope of value over week index (positive = increasing over time)
+        x_dev = x - ((n - 1) / 2)[gid]
+        sxx = np.bincount(gid, weights=x_dev**2)
+        sxy = np.bincount(gid, weights=x_dev * deviation)
+        trend_slope = np.divide(sxy, sxx, out=np.zeros_like(sxy), where=sxx > 0)
+
+        recent = newest_rank <= 8
+        last_8w_avg = np.bincount(gid[recent], weights=values[recent], minlength=len(keys)) / np.minimum(n, 8)
+
+        now_iso = datetime.now().isoformat()
+        stats = [
+            (
+                *keys[i],
+                float(rolling_mean[i]),
+                float(rolling_std[i]),
+                float(trend_slope[i]),
+                float(last_8w_avg[i]),
+                now_iso,
+            )
+            for i in np.flatnonzero(sizes >= 2)
+        ]
+        with conn:
+            conn.executemany(
+                "INSERT INTO rolling_stats (dashboard, project_name, metric_name, "
+                "rolling_mean, rolling_std, trend_slope, last_8w_avg, last_updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(dashboard, project_name, metric_name) DO UPDATE SET "
+                "rolling_mean=excluded.rolling_mean, rolling_std=excluded.rolling_std, "
+                "trend_slope=excluded.trend_slope, last_8w_avg=excluded.last_8w_avg, "
+                "last_updated=excluded.last_updated",
+                stats,
+            )
+        count = len(stats)
 
-        cursor.execute(
-            "INSERT INTO rolling_stats (dashboard, project_name, metric_name, "
-            "rolling_mean, rolling_std, trend_slope, last_8w_avg, last_updated) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
-            "ON CONFLICT(dashboard, project_name, metric_name) DO UPDATE SET "
-            "rolling_mean=excluded.rolling_mean, rolling_std=excluded.rolling_std, "
-            "trend_slope=excluded.trend_slope, last_8w_avg=excluded.last_8w_avg, "
-            "last_updated=excluded.last_updated",
-            (dashboard, project_name, metric_name, rolling_mean, rolling_std, trend_slope, last_8w_avg, now_iso),
-        )
-        count += 1
+    if has_changes:
+        with conn:
+            conn.execute("DELETE FROM temp.changed_series")
 
     conn.commit()
     print(f"  ✓ rolling stats computed: {count} series")
@@ -442,19 +568,25 @@ def clear_existing_data(conn: sqlite3.Connection) -> None:
 
 
 def main() -> None:
-    """Run the full import pipeline: raw metrics → rolling stats."""
+    """Run the import pipeline: new raw metrics → rolling stats of the changed series."""
+    parser = argparse.ArgumentParser(description="Import Observatory history files into SQLite")
+    parser.add_argument("--full", action="store_true", help="Truncate raw metrics and re-import every week")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Observatory Metrics → SQLite")
     print("=" * 60)
 
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(DB_PATH)
+    configure_connection(conn)
 
     print("\nInitialising schema...")
     create_database(conn)
 
-    print("\nClearing existing raw metrics...")
-    clear_existing_data(conn)
+    if args.full:
+        print("\nClearing existing raw metrics...")
+        clear_existing_data(conn)
 
     print("\nImporting raw metrics...")
     total = 0
@@ -468,7 +600,7 @@ def main() -> None:
     total += import_exploitable_metrics(conn)
 
     print("\nComputing rolling statistics...")
-    compute_rolling_stats(conn)
+    compute_rolling_stats(conn, changed_only=True)
 
     cursor = conn.cursor()
     cursor.execute("SELECT COUNT(DISTINCT metric_date) FROM metrics")
@@ -483,7 +615,7 @@ def main() -> None:
     print()
     print("=" * 60)
     print("✓ Import complete")
-    print(f"  Raw rows:       {total}")
+    print(f"  Rows upserted:  {total}")
     print(f"  Unique dates:   {date_count}")
     print(f"  Dashboards:     {dash_count}")
     print(f"  Rolling stats:  {stats_count}")
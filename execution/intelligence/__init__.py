@@ -13,6 +13,7 @@ Public API (import from here for cross-module use):
         compute_project_risk, compute_all_risks,   # risk scoring
         find_top_opportunities,                    # opportunity scoring
         run_monte_carlo, compare_scenarios,        # Phase C: scenario simulation
+        run_monte_carlo_batch, ScenarioSpec,       # batched Monte Carlo (all scenarios at once)
         compute_correlation_matrix,                # Phase C: correlation analysis
         find_leading_indicators,                   # Phase C: correlation analysis
         decompose_delta, get_top_contributors,     # Phase C: causal analysis
@@ -56,7 +57,12 @@ from execution.intelligence.insight_generator import generate_insight, generate_
 from execution.intelligence.narrative_engine import generate_report
 from execution.intelligence.opportunity_scorer import find_top_opportunities
 from execution.intelligence.risk_scorer import compute_all_risks, compute_project_risk
-from execution.intelligence.scenario_simulator import compare_scenarios, run_monte_carlo
+from execution.intelligence.scenario_simulator import (
+    ScenarioSpec,
+    compare_scenarios,
+    run_monte_carlo,
+    run_monte_carlo_batch,
+)
 
 __all__ = [
     # Feature store
@@ -77,6 +83,8 @@ __all__ = [
     # Phase C: Scenario simulation
     "run_monte_carlo",
     "compare_scenarios",
+    "run_monte_carlo_batch",
+    "ScenarioSpec",
     # Phase C: Correlation analysis
     "compute_correlation_matrix",
     "find_leading_indicators",
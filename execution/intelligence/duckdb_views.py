@@ -3,7 +3,12 @@ DuckDB Views — execution/intelligence/duckdb_views.py
 
 Single responsibility: Provides analytical SQL queries over feature Parquet files via DuckDB.
 
-Uses in-memory DuckDB (no persistent .duckdb file) to avoid path traversal risks.
+Queries run against one process-wide in-memory DuckDB session (no persistent
+.duckdb file, to avoid path traversal risks). Each metric is a view that scans the
+feature Parquet files directly with read_parquet, so DuckDB pushes column
+projection and row filters into the scan instead of copying the whole feature
+table through pandas on every call. A view is rebuilt only when the feature
+manifest (or the dated snapshot it falls back to) changes.
 All SQL identifier interpolation uses the VALID_METRICS whitelist before substitution.
 All SQL value filters use parameterized queries.
 
@@ -12,9 +17,12 @@ Security requirements satisfied:
 - SQL identifiers validated against VALID_METRICS before interpolation (Phase B cond. 3)
 - Parameterized queries for all value filters (Phase B cond. 3)
 - In-memory DuckDB: no persistent .db file, no path traversal surface (Phase B cond. 3)
+- Parquet paths come from feature_partition_paths() (PathValidator-checked) and are
+  passed to DuckDB's relation API, never interpolated into SQL text
 """
 
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -22,7 +30,7 @@ import duckdb
 import pandas as pd
 
 from execution.core.logging_config import get_logger
-from execution.intelligence.feature_engineering import VALID_METRICS, load_features
+from execution.intelligence.feature_engineering import MANIFEST_FILENAME, VALID_METRICS, feature_partition_paths
 
 logger: logging.Logger = get_logger(__name__)
 
@@ -65,29 +73,112 @@ def _assert_valid_metric(metric: str) -> None:
         raise ValueError(f"Invalid metric '{metric}'. " f"Allowed values: {sorted(VALID_METRICS)}")
 
 
-def _load_into_connection(
-    conn: duckdb.DuckDBPyConnection,
-    metric: str,
-    base_dir: Path,
-) -> None:
+def _feature_source(metric: str, base_dir: Path) -> tuple[list[Path], tuple]:
     """
-    Load the latest feature Parquet for a metric into a DuckDB connection as a view.
-
-    The view name is ``features`` (fixed identifier — not derived from user input).
-    The Parquet file path is built from the whitelisted metric name.
+    Parquet files backing a metric and a signature that changes when they do.
 
-    Args:
-        conn: In-memory DuckDB connection.
-        metric: Metric name — must be in VALID_METRICS (caller's responsibility).
-        base_dir: Directory containing feature Parquet files.
+    Mirrors load_features(): manifest partitions first, else the latest dated snapshot.
 
     Raises:
         ValueError: If no Parquet file exists for the metric.
     """
-    # Use load_features() to get the latest DataFrame, then register it as a table.
-    # This avoids passing a file path into DuckDB SQL (no SQL path injection surface).
-    df = load_features(metric=metric, base_dir=base_dir)
-    conn.register("features", df)
+    partition_paths = feature_partition_paths(metric, base_dir)
+    if partition_paths is not None:
+        manifest_stat = (base_dir / MANIFEST_FILENAME).stat()
+        return partition_paths, ("manifest", manifest_stat.st_mtime_ns, manifest_stat.st_size)
+
+    candidates = sorted(base_dir.glob(f"{metric}_features_*.parquet"))
+    if not candidates:
+        raise ValueError(
+            f"No feature Parquet found for metric '{metric}' in '{base_dir}'. "
+            "Run feature_engineering.__main__ to build features first."
+        )
+    latest = candidates[-1]
+    return [latest], ("snapshot", str(latest), latest.stat().st_mtime_ns)
+
+
+class FeatureSession:
+    """
+    Process-wide DuckDB session with one read_parquet view per (feature dir, metric).
+
+    Views are only (re)created when the feature source signature changes, and
+    queries run on per-call cursors so concurrent API requests can share the session.
+    The session only ever creates views — it never writes data.
+    """
+
+    def __init__(self) -> None:
+        self._conn = duckdb.connect(database=":memory:")
+        self._lock = threading.Lock()
+        # (resolved feature dir, metric) -> (view name, source signature)
+        self._views: dict[tuple[str, str], tuple[str, tuple]] = {}
+        self._dir_ids: dict[str, int] = {}
+
+    def view_for(self, metric: str, base_dir: Path) -> str:
+        """
+        Name of the up-to-date view for a metric, (re)creating it if the source changed.
+
+        Args:
+            metric: Metric name — must be in VALID_METRICS.
+            base_dir: Feature Parquet directory.
+
+        Returns:
+            View identifier built only from the whitelisted metric and an integer
+
+        Raises:
+            ValueError: If metric is invalid or no Parquet file exists for it.
+        """
+        _assert_valid_metric(metric)
+        paths, signature = _feature_source(metric, base_dir)
+        key = (str(base_dir.resolve()), metric)
+
+        with self._lock:
+            cached = self._views.get(key)
+            if cached is not None and cached[1] == signature:
+                return cached[0]
+
+            dir_id = self._dir_ids.setdefault(key[0], len(self._dir_ids))
+            view_name = f"features_{metric}_{dir_id}"
+            if paths:
+                relation = self._conn.read_parquet([str(path) for path in paths], union_by_name=True)
+            else:
+                relation = self._conn.sql("SELECT NULL::TIMESTAMP AS week_date, NULL::VARCHAR AS project LIMIT 0")
+            relation.create_view(view_name, replace=True)
+            self._views[key] = (view_name, signature)
+
+        logger.info(
+            "Feature view refreshed",
+            extra={"metric": metric, "view": view_name, "files": len(paths)},
+        )
+        return view_name
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """New cursor on the shared session (one per query; cursors are not shared across threads)."""
+        return self._conn.cursor()
+
+
+_session: FeatureSession | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> FeatureSession:
+    """
+    Return the process-wide feature session, creating it on first use.
+
+    Returns:
+        Shared FeatureSession (in-memory DuckDB).
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = FeatureSession()
+        return _session
+
+
+def reset_session() -> None:
+    """Drop the shared session (e.g. after replacing the feature directory wholesale)."""
+    global _session
+    with _session_lock:
+        _session = None
 
 
 # ---------------------------------------------------------------------------
@@ -123,24 +214,24 @@ def query_metric_trend(
     """
     _assert_valid_metric(metric)
 
-    conn = get_connection()
+    session = get_session()
+    view = session.view_for(metric, base_dir)
+    cursor = session.cursor()
     try:
-        _load_into_connection(conn, metric, base_dir)
-
         # Parameterized query: project and weeks are bound values, not interpolated.
-        # The table name "features" is a fixed literal (not from user input).
-        result: pd.DataFrame = conn.execute(
-            """
+        # The view name is built from the whitelisted metric (not from user input).
+        result: pd.DataFrame = cursor.execute(
+            f"""
             SELECT *
-            FROM features
+            FROM {view}
             WHERE project = ?
             ORDER BY week_date ASC
             LIMIT ?
-            """,
+            """,  # nosec B608 - view name derived from VALID_METRICS whitelist
             [project, weeks],
         ).df()
     finally:
-        conn.close()
+        cursor.close()
 
     logger.info(
         "Metric trend query complete",
@@ -175,20 +266,18 @@ def query_portfolio_summary(
     """
     _assert_valid_metric(metric)
 
-    conn = get_connection()
+    session = get_session()
+    view = session.view_for(metric, base_dir)
+    cursor = session.cursor()
     try:
-        _load_into_connection(conn, metric, base_dir)
-
-        result: pd.DataFrame = conn.execute("""
+        result: pd.DataFrame = cursor.execute(f"""
             SELECT *
-            FROM features
-            WHERE week_date = (
-                SELECT MAX(week_date) FROM features WHERE project = features.project
-            )
+            FROM {view}
+            QUALIFY week_date = MAX(week_date) OVER (PARTITION BY project)
             ORDER BY project ASC
-            """).df()
+            """).df()  # nosec B608 - view name derived from VALID_METRICS whitelist
     finally:
-        conn.close()
+        cursor.close()
 
     logger.info(
         "Portfolio summary query complete",
@@ -216,12 +305,15 @@ def query_project_list(
     """
     _assert_valid_metric(metric)
 
-    conn = get_connection()
+    session = get_session()
+    view = session.view_for(metric, base_dir)
+    cursor = session.cursor()
     try:
-        _load_into_connection(conn, metric, base_dir)
-        result = conn.execute("SELECT DISTINCT project FROM features ORDER BY project ASC").fetchall()
+        result = cursor.execute(
+            f"SELECT DISTINCT project FROM {view} ORDER BY project ASC"  # nosec B608 - whitelisted view name
+        ).fetchall()
     finally:
-        conn.close()
+        cursor.close()
 
     projects = [row[0] for row in result]
     logger.info(
@@ -7,6 +7,15 @@ Reads weekly JSON history files from .tmp/observatory/ and transforms them into
 structured Parquet feature files in data/features/ for use by forecast_engine.py
 and anomaly_detector.py.
 
+The pipeline build is incremental: data/features/feature_manifest.json records
+which history weeks each metric has already processed, and each run extracts
+rows only for new weeks and appends them as one Parquet partition under
+data/features/<metric>/. Partitions are compacted once there are more than
+DEFAULT_MAX_PARTITIONS, and compaction drops rows older than
+DEFAULT_RETAIN_WEEKS, so data/features stays bounded. load_features() reads the
+manifest's partitions and falls back to the older dated
+``<metric>_features_<date>.parquet`` snapshots.
+
 Security requirements satisfied:
 - VALID_METRICS whitelist for all metric name → filename construction (Phase B cond. 1)
 - PathValidator.validate_safe_path() called before every Parquet write (Phase B cond. 2)
@@ -16,7 +25,8 @@ Security requirements satisfied:
 
 import json
 import logging
-from datetime import date
+import os
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
@@ -24,9 +34,11 @@ import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+from execution.core.history_store import HistoryStore, history_exists, load_history
 from execution.core.logging_config import get_logger
 from execution.security.path_validator import PathValidator
 from execution.security.validation import ValidationError
+from execution.utils_atomic_json import atomic_json_save
 
 logger: logging.Logger = get_logger(__name__)
 
@@ -63,6 +75,15 @@ _HISTORY_FILES: dict[str, str] = {
     "exploitable": "exploitable_history.json",
 }
 
+# Incremental feature store (manifest + per-metric Parquet partitions)
+MANIFEST_FILENAME: str = "feature_manifest.json"
+
+# Compact a metric's partitions into one file once it has more than this many
+DEFAULT_MAX_PARTITIONS: int = 12
+
+# Rows older than this many weeks before a metric's newest week are dropped at compaction
+DEFAULT_RETAIN_WEEKS: int = 104
+
 
 # ---------------------------------------------------------------------------
 # Validation helper
@@ -218,6 +239,16 @@ def _extract_week_rows(metric: str, week_date: str, week: dict) -> list[dict]:
     return result
 
 
+def _rows_to_frame(rows: list[dict]) -> pd.DataFrame:
+    """Build a feature DataFrame from extracted rows, with parsed week_date in date order."""
+    df = pd.DataFrame(rows)
+
+    if not df.empty and "week_date" in df.columns:
+        df["week_date"] = pd.to_datetime(df["week_date"], errors="coerce")
+        df = df.sort_values("week_date", kind="stable").reset_index(drop=True)
+    return df
+
+
 # ---------------------------------------------------------------------------
 # Main extraction function
 # ---------------------------------------------------------------------------
@@ -240,11 +271,11 @@ def extract_features(metric: str, history_path: Path) -> pd.DataFrame:
     """
     _validate_metric(metric)
 
-    if not history_path.exists():
+    if not history_exists(history_path):
         raise FileNotFoundError(f"History file not found for metric '{metric}': {history_path}")
 
     try:
-        raw = json.loads(history_path.read_text(encoding="utf-8"))
+        raw = load_history(history_path)
     except json.JSONDecodeError as e:
         raise ValueError(f"History file for '{metric}' contains invalid JSON: {e}") from e
 
@@ -267,11 +298,7 @@ def extract_features(metric: str, history_path: Path) -> pd.DataFrame:
             extra={"metric": metric, "history_path": str(history_path)},
         )
 
-    df = pd.DataFrame(rows)
-
-    if not df.empty and "week_date" in df.columns:
-        df["week_date"] = pd.to_datetime(df["week_date"], errors="coerce")
-        df = df.sort_values("week_date").reset_index(drop=True)
+    df = _rows_to_frame(rows)
 
     logger.info(
         "Features extracted",
@@ -344,9 +371,10 @@ def load_features(
     """
     Load the most recent feature Parquet for a metric, with optional project filter.
 
-    Selects the lexicographically latest file matching
-    ``{metric}_features_*.parquet`` so that re-running the pipeline does not
-    require callers to track file dates.
+    Reads the partitions listed in the feature manifest when the metric has been
+    built incrementally. Otherwise selects the lexicographically latest file
+    matching ``{metric}_features_*.parquet`` so that re-running the pipeline
+    does not require callers to track file dates.
 
     Args:
         metric: Metric name — must be in VALID_METRICS.
@@ -361,17 +389,23 @@ def load_features(
     """
     _validate_metric(metric)
 
-    pattern = f"{metric}_features_*.parquet"
-    candidates = sorted(base_dir.glob(pattern))
-
-    if not candidates:
-        raise ValueError(
-            f"No feature Parquet found for metric '{metric}' in '{base_dir}'. "
-            "Run feature_engineering.__main__ to build features first."
-        )
+    partition_paths = feature_partition_paths(metric, base_dir)
+    if partition_paths is not None:
+        df = _read_partitions(partition_paths)
+        source = str(base_dir / metric)
+    else:
+        pattern = f"{metric}_features_*.parquet"
+        candidates = sorted(base_dir.glob(pattern))
+
+        if not candidates:
+            raise ValueError(
+                f"No feature Parquet found for metric '{metric}' in '{base_dir}'. "
+                "Run feature_engineering.__main__ to build features first."
+            )
 
-    latest = candidates[-1]  # Lexicographic sort → latest date wins
-    df = pd.read_parquet(latest)
+        latest = candidates[-1]  # Lexicographic sort → latest date wins
+        df = pd.read_parquet(latest)
+        source = str(latest)
 
     if project is not None:
         if "project" in df.columns:
@@ -387,13 +421,241 @@ def load_features(
         extra={
             "metric": metric,
             "project": project or "all",
-            "source": str(latest),
+            "source": source,
             "rows": len(df),
         },
     )
     return df
 
 
+# ---------------------------------------------------------------------------
+# Incremental feature store
+# ---------------------------------------------------------------------------
+
+
+def _empty_manifest() -> dict:
+    return {"version": 1, "metrics": {}}
+
+
+def _load_manifest(base_dir: Path) -> dict:
+    """Load the feature manifest; a missing or unreadable manifest means nothing was built incrementally."""
+    manifest_path = base_dir / MANIFEST_FILENAME
+    if not manifest_path.exists():
+        return _empty_manifest()
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("Feature manifest unreadable — ignoring", extra={"path": str(manifest_path), "error": str(e)})
+        return _empty_manifest()
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("metrics"), dict):
+        return _empty_manifest()
+    return manifest
+
+
+def _safe_feature_path(base_dir: Path, relative_path: str) -> Path:
+    """Resolve a path under base_dir, rejecting anything that escapes it."""
+    return Path(PathValidator.validate_safe_path(base_dir=str(base_dir.resolve()), user_path=relative_path))
+
+
+def feature_partition_paths(metric: str, base_dir: Path = Path("data/features")) -> list[Path] | None:
+    """
+    Parquet partitions the manifest lists for a metric.
+
+    Args:
+        metric: Metric name — must be in VALID_METRICS.
+        base_dir: Feature directory (default: data/features).
+
+    Returns:
+        Partition paths in write order, or None if the metric has not been built incrementally.
+
+    Raises:
+        ValueError: If metric is not in VALID_METRICS.
+        ValidationError: If a manifest entry points outside base_dir.
+    """
+    _validate_metric(metric)
+    entry = _load_manifest(base_dir)["metrics"].get(metric)
+    if not isinstance(entry, dict):
+        return None
+    return [_safe_feature_path(base_dir, part["file"]) for part in entry.get("partitions", [])]
+
+
+def _read_partitions(paths: list[Path]) -> pd.DataFrame:
+    """Concatenate feature partitions in week_date order."""
+    if not paths:
+        return pd.DataFrame()
+    df = pd.concat([pd.read_parquet(path) for path in paths], ignore_index=True)
+    if "week_date" in df.columns:
+        df = df.sort_values("week_date", kind="stable").reset_index(drop=True)
+    return df
+
+
+def _write_partition(df: pd.DataFrame, metric: str, base_dir: Path, seq: int) -> dict:
+    """Write one partition (temp file + rename) and return its manifest record."""
+    relative_path = f"{metric}/part-{seq:06d}.parquet"
+    output_path = _safe_feature_path(base_dir, relative_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), temp_path)
+    os.replace(temp_path, output_path)
+
+    weeks = df["week_date"].dropna() if "week_date" in df.columns else pd.Series(dtype="datetime64[ns]")
+    return {
+        "file": relative_path,
+        "rows": len(df),
+        "min_week": weeks.min().date().isoformat() if not weeks.empty else None,
+        "max_week": weeks.max().date().isoformat() if not weeks.empty else None,
+    }
+
+
+def _remove_unlisted_partitions(metric: str, base_dir: Path, partitions: list[dict]) -> None:
+    """Delete partition files the manifest no longer references (compacted away or orphaned by a crash)."""
+    metric_dir = base_dir / metric
+    if not metric_dir.is_dir():
+        return
+    keep = {Path(part["file"]).name for part in partitions}
+    for path in metric_dir.glob("part-*"):
+        if path.name not in keep:
+            path.unlink()
+
+
+def _compact_partitions(
+    metric: str, base_dir: Path, partitions: list[dict], seq: int, retain_weeks: int
+) -> tuple[list[dict], int]:
+    """Merge all partitions into one, dropping rows older than the retention window."""
+    df = _read_partitions([_safe_feature_path(base_dir, part["file"]) for part in partitions])
+    if not df.empty and "week_date" in df.columns:
+        cutoff = df["week_date"].max() - timedelta(weeks=retain_weeks)
+        df = df[df["week_date"] >= cutoff].reset_index(drop=True)
+
+    compacted = [_write_partition(df, metric, base_dir, seq)]
+    _remove_unlisted_partitions(metric, base_dir, compacted)
+    logger.info(
+        "Feature partitions compacted",
+        extra={"metric": metric, "partitions_merged": len(partitions), "rows": len(df)},
+    )
+    return compacted, seq + 1
+
+
+def _history_rewritten(processed: dict[str, str], current_keys: list[str], new_weeks: list[tuple[str, dict]]) -> bool:
+    """
+    True if weeks were removed from inside the history rather than pruned from its old end.
+
+    Retention pruning only drops the oldest weeks, whose rows stay until feature
+    retention removes them. A week replaced in place (e.g. exploitable history
+    re-saving the same week_date) leaves rows on disk that no longer match the
+    history, so the metric must be rebuilt.
+    """
+    current = set(current_keys)
+    removed_dates = [processed[key] for key in processed if key not in current]
+    if not removed_dates:
+        return False
+    current_dates = [processed[key] for key in current_keys if key in processed]
+    current_dates += [str(week.get("week_date", "")) for _, week in new_weeks]
+    return bool(current_dates) and max(removed_dates) >= min(current_dates)
+
+
+def update_features_incremental(
+    metric: str,
+    history_path: Path,
+    base_dir: Path = Path("data/features"),
+    max_partitions: int = DEFAULT_MAX_PARTITIONS,
+    retain_weeks: int = DEFAULT_RETAIN_WEEKS,
+    full_rebuild: bool = False,
+) -> dict:
+    """
+    Extract features for history weeks not yet processed and append them as a partition.
+
+    Args:
+        metric: Metric name — must be in VALID_METRICS.
+        history_path: Path to the history JSON file.
+        base_dir: Feature directory holding the manifest and partitions.
+        max_partitions: Compact once a metric has more partitions than this.
+        retain_weeks: Rows older than this many weeks before the newest week are dropped at compaction.
+        full_rebuild: Discard existing partitions and reprocess the whole history.
+
+    Returns:
+        Stats dict with new_weeks, rows_added, partitions, rebuilt and compacted.
+
+    Raises:
+        ValueError: If metric is not in VALID_METRICS or history file is malformed.
+        FileNotFoundError: If history_path does not exist.
+        ValidationError: If a partition path escapes base_dir.
+    """
+    _validate_metric(metric)
+
+    if not history_exists(history_path):
+        raise FileNotFoundError(f"History file not found for metric '{metric}': {history_path}")
+
+    base_dir.mkdir(parents=True, exist_ok=True)
+    manifest = _load_manifest(base_dir)
+    entry = manifest["metrics"].get(metric) if not full_rebuild else None
+    entry = entry if isinstance(entry, dict) else {}
+    processed: dict[str, str] = dict(entry.get("weeks", {}))
+    partitions: list[dict] = list(entry.get("partitions", []))
+    seq: int = int(entry.get("next_seq", 1))
+
+    store = HistoryStore(history_path)
+    try:
+        keys, new_weeks = store.load_new(processed)
+        rebuilt = full_rebuild or _history_rewritten(processed, keys, new_weeks)
+        if rebuilt and processed:
+            processed, partitions = {}, []
+            keys, new_weeks = store.load_new(processed)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"History file for '{metric}' contains invalid JSON: {e}") from e
+
+    rows: list[dict] = []
+    for _, week in new_weeks:
+        rows.extend(_extract_week_rows(metric, week.get("week_date", ""), week))
+
+    if rows:
+        partitions.append(_write_partition(_rows_to_frame(rows), metric, base_dir, seq))
+        seq += 1
+
+    compacted = len(partitions) > max_partitions
+    if compacted:
+        partitions, seq = _compact_partitions(metric, base_dir, partitions, seq, retain_weeks)
+
+    # Forget weeks that have left the history; their rows stay until feature retention drops them
+    current = set(keys)
+    processed = {key: week_date for key, week_date in processed.items() if key in current}
+    processed.update({key: str(week.get("week_date", "")) for key, week in new_weeks})
+
+    manifest["metrics"][metric] = {
+        "history": str(history_path),
+        "weeks": processed,
+        "partitions": partitions,
+        "next_seq": seq,
+        "updated_at": datetime.now().isoformat(),
+    }
+    atomic_json_save(manifest, str(_safe_feature_path(base_dir, MANIFEST_FILENAME)))
+
+    if rebuilt:
+        _remove_unlisted_partitions(metric, base_dir, partitions)
+
+    stats = {
+        "new_weeks": len(new_weeks),
+        "rows_added": len(rows),
+        "partitions": len(partitions),
+        "rebuilt": rebuilt,
+        "compacted": compacted,
+    }
+    logger.info("Features updated incrementally", extra={"metric": metric, **stats})
+    return stats
+
+
+def _prune_snapshot_files(metric: str, base_dir: Path) -> int:
+    """Delete dated ``{metric}_features_*.parquet`` snapshots superseded by the incremental store."""
+    removed = 0
+    for path in base_dir.glob(f"{metric}_features_*.parquet"):
+        path.unlink()
+        removed += 1
+    if removed:
+        logger.info("Superseded feature snapshots removed", extra={"metric": metric, "files": removed})
+    return removed
+
+
 # ---------------------------------------------------------------------------
 # __main__ entry point — build all features
 # ---------------------------------------------------------------------------
@@ -402,13 +664,14 @@ def load_features(
 def _build_all_features(
     history_dir: Path = _HISTORY_DIR,
     output_dir: Path = Path("data/features"),
+    full_rebuild: bool = False,
 ) -> None:
-    """Build and save feature Parquet files for all supported metrics."""
-    logger.info("Starting full feature build", extra={"history_dir": str(history_dir)})
+    """Incrementally update the feature store for all supported metrics."""
+    logger.info("Starting feature build", extra={"history_dir": str(history_dir), "full_rebuild": full_rebuild})
 
     for metric, filename in _HISTORY_FILES.items():
         history_path = history_dir / filename
-        if not history_path.exists():
+        if not history_exists(history_path):
             logger.warning(
                 "History file missing — skipping metric",
                 extra={"metric": metric, "path": str(history_path)},
@@ -416,13 +679,9 @@ def _build_all_features(
             continue
 
         try:
-            df = extract_features(metric, history_path)
-            output_path = save_features(df, metric, base_dir=output_dir)
-            logger.info(
-                "Feature file written",
-                extra={"metric": metric, "rows": len(df), "output": str(output_path)},
-            )
-        except (ValueError, ValidationError, FileNotFoundError) as e:
+            update_features_incremental(metric, history_path, base_dir=output_dir, full_rebuild=full_rebuild)
+            _prune_snapshot_files(metric, output_dir)
+        except (ValueError, ValidationError, FileNotFoundError, OSError) as e:
             logger.error(
                 "Failed to build features for metric",
                 extra={"metric": metric, "error": str(e)},
@@ -432,4 +691,6 @@ def _build_all_features(
 
 
 if __name__ == "__main__":
-    _build_all_features()
+    import sys
+
+    _build_all_features(full_rebuild="--full-rebuild" in sys.argv[1:])
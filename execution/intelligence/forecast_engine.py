@@ -4,6 +4,12 @@ Forecast Engine — execution/intelligence/forecast_engine.py
 Single responsibility: Generates P10/P50/P90 forecasts for metrics using
 linear regression with confidence intervals (scipy.stats.linregress).
 
+forecast_all_projects() fits every project in one NumPy pass: series are
+grouped once, padded into a (projects x weeks) matrix with a validity mask,
+and the closed-form least-squares sums are computed row-wise. The results
+match forecast_metric() per project; batched=False keeps the per-project loop
+(see scripts/benchmark_forecast_engine.py).
+
 Security requirements satisfied:
 - VALID_METRICS whitelist for all metric name → filename construction (Phase B cond. 1)
 - PathValidator.validate_safe_path() called before every JSON write (Phase B cond. 2)
@@ -16,6 +22,7 @@ from datetime import date, datetime
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
 from scipy.stats import linregress
 
 from execution.core.logging_config import get_logger
@@ -128,6 +135,101 @@ def _compute_mape(y_values: np.ndarray) -> float:
     return float(np.mean(errors)) if errors else 0.0
 
 
+# ---------------------------------------------------------------------------
+# Batched (all projects at once) regression helpers
+# ---------------------------------------------------------------------------
+
+
+def _pad_series(df: pd.DataFrame, metric_col: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Group the non-null metric values by project into a padded matrix.
+
+    Rows keep the order projects first appear in, and values keep their row
+    order within a project (the same series forecast_metric() sees after
+    filtering and dropna).
+
+    Returns:
+        (projects, y, mask, counts) — y is (P, max_len) with zeros in padding,
+        mask marks the real values, counts is the series length per project.
+    """
+    codes, projects = pd.factorize(df["project"])
+    values = df[metric_col].to_numpy(dtype=float)
+    keep = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[keep], values[keep]
+
+    order = np.argsort(codes, kind="stable")
+    codes, values = codes[order], values[order]
+    counts = np.bincount(codes, minlength=len(projects))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    positions = np.arange(len(codes)) - starts[codes]
+
+    y = np.zeros((len(projects), int(counts.max(initial=0))), dtype=float)
+    mask = np.zeros(y.shape, dtype=bool)
+    y[codes, positions] = values
+    mask[codes, positions] = True
+    return np.asarray(projects), y, mask, counts
+
+
+def _fit_linear_batch(y: np.ndarray, mask: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Row-wise _fit_linear() over a padded matrix.
+
+    Each row is fitted on its masked values against x = 0, 1, 2, ... (the
+    column index). Rows need at least two values.
+
+    Returns:
+        Dict of per-row arrays: slope, intercept, r_squared, stderr, n,
+        x_mean and ss_xx (for prediction intervals).
+    """
+    x = np.broadcast_to(np.arange(y.shape[1], dtype=float), y.shape)
+    w = mask.astype(float)
+    n = w.sum(axis=1)
+    x_mean = (x * w).sum(axis=1) / n
+    y_mean = (y * w).sum(axis=1) / n
+
+    dx = (x - x_mean[:, None]) * w
+    dy = (y - y_mean[:, None]) * w
+    ss_xx = (dx * dx).sum(axis=1)
+    ss_yy = (dy * dy).sum(axis=1)
+    ss_xy = (dx * dy).sum(axis=1)
+
+    slope = ss_xy / ss_xx
+    intercept = y_mean - slope * x_mean
+
+    # Mirror linregress + _fit_linear clipping: a zero-variance series has r = NaN
+    # when ss_xy is also zero (clipped to 1.0), otherwise r = 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = np.clip(ss_xy**2 / (ss_xx * ss_yy), 0.0, 1.0)
+    degenerate = ss_yy == 0.0
+    r_squared[degenerate] = np.where(ss_xy[degenerate] == 0.0, 1.0, 0.0)
+
+    residuals = (y - (slope[:, None] * x + intercept[:, None])) * w
+    stderr = np.sqrt((residuals**2).sum(axis=1) / np.maximum(n - 2, 1))
+
+    return {
+        "slope": slope,
+        "intercept": intercept,
+        "r_squared": r_squared,
+        "stderr": stderr,
+        "n": n,
+        "x_mean": x_mean,
+        "ss_xx": ss_xx,
+    }
+
+
+def _compute_mape_batch(y: np.ndarray, mask: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Row-wise _compute_mape(): fit all but the last HOLDOUT_WEEKS values, score the holdout."""
+    columns = np.arange(y.shape[1])
+    train_len = counts - HOLDOUT_WEEKS
+    train_mask = mask & (columns[None, :] < train_len[:, None])
+    holdout_mask = mask & ~train_mask
+
+    fit = _fit_linear_batch(y, train_mask)
+    predicted = fit["slope"][:, None] * columns[None, :] + fit["intercept"][:, None]
+    errors = np.abs(y - predicted) / np.maximum(np.abs(y), 1.0)
+    return np.asarray((errors * holdout_mask).sum(axis=1) / HOLDOUT_WEEKS)
+
+
 # ---------------------------------------------------------------------------
 # Public API — forecast_metric
 # ---------------------------------------------------------------------------
@@ -294,25 +396,133 @@ def compute_trend_strength(df, metric_col: str, project: str) -> TrendStrengthSc
 
 
 # ---------------------------------------------------------------------------
-# Public API — forecast_all_projects
+# Public API — forecast_projects / forecast_all_projects
 # ---------------------------------------------------------------------------
 
 
+def _forecast_projects_loop(df: pd.DataFrame, metric_col: str, horizons: list[int]) -> list[ForecastResult]:
+    """Per-project forecast_metric() loop (reference implementation for the batched path)."""
+    results: list[ForecastResult] = []
+    for project_name in df["project"].unique():
+        df_proj = df[df["project"] == project_name].reset_index(drop=True)
+        try:
+            results.append(forecast_metric(df_proj, metric_col, project=str(project_name), horizons=horizons))
+        except ValueError as e:
+            logger.warning(
+                "Skipping project — insufficient data",
+                extra={"project": project_name, "error": str(e)},
+            )
+    return results
+
+
+def _forecast_projects_batch(df: pd.DataFrame, metric_col: str, horizons: list[int]) -> list[ForecastResult]:
+    """Forecast every project in one vectorised pass; same results as _forecast_projects_loop()."""
+    if metric_col not in df.columns:
+        logger.warning(
+            "Skipping all projects — column not found",
+            extra={"metric_col": metric_col, "available": list(df.columns)},
+        )
+        return []
+
+    projects, y, mask, counts = _pad_series(df, metric_col)
+
+    enough = counts >= MIN_DATA_POINTS
+    for project_name, n in zip(projects[~enough], counts[~enough], strict=True):
+        logger.warning(
+            "Skipping project — insufficient data",
+            extra={"project": project_name, "n_points": int(n), "minimum": MIN_DATA_POINTS},
+        )
+    if not enough.any():
+        return []
+
+    projects, y, mask, counts = projects[enough], y[enough], mask[enough], counts[enough]
+    fit = _fit_linear_batch(y, mask)
+    mape = _compute_mape_batch(y, mask, counts)
+
+    # P50 and prediction interval at each horizon: (projects, horizons)
+    x_pred = (counts - 1)[:, None] + np.asarray(horizons, dtype=float)[None, :]
+    p50 = fit["slope"][:, None] * x_pred + fit["intercept"][:, None]
+    factor = 1.0 + 1.0 / fit["n"][:, None] + (x_pred - fit["x_mean"][:, None]) ** 2 / fit["ss_xx"][:, None]
+    margin = _Z90 * fit["stderr"][:, None] * np.sqrt(factor)
+
+    # Same direction rule as forecast_metric(); an all-zero series normalises by 1.0
+    abs_y = np.abs(y) * mask
+    mean_abs = np.where((abs_y > 0).any(axis=1), abs_y.sum(axis=1) / counts, 1.0)
+    relative_slope = fit["slope"] / mean_abs
+    directions = np.where(
+        np.abs(relative_slope) < 0.005, "flat", np.where(relative_slope < 0, "improving", "worsening")
+    )
+
+    now = datetime.now()
+    results: list[ForecastResult] = []
+    for i, project_name in enumerate(projects):
+        forecast_points = [
+            ForecastPoint(
+                week=h,
+                p10=float(p50[i, j] - margin[i, j]),
+                p50=float(p50[i, j]),
+                p90=float(p50[i, j] + margin[i, j]),
+            )
+            for j, h in enumerate(horizons)
+        ]
+        results.append(
+            ForecastResult(
+                timestamp=now,
+                project=str(project_name),
+                metric=metric_col,
+                forecast=forecast_points,
+                model="linear_regression",
+                mape=float(mape[i]),
+                trend_direction=str(directions[i]),
+                trend_strength=float(fit["r_squared"][i]),
+            )
+        )
+    return results
+
+
+def forecast_projects(
+    df: pd.DataFrame,
+    metric_col: str,
+    horizons: list[int] = FORECAST_HORIZONS,
+    batched: bool = True,
+) -> list[ForecastResult]:
+    """
+    Forecast every project in a feature DataFrame.
+
+    Args:
+        df:         DataFrame with columns [week_date, project, <metric_col>]
+                    (output of load_features()).
+        metric_col: Column to forecast.
+        horizons:   Forecast horizons in weeks from each project's last data point.
+        batched:    Fit all projects in one NumPy pass (default). False calls
+                    forecast_metric() once per project.
+
+    Returns:
+        List of ForecastResult objects in the order projects first appear,
+        skipping projects with fewer than MIN_DATA_POINTS non-null values.
+    """
+    if batched:
+        return _forecast_projects_batch(df, metric_col, horizons)
+    return _forecast_projects_loop(df, metric_col, horizons)
+
+
 def forecast_all_projects(
     metric: str,
     metric_col: str,
     base_dir: Path = Path("data/features"),
+    batched: bool = True,
 ) -> list[ForecastResult]:
     """
     Forecast all projects for a given metric.
 
-    Loads the feature Parquet for the metric, then calls forecast_metric()
-    for each project that has sufficient data.
+    Loads the feature Parquet for the metric, then forecasts every project
+    that has sufficient data (see forecast_projects()).
 
     Args:
         metric:     Metric name — must be in VALID_METRICS.
         metric_col: Column to forecast within the feature DataFrame.
         base_dir:   Directory containing Parquet feature files.
+        batched:    Fit all projects in one NumPy pass (default) or one at a time.
 
     Returns:
         List of ForecastResult objects (one per project with enough data).
@@ -335,21 +545,11 @@ def forecast_all_projects(
             )
             return []
 
-    results: list[ForecastResult] = []
-    for project_name in df_all["project"].unique():
-        df_proj = df_all[df_all["project"] == project_name].reset_index(drop=True)
-        try:
-            result = forecast_metric(df_proj, metric_col, project=str(project_name))
-            results.append(result)
-        except ValueError as e:
-            logger.warning(
-                "Skipping project — insufficient data",
-                extra={"metric": metric, "project": project_name, "error": str(e)},
-            )
+    results = forecast_projects(df_all, metric_col, batched=batched)
 
     logger.info(
         "Forecast all projects complete",
-        extra={"metric": metric, "forecasted": len(results)},
+        extra={"metric": metric, "forecasted": len(results), "batched": batched},
     )
     return results
 
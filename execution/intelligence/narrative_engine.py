@@ -27,6 +27,7 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+from execution.core.history_store import load_history
 from execution.core.logging_config import get_logger
 from execution.dashboards.renderer import render_dashboard
 from execution.domain.intelligence import MetricInsight
@@ -124,7 +125,7 @@ def _load_metric_context(metric: str) -> dict[str, object]:
         return {}
 
     try:
-        raw = json.loads(history_path.read_text(encoding="utf-8"))
+        raw = load_history(history_path)
     except (json.JSONDecodeError, OSError) as exc:
         logger.debug(
             "Could not load history file for metric",
@@ -17,6 +17,20 @@ Typical usage:
         metric="open_bugs",
     )
 
+    # Every scenario x project x metric in one batched simulation
+    results = run_monte_carlo_batch(
+        [ScenarioSpec(base_series=series, scenario_params={}, scenario_name="BAU", metric="open_bugs"), ...],
+        n_simulations=100_000,
+        memory_budget_mb=256,
+    )
+
+run_monte_carlo_batch() draws one shared stream of standard normals (common
+random numbers, as compare_scenarios() always had via a shared seed) and
+simulates all specs together in chunks sized to the memory budget. When every
+simulated value fits in the budget, percentiles are exact and match
+run_monte_carlo() bit-for-bit; otherwise each (spec, week) streams into a
+fixed-range histogram and percentiles are interpolated from it.
+
 Security:
 - All scenario parameters validated: bounded floats, no NaN/inf
 - No file I/O in this module (pure computation)
@@ -28,6 +42,7 @@ Security:
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass, field
 from datetime import datetime
 
 import numpy as np
@@ -51,6 +66,14 @@ _DEFAULT_BOUNDS: tuple[float, float] = (-100.0, 100.0)
 # Minimum number of observations required to run a simulation
 _MIN_DATA_POINTS: int = 4
 
+# Batched engine: default working-memory budget and histogram resolution bounds
+DEFAULT_MEMORY_BUDGET_MB: float = 256.0
+_PERCENTILES: tuple[float, float, float] = (10.0, 50.0, 90.0)
+_MAX_HISTOGRAM_BINS: int = 4096
+_MIN_HISTOGRAM_BINS: int = 256
+# Histogram range: week w spans mean +/- _HISTOGRAM_SIGMAS * std * sqrt(w)
+_HISTOGRAM_SIGMAS: float = 8.0
+
 
 # ---------------------------------------------------------------------------
 # Validation
@@ -269,6 +292,227 @@ def run_monte_carlo(
     )
 
 
+# ---------------------------------------------------------------------------
+# Batched engine
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ScenarioSpec:
+    """
+    One scenario x project x metric combination for run_monte_carlo_batch().
+
+    Attributes:
+        base_series:     Historical observations in chronological order.
+        scenario_params: Scenario parameter overrides (see SCENARIO_PARAM_BOUNDS).
+        scenario_name:   Display name for this scenario.
+        metric:          Metric name for labelling output.
+        lower_is_better: True for bugs/vulns, False for throughput.
+        project:         Optional project name (None for org-level series).
+    """
+
+    base_series: list[float]
+    scenario_params: dict[str, float] = field(default_factory=dict)
+    scenario_name: str = "Scenario"
+    metric: str = "metric"
+    lower_is_better: bool = True
+    project: str | None = None
+
+
+def _plan_chunks(
+    n_specs: int,
+    horizon_weeks: int,
+    n_simulations: int,
+    memory_budget_mb: float,
+    exact: bool | None,
+) -> tuple[bool, int, int]:
+    """
+    Decide exact vs histogram percentiles, chunk size and histogram bins.
+
+    Returns:
+        (exact, chunk_size, bins) — bins is 0 in exact mode.
+    """
+    budget = memory_budget_mb * 1024 * 1024
+    retained = n_specs * horizon_weeks * n_simulations * 8  # every value, float64
+    if exact is None:
+        exact = retained <= budget / 2
+
+    if exact:
+        # A forced exact run keeps every value regardless; chunks still get half the budget
+        remaining = max(budget - retained, budget / 2)
+        bins = 0
+    else:
+        # int64 counts per (spec, week, bin) plus the same again for each chunk's
+        # bincount, together at most half the budget
+        bins = int(budget / 4 / (n_specs * horizon_weeks * 8))
+        bins = max(_MIN_HISTOGRAM_BINS, min(_MAX_HISTOGRAM_BINS, bins))
+        remaining = budget - 2 * n_specs * horizon_weeks * bins * 8
+
+    # Per simulated row: shared noise + float64 paths (+ int64 bin indices in histogram mode)
+    row_bytes = horizon_weeks * 8 * (1 + n_specs * (1 if exact else 2))
+    chunk_size = max(1, min(n_simulations, int(remaining // row_bytes)))
+    return exact, chunk_size, bins
+
+
+def _histogram_percentiles(
+    counts: np.ndarray,
+    lo: np.ndarray,
+    width: np.ndarray,
+    n_simulations: int,
+) -> np.ndarray:
+    """
+    Interpolate _PERCENTILES from per-(spec, week) histograms.
+
+    Uses the same rank as np.percentile's linear method (q/100 * (n-1)) and
+    assumes values are spread evenly within a bin.
+
+    Returns:
+        Array of shape (len(_PERCENTILES), n_specs, horizon_weeks).
+    """
+    cumulative = np.cumsum(counts, axis=2)
+    out = np.empty((len(_PERCENTILES),) + counts.shape[:2], dtype=np.float64)
+    for i, q in enumerate(_PERCENTILES):
+        rank = q / 100.0 * (n_simulations - 1)
+        bin_idx = np.argmax(cumulative > rank, axis=2)[..., np.newaxis]
+        in_bin = np.take_along_axis(counts, bin_idx, axis=2)[..., 0]
+        before = np.take_along_axis(cumulative, bin_idx, axis=2)[..., 0] - in_bin
+        frac = np.clip((rank - before + 0.5) / np.maximum(in_bin, 1), 0.0, 1.0)
+        out[i] = lo + (bin_idx[..., 0] + frac) * width
+    return out
+
+
+def run_monte_carlo_batch(
+    specs: list[ScenarioSpec],
+    horizon_weeks: int = 13,
+    n_simulations: int = 1000,
+    random_seed: int | None = None,
+    memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+    exact: bool | None = None,
+) -> list[ScenarioResult]:
+    """
+    Run the Monte Carlo simulation for many specs in one batched pass.
+
+    All specs share the same noise draws, scaled by each spec's residual std,
+    so scenarios are compared on common random numbers. Simulations run in
+    chunks of shape (len(specs), chunk, horizon_weeks) sized to fit
+    memory_budget_mb; P10/P50/P90 and probability of improvement are merged
+    across chunks.
+
+    Args:
+        specs:            Scenario x project x metric combinations to simulate.
+        horizon_weeks:    Number of weeks to project forward.
+        n_simulations:    Number of Monte Carlo runs per spec.
+        random_seed:      Optional seed for reproducibility.
+        memory_budget_mb: Approximate ceiling on working memory.
+        exact:            True keeps every simulated value for exact percentiles
+                          (even past the budget), False streams into histograms
+                          (percentiles accurate to a small fraction of a bin),
+                          None picks exact when the values fit in half the budget.
+
+    Returns:
+        One ScenarioResult per spec, in the same order. With exact percentiles
+        (and the same seed) each result equals run_monte_carlo() for that spec.
+
+    Raises:
+        ValueError: If any base_series has fewer than _MIN_DATA_POINTS observations.
+        ValueError: If any scenario_param value is NaN or infinite.
+    """
+    if not specs:
+        return []
+
+    slopes = np.empty(len(specs), dtype=np.float64)
+    stds = np.empty(len(specs), dtype=np.float64)
+    starts = np.empty(len(specs), dtype=np.float64)
+    for j, spec in enumerate(specs):
+        if len(spec.base_series) < _MIN_DATA_POINTS:
+            raise ValueError(
+                f"Insufficient data for Monte Carlo simulation: "
+                f"{len(spec.base_series)} observations provided, "
+                f"minimum {_MIN_DATA_POINTS} required."
+            )
+        base_slope, residual_std = _fit_slope_and_residual_std(spec.base_series)
+        slopes[j] = _apply_params_to_slope(base_slope, _validate_scenario_params(spec.scenario_params))
+        stds[j] = max(residual_std, 1e-9)
+        starts[j] = float(spec.base_series[-1])
+
+    exact, chunk_size, bins = _plan_chunks(len(specs), horizon_weeks, n_simulations, memory_budget_mb, exact)
+
+    weeks = np.arange(1, horizon_weeks + 1, dtype=np.float64)
+    # (specs, weeks) deterministic part of every path
+    drift = starts[:, np.newaxis] + slopes[:, np.newaxis] * weeks[np.newaxis, :]
+    lower_is_better = np.array([spec.lower_is_better for spec in specs])
+    improved = np.zeros(len(specs), dtype=np.int64)
+
+    if exact:
+        retained = np.empty((len(specs), horizon_weeks, n_simulations), dtype=np.float64)
+    else:
+        # Week w is Normal(drift, std^2 * w); values past the range land in the edge bins
+        half_range = _HISTOGRAM_SIGMAS * stds[:, np.newaxis] * np.sqrt(weeks)[np.newaxis, :]
+        lo = drift - half_range
+        width = 2.0 * half_range / bins
+        counts = np.zeros(len(specs) * horizon_weeks * bins, dtype=np.int64)
+        cell_offsets = (np.arange(len(specs) * horizon_weeks) * bins).reshape(len(specs), 1, horizon_weeks)
+
+    rng = np.random.default_rng(random_seed)
+    done = 0
+    while done < n_simulations:
+        size = min(chunk_size, n_simulations - done)
+        noise = rng.standard_normal(size=(size, horizon_weeks))
+
+        # paths[j, i, w] = start_j + slope_j * (w+1) + cumulative noise_j
+        paths = noise[np.newaxis, :, :] * stds[:, np.newaxis, np.newaxis]
+        # Running sum week by week: same additions as np.cumsum, without its temporary copy
+        for w in range(1, horizon_weeks):
+            paths[:, :, w] += paths[:, :, w - 1]
+        paths += drift[:, np.newaxis, :]
+
+        final = paths[:, :, -1]
+        better = np.where(lower_is_better[:, np.newaxis], final < starts[:, np.newaxis], final > starts[:, np.newaxis])
+        improved += better.sum(axis=1)
+
+        if exact:
+            retained[:, :, done : done + size] = paths.transpose(0, 2, 1)
+        else:
+            paths -= lo[:, np.newaxis, :]
+            paths /= width[:, np.newaxis, :]
+            bin_idx = paths.astype(np.int64)
+            np.clip(bin_idx, 0, bins - 1, out=bin_idx)
+            bin_idx += cell_offsets
+            counts += np.bincount(bin_idx.ravel(), minlength=counts.size)
+            del bin_idx
+        # Release this chunk before the next one is allocated
+        del paths, noise
+        done += size
+
+    if exact:
+        percentiles = np.percentile(retained, _PERCENTILES, axis=2, overwrite_input=True)
+    else:
+        percentiles = _histogram_percentiles(counts.reshape(len(specs), horizon_weeks, bins), lo, width, n_simulations)
+
+    now = datetime.now()
+    return [
+        ScenarioResult(
+            timestamp=now,
+            project=spec.project,
+            scenario_name=spec.scenario_name,
+            metric=spec.metric,
+            horizon_weeks=horizon_weeks,
+            n_simulations=n_simulations,
+            forecast=[
+                ScenarioPoint(
+                    week=int(w + 1),
+                    p10=float(percentiles[0, j, w]),
+                    p50=float(percentiles[1, j, w]),
+                    p90=float(percentiles[2, j, w]),
+                )
+                for w in range(horizon_weeks)
+            ],
+            probability_of_improvement=float(improved[j]) / float(n_simulations),
+        )
+        for j, spec in enumerate(specs)
+    ]
+
+
 def compare_scenarios(
     base_series: list[float],
     scenarios: dict[str, dict[str, float]],
@@ -292,8 +536,8 @@ def compare_scenarios(
         n_simulations:   Number of Monte Carlo runs per scenario.
         lower_is_better: True for bugs/vulns, False for throughput.
         metric:          Metric name for labelling.
-        random_seed:     Optional seed for reproducibility (same seed
-                         applied per-scenario for consistent comparisons).
+        random_seed:     Optional seed for reproducibility (scenarios share the
+                         same noise draws for consistent comparisons).
 
     Returns:
         List of ScenarioResult objects, one per scenario (BAU first).
@@ -310,18 +554,19 @@ def compare_scenarios(
         if name != "BAU":
             all_scenarios[name] = params
 
-    results: list[ScenarioResult] = []
-    for scenario_name, params in all_scenarios.items():
-        result = run_monte_carlo(
+    specs = [
+        ScenarioSpec(
             base_series=base_series,
             scenario_params=params,
-            horizon_weeks=horizon_weeks,
-            n_simulations=n_simulations,
-            lower_is_better=lower_is_better,
             scenario_name=scenario_name,
             metric=metric,
-            random_seed=random_seed,
+            lower_is_better=lower_is_better,
         )
-        results.append(result)
-
-    return results
+        for scenario_name, params in all_scenarios.items()
+    ]
+    return run_monte_carlo_batch(
+        specs,
+        horizon_weeks=horizon_weeks,
+        n_simulations=n_simulations,
+        random_seed=random_seed,
+    )
@@ -5,6 +5,10 @@ Combines anomaly detection with threshold-based rules to produce a unified
 alert list.  Alerts are persisted to the SQLite ``alerts`` table and can be
 read back for dashboard rendering.
 
+All threshold rules are evaluated together in one query over the latest value
+of each series (see anomaly_detector.LATEST_VALUES_SQL), and alerts are written
+with executemany().
+
 Usage::
 
     from execution.ml.alert_engine import AlertEngine
@@ -20,12 +24,23 @@ from pathlib import Path
 from typing import Optional
 
 from execution.core import get_logger
-from execution.ml.anomaly_detector import AnomalyDetector, AnomalyResult
+from execution.ml.anomaly_detector import (
+    LATEST_VALUES_SQL,
+    AnomalyDetector,
+    AnomalyResult,
+    ensure_latest_value_index,
+)
 
 logger = get_logger(__name__)
 
 DEFAULT_DB_PATH = Path(".tmp/observatory/observatory.db")
 
+_INSERT_ALERT_SQL = (
+    "INSERT INTO alerts (dashboard, project_name, metric_name, metric_date, "
+    "alert_type, severity, value, expected, message) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
 # ---------------------------------------------------------------------------
 # Root-cause dimension whitelist — only these values may appear in hint strings.
 # Phase B ML work will populate root_cause_hint; this whitelist guards the format.
@@ -229,6 +244,8 @@ class AlertEngine:
 
         conn = sqlite3.connect(self.db_path)
         try:
+            ensure_latest_value_index(conn)
+
             # Clear previous alerts to avoid accumulating stale rows
             conn.execute("DELETE FROM alerts")
             conn.commit()
@@ -299,35 +316,31 @@ class AlertEngine:
         except FileNotFoundError:
             return 0
 
-        cursor = conn.cursor()
-        count = 0
-
+        rows = []
         for a in anomalies:
             direction_word = "spike" if a.direction == "above" else "drop"
             message = (
                 f"{a.project_name} {a.metric_name}: {direction_word} detected "
                 f"(value={a.value:.2f}, expected≈{a.expected:.2f}, z={a.z_score:+.1f})"
             )
-            cursor.execute(
-                "INSERT INTO alerts (dashboard, project_name, metric_name, metric_date, "
-                "alert_type, severity, value, expected, message) "
-                "VALUES (?, ?, ?, ?, 'anomaly', ?, ?, ?, ?)",
+            rows.append(
                 (
                     a.dashboard,
                     a.project_name,
                     a.metric_name,
                     a.metric_date,
+                    "anomaly",
                     a.severity,
                     a.value,
                     a.expected,
                     message,
-                ),
+                )
             )
-            count += 1
 
+        conn.executemany(_INSERT_ALERT_SQL, rows)
         conn.commit()
-        logger.info("Anomaly alerts written", extra={"count": count})
-        return count
+        logger.info("Anomaly alerts written", extra={"count": len(rows)})
+        return len(rows)
 
     def _run_threshold_alerts(self, conn: sqlite3.Connection) -> int:
         """Evaluate hard-threshold rules against latest metric values.
@@ -336,54 +349,57 @@ class AlertEngine:
         per (dashboard, project, metric) combination — so place stricter
         (higher-severity) rules before looser ones to avoid duplicate alerts.
         """
-        cursor = conn.cursor()
-        count = 0
-        # Track which (dashboard, project, metric) combos have already fired
-        fired: set[tuple[str, str, str]] = set()
+        if not THRESHOLD_RULES:
+            return 0
 
-        for rule in THRESHOLD_RULES:
-            cursor.execute(
-                "SELECT project_name, metric_date, metric_value FROM metrics "
-                "WHERE dashboard=? AND metric_name=? AND metric_value IS NOT NULL "
-                "ORDER BY metric_date DESC",
-                (rule.dashboard, rule.metric_name),
-            )
-            # Get one row per project (latest only)
-            seen_projects: set[str] = set()
-            for project_name, metric_date, value in cursor.fetchall():
-                if project_name in seen_projects:
-                    continue
-                seen_projects.add(project_name)
-
-                triggered = (rule.operator == "below" and value < rule.threshold) or (
-                    rule.operator == "above" and value > rule.threshold
-                )
-                if not triggered:
-                    continue
-
-                key = (rule.dashboard, project_name, rule.metric_name)
-                if key in fired:
-                    continue  # a stricter rule already fired for this combo
-                fired.add(key)
-
-                message = rule.message_template.format(project=project_name, value=value)
-                conn.execute(
-                    "INSERT INTO alerts (dashboard, project_name, metric_name, metric_date, "
-                    "alert_type, severity, value, expected, message) "
-                    "VALUES (?, ?, ?, ?, 'threshold', ?, ?, ?, ?)",
-                    (
-                        rule.dashboard,
-                        project_name,
-                        rule.metric_name,
-                        metric_date,
-                        rule.severity,
-                        value,
-                        rule.threshold,
-                        message,
-                    ),
+        # Rules as a VALUES table; priority is the position in THRESHOLD_RULES
+        rule_values = ", ".join("(?, ?, ?, ?, ?)" for _ in THRESHOLD_RULES)
+        params: list[object] = []
+        for priority, rule in enumerate(THRESHOLD_RULES):
+            params.extend((priority, rule.dashboard, rule.metric_name, rule.threshold, rule.operator))
+
+        # ROW_NUMBER() over rule priority keeps only the first matching rule per series
+        cursor = conn.execute(
+            f"WITH rules (priority, dashboard, metric_name, threshold, operator) AS (VALUES {rule_values}), "
+            "series AS ("
+            "SELECT DISTINCT m.dashboard, m.metric_name, m.project_name "
+            "FROM (SELECT DISTINCT dashboard, metric_name FROM rules) p "
+            "JOIN metrics m ON m.dashboard = p.dashboard AND m.metric_name = p.metric_name), "
+            f"latest AS ({LATEST_VALUES_SQL}), "
+            "hits AS ("
+            "SELECT r.priority, l.project_name, l.metric_date, l.metric_value, "
+            "ROW_NUMBER() OVER ("
+            "PARTITION BY l.dashboard, l.metric_name, l.project_name ORDER BY r.priority"
+            ") AS rule_rank "
+            "FROM latest l "
+            "JOIN rules r ON r.dashboard = l.dashboard AND r.metric_name = l.metric_name "
+            "WHERE (r.operator = 'below' AND l.metric_value < r.threshold) "
+            "OR (r.operator = 'above' AND l.metric_value > r.threshold)"
+            ") "
+            "SELECT priority, project_name, metric_date, metric_value FROM hits "
+            "WHERE rule_rank = 1 "
+            "ORDER BY priority, metric_date DESC, project_name",
+            params,
+        )
+
+        rows = []
+        for priority, project_name, metric_date, value in cursor.fetchall():
+            rule = THRESHOLD_RULES[priority]
+            rows.append(
+                (
+                    rule.dashboard,
+                    project_name,
+                    rule.metric_name,
+                    metric_date,
+                    "threshold",
+                    rule.severity,
+                    value,
+                    rule.threshold,
+                    rule.message_template.format(project=project_name, value=value),
                 )
-                count += 1
+            )
 
+        conn.executemany(_INSERT_ALERT_SQL, rows)
         conn.commit()
-        logger.info("Threshold alerts written", extra={"count": count})
-        return count
+        logger.info("Threshold alerts written", extra={"count": len(rows)})
+        return len(rows)
@@ -5,6 +5,11 @@ Reads pre-computed rolling_stats from the SQLite database and flags the
 most-recent data point for each (dashboard, project, metric) series when its
 z-score exceeds a configurable threshold.
 
+Detection is one set-based query: the latest non-null value of every series
+is read from the covering idx_metrics_latest index inside the same statement
+that joins rolling_stats and applies the z-score threshold (instead of one
+latest-value query per series issued from Python).
+
 Usage::
 
     from execution.ml.anomaly_detector import AnomalyDetector
@@ -25,6 +30,32 @@ logger = get_logger(__name__)
 DEFAULT_DB_PATH = Path(".tmp/observatory/observatory.db")
 DEFAULT_ZSCORE_THRESHOLD = 2.0
 
+# Covering index for latest-value lookups: each series' newest non-null row is
+# one index-only seek, whatever the length of its history.
+LATEST_VALUE_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_metrics_latest "
+    "ON metrics (dashboard, metric_name, project_name, metric_date, metric_value)"
+)
+
+# Columns of a `series` CTE (which must have dashboard, metric_name and
+# project_name) plus the latest non-null metric_date/metric_value of each.
+# A ROW_NUMBER() window over the metrics history evaluates every historical
+# row; the correlated LIMIT 1 seek only touches the newest one.
+LATEST_VALUES_SQL = (
+    "SELECT k.*, m.metric_date, m.metric_value "
+    "FROM series k JOIN metrics m ON m.id = ("
+    "SELECT id FROM metrics "
+    "WHERE dashboard = k.dashboard AND metric_name = k.metric_name AND project_name = k.project_name "
+    "AND metric_value IS NOT NULL "
+    "ORDER BY metric_date DESC LIMIT 1)"
+)
+
+
+def ensure_latest_value_index(conn: sqlite3.Connection) -> None:
+    """Create idx_metrics_latest on databases imported before it existed (idempotent)."""
+    conn.execute(LATEST_VALUE_INDEX_SQL)
+    conn.commit()
+
 
 @dataclass
 class AnomalyResult:
@@ -84,7 +115,7 @@ class AnomalyDetector:
 
         conn = sqlite3.connect(self.db_path)
         try:
-            return [r for r in self._run_detection(conn) if r.dashboard == dashboard]
+            return self._run_detection(conn, dashboard=dashboard)
         finally:
             conn.close()
 
@@ -92,44 +123,41 @@ class AnomalyDetector:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _run_detection(self, conn: sqlite3.Connection) -> list[AnomalyResult]:
+    def _run_detection(self, conn: sqlite3.Connection, dashboard: str | None = None) -> list[AnomalyResult]:
         cursor = conn.cursor()
 
-        # Fetch rolling stats for all series
-        cursor.execute(
-            "SELECT dashboard, project_name, metric_name, rolling_mean, rolling_std "
-            "FROM rolling_stats "
-            "WHERE rolling_std > 0"
-        )
-        stats_rows = cursor.fetchall()
-
-        if not stats_rows:
+        has_stats = cursor.execute("SELECT 1 FROM rolling_stats WHERE rolling_std > 0 LIMIT 1").fetchone()
+        if not has_stats:
             logger.warning("No rolling stats found in database — run import first")
             return []
 
-        results: list[AnomalyResult] = []
+        # Latest value per series with rolling stats; only |z| >= threshold comes back
+        cursor.execute(
+            "WITH series AS ("
+            "SELECT dashboard, metric_name, project_name, rolling_mean, rolling_std FROM rolling_stats "
+            "WHERE rolling_std > 0 AND (? IS NULL OR dashboard = ?)), "
+            f"latest AS ({LATEST_VALUES_SQL}) "
+            "SELECT dashboard, project_name, metric_name, metric_date, metric_value, rolling_mean, rolling_std "
+            "FROM latest "
+            "WHERE ABS((metric_value - rolling_mean) / rolling_std) >= ? "
+            "ORDER BY dashboard, project_name, metric_name",
+            (dashboard, dashboard, self.threshold),
+        )
 
-        for dashboard, project_name, metric_name, rolling_mean, rolling_std in stats_rows:
-            latest = self._fetch_latest_value(cursor, dashboard, project_name, metric_name)
-            if latest is None:
-                continue
+        results: list[AnomalyResult] = []
 
-            metric_date, value = latest
+        for series_dashboard, project_name, metric_name, metric_date, value, rolling_mean, rolling_std in cursor:
             z_score = (value - rolling_mean) / rolling_std
-
-            if abs(z_score) < self.threshold:
-                continue
-
             severity = "high" if abs(z_score) > 3.0 else "medium"
             direction = "above" if z_score > 0 else "below"
 
             results.append(
                 AnomalyResult(
-                    dashboard=dashboard,
+                    dashboard=series_dashboard,
                     project_name=project_name,
                     metric_name=metric_name,
-                    metric_date=metric_date,
-                    value=value,
+                    metric_date=str(metric_date),
+                    value=float(value),
                     expected=rolling_mean,
                     z_score=round(z_score, 2),
                     direction=direction,
@@ -144,23 +172,3 @@ class AnomalyDetector:
 
         # Sort: high severity first, then by absolute z-score descending
         return sorted(results, key=lambda r: (r.severity != "high", -abs(r.z_score)))
-
-    def _fetch_latest_value(
-        self,
-        cursor: sqlite3.Cursor,
-        dashboard: str,
-        project_name: str,
-        metric_name: str,
-    ) -> tuple[str, float] | None:
-        """Return (metric_date, value) for the most recent row in this series."""
-        cursor.execute(
-            "SELECT metric_date, metric_value FROM metrics "
-            "WHERE dashboard=? AND project_name=? AND metric_name=? "
-            "AND metric_value IS NOT NULL "
-            "ORDER BY metric_date DESC LIMIT 1",
-            (dashboard, project_name, metric_name),
-        )
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        return str(row[0]), float(row[1])
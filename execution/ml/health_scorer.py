@@ -28,6 +28,7 @@ import numpy as np
 from sklearn.linear_model import LinearRegression
 
 from execution.core import get_logger
+from execution.core.history_store import history_exists, load_history
 from execution.domain.health import OrgHealthSummary, ProductHealth
 from execution.ml.trend_predictor import TrendPredictor
 
@@ -206,11 +207,11 @@ class SecurityForecaster:
         Returns:
             List of deduplicated weekly dicts, sorted by week_date
         """
-        if not self.history_file.exists():
+        if not history_exists(self.history_file):
             logger.warning("Security history not found", extra={"file": str(self.history_file)})
             return []
 
-        data = json.loads(self.history_file.read_text(encoding="utf-8"))
+        data = load_history(self.history_file)
         raw_weeks = data.get("weeks", [])
 
         # 1. Filter obvious corrupt entries (>3x baseline)
@@ -503,11 +504,11 @@ class HealthScorer:
 
     def _load_quality_weeks(self) -> list[dict]:
         """Load quality history sorted by date."""
-        if not self.quality_history_file.exists():
+        if not history_exists(self.quality_history_file):
             logger.warning("Quality history not found", extra={"file": str(self.quality_history_file)})
             return []
 
-        data = json.loads(self.quality_history_file.read_text(encoding="utf-8"))
+        data = load_history(self.quality_history_file)
         weeks = data.get("weeks", [])
         return sorted(weeks, key=lambda w: w["week_date"])
 
@@ -518,11 +519,11 @@ class HealthScorer:
         This method translates IDs to names using data/armorcode_id_map.json.
         If the ID map is unavailable (local dev without secret), keys are returned as-is.
         """
-        if not self.exploitable_history_file.exists():
+        if not history_exists(self.exploitable_history_file):
             logger.debug("Exploitable history not found", extra={"file": str(self.exploitable_history_file)})
             return {}
 
-        data = json.loads(self.exploitable_history_file.read_text(encoding="utf-8"))
+        data = load_history(self.exploitable_history_file)
         weeks = data.get("weeks", [])
         if not weeks:
             return {}
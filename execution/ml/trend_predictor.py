@@ -18,6 +18,7 @@ import numpy as np
 from sklearn.linear_model import LinearRegression
 
 from execution.core import get_logger
+from execution.core.history_store import history_exists, load_history
 
 logger = get_logger(__name__)
 
@@ -131,13 +132,12 @@ class TrendPredictor:
         Returns:
             List of {week_ending, open_bugs} dicts, sorted by date
         """
-        if not self.history_file.exists():
+        if not history_exists(self.history_file):
             logger.error("History file not found", extra={"file_path": str(self.history_file)})
             raise FileNotFoundError(f"Quality history not found: {self.history_file}")
 
         try:
-            with open(self.history_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_history(self.history_file)
 
             history = []
             for week in data.get("weeks", []):
@@ -246,8 +246,7 @@ if __name__ == "__main__":
         logger.info("Predictor initialized", extra={"history_file": str(predictor.history_file)})
 
         # Load history to find a project
-        with open(predictor.history_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_history(predictor.history_file, last_n=1)
 
         if data.get("weeks") and data["weeks"][0].get("projects"):
             project_key = data["weeks"][0]["projects"][0]["project_key"]
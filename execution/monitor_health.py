@@ -28,6 +28,7 @@ from execution.core import (
     setup_observability,
     track_performance,
 )
+from execution.core.history_store import HistoryStore
 
 logger = get_logger(__name__)
 
@@ -53,7 +54,7 @@ def check_metrics_freshness(max_age_hours: float = 25.0) -> tuple[int, int]:
     stale_count = 0
 
     for filename in metric_files:
-        file_path = observatory_dir / filename
+        file_path = HistoryStore(observatory_dir / filename).data_path
         if file_path.exists():
             is_fresh, age = check_data_freshness(file_path, max_age_hours)
             if is_fresh:
@@ -10,6 +10,7 @@ Features:
 - XSS-safe HTML escaping
 - Sortable column headers
 - Responsive table structure
+- Column-wise row formatting streamed in chunks (iter_table_html)
 
 Usage:
     from execution.reports.usage_tables.table_generator import generate_table_html
@@ -24,12 +25,20 @@ Usage:
 """
 
 import html as html_module
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+# Rows formatted per chunk by iter_table_html (bounds memory for very large tables)
+TABLE_CHUNK_ROWS = 5000
+
+# Access values shown as "Yes" (compared after str().strip().upper())
+_YES_ACCESS_VALUES = ["YES", "1", "1.0"]
+
 
 class AccessBadgeType(Enum):
     """
@@ -78,6 +87,11 @@ class TableRow:
     usage: float
 
 
+_HIGH = HeatmapColor(background="#d1fae5", text="#065f46", intensity="high")
+_MEDIUM = HeatmapColor(background="#fef3c7", text="#92400e", intensity="medium")
+_LOW = HeatmapColor(background="#fee2e2", text="#991b1b", intensity="low")
+
+
 def get_usage_heatmap_color(usage: float) -> HeatmapColor:
     """
     Determine heatmap color based on usage value.
@@ -102,13 +116,13 @@ def get_usage_heatmap_color(usage: float) -> HeatmapColor:
     """
     if usage >= 100:
         # High - Green
-        return HeatmapColor(background="#d1fae5", text="#065f46", intensity="high")
+        return _HIGH
     elif usage >= 20:
         # Medium - Amber
-        return HeatmapColor(background="#fef3c7", text="#92400e", intensity="medium")
+        return _MEDIUM
     else:
         # Low - Red
-        return HeatmapColor(background="#fee2e2", text="#991b1b", intensity="low")
+        return _LOW
 
 
 def parse_access_value(access_value: Any) -> AccessBadgeType:
@@ -135,7 +149,7 @@ def parse_access_value(access_value: Any) -> AccessBadgeType:
         <AccessBadgeType.NO: 'no'>
     """
     access_str = str(access_value).strip().upper()
-    if access_str in ["YES", "1", "1.0"]:
+    if access_str in _YES_ACCESS_VALUES:
         return AccessBadgeType.YES
     else:
         return AccessBadgeType.NO
@@ -230,11 +244,24 @@ def generate_table_row_html(row: TableRow) -> str:
                         </tr>"""
 
 
+# Row markup of generate_table_row_html + generate_heatmap_cell_html, filled column-wise by _format_row_chunk
+_ROW_TEMPLATE = (
+    "\n                        <tr>"
+    "\n                            <td>{name}</td>"
+    "\n                            <td>{job_title}</td>"
+    "\n                            <td>{badge}</td>"
+    '\n                            <td class="heatmap-cell" '
+    'style="background-color: {background}; color: {text};" '
+    'data-value="{usage}">{usage_int}</td>'
+    "\n                        </tr>"
+)
+
+
 def generate_table_html(df: pd.DataFrame, table_id: str, title: str, usage_column: str, access_column: str) -> str:
     """
     Generate complete HTML table with header and rows.
 
-    Creates a sortable table with:
+    Joins the chunks of :func:`iter_table_html`. Creates a sortable table with:
     - Sortable column headers (onclick handlers)
     - HTML-escaped user data
     - Access status badges
@@ -273,17 +300,100 @@ def generate_table_html(df: pd.DataFrame, table_id: str, title: str, usage_colum
         >>> 'Alice' in html
         True
     """
-    # Validate required columns exist
+    return "".join(iter_table_html(df, table_id, title, usage_column, access_column))
+
+
+def _format_row_chunk(chunk: pd.DataFrame, usage_column: str, access_column: str) -> str:
+    """
+    Format a block of rows column-wise (same markup as generate_table_row_html).
+
+    Each column is extracted once and thresholds/badges are selected with numpy,
+    instead of building a Series and a TableRow per row as df.iterrows() did.
+    """
+    names = [html_module.escape(str(value)) for value in chunk["Name"].tolist()]
+    job_titles = [html_module.escape(str(value)) for value in chunk["Job Title"].tolist()]
+    usage = chunk[usage_column].astype(float)
+
+    has_access = np.array([str(value).strip().upper() in _YES_ACCESS_VALUES for value in chunk[access_column].tolist()])
+    badges = np.where(
+        has_access,
+        generate_access_badge_html(AccessBadgeType.YES),
+        generate_access_badge_html(AccessBadgeType.NO),
+    ).tolist()
+
+    is_high = (usage >= 100).to_numpy()
+    is_medium = (usage >= 20).to_numpy()
+    backgrounds = np.select([is_high, is_medium], [_HIGH.background, _MEDIUM.background], _LOW.background).tolist()
+    text_colors = np.select([is_high, is_medium], [_HIGH.text, _MEDIUM.text], _LOW.text).tolist()
+
+    return "".join(
+        _ROW_TEMPLATE.format(
+            name=name,
+            job_title=job_title,
+            badge=badge,
+            background=background,
+            text=text,
+            usage=value,
+            usage_int=value_int,
+        )
+        for name, job_title, badge, background, text, value, value_int in zip(
+            names,
+            job_titles,
+            badges,
+            backgrounds,
+            text_colors,
+            usage.tolist(),
+            usage.astype("int64").tolist(),
+            strict=True,
+        )
+    )
+
+
+def iter_table_html(
+    df: pd.DataFrame,
+    table_id: str,
+    title: str,
+    usage_column: str,
+    access_column: str,
+    chunk_rows: int = TABLE_CHUNK_ROWS,
+) -> Iterator[str]:
+    """
+    Generate the table HTML as a stream of chunks.
+
+    Yields the table header, then one string per block of ``chunk_rows`` rows,
+    then the footer. Writing the chunks to a file as they are produced keeps
+    memory flat regardless of the number of rows.
+
+    Args:
+        df: DataFrame with user data (must contain: Name, Job Title, usage_column, access_column)
+        table_id: Unique HTML ID for table element (used for sorting/filtering)
+        title: Table title displayed in h2 header
+        usage_column: Name of column containing usage counts
+        access_column: Name of column containing access status
+        chunk_rows: Rows formatted per yielded chunk
+
+    Yields:
+        str: HTML fragments in document order
+
+    Raises:
+        KeyError: If required columns are missing from DataFrame
+    """
+    # Validate required columns exist (before the first chunk is yielded)
     required_cols = ["Name", "Job Title", usage_column, access_column]
     missing_cols = [col for col in required_cols if col not in df.columns]
     if missing_cols:
         raise KeyError(f"Missing required columns: {missing_cols}")
 
+    return _iter_table_chunks(df, table_id, title, usage_column, access_column, chunk_rows)
+
+
+def _iter_table_chunks(
+    df: pd.DataFrame, table_id: str, title: str, usage_column: str, access_column: str, chunk_rows: int
+) -> Iterator[str]:
     # Escape title to prevent XSS
     title_escaped = html_module.escape(title)
 
-    # Start table HTML
-    html = f"""
+    yield f"""
             <div class="table-card">
                 <h2>{title_escaped}</h2>
                 <div class="table-wrapper">
@@ -298,21 +408,11 @@ def generate_table_html(df: pd.DataFrame, table_id: str, title: str, usage_colum
                         </thead>
                         <tbody>"""
 
-    # Generate rows
-    for _, row_data in df.iterrows():
-        row = TableRow(
-            name=str(row_data["Name"]),
-            job_title=str(row_data["Job Title"]),
-            access=row_data[access_column],
-            usage=float(row_data[usage_column]),
-        )
-        html += generate_table_row_html(row)
+    for start in range(0, len(df), chunk_rows):
+        yield _format_row_chunk(df.iloc[start : start + chunk_rows], usage_column, access_column)
 
-    # Close table HTML
-    html += """
+    yield """
                         </tbody>
                     </table>
                 </div>
             </div>"""
-
-    return html
@@ -31,14 +31,18 @@ import logging
 import os
 import sys
 import webbrowser
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 from dotenv import load_dotenv
 
+from execution.dashboards.renderer import write_html_chunks
+
 # Import mobile-responsive framework
 from execution.framework import get_dashboard_framework
+from execution.reports.usage_tables.table_generator import iter_table_html
 
 # Load environment variables
 load_dotenv()
@@ -253,59 +257,7 @@ def generate_table_html(df: pd.DataFrame, table_id: str, title: str, usage_colum
     Returns:
         str: HTML string for the table section
     """
-    html = f"""
-            <div class="table-card">
-                <h2>{html_module.escape(title)}</h2>
-                <div class="table-wrapper">
-                    <table id="{table_id}" class="usage-table">
-                        <thead>
-                            <tr>
-                                <th onclick="sortTable('{table_id}', 0)">Name</th>
-                                <th onclick="sortTable('{table_id}', 1)">Job Title</th>
-                                <th onclick="sortTable('{table_id}', 2)">Access</th>
-                                <th onclick="sortTable('{table_id}', 3)">Usage (30 days)</th>
-                            </tr>
-                        </thead>
-                        <tbody>"""
-
-    # Generate rows
-    for _, row in df.iterrows():
-        name = html_module.escape(str(row["Name"]))
-        job_title = html_module.escape(str(row["Job Title"]))
-        access = str(row[access_column]).strip()
-        usage = float(row[usage_column])
-
-        # Get heatmap color
-        bg_color, text_color, intensity = get_usage_heatmap_color(usage)
-
-        # Access badge (handle both text and numeric values)
-        # Treat NaN, empty, or 0 as "No"
-        if access.upper() in ["YES", "1", "1.0"]:
-            access_badge = '<span class="badge badge-success">Yes</span>'
-        elif access.upper() in ["NO", "0", "0.0", "NAN", "NONE", ""]:
-            access_badge = '<span class="badge badge-secondary">No</span>'
-        else:
-            access_badge = '<span class="badge badge-secondary">No</span>'
-
-        html += f"""
-                        <tr>
-                            <td>{name}</td>
-                            <td>{job_title}</td>
-                            <td>{access_badge}</td>
-                            <td class="heatmap-cell"
-                                style="background-color: {bg_color}; color: {text_color};"
-                                data-value="{usage}">
-                                {int(usage)}
-                            </td>
-                        </tr>"""
-
-    html += """
-                        </tbody>
-                    </table>
-                </div>
-            </div>"""
-
-    return html
+    return "".join(iter_table_html(df, table_id, title, usage_column, access_column))
 
 
 def generate_html_report_with_data(claude_df: pd.DataFrame, devin_df: pd.DataFrame, output_file: str) -> str:
@@ -332,16 +284,6 @@ def generate_html_report_with_data(claude_df: pd.DataFrame, devin_df: pd.DataFra
     # Generate report date
     report_date = datetime.now().strftime("%B %d, %Y at %I:%M %p")
 
-    # Generate Claude table HTML
-    claude_table_html = generate_table_html(
-        claude_df, "claudeTable", "Claude Usage (Last 30 Days)", "Claude 30 day usage", "Claude Access"
-    )
-
-    # Generate Devin table HTML
-    devin_table_html = generate_table_html(
-        devin_df, "devinTable", "Devin Usage (Last 30 Days)", "Devin_30d", "Devin Access"
-    )
-
     # Get mobile-responsive framework
     framework_css, framework_js = get_dashboard_framework(
         header_gradient_start="#0f172a",
@@ -351,8 +293,8 @@ def generate_html_report_with_data(claude_df: pd.DataFrame, devin_df: pd.DataFra
         include_glossary=False,
     )
 
-    # Complete HTML document
-    html = f"""<!DOCTYPE html>
+    # HTML document around the two tables
+    page_head = f"""<!DOCTYPE html>
 <html lang="en" data-theme="dark">
 <head>
     <meta charset="UTF-8">
@@ -703,8 +645,9 @@ def generate_html_report_with_data(claude_df: pd.DataFrame, devin_df: pd.DataFra
         </div>
 
         <div class="tables-container">
-{claude_table_html}
-{devin_table_html}
+"""
+
+    page_tail = f"""
         </div>
     </div>
 
@@ -791,11 +734,17 @@ def generate_html_report_with_data(claude_df: pd.DataFrame, devin_df: pd.DataFra
 </body>
 </html>"""
 
-    # Write HTML file
-    output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    # Stream the page: table rows are formatted in chunks and written as they are produced
+    def page_chunks() -> Iterator[str]:
+        yield page_head
+        yield from iter_table_html(
+            claude_df, "claudeTable", "Claude Usage (Last 30 Days)", "Claude 30 day usage", "Claude Access"
+        )
+        yield "\n"
+        yield from iter_table_html(devin_df, "devinTable", "Devin Usage (Last 30 Days)", "Devin_30d", "Devin Access")
+        yield page_tail
+
+    write_html_chunks(page_chunks(), Path(output_file))
 
     logger.info(f"HTML report created successfully: {output_file}")
 
@@ -0,0 +1,134 @@
+"""
+Precompiled Jinja2 Template Cache
+
+Both template environments (dashboards/renderer.py and template_engine.py)
+used a FileSystemLoader: every process parsed and compiled each template on
+first use and every later get_template() call stat'ed the source to check it
+was still fresh. A dashboard refresh renders in many short-lived processes, so
+most of that work was repeated for every dashboard.
+
+create_environment() compiles all templates once with Environment.compile_templates
+into a directory keyed by a digest of the template sources, environment
+options, filter names and Jinja version, then loads them through a ModuleLoader
+(imported modules, no source parsing and no freshness checks). Editing any
+template changes the digest, so a stale cache is never used. Templates that
+fail to compile (e.g. they use a filter this environment does not register)
+and an unwritable cache directory fall back to the source FileSystemLoader.
+
+Usage:
+    from execution.template_cache import TEMPLATE_DIRS, create_environment
+
+    env = create_environment(TEMPLATE_DIRS, filters={"format_number": format_number})
+    html = env.get_template("dashboards/quality_dashboard.html").render(**context)
+"""
+
+import hashlib
+import os
+import shutil
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+import jinja2
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, ModuleLoader, select_autoescape
+
+from execution.core import get_logger
+
+logger = get_logger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Template search path: project templates first, execution/templates for component partials only found there
+TEMPLATE_DIRS = (PROJECT_ROOT / "templates", PROJECT_ROOT / "execution" / "templates")
+
+DEFAULT_CACHE_DIR = PROJECT_ROOT / ".tmp" / "compiled_templates"
+
+# Options shared by every environment (they change the compiled code, so they are part of the digest)
+ENVIRONMENT_OPTIONS: dict[str, Any] = {"trim_blocks": True, "lstrip_blocks": True}
+
+
+def _template_digest(env: Environment, template_names: list[str]) -> str:
+    """Digest of everything the compiled modules depend on."""
+    digest = hashlib.sha256()
+    digest.update(f"jinja2={jinja2.__version__};{sorted(ENVIRONMENT_OPTIONS.items())}".encode())
+    digest.update(",".join(sorted(env.filters)).encode("utf-8"))
+    for name in template_names:
+        source, _, _ = env.loader.get_source(env, name)  # type: ignore[union-attr]
+        digest.update(name.encode("utf-8"))
+        digest.update(source.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def compile_template_cache(env: Environment, cache_dir: Path | str = DEFAULT_CACHE_DIR) -> Path | None:
+    """
+    Compile every template of an environment into a digest-keyed module directory.
+
+    Reuses the directory if a previous process already compiled the same
+    sources. Compilation goes to a private temp directory that is renamed into
+    place, so concurrent dashboard workers never load a half-written cache.
+
+    Args:
+        env: Environment with its source loader and filters configured
+        cache_dir: Parent folder of the compiled caches
+
+    Returns:
+        Directory of compiled template modules, or None if it could not be written
+    """
+    names = env.list_templates(filter_func=lambda name: not name.startswith("."))
+    target = Path(cache_dir) / _template_digest(env, names)
+    if target.is_dir():
+        return target
+
+    staging = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        env.compile_templates(
+            str(staging),
+            extensions=None,
+            filter_func=lambda name: name in names,
+            zip=None,
+            log_function=logger.debug,
+            ignore_errors=True,
+        )
+        os.replace(staging, target)
+    except OSError as e:
+        shutil.rmtree(staging, ignore_errors=True)
+        if target.is_dir():
+            # Another worker finished compiling the same sources first
+            return target
+        logger.warning(f"Template precompilation disabled, rendering from source: {e}")
+        return None
+
+    logger.info("Templates precompiled", extra={"templates": len(names), "path": str(target)})
+    return target
+
+
+def create_environment(
+    template_dirs: Iterable[Path | str] = TEMPLATE_DIRS,
+    filters: Mapping[str, Callable[..., Any]] | None = None,
+    cache_dir: Path | str | None = DEFAULT_CACHE_DIR,
+) -> Environment:
+    """
+    Create an auto-escaping environment that loads precompiled templates.
+
+    Args:
+        template_dirs: Template folders, searched in order
+        filters: Custom filters to register (needed before compiling templates that use them)
+        cache_dir: Parent folder of compiled caches; None renders from source only
+
+    Returns:
+        Environment loading compiled modules first, template sources second
+    """
+    source_loader = FileSystemLoader([str(d) for d in template_dirs if Path(d).is_dir()])
+    env = Environment(
+        loader=source_loader,
+        autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+        **ENVIRONMENT_OPTIONS,
+    )
+    env.filters.update(filters or {})
+
+    if cache_dir is not None:
+        compiled_dir = compile_template_cache(env, cache_dir)
+        if compiled_dir is not None:
+            env.loader = ChoiceLoader([ModuleLoader(str(compiled_dir)), source_loader])
+    return env
@@ -15,12 +15,13 @@ Security Features:
     - Automatic HTML escaping (prevents XSS attacks)
     - Template validation
     - Centralized template management
+    - Templates precompiled once into a shared module cache
 """
 
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from execution.template_cache import TEMPLATE_DIRS, create_environment
 
 
 class TemplateEngine:
@@ -36,18 +37,15 @@ class TemplateEngine:
             template_dir: Directory containing templates (default: templates/)
         """
         if template_dir is None:
-            # Default to templates directory at project root
-            template_dir = Path(__file__).parent.parent / "templates"
-
-        self.template_dir = Path(template_dir)
-
-        # Create Jinja2 environment with security settings
-        self.env = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(["html", "xml"]),  # Auto-escape HTML
-            trim_blocks=True,  # Remove first newline after template tag
-            lstrip_blocks=True,  # Strip leading spaces/tabs from start of line
-        )
+            # Default to templates directory at project root (execution/templates as fallback)
+            template_dirs: tuple[Path, ...] = TEMPLATE_DIRS
+        else:
+            template_dirs = (Path(template_dir),)
+
+        self.template_dir = template_dirs[0]
+
+        # Auto-escaping Jinja2 environment backed by the precompiled template cache
+        self.env = create_environment(template_dirs)
 
     def render(self, template_name: str, **context: Any) -> str:
         """
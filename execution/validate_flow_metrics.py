@@ -8,6 +8,8 @@ Shows sample work items to verify metrics against ADO UI
 import json
 import sys
 
+from execution.core.history_store import load_weeks
+
 # Set UTF-8 encoding for Windows
 if sys.platform == "win32":
     import codecs
@@ -18,9 +20,7 @@ if sys.platform == "win32":
 
 def load_latest_metrics():
     """Load latest flow metrics from history"""
-    with open(".tmp/observatory/flow_history.json", encoding="utf-8") as f:
-        data = json.load(f)
-    return data["weeks"][-1]  # Most recent week
+    return load_weeks(".tmp/observatory/flow_history.json", last_n=1).weeks[-1]  # Most recent week
 
 
 def display_project_summary(project_data):
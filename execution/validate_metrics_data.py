@@ -4,19 +4,23 @@ Validate metrics history files before dashboard generation.
 
 Checks that all required history files exist, are valid JSON,
 and have the expected structure with at least one week of data.
+Histories are read through HistoryStore, so migrated (week-partitioned)
+histories are validated from their partitions, not the legacy document.
 """
 
 import json
-import os
 import sys
 from pathlib import Path
 
+from execution.core.history_store import HistoryStore
 
-def _check_file_readable(file_path: str) -> tuple:
-    """Check file exists and is non-empty. Returns (file_size, error_message)."""
-    if not os.path.exists(file_path):
+
+def _check_file_readable(store: HistoryStore) -> tuple:
+    """Check the history exists and is non-empty. Returns (size_in_bytes, error_message)."""
+    if not store.exists():
         return None, "File does not exist"
-    file_size = os.path.getsize(file_path)
+    files = sorted(store.partition_dir.glob("*.json")) if store.partitioned else [store.legacy_file]
+    file_size = sum(f.stat().st_size for f in files)
     if file_size == 0:
         return None, "File is empty (0 bytes)"
     return file_size, None
@@ -45,17 +49,17 @@ def _check_required_fields(weeks: list, required_fields: list) -> tuple:
 
 def validate_history_file(file_path: str, required_fields: list | None = None) -> tuple:
     """
-    Validate a single history file.
+    Validate a single history (legacy document or week partitions).
 
     Returns: (is_valid, error_message)
     """
-    file_size, err = _check_file_readable(file_path)
+    store = HistoryStore(file_path)
+    file_size, err = _check_file_readable(store)
     if err:
         return False, err
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = store.load()
     except json.JSONDecodeError as e:
         return False, f"Invalid JSON: {e}"
     except UnicodeDecodeError as e:
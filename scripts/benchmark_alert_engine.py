@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Benchmark set-based vs per-series alert evaluation.
+
+Builds a synthetic Observatory database (weekly values for every series,
+~3% nulls, rolling stats for each series, and a slice of series on the
+threshold-rule metrics), then times AlertEngine.run() against the previous
+evaluation: one latest-value query per rolling_stats row, one full-history
+scan per threshold rule and row-by-row inserts. Both must write the same
+alerts.
+
+Usage:
+    python -m scripts.benchmark_alert_engine                     # 1k, 10k, 100k series
+    python -m scripts.benchmark_alert_engine --series 100000 --weeks 26
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from execution.import_to_sqlite import create_database
+from execution.ml.alert_engine import THRESHOLD_RULES, AlertEngine
+
+# (dashboard, metric_name) pairs other than the rule metrics, so most series only feed anomaly detection
+_OTHER_METRICS = [
+    ("quality", "median_bug_age_days"),
+    ("flow", "lead_time_p85_days"),
+    ("flow", "wip_count"),
+    ("collaboration", "review_hours"),
+]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="benchmark_alert_engine",
+        description="Compare set-based and per-series alert evaluation on a synthetic database.",
+    )
+    parser.add_argument(
+        "--series",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000],
+        help="Series counts to benchmark (default: 1000 10000 100000)",
+    )
+    parser.add_argument("--weeks", type=int, default=12, help="Weeks of history per series (default: 12)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per mode; best is reported (default: 3)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    return parser
+
+
+def synthetic_database(path: Path, n_series: int, weeks: int, seed: int = 42) -> None:
+    """
+    Observatory-schema database with `n_series` weekly series and their rolling stats.
+
+    A quarter of the series use the threshold-rule metrics; latest values are
+    drawn so a few percent of series are anomalous or breach a threshold.
+    """
+    rng = np.random.default_rng(seed)
+    pairs = [(rule.dashboard, rule.metric_name) for rule in THRESHOLD_RULES]
+    rule_pairs = list(dict.fromkeys(pairs))
+    dates = [(date(2026, 1, 4) + timedelta(weeks=w)).isoformat() for w in range(weeks)]
+
+    metric_rows = []
+    stat_rows = []
+    for i in range(n_series):
+        dashboard, metric_name = rule_pairs[i % len(rule_pairs)] if i % 4 == 0 else _OTHER_METRICS[i % 4]
+        project = f"Product_{i // 4:05d}"
+        mean = float(rng.uniform(0, 100))
+        std = float(rng.uniform(1, 10))
+        values = rng.normal(mean, std, weeks)
+        values[rng.random(weeks) < 0.03] = np.nan
+        for metric_date, value in zip(dates, values.tolist(), strict=True):
+            metric_rows.append((metric_date, dashboard, project, metric_name, None if math.isnan(value) else value))
+        stat_rows.append((dashboard, project, metric_name, mean, std))
+
+    conn = sqlite3.connect(path)
+    try:
+        create_database(conn)
+        conn.executemany(
+            "INSERT INTO metrics (metric_date, dashboard, project_name, metric_name, metric_value) "
+            "VALUES (?, ?, ?, ?, ?)",
+            metric_rows,
+        )
+        conn.executemany(
+            "INSERT INTO rolling_stats (dashboard, project_name, metric_name, rolling_mean, rolling_std) "
+            "VALUES (?, ?, ?, ?, ?)",
+            stat_rows,
+        )
+        conn.commit()
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+
+def per_series_run(db_path: Path, zscore_threshold: float = 2.0) -> int:
+    """The previous evaluation: N+1 latest-value lookups, per-rule history scans, row-by-row inserts."""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("DELETE FROM alerts")
+        conn.commit()
+        cursor = conn.cursor()
+        count = 0
+
+        stats = cursor.execute(
+            "SELECT dashboard, project_name, metric_name, rolling_mean, rolling_std "
+            "FROM rolling_stats WHERE rolling_std > 0"
+        ).fetchall()
+        for dashboard, project_name, metric_name, mean, std in stats:
+            latest = cursor.execute(
+                "SELECT metric_date, metric_value FROM metrics "
+                "WHERE dashboard=? AND project_name=? AND metric_name=? AND metric_value IS NOT NULL "
+                "ORDER BY metric_date DESC LIMIT 1",
+                (dashboard, project_name, metric_name),
+            ).fetchone()
+            if latest is None:
+                continue
+            z_score = (latest[1] - mean) / std
+            if abs(z_score) < zscore_threshold:
+                continue
+            cursor.execute(
+                "INSERT INTO alerts (dashboard, project_name, metric_name, metric_date, "
+                "alert_type, severity, value, expected, message) VALUES (?, ?, ?, ?, 'anomaly', ?, ?, ?, '')",
+                (
+                    dashboard,
+                    project_name,
+                    metric_name,
+                    latest[0],
+                    "high" if abs(z_score) > 3.0 else "medium",
+                    latest[1],
+                    mean,
+                ),
+            )
+            count += 1
+
+        fired: set[tuple[str, str, str]] = set()
+        for rule in THRESHOLD_RULES:
+            cursor.execute(
+                "SELECT project_name, metric_date, metric_value FROM metrics "
+                "WHERE dashboard=? AND metric_name=? AND metric_value IS NOT NULL ORDER BY metric_date DESC",
+                (rule.dashboard, rule.metric_name),
+            )
+            seen: set[str] = set()
+            for project_name, metric_date, value in cursor.fetchall():
+                if project_name in seen:
+                    continue
+                seen.add(project_name)
+                triggered = (rule.operator == "below" and value < rule.threshold) or (
+                    rule.operator == "above" and value > rule.threshold
+                )
+                key = (rule.dashboard, project_name, rule.metric_name)
+                if not triggered or key in fired:
+                    continue
+                fired.add(key)
+                conn.execute(
+                    "INSERT INTO alerts (dashboard, project_name, metric_name, metric_date, "
+                    "alert_type, severity, value, expected, message) VALUES (?, ?, ?, ?, 'threshold', ?, ?, ?, '')",
+                    (rule.dashboard, project_name, rule.metric_name, metric_date, rule.severity, value, rule.threshold),
+                )
+                count += 1
+        conn.commit()
+        return count
+    finally:
+        conn.close()
+
+
+def _alert_keys(db_path: Path) -> list[tuple]:
+    conn = sqlite3.connect(db_path)
+    try:
+        return sorted(
+            conn.execute(
+                "SELECT dashboard, project_name, metric_name, metric_date, alert_type, severity, value, expected "
+                "FROM alerts"
+            ).fetchall()
+        )
+    finally:
+        conn.close()
+
+
+def _best_time(run: Callable[[], int], repeat: int) -> tuple[float, int]:
+    best = math.inf
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = run()
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
+    # Keep per-run log lines out of the timings
+    logging.disable(logging.WARNING)
+
+    print(f"Alert engine benchmark: {args.weeks} weeks per series, best of {args.repeat}")
+    print("=" * 72)
+    print(f"{'series':>10} {'alerts':>8} {'per-series (s)':>15} {'set-based (s)':>14} {'speedup':>9}  match")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_series in args.series:
+            db_path = Path(tmp) / f"observatory_{n_series}.db"
+            synthetic_database(db_path, n_series, args.weeks, seed=args.seed)
+
+            loop_s, _ = _best_time(partial(per_series_run, db_path), args.repeat)
+            loop_alerts = _alert_keys(db_path)
+            engine = AlertEngine(db_path=db_path)
+            set_s, count = _best_time(engine.run, args.repeat)
+            match = "yes" if _alert_keys(db_path) == loop_alerts else "NO"
+            print(f"{n_series:>10} {count:>8} {loop_s:>15.4f} {set_s:>14.4f} {loop_s / set_s:>8.1f}x  {match}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Migrate metric history files to week partitions (and export them back).
+
+Processes every metric history in .tmp/observatory (see METRIC_HISTORY_FILES):
+  .tmp/observatory/flow_history.json  ->  .tmp/observatory/history/flow/000001_2026-01-05.json, ...
+
+After migration collectors append one small file per week instead of rewriting
+the whole document, and readers only parse the weeks they ask for. The legacy
+document is left in place; deleting .tmp/observatory/history/<metric>/ reverts
+that metric to it.
+
+`export` regenerates the {"weeks": [...]} documents from the partitions. Run it
+before anything that consumes the single-file format (CI artifacts,
+de_genericize_history_files.py, external tools).
+
+Usage:
+  python -m scripts.migrate_history_to_partitions            # migrate (skips already migrated)
+  python -m scripts.migrate_history_to_partitions --force    # rebuild partitions from the documents
+  python -m scripts.migrate_history_to_partitions export     # write the compatibility documents
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from execution.core.history_store import METRIC_HISTORY_FILES, HistoryStore
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="migrate_history_to_partitions",
+        description="Migrate metric history files to week partitions, or export the compatibility documents.",
+    )
+    parser.add_argument(
+        "mode",
+        nargs="?",
+        choices=["migrate", "export"],
+        default="migrate",
+        help="migrate: split documents into week partitions; export: rebuild documents from partitions",
+    )
+    parser.add_argument(
+        "--dir",
+        type=Path,
+        default=Path(".tmp/observatory"),
+        help="Observatory directory holding the *_history.json files (default: .tmp/observatory)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild partitions even if a history is already migrated",
+    )
+    return parser
+
+
+def migrate(history_dir: Path, force: bool = False) -> int:
+    """
+    Migrate every metric history found in history_dir.
+
+    Returns:
+        Number of histories that failed to migrate
+    """
+    failures = 0
+    for filename in METRIC_HISTORY_FILES:
+        store = HistoryStore(history_dir / filename)
+        if not store.legacy_file.exists():
+            print(f"SKIP {filename}: not found")
+            continue
+        if store.partitioned and not force:
+            print(f"SKIP {filename}: already migrated ({store.partition_dir})")
+            continue
+        try:
+            weeks = store.migrate(force=force)
+            print(f"OK   {filename}: {weeks} weeks -> {store.partition_dir}")
+        except (OSError, ValueError) as e:
+            print(f"FAIL {filename}: {e}")
+            failures += 1
+    return failures
+
+
+def export(history_dir: Path) -> int:
+    """
+    Write the {"weeks": [...]} document for every migrated history in history_dir.
+
+    Returns:
+        Number of histories that failed to export
+    """
+    failures = 0
+    for filename in METRIC_HISTORY_FILES:
+        store = HistoryStore(history_dir / filename)
+        if not store.partitioned:
+            print(f"SKIP {filename}: not migrated")
+            continue
+        try:
+            store.export()
+            print(f"OK   {filename}: exported")
+        except (OSError, ValueError) as e:
+            print(f"FAIL {filename}: {e}")
+            failures += 1
+    return failures
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
+
+    print(f"History partitions: {args.mode} ({args.dir})")
+    print("=" * 60)
+
+    if args.mode == "export":
+        failures = export(args.dir)
+    else:
+        failures = migrate(args.dir, force=args.force)
+
+    if failures:
+        print(f"\n{failures} history file(s) failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
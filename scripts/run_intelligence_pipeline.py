@@ -32,7 +32,7 @@ from execution.core.logging_config import get_logger
 from execution.intelligence.feature_engineering import _build_all_features, load_features
 from execution.intelligence.forecast_engine import forecast_all_projects, save_forecasts
 from execution.intelligence.risk_scorer import compute_all_risks, save_risk_scores
-from execution.intelligence.scenario_simulator import compare_scenarios
+from execution.intelligence.scenario_simulator import ScenarioSpec, run_monte_carlo_batch
 
 logger: logging.Logger = get_logger(__name__)
 
@@ -173,12 +173,13 @@ def _run_scenarios() -> bool:
     Run Monte Carlo scenario analysis for all forecast targets.
 
     For each metric, loads the org-level weekly time series from the feature
-    store, runs BAU + Accelerated + Conservative scenarios, and saves results
-    to data/insights/scenario_results_{date}.json.
+    store and queues BAU + Accelerated + Conservative scenarios; all of them
+    are then simulated in one batched run and saved to
+    data/insights/scenario_results_{date}.json.
     """
     try:
         logger.info("Step 3/5 — Running scenario simulations...")
-        all_entries: list[dict] = []
+        specs: list[ScenarioSpec] = []
 
         for metric, col in _FORECAST_TARGETS:
             try:
@@ -203,45 +204,20 @@ def _run_scenarios() -> bool:
                 accelerated_params = (
                     {"closure_rate_multiplier": 1.5} if lower_is_better else {"velocity_multiplier": 1.5}
                 )
-                scenarios = {
+                scenarios: dict[str, dict[str, float]] = {
+                    "BAU": {},
                     "Accelerated": accelerated_params,
                     "Conservative": {"arrival_rate_multiplier": 1.5},
                 }
-
-                results = compare_scenarios(
-                    base_series=series,
-                    scenarios=scenarios,
-                    horizon_weeks=13,
-                    metric=col,
-                    lower_is_better=lower_is_better,
-                    random_seed=42,
-                )
-
-                for sr in results:
-                    all_entries.append(
-                        {
-                            "scenario_name": sr.scenario_name,
-                            "metric": sr.metric,
-                            "horizon_weeks": sr.horizon_weeks,
-                            "n_simulations": sr.n_simulations,
-                            "forecast": [
-                                {
-                                    "week": p.week,
-                                    "p10": p.p10,
-                                    "p50": p.p50,
-                                    "p90": p.p90,
-                                }
-                                for p in sr.forecast
-                            ],
-                            "probability_of_improvement": sr.probability_of_improvement,
-                            "description": sr.description,
-                            "timestamp": datetime.now().isoformat(),
-                        }
+                specs.extend(
+                    ScenarioSpec(
+                        base_series=series,
+                        scenario_params=params,
+                        scenario_name=name,
+                        metric=col,
+                        lower_is_better=lower_is_better,
                     )
-
-                logger.info(
-                    "Scenarios computed",
-                    extra={"metric": metric, "scenarios": len(results)},
+                    for name, params in scenarios.items()
                 )
 
             except Exception as exc:  # noqa: BLE001
@@ -250,10 +226,35 @@ def _run_scenarios() -> bool:
                     extra={"metric": metric, "error": str(exc)},
                 )
 
-        if not all_entries:
+        if not specs:
             logger.warning("No scenario results produced.")
             return False
 
+        results = run_monte_carlo_batch(specs, horizon_weeks=13, random_seed=42)
+        logger.info("Scenarios computed", extra={"scenarios": len(results)})
+
+        all_entries: list[dict] = [
+            {
+                "scenario_name": sr.scenario_name,
+                "metric": sr.metric,
+                "horizon_weeks": sr.horizon_weeks,
+                "n_simulations": sr.n_simulations,
+                "forecast": [
+                    {
+                        "week": p.week,
+                        "p10": p.p10,
+                        "p50": p.p50,
+                        "p90": p.p90,
+                    }
+                    for p in sr.forecast
+                ],
+                "probability_of_improvement": sr.probability_of_improvement,
+                "description": sr.description,
+                "timestamp": datetime.now().isoformat(),
+            }
+            for sr in results
+        ]
+
         _INSIGHTS_DIR.mkdir(parents=True, exist_ok=True)
         date_str = datetime.now().strftime("%Y-%m-%d")
         out_path = _INSIGHTS_DIR / f"scenario_results_{date_str}.json"
@@ -4,7 +4,6 @@ API Middleware Tests - Security, Performance, and Architecture
 Tests for rate limiting, memory management, and security vulnerabilities.
 """
 
-from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
@@ -12,6 +11,21 @@ from fastapi import FastAPI, Request
 from starlette.responses import Response
 
 from execution.api.middleware import RateLimitMiddleware, RequestIDMiddleware
+from execution.api.rate_limit import SQLiteRateLimitBackend
+
+
+class FakeClock:
+    """Monotonic clock the tests can move forward."""
+
+    def __init__(self, start: float = 1_000_000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
 
 # ============================================================
 # Memory Leak Prevention Tests
@@ -22,12 +36,16 @@ class TestRateLimiterMemoryManagement:
     """Test that rate limiter does not leak memory over time."""
 
     @pytest.fixture
-    def middleware(self):
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def middleware(self, clock):
         """Create rate limiter middleware instance."""
         app = FastAPI()
-        return RateLimitMiddleware(app, requests_per_minute=60, requests_per_hour=1000)
+        return RateLimitMiddleware(app, requests_per_minute=60, requests_per_hour=1000, clock=clock)
 
-    def test_stale_ips_are_cleaned_up(self, middleware):
+    def test_stale_ips_are_cleaned_up(self, middleware, clock):
         """
         CRITICAL: Test that old IPs are removed to prevent memory leak.
 
@@ -36,39 +54,32 @@ class TestRateLimiterMemoryManagement:
         """
         # Record requests from 100 different IPs
         for i in range(100):
-            ip = f"192.168.1.{i}"
-            middleware._record_request(ip)
+            middleware._acquire(f"192.168.1.{i}")
 
         # Verify all IPs are tracked
-        assert len(middleware.request_counts) == 100
-
-        # Simulate time passing (2 hours - beyond cleanup threshold)
-        cutoff_time = datetime.now() - timedelta(hours=2)
-
-        # Manually trigger cleanup with old cutoff time
-        middleware._cleanup_stale_ips(cutoff_time)
+        assert len(middleware.backend) == 100
 
-        # All IPs should still be there (they were just added)
-        assert len(middleware.request_counts) == 100
+        # Cleanup right away keeps them (they were just added)
+        middleware._cleanup_stale_ips(clock())
+        assert len(middleware.backend) == 100
 
-        # Now simulate cleanup with current time + 2 hours (all become stale)
-        future_cutoff = datetime.now() + timedelta(hours=2)
-        middleware._cleanup_stale_ips(future_cutoff)
+        # Two hours later every window has aged out
+        clock.advance(2 * 3600)
+        middleware._cleanup_stale_ips(clock())
 
-        # All IPs should be removed (they're all stale)
-        assert len(middleware.request_counts) == 0
+        assert len(middleware.backend) == 0
 
     def test_periodic_cleanup_triggers_automatically(self, middleware):
         """Test that cleanup triggers every 100 requests."""
         # Record 99 requests (should not trigger cleanup)
         for i in range(99):
-            middleware._record_request(f"ip_{i}")
+            middleware._acquire(f"ip_{i}")
 
         assert middleware._request_counter == 99
 
         # 100th request should trigger cleanup and reset counter
         with patch.object(middleware, "_cleanup_stale_ips") as mock_cleanup:
-            middleware._record_request("ip_100")
+            middleware._acquire("ip_100")
 
             # Cleanup should have been called
             mock_cleanup.assert_called_once()
@@ -76,28 +87,21 @@ class TestRateLimiterMemoryManagement:
             # Counter should be reset
             assert middleware._request_counter == 0
 
-    def test_inline_cleanup_removes_stale_ips_during_check(self, middleware):
-        """Test that _check_rate_limit removes stale IPs inline."""
-        # Add an IP with a request
-        middleware._record_request("192.168.1.1")
-
-        # Verify IP is tracked
-        assert "192.168.1.1" in middleware.request_counts
-
-        # Manually set timestamp to 2 hours ago (make it stale)
-        old_time = datetime.now() - timedelta(hours=2)
-        middleware.request_counts["192.168.1.1"] = [(old_time, 1)]
-
-        # Check rate limit - should remove stale IP
-        is_allowed, _ = middleware._check_rate_limit("192.168.1.1")
+    def test_state_per_ip_is_fixed_size(self, middleware, clock):
+        """10k requests per minute from one IP keep one fixed-size entry."""
+        middleware.windows = tuple(
+            type(window)(period=window.period, limit=10**9, label=window.label) for window in middleware.windows
+        )
 
-        # Should be allowed (no recent requests)
-        assert is_allowed is True
+        for _ in range(10_000):
+            middleware._acquire("busy_ip")
+            clock.advance(0.006)
 
-        # IP should be removed
-        assert "192.168.1.1" not in middleware.request_counts
+        assert len(middleware.backend) == 1
+        state = middleware.backend.clients["busy_ip"]
+        assert len(state) == 2 and all(len(window) == 3 for window in state)
 
-    def test_memory_does_not_grow_with_many_unique_ips(self, middleware):
+    def test_memory_does_not_grow_with_many_unique_ips(self, middleware, clock):
         """
         Test that dictionary size doesn't grow unbounded with many unique IPs.
 
@@ -105,17 +109,17 @@ class TestRateLimiterMemoryManagement:
         """
         # Simulate 1000 unique IPs hitting the API
         for i in range(1000):
-            middleware._record_request(f"unique_ip_{i}")
+            middleware._acquire(f"unique_ip_{i}")
 
         # All IPs should be tracked initially
-        assert len(middleware.request_counts) == 1000
+        assert len(middleware.backend) == 1000
 
         # Simulate time passing (make all IPs stale)
-        future_cutoff = datetime.now() + timedelta(hours=2)
-        middleware._cleanup_stale_ips(future_cutoff)
+        clock.advance(2 * 3600)
+        middleware._cleanup_stale_ips(clock())
 
         # All stale IPs should be removed
-        assert len(middleware.request_counts) == 0
+        assert len(middleware.backend) == 0
 
 
 # ============================================================
@@ -127,54 +131,110 @@ class TestRateLimiterSecurity:
     """Test security aspects of rate limiting."""
 
     @pytest.fixture
-    def middleware(self):
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def middleware(self, clock):
         """Create rate limiter with strict limits for testing."""
         app = FastAPI()
-        return RateLimitMiddleware(app, requests_per_minute=5, requests_per_hour=50)
+        return RateLimitMiddleware(app, requests_per_minute=5, requests_per_hour=50, clock=clock)
 
     def test_rate_limit_prevents_abuse(self, middleware):
         """Test that rate limiter blocks excessive requests."""
         ip = "attacker_ip"
 
         # Make 5 requests (should all pass)
-        for _ in range(5):
-            is_allowed, _ = middleware._check_rate_limit(ip)
-            assert is_allowed is True
-            middleware._record_request(ip)
+        for expected_remaining in (4, 3, 2, 1, 0):
+            decision = middleware._acquire(ip)
+            assert decision.allowed is True
+            assert decision.remaining == expected_remaining
 
         # 6th request should be blocked
-        is_allowed, reason = middleware._check_rate_limit(ip)
-        assert is_allowed is False
-        assert "exceeded" in reason
+        decision = middleware._acquire(ip)
+        assert decision.allowed is False
+        assert "5 requests per minute exceeded" in decision.reason
+
+    def test_rejected_requests_are_not_counted(self, middleware, clock):
+        """Blocked requests don't extend the lockout."""
+        for _ in range(10):
+            middleware._acquire("ip")
+
+        # Two minutes on, the previous window no longer counts
+        clock.advance(120)
+        assert middleware._acquire("ip").allowed is True
+
+    def test_window_slides(self, middleware, clock):
+        """Requests from the previous minute count in proportion to the overlap."""
+        clock.now = 600.0  # start of a minute window
+        for _ in range(5):
+            middleware._acquire("ip")
+
+        # 30s into the next window about half of the previous 5 still count
+        clock.advance(90)
+        allowed = sum(middleware._acquire("ip").allowed for _ in range(5))
+        assert allowed == 2
+
+    def test_hour_limit_enforced(self, clock):
+        """The hourly limit applies even when every minute is under its limit."""
+        middleware = RateLimitMiddleware(FastAPI(), requests_per_minute=5, requests_per_hour=8, clock=clock)
+        clock.now = 3600.0
+        for _ in range(4):
+            middleware._acquire("ip")
+        clock.advance(120)
+        for _ in range(4):
+            middleware._acquire("ip")
+        clock.advance(120)
+
+        decision = middleware._acquire("ip")
+        assert decision.allowed is False
+        assert "8 requests per hour exceeded" in decision.reason
 
     def test_different_ips_have_separate_limits(self, middleware):
         """Test that IPs are tracked independently."""
         # IP 1 makes 5 requests (hits limit)
         for _ in range(5):
-            middleware._record_request("ip_1")
+            middleware._acquire("ip_1")
 
         # IP 2 should still be allowed (separate counter)
-        is_allowed, _ = middleware._check_rate_limit("ip_2")
-        assert is_allowed is True
+        assert middleware._acquire("ip_2").allowed is True
 
-    def test_cleanup_does_not_affect_active_ips(self, middleware):
+    def test_cleanup_does_not_affect_active_ips(self, middleware, clock):
         """Test that cleanup only removes truly stale IPs."""
-        # Add active IP (recent request)
-        middleware._record_request("active_ip")
-
         # Add stale IP (old request)
-        old_time = datetime.now() - timedelta(hours=2)
-        middleware.request_counts["stale_ip"] = [(old_time, 1)]
+        middleware._acquire("stale_ip")
+        clock.advance(2 * 3600)
+
+        # Add active IP (recent request)
+        middleware._acquire("active_ip")
 
         # Trigger cleanup
-        cutoff = datetime.now() - timedelta(hours=1)
-        middleware._cleanup_stale_ips(cutoff)
+        middleware._cleanup_stale_ips(clock())
 
         # Active IP should remain
-        assert "active_ip" in middleware.request_counts
+        assert "active_ip" in middleware.backend.clients
 
         # Stale IP should be removed
-        assert "stale_ip" not in middleware.request_counts
+        assert "stale_ip" not in middleware.backend.clients
+
+    def test_shared_backend_enforces_one_limit(self, tmp_path, clock):
+        """Two workers sharing a SQLite backend share the limit."""
+        db_path = tmp_path / "rate_limit.db"
+        worker_a = RateLimitMiddleware(
+            FastAPI(), requests_per_minute=5, backend=SQLiteRateLimitBackend(db_path), clock=clock
+        )
+        worker_b = RateLimitMiddleware(
+            FastAPI(), requests_per_minute=5, backend=SQLiteRateLimitBackend(db_path), clock=clock
+        )
+
+        for worker in (worker_a, worker_b, worker_a, worker_b, worker_a):
+            assert worker._acquire("ip").allowed is True
+
+        assert worker_b._acquire("ip").allowed is False
+
+        clock.advance(2 * 3600)
+        worker_a._cleanup_stale_ips(clock())
+        assert len(worker_b.backend) == 0
 
 
 # ============================================================
@@ -208,10 +268,9 @@ class TestMiddlewareArchitecture:
         middleware = RateLimitMiddleware(app)
 
         # Should not crash with empty dictionary
-        cutoff = datetime.now() - timedelta(hours=1)
-        middleware._cleanup_stale_ips(cutoff)
+        middleware._cleanup_stale_ips(middleware._clock())
 
-        assert len(middleware.request_counts) == 0
+        assert len(middleware.backend) == 0
 
     def test_cleanup_handles_all_active_ips(self):
         """Test cleanup when all IPs are active."""
@@ -220,14 +279,13 @@ class TestMiddlewareArchitecture:
 
         # Add 10 active IPs
         for i in range(10):
-            middleware._record_request(f"active_ip_{i}")
+            middleware._acquire(f"active_ip_{i}")
 
-        # Trigger cleanup with cutoff in the past
-        cutoff = datetime.now() - timedelta(hours=1)
-        middleware._cleanup_stale_ips(cutoff)
+        # Trigger cleanup
+        middleware._cleanup_stale_ips(middleware._clock())
 
         # All IPs should remain (they're active)
-        assert len(middleware.request_counts) == 10
+        assert len(middleware.backend) == 10
 
 
 # ============================================================
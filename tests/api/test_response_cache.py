@@ -0,0 +1,186 @@
+"""
+API Response Cache Tests
+
+Tests for pre-serialized responses, source-based invalidation, ETag/Last-Modified
+revalidation and compressed payloads.
+"""
+
+import gzip
+import json
+import os
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from execution.api.response_cache import ResponseCache, serialize_json
+
+
+@pytest.fixture
+def history_file(tmp_path):
+    """Legacy quality history document with one week."""
+    path = tmp_path / "quality_history.json"
+    path.write_text(json.dumps({"weeks": [{"week_date": "2026-02-07", "open_bugs": 10}]}), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache()
+
+
+@pytest.fixture
+def builds():
+    """Counts how often the payload was built."""
+    return {"count": 0}
+
+
+@pytest.fixture
+def client(cache, history_file, builds):
+    """App with one cached endpoint reading `history_file`."""
+    app = FastAPI()
+
+    @app.get("/history")
+    async def history(request: Request, weeks: int = 12):
+        def build():
+            builds["count"] += 1
+            data = json.loads(history_file.read_text(encoding="utf-8"))
+            return {"weeks": data["weeks"][-weeks:], "padding": "x" * 2000}
+
+        return cache.respond(request, ("history", weeks), [history_file], build)
+
+    return TestClient(app)
+
+
+def _touch_forward(path, seconds=10):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+class TestResponseCaching:
+    """Serialized bodies are reused until a source history changes."""
+
+    def test_repeated_requests_build_once(self, client, cache, builds):
+        first = client.get("/history")
+        second = client.get("/history")
+
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        assert builds["count"] == 1
+        assert cache.hits == 1 and cache.misses == 1
+
+    def test_parameters_are_cached_separately(self, client, builds):
+        client.get("/history?weeks=1")
+        client.get("/history?weeks=4")
+
+        assert builds["count"] == 2
+
+    def test_source_change_rebuilds(self, client, history_file, builds):
+        client.get("/history")
+        history_file.write_text(
+            json.dumps({"weeks": [{"week_date": "2026-02-07"}, {"week_date": "2026-02-14"}]}), encoding="utf-8"
+        )
+        _touch_forward(history_file)
+
+        response = client.get("/history")
+
+        assert builds["count"] == 2
+        assert len(response.json()["weeks"]) == 2
+
+    def test_disabled_cache_always_builds(self, client, cache, builds):
+        cache.enabled = False
+        client.get("/history")
+        client.get("/history")
+
+        assert builds["count"] == 2
+
+    def test_build_errors_are_not_cached(self, cache, history_file):
+        def failing():
+            raise FileNotFoundError("missing")
+
+        with pytest.raises(FileNotFoundError):
+            cache.get(("broken",), [history_file], failing)
+
+        assert cache.get(("broken",), [history_file], lambda: {"ok": True}).body == b'{"ok":true}'
+
+    def test_lru_eviction(self, history_file):
+        cache = ResponseCache(max_entries=2)
+        for weeks in range(3):
+            cache.get(("history", weeks), [history_file], lambda: {})
+
+        cache.get(("history", 0), [history_file], lambda: {})
+        assert cache.misses == 4
+
+    def test_body_matches_fastapi_serialization(self):
+        assert serialize_json({"name": "Café", "n": [1, 2]}) == '{"name":"Café","n":[1,2]}'.encode()
+
+
+class TestConditionalRequests:
+    """ETag and Last-Modified revalidation."""
+
+    def test_validators_present(self, client):
+        response = client.get("/history")
+
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["last-modified"].endswith("GMT")
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    def test_if_none_match_returns_304(self, client):
+        etag = client.get("/history").headers["etag"]
+
+        response = client.get("/history", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_weak_etag_matches(self, client):
+        etag = client.get("/history").headers["etag"]
+
+        assert client.get("/history", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+
+    def test_stale_etag_returns_body(self, client):
+        response = client.get("/history", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+
+    def test_if_modified_since_returns_304(self, client):
+        last_modified = client.get("/history").headers["last-modified"]
+
+        assert client.get("/history", headers={"If-Modified-Since": last_modified}).status_code == 304
+
+    def test_etag_changes_with_content(self, client, history_file):
+        etag = client.get("/history").headers["etag"]
+        history_file.write_text(json.dumps({"weeks": []}), encoding="utf-8")
+        _touch_forward(history_file)
+
+        response = client.get("/history", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+
+class TestCompression:
+    """Compressed variants negotiated from Accept-Encoding."""
+
+    def test_gzip_payload(self, client):
+        response = client.get("/history", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["weeks"][0]["open_bugs"] == 10  # httpx decodes transparently
+
+    def test_gzip_bytes_are_reused(self, cache, history_file):
+        entry = cache.get(("history",), [history_file], lambda: {"padding": "x" * 2000})
+
+        assert entry.encoded("gzip") is entry.encoded("gzip")
+        assert gzip.decompress(entry.encoded("gzip")) == entry.body
+
+    def test_identity_when_not_accepted(self, client):
+        response = client.get("/history", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_q_zero_excludes_encoding(self, client):
+        response = client.get("/history", headers={"Accept-Encoding": "gzip;q=0"})
+
+        assert "content-encoding" not in response.headers
@@ -0,0 +1,203 @@
+"""
+Unit Tests for Adaptive Rate Limiter
+
+Test Coverage:
+- Concurrency limit enforcement and queue depth
+- AIMD additive increase / multiplicative decrease
+- Global pause on throttling (429 / Retry-After)
+- Header-driven decrease (X-RateLimit-Remaining)
+- Token bucket pacing
+- Org-wide limiter sharing
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from execution.collectors.ado_rate_limiter import AdaptiveRateLimiter, get_org_rate_limiter
+
+
+class TestInitialization:
+    """Test limiter configuration validation"""
+
+    def test_defaults(self):
+        """Test limiter starts at the initial limit with no traffic"""
+        limiter = AdaptiveRateLimiter()
+
+        snapshot = limiter.snapshot()
+        assert snapshot["concurrency_limit"] == AdaptiveRateLimiter.DEFAULT_INITIAL_LIMIT
+        assert snapshot["in_flight"] == 0
+        assert snapshot["queue_depth"] == 0
+
+    def test_invalid_limits_raise(self):
+        """Test that inconsistent limits are rejected"""
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter(initial_limit=100, max_limit=10)
+
+    def test_invalid_rate_raises(self):
+        """Test that a non-positive rate is rejected"""
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter(rate_per_second=0)
+
+
+class TestConcurrency:
+    """Test the concurrency gate"""
+
+    @pytest.mark.asyncio
+    async def test_never_exceeds_limit(self):
+        """Test that at most `limit` callers run at once and the rest queue"""
+        limiter = AdaptiveRateLimiter(initial_limit=3, min_limit=1, max_limit=3, rate_per_second=10_000)
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            async with limiter.slot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*[work() for _ in range(20)])
+
+        assert peak == 3
+        assert limiter.in_flight == 0
+        assert limiter.peak_queue_depth >= 17
+
+    @pytest.mark.asyncio
+    async def test_reusable_across_event_loops(self):
+        """Test that loop-bound state is reset when a new event loop is used"""
+        limiter = AdaptiveRateLimiter(initial_limit=1, min_limit=1, max_limit=1)
+        limiter._loop = object()  # type: ignore[assignment]
+        limiter.in_flight = 1  # stale slot from a previous loop
+
+        async with limiter.slot():
+            assert limiter.in_flight == 1
+
+
+class TestAIMD:
+    """Test additive increase / multiplicative decrease"""
+
+    def test_additive_increase_after_full_window(self):
+        """Test limit grows by one after `limit` fast successes"""
+        limiter = AdaptiveRateLimiter(initial_limit=4, min_limit=1, max_limit=10)
+
+        for _ in range(4):
+            limiter.record_success(latency=0.1)
+
+        assert limiter.limit == 5
+
+    def test_increase_capped_at_max(self):
+        """Test limit never exceeds max_limit"""
+        limiter = AdaptiveRateLimiter(initial_limit=2, min_limit=1, max_limit=2)
+
+        for _ in range(50):
+            limiter.record_success(latency=0.1)
+
+        assert limiter.limit == 2
+
+    def test_slow_response_halves_limit(self):
+        """Test latency above target triggers multiplicative decrease"""
+        limiter = AdaptiveRateLimiter(initial_limit=16, latency_target=1.0)
+
+        limiter.record_success(latency=3.0)
+
+        assert limiter.limit == 8
+
+    def test_decrease_respects_floor_and_cooldown(self):
+        """Test a burst of congestion signals only decreases once, never below min"""
+        limiter = AdaptiveRateLimiter(initial_limit=4, min_limit=3, latency_target=1.0)
+
+        for _ in range(10):
+            limiter.record_success(latency=3.0)
+
+        assert limiter.limit == 3
+
+    def test_low_remaining_quota_decreases(self):
+        """Test X-RateLimit-Remaining below 10% of the quota decreases the limit"""
+        limiter = AdaptiveRateLimiter(initial_limit=16)
+
+        limiter.record_success(latency=0.1, headers={"X-RateLimit-Remaining": "5", "X-RateLimit-Limit": "200"})
+
+        assert limiter.limit == 8
+
+    def test_malformed_headers_ignored(self):
+        """Test that non-numeric headers are treated as absent"""
+        limiter = AdaptiveRateLimiter(initial_limit=1, min_limit=1, max_limit=2)
+
+        limiter.record_success(latency=0.1, headers={"Retry-After": "soon", "X-RateLimit-Remaining": "n/a"})
+
+        assert limiter.limit == 2
+        assert limiter.throttle_events == 0
+
+
+class TestThrottle:
+    """Test global pause on 429 / Retry-After"""
+
+    def test_throttle_pauses_and_decreases(self):
+        """Test throttle() halves the limit and records the event"""
+        limiter = AdaptiveRateLimiter(initial_limit=16)
+
+        limiter.throttle(30)
+
+        assert limiter.limit == 8
+        assert limiter.throttle_events == 1
+
+    def test_retry_after_on_success_throttles(self):
+        """Test Retry-After on a 200 response pauses everyone"""
+        limiter = AdaptiveRateLimiter()
+
+        limiter.record_success(latency=0.1, headers={"Retry-After": "2"})
+
+        assert limiter.throttle_events == 1
+
+    @pytest.mark.asyncio
+    async def test_all_callers_wait_for_pause(self):
+        """Test every queued caller waits out the shared pause deadline once"""
+        limiter = AdaptiveRateLimiter(rate_per_second=10_000)
+        limiter.throttle(5)
+
+        with patch("asyncio.sleep") as mock_sleep:
+            for _ in range(3):
+                async with limiter.slot():
+                    pass
+
+        assert mock_sleep.call_count == 3
+        for call in mock_sleep.call_args_list:
+            assert call[0][0] == pytest.approx(5, abs=0.5)
+
+
+class TestTokenBucket:
+    """Test request-rate pacing"""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self):
+        """Test requests beyond the burst are delayed by 1/rate each"""
+        limiter = AdaptiveRateLimiter(initial_limit=4, min_limit=1, max_limit=4, rate_per_second=2)
+
+        with patch("asyncio.sleep") as mock_sleep:
+            for _ in range(4):
+                async with limiter.slot():
+                    pass
+
+        # Burst of 2 tokens, then 0.5s and 1.0s of debt
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert delays == [pytest.approx(0.5, abs=0.05), pytest.approx(1.0, abs=0.05)]
+
+
+class TestOrgLimiter:
+    """Test org-wide limiter registry"""
+
+    def test_same_org_shares_limiter(self):
+        """Test URLs for the same org resolve to one limiter"""
+        first = get_org_rate_limiter("https://dev.azure.com/shared-org")
+        second = get_org_rate_limiter("https://dev.azure.com/Shared-Org/")
+
+        assert first is second
+
+    def test_different_orgs_isolated(self):
+        """Test different orgs get separate limiters"""
+        assert get_org_rate_limiter("https://dev.azure.com/org-a") is not get_org_rate_limiter(
+            "https://dev.azure.com/org-b"
+        )
@@ -408,8 +408,9 @@ class TestErrorHandling:
 
                 # Verify retry occurred
                 assert mock_http_client.post.call_count == 2
-                # Verify sleep was called with Retry-After value
-                mock_sleep.assert_called_with(1)
+                # Verify the retry waited out the shared Retry-After pause
+                assert mock_sleep.call_args[0][0] == pytest.approx(1, abs=0.1)
+                assert client.rate_limiter.throttle_events == 1
 
     @pytest.mark.asyncio
     async def test_server_error_retries_with_exponential_backoff(self):
@@ -473,6 +474,95 @@ class TestErrorHandling:
                 assert mock_http_client.post.call_count == 3
 
 
+class TestSharedSession:
+    """Test the long-lived pooled session opened via the async context manager"""
+
+    @staticmethod
+    def _mock_http_client():
+        mock_response = Mock()
+        mock_response.json = Mock(return_value={"value": []})
+        mock_response.raise_for_status = Mock()
+
+        mock_http_client = AsyncMock()
+        mock_http_client.get = AsyncMock(return_value=mock_response)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
+        mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
+        mock_http_client.__aexit__ = AsyncMock(return_value=None)
+        return mock_http_client
+
+    @pytest.mark.asyncio
+    async def test_session_reused_across_calls(self):
+        """Test that one HTTP client serves every call inside the context"""
+        client = AzureDevOpsRESTClient(organization_url="https://dev.azure.com/org", pat="pat")
+        mock_http_client = self._mock_http_client()
+
+        with patch(
+            "execution.collectors.ado_rest_client.AsyncSecureHTTPClient", return_value=mock_http_client
+        ) as mock_cls:
+            async with client:
+                await client.get_repositories(project="TestProject")
+                await client.get_builds(project="TestProject")
+                await client.query_by_wiql(project="TestProject", wiql_query="SELECT [System.Id] FROM WorkItems")
+
+        assert mock_cls.call_count == 1
+        assert mock_http_client.get.call_count == 2
+        assert mock_http_client.post.call_count == 1
+        mock_http_client.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_nested_context_keeps_outer_session_open(self):
+        """Test that exiting an inner context does not close the shared session"""
+        client = AzureDevOpsRESTClient(organization_url="https://dev.azure.com/org", pat="pat")
+        mock_http_client = self._mock_http_client()
+
+        with patch(
+            "execution.collectors.ado_rest_client.AsyncSecureHTTPClient", return_value=mock_http_client
+        ) as mock_cls:
+            async with client:
+                async with client:
+                    await client.get_repositories(project="TestProject")
+                mock_http_client.__aexit__.assert_not_awaited()
+                await client.get_repositories(project="TestProject")
+
+        assert mock_cls.call_count == 1
+        mock_http_client.__aexit__.assert_awaited_once()
+        assert client._session is None
+
+    @pytest.mark.asyncio
+    async def test_retry_keeps_auth_headers(self):
+        """Test that auth headers are sent on every retry attempt"""
+        client = AzureDevOpsRESTClient(organization_url="https://dev.azure.com/org", pat="pat")
+
+        mock_response_500 = Mock()
+        mock_response_500.status_code = 500
+        mock_response_500.raise_for_status = Mock(
+            side_effect=httpx.HTTPStatusError("500", request=Mock(), response=mock_response_500)
+        )
+        mock_response_ok = Mock()
+        mock_response_ok.json = Mock(return_value={"value": []})
+        mock_response_ok.raise_for_status = Mock()
+
+        mock_http_client = self._mock_http_client()
+        mock_http_client.get = AsyncMock(side_effect=[mock_response_500, mock_response_ok])
+
+        with patch("execution.collectors.ado_rest_client.AsyncSecureHTTPClient", return_value=mock_http_client):
+            with patch("asyncio.sleep"):
+                async with client:
+                    await client.get_repositories(project="TestProject")
+
+        for call in mock_http_client.get.call_args_list:
+            assert call.kwargs["headers"]["Authorization"] == client.auth_header["Authorization"]
+
+    def test_connection_events_forwarded_to_tracker(self):
+        """Test that connection reuse events reach the active collector tracker"""
+        mock_tracker = Mock()
+
+        with patch("execution.collectors.ado_rest_client.get_current_tracker", return_value=mock_tracker):
+            AzureDevOpsRESTClient._record_connection("dev.azure.com", True)
+
+        mock_tracker.record_connection.assert_called_once_with("dev.azure.com", True)
+
+
 class TestFactoryFunction:
     """Test get_ado_rest_client() factory function"""
 
@@ -34,6 +34,11 @@ _MODULE = "execution.armorcode_enhanced_metrics"
 _LOADER_CLASS = f"{_MODULE}.ArmorCodeVulnerabilityLoader"
 
 
+def _matrix(critical: dict, high: dict) -> dict:
+    """count_matrix_aql return value for the unscoped Critical/High matrix."""
+    return {"all": {"Critical": critical, "High": high}}
+
+
 # ---------------------------------------------------------------------------
 # query_current_vulnerabilities_aql
 # ---------------------------------------------------------------------------
@@ -43,43 +48,35 @@ class TestQueryCurrentVulnerabilitiesAql:
     """Tests for the AQL-based Production-only count implementation."""
 
     def test_makes_exactly_two_aql_calls(self):
-        """Must call count_by_severity_aql exactly twice — Critical then High."""
+        """Must request one Critical + High matrix (two AQL cells sent together)."""
         product_id_to_name = {"101": "Product A", "202": "Product B"}
         mock_loader = MagicMock()
-        mock_loader.count_by_severity_aql.side_effect = [
-            {"101": 10, "202": 5},  # Critical call
-            {"101": 30, "202": 20},  # High call
-        ]
+        mock_loader.count_matrix_aql.return_value = _matrix(critical={"101": 10, "202": 5}, high={"101": 30, "202": 20})
 
         with patch(_LOADER_CLASS, return_value=mock_loader):
             query_current_vulnerabilities_aql("my-hierarchy", product_id_to_name)
 
-        assert mock_loader.count_by_severity_aql.call_count == 2
-        calls = mock_loader.count_by_severity_aql.call_args_list
-        assert calls[0][0][0] == "Critical"
-        assert calls[1][0][0] == "High"
+        mock_loader.count_matrix_aql.assert_called_once()
+        assert mock_loader.count_matrix_aql.call_args[0][0] == ["Critical", "High"]
 
     def test_passes_hierarchy_and_production_environment(self):
         """hierarchy and environment='Production' must be forwarded to every AQL call."""
         product_id_to_name = {"101": "Product A"}
         mock_loader = MagicMock()
-        mock_loader.count_by_severity_aql.return_value = {"101": 0}
+        mock_loader.count_matrix_aql.return_value = _matrix(critical={"101": 0}, high={"101": 0})
 
         with patch(_LOADER_CLASS, return_value=mock_loader):
             query_current_vulnerabilities_aql("test-hierarchy-value", product_id_to_name)
 
-        for call in mock_loader.count_by_severity_aql.call_args_list:
-            assert call[0][1] == "test-hierarchy-value"
-            assert call[1].get("environment") == "Production"
+        call = mock_loader.count_matrix_aql.call_args
+        assert call[0][1] == "test-hierarchy-value"
+        assert call[1].get("environment") == "Production"
 
     def test_totals_summed_across_all_products(self):
         """total_count must be the sum of all per-product critical + high counts."""
         product_id_to_name = {"101": "Product A", "202": "Product B"}
         mock_loader = MagicMock()
-        mock_loader.count_by_severity_aql.side_effect = [
-            {"101": 10, "202": 5},  # Critical
-            {"101": 30, "202": 20},  # High
-        ]
+        mock_loader.count_matrix_aql.return_value = _matrix(critical={"101": 10, "202": 5}, high={"101": 30, "202": 20})
 
         with patch(_LOADER_CLASS, return_value=mock_loader):
             result = query_current_vulnerabilities_aql("hier", product_id_to_name)
@@ -93,10 +90,7 @@ class TestQueryCurrentVulnerabilitiesAql:
         """product_breakdown must reflect individual AQL counts per product."""
         product_id_to_name = {"101": "Product A", "202": "Product B"}
         mock_loader = MagicMock()
-        mock_loader.count_by_severity_aql.side_effect = [
-            {"101": 10, "202": 5},  # Critical
-            {"101": 30, "202": 20},  # High
-        ]
+        mock_loader.count_matrix_aql.return_value = _matrix(critical={"101": 10, "202": 5}, high={"101": 30, "202": 20})
 
         with patch(_LOADER_CLASS, return_value=mock_loader):
             result = query_current_vulnerabilities_aql("hier", product_id_to_name)
@@ -108,7 +102,7 @@ class TestQueryCurrentVulnerabilitiesAql:
     def test_findings_list_always_empty(self):
         """findings key must always be an empty list — no raw findings fetched."""
         mock_loader = MagicMock()
-        mock_loader.count_by_severity_aql.return_value = {}
+        mock_loader.count_matrix_aql.return_value = _matrix(critical={}, high={})
 
         with patch(_LOADER_CLASS, return_value=mock_loader):
             result = query_current_vulnerabilities_aql("hier", {"101": "Product A"})
@@ -120,10 +114,7 @@ class TestQueryCurrentVulnerabilitiesAql:
         product_id_to_name = {"101": "Product A", "202": "Product B"}
         mock_loader = MagicMock()
         # Product 202 absent from both responses
-        mock_loader.count_by_severity_aql.side_effect = [
-            {"101": 8},  # Critical — 202 missing
-            {"101": 12},  # High — 202 missing
-        ]
+        mock_loader.count_matrix_aql.return_value = _matrix(critical={"101": 8}, high={"101": 12})
 
         with patch(_LOADER_CLASS, return_value=mock_loader):
             result = query_current_vulnerabilities_aql("hier", product_id_to_name)
@@ -135,7 +126,7 @@ class TestQueryCurrentVulnerabilitiesAql:
     def test_returns_zeros_when_aql_returns_empty_dict(self):
         """Empty AQL responses must return zero counts without raising exceptions."""
         mock_loader = MagicMock()
-        mock_loader.count_by_severity_aql.return_value = {}
+        mock_loader.count_matrix_aql.return_value = _matrix(critical={}, high={})
 
         with patch(_LOADER_CLASS, return_value=mock_loader):
             result = query_current_vulnerabilities_aql("hier", {"101": "Product A"})
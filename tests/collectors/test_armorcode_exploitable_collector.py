@@ -183,7 +183,7 @@ class TestCollectExploitableMetrics:
             ),
             patch(
                 "execution.collectors.armorcode_exploitable_collector._count_by_severity",
-                side_effect=[critical_counts, high_counts, medium_counts],
+                return_value={"Critical": critical_counts, "High": high_counts, "Medium": medium_counts},
             ),
             patch("execution.collectors.armorcode_exploitable_collector.get_config") as mock_cfg,
         ):
@@ -212,7 +212,7 @@ class TestCollectExploitableMetrics:
             ),
             patch(
                 "execution.collectors.armorcode_exploitable_collector._count_by_severity",
-                side_effect=[critical_counts, high_counts, medium_counts],
+                return_value={"Critical": critical_counts, "High": high_counts, "Medium": medium_counts},
             ),
             patch("execution.collectors.armorcode_exploitable_collector.get_config") as mock_cfg,
         ):
@@ -239,7 +239,7 @@ class TestCollectExploitableMetrics:
             ),
             patch(
                 "execution.collectors.armorcode_exploitable_collector._count_by_severity",
-                side_effect=[critical_counts, high_counts, medium_counts],
+                return_value={"Critical": critical_counts, "High": high_counts, "Medium": medium_counts},
             ),
             patch("execution.collectors.armorcode_exploitable_collector.get_config") as mock_cfg,
         ):
@@ -252,3 +252,29 @@ class TestCollectExploitableMetrics:
         assert sev["medium"] == 0
         assert sev["total"] == 7
         assert result["metrics"]["current_total"] == 7
+
+
+class TestCountBySeverity:
+    """Test _count_by_severity() asks the loader for the whole severity matrix."""
+
+    def test_requests_kev_matrix_in_one_batch(self):
+        """One count_matrix_aql call covers Critical, High and Medium for the KEV scope."""
+        from execution.collectors.armorcode_exploitable_collector import _count_by_severity
+
+        mock_loader = MagicMock()
+        mock_loader.count_matrix_aql.return_value = {"exploitable": {"Critical": {"1": 2}, "High": {}, "Medium": {}}}
+
+        with patch(
+            "execution.collectors.armorcode_exploitable_collector.ArmorCodeVulnerabilityLoader",
+            return_value=mock_loader,
+        ):
+            counts = _count_by_severity("test-hierarchy")
+
+        assert counts == {"Critical": {"1": 2}, "High": {}, "Medium": {}}
+        mock_loader.count_matrix_aql.assert_called_once()
+        args, kwargs = mock_loader.count_matrix_aql.call_args
+        assert args == (["Critical", "High", "Medium"], "test-hierarchy")
+        assert kwargs["environment"] is None
+        scope = kwargs["scopes"]["exploitable"]
+        assert scope.cisa_kev is True
+        assert scope.asset_cloud_providers == ["aws", "azure"]
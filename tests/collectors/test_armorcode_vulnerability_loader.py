@@ -5,6 +5,8 @@ Comprehensive test coverage for ArmorCode vulnerability loading:
 - ArmorCodeVulnerabilityLoader initialization
 - get_product_ids() - Product ID mapping with pagination
 - load_vulnerabilities_for_products() - Full vulnerability loading pipeline
+- count_matrix_aql() - Severity × scope count matrix, deduplicated and cached per run
+- fetch_findings_batch_aql() - Concurrent findings fetch matches per-scope fetch_findings_aql()
 - _calculate_age_days() - Date parsing and age calculation
 - group_by_product() - Vulnerability grouping
 - VulnerabilityDetail dataclass properties
@@ -15,13 +17,18 @@ Run with:
     pytest tests/collectors/test_armorcode_vulnerability_loader.py -v
 """
 
+import asyncio
 import json
+import re
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
 
+from execution.collectors.aql_count_cache import use_aql_count_cache
 from execution.collectors.armorcode_vulnerability_loader import (
+    AqlCountScope,
+    AqlFindingsScope,
     ArmorCodeVulnerabilityLoader,
     VulnerabilityDetail,
 )
@@ -705,6 +712,103 @@ class TestCountByBucketAql:
         assert "AppCheck" in aql
 
 
+def _count_post(counts_by_severity: dict[str, dict[str, int]]):
+    """Fake count endpoint answering each AQL with the counts for its severity."""
+
+    def post(url, **kwargs):
+        aql = kwargs["json"]["filters"]["aqlQuery"][0]
+        m = re.search(r"severity = (\w+)", aql)
+        assert m is not None
+        severity = m.group(1)
+        resp = Mock()
+        resp.status_code = 200
+        resp.json.return_value = {pid: {"count": n} for pid, n in counts_by_severity.get(severity, {}).items()}
+        return resp
+
+    return post
+
+
+class TestCountMatrixAql:
+    """Tests for count_matrix_aql() and the per-run AQL count cache."""
+
+    @patch("execution.collectors.armorcode_vulnerability_loader.post")
+    def test_one_request_per_cell(self, mock_post, loader):
+        """Every scope × severity cell is counted, with scope filters in the AQL."""
+        mock_post.side_effect = _count_post({"Critical": {"pid-1": 3}, "High": {"pid-1": 7, "pid-2": 1}})
+        scopes = {
+            "all": AqlCountScope(),
+            "kev": AqlCountScope(sources=["Cortex XDR"], asset_cloud_providers=["aws", "azure"], cisa_kev=True),
+        }
+
+        result = loader.count_matrix_aql(["Critical", "High"], "access group/legal", scopes=scopes)
+
+        assert result["all"] == {"Critical": {"pid-1": 3}, "High": {"pid-1": 7, "pid-2": 1}}
+        assert result["kev"] == result["all"]
+        assert mock_post.call_count == 4
+        aqls = [call.kwargs["json"]["filters"]["aqlQuery"][0] for call in mock_post.call_args_list]
+        kev_aqls = [aql for aql in aqls if "isCISAKEV = true" in aql]
+        assert len(kev_aqls) == 2
+        assert all(
+            "source IN ('Cortex XDR')" in aql and "assetCloudProviders IN (aws,azure)" in aql for aql in kev_aqls
+        )
+
+    @patch("execution.collectors.armorcode_vulnerability_loader.post")
+    def test_identical_cells_sent_once(self, mock_post, loader):
+        """Scopes with the same filters share one request per severity."""
+        mock_post.side_effect = _count_post({"Critical": {"pid-1": 2}})
+
+        result = loader.count_matrix_aql(["Critical"], "h", scopes={"a": AqlCountScope(), "b": AqlCountScope()})
+
+        assert result == {"a": {"Critical": {"pid-1": 2}}, "b": {"Critical": {"pid-1": 2}}}
+        assert mock_post.call_count == 1
+
+    @patch("execution.collectors.armorcode_vulnerability_loader.post")
+    def test_run_cache_shared_between_processes_of_a_run(self, mock_post, loader, tmp_path):
+        """A later step of the same run reads counts from the cache file; another run does not."""
+        mock_post.side_effect = _count_post({"Critical": {"pid-1": 3}, "High": {"pid-1": 7}})
+        cache_path = tmp_path / "aql_count_cache.json"
+
+        with use_aql_count_cache(cache_path, run_id="run-1"):
+            loader.count_matrix_aql(["Critical", "High"], "h")
+        with use_aql_count_cache(cache_path, run_id="run-1") as cache:
+            assert loader.count_by_severity_aql("High", "h") == {"pid-1": 7}
+            assert (cache.hits, cache.misses) == (1, 0)
+        assert mock_post.call_count == 2
+
+        with use_aql_count_cache(cache_path, run_id="run-2"):
+            loader.count_by_severity_aql("High", "h")
+        assert mock_post.call_count == 3
+
+    @patch("execution.collectors.armorcode_vulnerability_loader.post")
+    def test_failed_cells_not_cached(self, mock_post, loader, tmp_path):
+        """An HTTP error yields {} and the next request for the cell is retried."""
+        error = Mock(status_code=500, text="Internal Server Error")
+        ok = Mock(status_code=200)
+        ok.json.return_value = {"pid-1": {"count": 4}}
+        mock_post.side_effect = [error, ok]
+
+        with use_aql_count_cache(tmp_path / "aql_count_cache.json"):
+            assert loader.count_by_severity_aql("Critical", "h") == {}
+            assert loader.count_by_severity_aql("Critical", "h") == {"pid-1": 4}
+        assert mock_post.call_count == 2
+
+    @patch("execution.collectors.armorcode_vulnerability_loader.time.sleep")
+    @patch("execution.collectors.armorcode_vulnerability_loader.post")
+    def test_rate_limited_cell_retried(self, mock_post, mock_sleep, loader):
+        """HTTP 429 waits for Retry-After and retries the same cell."""
+        limited = Mock(status_code=429, headers={"Retry-After": "2"})
+        ok = Mock(status_code=200)
+        ok.json.return_value = {"pid-1": {"count": 1}}
+        mock_post.side_effect = [limited, ok]
+
+        assert loader.count_matrix_aql(["Medium"], "h") == {"all": {"Medium": {"pid-1": 1}}}
+        mock_sleep.assert_called_once_with(2)
+
+    def test_returns_empty_when_no_config(self, loader_no_config):
+        """Returns empty dict when ArmorCode is not configured."""
+        assert loader_no_config.count_matrix_aql(["Critical"], "h") == {}
+
+
 # ---------------------------------------------------------------------------
 # fetch_findings_aql + _age_from_epoch_ms
 # ---------------------------------------------------------------------------
@@ -812,12 +916,35 @@ class TestFetchFindingsAql:
 
     @patch("execution.collectors.armorcode_vulnerability_loader.post")
     def test_returns_empty_on_http_error(self, mock_post, loader):
-        """Returns empty list when API returns non-200."""
-        mock_post.return_value = Mock(status_code=429, text="Too Many Requests")
+        """Returns empty list when API returns a non-200, non-429 status."""
+        mock_post.return_value = Mock(status_code=500, text="Internal Server Error")
 
         results = loader.fetch_findings_aql("access group/legal")
 
         assert results == []
+        assert mock_post.call_count == 1
+
+    @patch("execution.collectors.armorcode_vulnerability_loader.time.sleep")
+    @patch("execution.collectors.armorcode_vulnerability_loader.post")
+    def test_rate_limited_page_retried(self, mock_post, mock_sleep, loader):
+        """HTTP 429 waits for Retry-After and retries the same page."""
+        limited = Mock(status_code=429, headers={"Retry-After": "2"})
+        ok = Mock(status_code=200, json=Mock(return_value=_page_response([_aql_record(id="1")])))
+        mock_post.side_effect = [limited, ok]
+
+        results = loader.fetch_findings_aql("access group/legal")
+
+        assert [v.id for v in results] == ["1"]
+        mock_sleep.assert_called_once_with(2)
+
+    @patch("execution.collectors.armorcode_vulnerability_loader.time.sleep")
+    @patch("execution.collectors.armorcode_vulnerability_loader.post")
+    def test_rate_limited_page_gives_up_after_max_retries(self, mock_post, mock_sleep, loader):
+        """Three 429 retries, then the page is abandoned."""
+        mock_post.return_value = Mock(status_code=429, headers={"Retry-After": "0"})
+
+        assert loader.fetch_findings_aql("access group/legal") == []
+        assert mock_post.call_count == 4
 
     def test_returns_empty_when_not_configured(self, loader_no_config):
         """Returns empty list when API key is not configured."""
@@ -852,6 +979,131 @@ class TestFetchFindingsAql:
         assert results[0].environment is None
 
 
+def _fake_findings(payload: dict, limited: set | None = None, always_limited: str | None = None) -> Mock:
+    """Deterministic AQL findings responder: records depend on the product, sources and page of the query."""
+    aql = payload["filters"]["aqlQuery"][0]
+    page, size = payload["page"], payload["size"]
+    resp = Mock(headers={}, text="")
+    key = (aql, page)
+    if (always_limited and f"product = {always_limited}" in aql) or (limited is not None and key not in limited):
+        if limited is not None:
+            limited.add(key)
+        resp.status_code = 429
+        resp.headers = {"Retry-After": "0"}
+        return resp
+
+    m = re.search(r"product = (\w+)", aql)
+    product = m.group(1) if m else "all"
+    total = (len(product) + aql.count(",")) % 5 + 2 if m else 7  # unscoped query spans several pages
+    start = page * size
+    content = [
+        _aql_record(id=f"{len(aql)}{i}", product_name=f"P{product}", source="Mend")
+        for i in range(start, min(start + size, total))
+    ]
+    resp.status_code = 200
+    resp.json.return_value = _page_response(content, last=start + size >= total, total=total)
+    return resp
+
+
+class TestFetchFindingsBatchAql:
+    """Tests for the concurrent fetch_findings_batch_aql()."""
+
+    SCOPES = {
+        ("A", "CODE"): AqlFindingsScope(product_id="101", sources=["Mend", "SonarQube"]),
+        ("A", "CLOUD"): AqlFindingsScope(product_id="101", sources=["Prisma Cloud"]),
+        ("B", "CODE"): AqlFindingsScope(product_id="20202", sources=["Mend"]),
+        "kev": AqlFindingsScope(cisa_kev=True),
+        "all": AqlFindingsScope(),
+    }
+
+    def _run_sync(self, loader, page_size, always_limited=None):
+        with (
+            patch("execution.collectors.armorcode_vulnerability_loader.time.sleep"),
+            patch(
+                "execution.collectors.armorcode_vulnerability_loader.post",
+                side_effect=lambda url, **kwargs: _fake_findings(kwargs["json"], always_limited=always_limited),
+            ),
+        ):
+            return {
+                key: loader.fetch_findings_aql(
+                    "h",
+                    page_size=page_size,
+                    sources=scope.sources,
+                    product_id=scope.product_id,
+                    cisa_kev=scope.cisa_kev,
+                )
+                for key, scope in self.SCOPES.items()
+            }
+
+    def _run_batch(self, loader, page_size, limited=None, always_limited=None):
+        async def fake_post(url, **kwargs):
+            return _fake_findings(kwargs["json"], limited, always_limited)
+
+        with (
+            patch("execution.collectors.armorcode_vulnerability_loader.time.sleep") as mock_sleep,
+            patch(
+                "execution.collectors.armorcode_vulnerability_loader.AsyncSecureHTTPClient.post",
+                side_effect=fake_post,
+            ) as mock_post,
+        ):
+            result = loader.fetch_findings_batch_aql("h", self.SCOPES, page_size=page_size, rate_per_second=1000)
+        mock_sleep.assert_not_called()
+        return result, mock_post
+
+    @pytest.mark.parametrize("page_size", [2, 50])
+    def test_matches_per_scope_fetch(self, loader, page_size):
+        """Each scope gets exactly the records fetch_findings_aql() returns for it, keys in scope order."""
+        expected = self._run_sync(loader, page_size)
+
+        actual, _ = self._run_batch(loader, page_size)
+
+        assert list(actual) == list(self.SCOPES)
+        assert actual == expected
+        assert len(expected["all"]) == 7
+
+    def test_rate_limited_pages_retried_without_blocking_sleep(self, loader):
+        """A 429 pauses the batch on the limiter and the page is retried; results are unchanged."""
+        expected = self._run_sync(loader, 2)
+        limited: set = set()
+
+        actual, mock_post = self._run_batch(loader, 2, limited=limited)
+
+        assert actual == expected
+        assert mock_post.call_count == 2 * len(limited)
+
+    def test_gives_up_after_max_retries_like_sync_path(self, loader):
+        """A scope that stays throttled yields [] after three retries, as fetch_findings_aql() does."""
+        expected = self._run_sync(loader, 2, always_limited="20202")
+
+        actual, _ = self._run_batch(loader, 2, always_limited="20202")
+
+        assert actual[("B", "CODE")] == []
+        assert actual == expected
+
+    def test_async_variant_runs_in_event_loop(self, loader):
+        """fetch_findings_batch_aql_async() can be awaited from async callers."""
+
+        async def fake_post(url, **kwargs):
+            return _fake_findings(kwargs["json"])
+
+        with patch(
+            "execution.collectors.armorcode_vulnerability_loader.AsyncSecureHTTPClient.post", side_effect=fake_post
+        ):
+            result = asyncio.run(loader.fetch_findings_batch_aql_async("h", {"kev": AqlFindingsScope(cisa_kev=True)}))
+
+        assert len(result["kev"]) > 0
+
+    def test_empty_scopes_send_nothing(self, loader):
+        """No scopes, no requests."""
+        with patch("execution.collectors.armorcode_vulnerability_loader.AsyncSecureHTTPClient.post") as mock_post:
+            assert loader.fetch_findings_batch_aql("h", {}) == {}
+        mock_post.assert_not_called()
+
+    def test_returns_empty_when_no_config(self, loader_no_config):
+        """Returns empty dict when ArmorCode is not configured."""
+        assert loader_no_config.fetch_findings_batch_aql("h", self.SCOPES) == {}
+
+
 class TestAgeFromEpochMs:
     def test_calculates_age_in_days(self, loader):
         """Returns correct age for a known timestamp."""
@@ -13,7 +13,7 @@ import asyncio
 import json
 import sys
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, mock_open, patch
 
 import pytest
 
@@ -24,8 +24,8 @@ from execution.collectors.base import BaseCollector
 class TestCollector(BaseCollector):
     """Concrete implementation of BaseCollector for testing"""
 
-    def __init__(self, name: str = "test", lookback_days: int = 90):
-        super().__init__(name=name, lookback_days=lookback_days)
+    def __init__(self, name: str = "test", lookback_days: int = 90, rest_client=None):
+        super().__init__(name=name, lookback_days=lookback_days, rest_client=rest_client)
         self.collected_projects: list[str] = []
 
     async def collect(self, project: str, rest_client: AzureDevOpsRESTClient):
@@ -160,6 +160,16 @@ class TestBaseCollectorGetRestClient:
         with pytest.raises(ValueError, match="Invalid credentials"):
             collector.get_rest_client()
 
+    @patch("execution.collectors.base.get_ado_rest_client")
+    def test_get_rest_client_uses_shared_client(self, mock_get_client):
+        """Test an injected client is returned without creating a new one"""
+        shared_client = Mock(spec=AzureDevOpsRESTClient)
+
+        collector = TestCollector(rest_client=shared_client)
+
+        assert collector.get_rest_client() is shared_client
+        mock_get_client.assert_not_called()
+
 
 class TestBaseCollectorConcurrentCollection:
     """Test concurrent collection orchestration"""
@@ -236,7 +246,7 @@ class TestBaseCollectorRun:
 
         # Patch methods
         with patch.object(collector, "load_discovery_data", return_value=sample_discovery_data):
-            with patch.object(collector, "get_rest_client", return_value=Mock()):
+            with patch.object(collector, "get_rest_client", return_value=MagicMock()):
                 with patch.object(collector, "save_metrics", return_value=True):
                     result = await collector.run()
 
@@ -274,7 +284,7 @@ class TestBaseCollectorRun:
         collector = TestCollector()
 
         with patch.object(collector, "load_discovery_data", return_value=sample_discovery_data):
-            with patch.object(collector, "get_rest_client", return_value=Mock()):
+            with patch.object(collector, "get_rest_client", return_value=MagicMock()):
                 with patch.object(collector, "save_metrics", return_value=False):
                     result = await collector.run()
 
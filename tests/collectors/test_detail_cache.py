@@ -0,0 +1,192 @@
+"""
+Unit Tests for the Persistent Detail Cache
+
+Test Coverage:
+- Cache hits skip the REST call; entries persist across runs
+- Keys separate kind, project, repository and object ID
+- Least recently used entries are evicted beyond the size budget
+- Sampling caps are raised only while a cache is active
+- Collectors route PR/commit/build detail fetches through the cache
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from execution.collectors import ado_collaboration_metrics, ado_deployment_metrics, ado_risk_metrics
+from execution.collectors.detail_cache import (
+    DetailCache,
+    detail_key,
+    detail_limit,
+    fetch_detail,
+    get_current_detail_cache,
+    use_detail_cache,
+)
+from execution.domain.constants import sampling_config
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Active detail cache backed by a temp database"""
+    with use_detail_cache(tmp_path / "details.db") as active:
+        yield active
+
+
+class TestFetchDetail:
+    """Test read-through caching"""
+
+    @pytest.mark.asyncio
+    async def test_second_fetch_is_served_from_cache(self, cache):
+        """Test the REST call is made once per object"""
+        fetch = AsyncMock(return_value={"value": [1, 2]})
+
+        first = await fetch_detail("pr_threads", "ProjectA", "repo-1", 42, fetch)
+        second = await fetch_detail("pr_threads", "ProjectA", "repo-1", 42, fetch)
+
+        assert first == second == {"value": [1, 2]}
+        assert fetch.await_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_entries_persist_across_runs(self, tmp_path):
+        """Test a new run reads what an earlier run stored"""
+        with use_detail_cache(tmp_path / "details.db"):
+            await fetch_detail("build_changes", "ProjectA", "", 7, AsyncMock(return_value={"value": ["c"]}))
+
+        fetch = AsyncMock()
+        with use_detail_cache(tmp_path / "details.db"):
+            assert await fetch_detail("build_changes", "ProjectA", "", 7, fetch) == {"value": ["c"]}
+        fetch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, cache):
+        """Test an exception propagates and the next call retries"""
+        fetch = AsyncMock(side_effect=[RuntimeError("503"), {"value": []}])
+
+        with pytest.raises(RuntimeError):
+            await fetch_detail("commit_changes", "ProjectA", "repo-1", "abc", fetch)
+
+        assert await fetch_detail("commit_changes", "ProjectA", "repo-1", "abc", fetch) == {"value": []}
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_active_cache_calls_through(self):
+        """Test fetch_detail is a plain call when no cache is enabled"""
+        fetch = AsyncMock(return_value={"value": []})
+
+        assert get_current_detail_cache() is None
+        await fetch_detail("pr_commits", "ProjectA", "repo-1", 1, fetch)
+        await fetch_detail("pr_commits", "ProjectA", "repo-1", 1, fetch)
+
+        assert fetch.await_count == 2
+
+    def test_keys_separate_every_component(self):
+        """Test the same ID in another kind, project or repository is a different object"""
+        keys = {
+            detail_key("pr_threads", "A", "repo-1", 1),
+            detail_key("pr_commits", "A", "repo-1", 1),
+            detail_key("pr_threads", "B", "repo-1", 1),
+            detail_key("pr_threads", "A", "repo-2", 1),
+            detail_key("pr_threads", "A", "repo-1", 2),
+        }
+        assert len(keys) == 5
+        assert detail_key("build_changes", "A", "", 7) == detail_key("build_changes", "A", "", "7")
+
+
+class TestEviction:
+    """Test the size budget"""
+
+    def test_least_recently_used_entry_evicted_first(self, tmp_path):
+        """Test eviction removes the entry used longest ago"""
+        cache = DetailCache(tmp_path / "details.db")
+        cache.put("commit_changes", "A", "r", "old", {"value": ["old"]})
+        cache.put("commit_changes", "A", "r", "recent", {"value": ["recent"]})
+        cache.get("commit_changes", "A", "r", "old")  # touch: "recent" is now least recently used
+
+        assert cache.evict(target_bytes=cache.total_bytes - 1) == 1
+        assert cache.get("commit_changes", "A", "r", "recent") is None
+        assert cache.get("commit_changes", "A", "r", "old") == {"value": ["old"]}
+        cache.close()
+
+    def test_puts_stay_within_budget(self, tmp_path):
+        """Test the stored size never exceeds max_bytes"""
+        cache = DetailCache(tmp_path / "details.db", max_bytes=10_000)
+        payload = [str(i) * 40 for i in range(200)]  # compresses to under 1 KB
+
+        for i in range(50):
+            cache.put("commit_changes", "A", "r", i, {"value": payload, "id": i})
+            assert cache.total_bytes <= cache.max_bytes
+
+        assert cache.evictions > 0
+        assert cache.get("commit_changes", "A", "r", 49) is not None
+        cache.close()
+
+    def test_total_bytes_restored_on_open(self, tmp_path):
+        """Test the stored size is read back when the database is reopened"""
+        cache = DetailCache(tmp_path / "details.db")
+        cache.put("pr_threads", "A", "r", 1, {"value": ["x"]})
+        size = cache.total_bytes
+        cache.put("pr_threads", "A", "r", 1, {"value": ["x"]})  # replace, not add
+        cache.close()
+
+        assert DetailCache(tmp_path / "details.db").total_bytes == size
+
+
+class TestCollectorIntegration:
+    """Test the collectors use the cache and its higher sampling caps"""
+
+    def test_detail_limit(self, tmp_path):
+        """Test the cached cap applies only inside use_detail_cache"""
+        assert detail_limit(10, 200) == 10
+        with use_detail_cache(tmp_path / "details.db"):
+            assert detail_limit(10, 200) == 200
+
+    def test_pr_sample_size_raised_with_cache(self, cache):
+        """Test PR sampling uses CACHED_PR_SAMPLE_SIZE while the cache is active"""
+        prs = [{"pr_id": i} for i in range(1000)]
+
+        assert len(ado_collaboration_metrics.sample_prs(prs)) == sampling_config.CACHED_PR_SAMPLE_SIZE
+
+    def test_pr_sample_size_default_without_cache(self):
+        """Test PR sampling keeps PR_SAMPLE_SIZE without a cache"""
+        prs = [{"pr_id": i} for i in range(1000)]
+
+        assert len(ado_collaboration_metrics.sample_prs(prs)) == sampling_config.PR_SAMPLE_SIZE
+
+    @pytest.mark.asyncio
+    async def test_pr_iterations_cached(self, cache):
+        """Test a second iteration count for the same PRs makes no REST calls"""
+        client = AsyncMock()
+        client.get_pull_request_iterations.return_value = {"value": [{}, {}]}
+        prs = [{"pr_id": i, "repository_id": "repo-1"} for i in range(5)]
+
+        await ado_collaboration_metrics.calculate_review_iteration_count(client, "ProjectA", prs)
+        result = await ado_collaboration_metrics.calculate_review_iteration_count(client, "ProjectA", prs)
+
+        assert result["median_iterations"] == 2
+        assert client.get_pull_request_iterations.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_commit_changes_cached(self, cache):
+        """Test commit file changes are fetched once"""
+        client = AsyncMock()
+        client.get_changes.return_value = {"changes": [{"item": {"path": "/src/a.py"}}]}
+
+        await ado_risk_metrics._fetch_commit_changes(client, "abc12345", "repo-1", "ProjectA")
+        result = await ado_risk_metrics._fetch_commit_changes(client, "abc12345", "repo-1", "ProjectA")
+
+        assert result == (1, ["/src/a.py"])
+        assert client.get_changes.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_build_changes_cached(self, cache):
+        """Test build changes are fetched once"""
+        client = AsyncMock()
+        client.get_build_changes.return_value = {"value": [{"id": "abc", "timestamp": "2026-01-01T00:00:00Z"}]}
+        build = {"build_id": 7, "finish_time": "2026-01-02T00:00:00Z", "source_version": "abc"}
+
+        await ado_deployment_metrics._get_commit_timestamp_from_build(client, "ProjectA", build)
+        commit_time = await ado_deployment_metrics._get_commit_timestamp_from_build(client, "ProjectA", build)
+
+        assert commit_time is not None
+        assert client.get_build_changes.await_count == 1
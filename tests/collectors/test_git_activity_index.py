@@ -0,0 +1,153 @@
+"""
+Unit Tests for the Git Activity Index
+
+Test Coverage:
+- $skip paging of the commit log
+- Each repository's log is fetched once per run, shared by concurrent callers
+- Later runs fetch only from the last seen commit date
+- Change details are stored once and reused by the risk collector
+- Ownership and risk read the same dataset; fallback without an active index
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from execution.collectors import ado_ownership_metrics, ado_risk_metrics
+from execution.collectors.git_activity_index import (
+    fetch_commit_log,
+    get_current_git_activity_index,
+    load_repo_commits,
+    use_git_activity_index,
+)
+
+
+def _commit(commit_id: str, days_ago: float, author: str = "Dev A") -> dict:
+    date = (datetime.now(UTC) - timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {
+        "commitId": commit_id,
+        "comment": "change",
+        "author": {"name": author, "email": f"{author}@example.com", "date": date},
+        "committer": {"name": author, "date": date},
+    }
+
+
+def _mock_client(commits: list[dict]) -> AsyncMock:
+    """REST client whose get_commits pages through `commits` (newest first) honouring fromDate."""
+    client = AsyncMock()
+    client.get_repositories.return_value = {"value": [{"id": "repo-1", "name": "Repo"}]}
+
+    def get_commits(project, repository_id, from_date=None, to_date=None, top=1000, skip=0):
+        since = datetime.fromisoformat(from_date.replace("Z", "+00:00"))
+        matching = [
+            c for c in commits if datetime.fromisoformat(c["committer"]["date"].replace("Z", "+00:00")) >= since
+        ]
+        return {"value": matching[skip : skip + top]}
+
+    client.get_commits.side_effect = get_commits
+    client.get_changes.return_value = {"changes": [{"item": {"path": "/src/a.py"}}, {"item": {"path": "/src/b.py"}}]}
+    return client
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Active git activity index backed by a temp database"""
+    with use_git_activity_index(tmp_path / "git.db") as active:
+        yield active
+
+
+class TestSync:
+    """Test fetching and incremental updates"""
+
+    @pytest.mark.asyncio
+    async def test_fetch_commit_log_follows_skip_paging(self):
+        """Test pages are requested until a short page is returned"""
+        client = _mock_client([_commit(f"c{i}", i / 10) for i in range(25)])
+
+        commits = await fetch_commit_log(client, "P", "repo-1", datetime.now(UTC) - timedelta(days=30), page_size=10)
+
+        assert len(commits) == 25
+        assert [call.kwargs["skip"] for call in client.get_commits.call_args_list] == [0, 10, 20]
+
+    @pytest.mark.asyncio
+    async def test_repo_fetched_once_per_run(self, index):
+        """Test concurrent callers for the same repository share one sync"""
+        client = _mock_client([_commit("c1", 1), _commit("c2", 2)])
+
+        first, second = await asyncio.gather(
+            load_repo_commits(client, "P", "repo-1", 90), load_repo_commits(client, "P", "repo-1", 90)
+        )
+        await load_repo_commits(client, "P", "repo-1", 90)
+
+        assert [c["commit_id"] for c in first] == [c["commit_id"] for c in second] == ["c1", "c2"]
+        assert client.get_commits.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_later_run_fetches_from_last_seen_commit(self, tmp_path):
+        """Test the next run only pages commits since the watermark (minus overlap)"""
+        commits = [_commit("c2", 10), _commit("c1", 60)]
+        with use_git_activity_index(tmp_path / "git.db"):
+            await load_repo_commits(_mock_client(commits), "P", "repo-1", 90)
+
+        client = _mock_client([_commit("c3", 1), *commits])
+        with use_git_activity_index(tmp_path / "git.db"):
+            result = await load_repo_commits(client, "P", "repo-1", 90)
+
+        from_date = datetime.fromisoformat(client.get_commits.call_args.kwargs["from_date"].replace("Z", "+00:00"))
+        assert datetime.now(UTC) - from_date < timedelta(days=14)
+        assert [c["commit_id"] for c in result] == ["c3", "c2", "c1"]
+
+    @pytest.mark.asyncio
+    async def test_longer_lookback_refetches_older_range(self, index):
+        """Test a lookback beyond the synced range pages the full period"""
+        client = _mock_client([_commit("c1", 5), _commit("c0", 150)])
+
+        assert len(await load_repo_commits(client, "P", "repo-1", 90)) == 1
+        assert len(await load_repo_commits(client, "P", "repo-1", 180)) == 2
+        assert client.get_commits.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_active_index_calls_through(self):
+        """Test the fallback returns transformed REST commits"""
+        client = _mock_client([_commit("c1", 1)])
+
+        assert get_current_git_activity_index() is None
+        commits = await load_repo_commits(client, "P", "repo-1", 90)
+
+        assert commits[0]["commit_id"] == "c1"
+        assert commits[0]["author_name"] == "Dev A"
+
+
+class TestCollectors:
+    """Test ownership and risk share one dataset"""
+
+    @pytest.mark.asyncio
+    async def test_ownership_and_risk_share_commit_log(self, index):
+        """Test both collectors together list repositories and commits once"""
+        client = _mock_client([_commit("c1", 1, "Dev A"), _commit("c2", 2, "Dev B"), _commit("c3", 3, "Dev A")])
+
+        activity = await ado_ownership_metrics.calculate_developer_active_days(client, "P", 90)
+        risk = await ado_risk_metrics.collect_risk_metrics_for_project(
+            client, {"project_name": "P", "project_key": "P"}, {"lookback_days": 90}
+        )
+
+        assert activity["total_commits"] == 3
+        assert activity["developers"][0] == {"developer": "Dev A", "active_days": 2, "commits": 3}
+        assert risk["code_churn"]["total_commits"] == 3
+        assert risk["code_churn"]["total_file_changes"] == 6
+        assert client.get_repositories.call_count == 1
+        assert client.get_commits.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_commit_changes_stored_once(self, index):
+        """Test a second risk pass reads change details from the index"""
+        client = _mock_client([_commit("c1", 1), _commit("c2", 2)])
+
+        await ado_risk_metrics.query_recent_commits(client, "P", "repo-1", days=90)
+        commits = await ado_risk_metrics.query_recent_commits(client, "P", "repo-1", days=90)
+
+        assert client.get_changes.await_count == 2
+        assert commits[0]["files"] == ["/src/a.py", "/src/b.py"]
+        assert index.get_changes("P", "repo-1", "c2") == (2, ["/src/a.py", "/src/b.py"])
@@ -0,0 +1,212 @@
+"""
+Unit Tests for the Per-Run Detail Snapshot
+
+Test Coverage:
+- Sections round-trip through gzip-compressed files stamped with the run ID
+- Sections from another run, unreadable files and unset run IDs are ignored
+- Snapshot-only mode raises instead of allowing a live query
+- Collectors save full (unstripped) payloads; dashboards render from them
+"""
+
+import gzip
+import json
+from unittest.mock import patch
+
+import pytest
+
+from execution.collectors import ado_deployment_metrics, ado_flow_metrics
+from execution.collectors.run_snapshot import (
+    RUN_ID_ENV,
+    SNAPSHOT_ONLY_ENV,
+    RunSnapshot,
+    SnapshotMissingError,
+    load_snapshot_section,
+    save_snapshot_section,
+)
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    """Refresh run with its snapshot under a temp working directory"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv(RUN_ID_ENV, "run-1")
+    monkeypatch.delenv(SNAPSHOT_ONLY_ENV, raising=False)
+    return RunSnapshot("run-1")
+
+
+@pytest.fixture
+def flow_week():
+    """Flow week with a detail list the history file strips"""
+    return {
+        "week_date": "2026-10-16",
+        "week_number": 42,
+        "projects": [
+            {
+                "project_name": "Alpha",
+                "total_open": 3,
+                "total_closed_90d": 5,
+                "work_type_metrics": {"Bug": {"aging_items": {"count": 1, "items": [{"id": 7, "title": "Fix it"}]}}},
+            }
+        ],
+    }
+
+
+class TestRunSnapshot:
+    """Test section storage"""
+
+    def test_round_trip(self, run):
+        """Test a saved section loads back unchanged"""
+        assert save_snapshot_section("quality", {"projects": [{"name": "Alpha"}]})
+
+        assert load_snapshot_section("quality") == {"projects": [{"name": "Alpha"}]}
+
+    def test_file_is_gzip_json_with_run_id(self, run):
+        """Test the section file is compressed JSON stamped with the run"""
+        save_snapshot_section("quality", {"projects": []})
+
+        with gzip.open(run.path("quality"), "rt", encoding="utf-8") as f:
+            document = json.load(f)
+
+        assert document["run_id"] == "run-1"
+        assert document["section"] == "quality"
+
+    def test_other_run_is_ignored(self, run, monkeypatch):
+        """Test sections written by a previous refresh are not reused"""
+        save_snapshot_section("quality", {"projects": []})
+        monkeypatch.setenv(RUN_ID_ENV, "run-2")
+
+        assert load_snapshot_section("quality") is None
+
+    def test_no_run_id_disables_snapshot(self, run, monkeypatch):
+        """Test nothing is written or read outside a refresh run"""
+        monkeypatch.delenv(RUN_ID_ENV)
+
+        assert save_snapshot_section("quality", {"projects": []}) is False
+        assert load_snapshot_section("quality") is None
+        assert not run.path("quality").exists()
+
+    def test_unreadable_section_is_ignored(self, run):
+        """Test a corrupt file falls back to a live query"""
+        run.path("flow").parent.mkdir(parents=True)
+        run.path("flow").write_bytes(b"not gzip")
+
+        assert load_snapshot_section("flow") is None
+
+    def test_snapshot_only_missing_section_raises(self, run, monkeypatch):
+        """Test snapshot-only mode forbids the live fallback"""
+        monkeypatch.setenv(SNAPSHOT_ONLY_ENV, "1")
+
+        with pytest.raises(SnapshotMissingError, match="risk"):
+            load_snapshot_section("risk")
+
+
+class TestCollectorSnapshots:
+    """Test collectors store what the history file strips"""
+
+    def test_flow_snapshot_keeps_detail_lists(self, run, flow_week, tmp_path):
+        """Test the snapshot keeps work item titles removed from history"""
+        assert ado_flow_metrics.save_flow_metrics(flow_week, output_file=str(tmp_path / "flow_history.json"))
+
+        snapshot = load_snapshot_section("flow")
+        history = json.loads((tmp_path / "flow_history.json").read_text(encoding="utf-8"))
+
+        assert snapshot["projects"][0]["work_type_metrics"]["Bug"]["aging_items"]["items"][0]["title"] == "Fix it"
+        assert "items" not in history["weeks"][-1]["projects"][0]["work_type_metrics"]["Bug"]["aging_items"]
+
+    def test_snapshot_written_even_when_history_rejects_week(self, run, tmp_path):
+        """Test an all-zero week is still rendered from the snapshot"""
+        week = {"week_date": "2026-10-16", "projects": [{"project_name": "Alpha", "build_success_rate": {}}]}
+
+        saved = ado_deployment_metrics.save_deployment_metrics(week, output_file=str(tmp_path / "d.json"))
+
+        assert saved is False
+        assert load_snapshot_section("deployment") == week
+
+
+class TestDashboardsRenderFromSnapshot:
+    """Test dashboard data loaders skip the APIs when the snapshot has their section"""
+
+    @pytest.mark.asyncio
+    async def test_flow_data_from_snapshot(self, run, flow_week):
+        """Test the flow dashboard makes no REST calls"""
+        from execution.dashboards import flow
+
+        save_snapshot_section("flow", flow_week)
+
+        with patch("execution.dashboards.flow.get_ado_rest_client") as get_client:
+            data = await flow._collect_flow_data()
+
+        get_client.assert_not_called()
+        assert data == flow_week
+
+    @pytest.mark.asyncio
+    async def test_deployment_data_from_snapshot(self, run):
+        """Test the deployment dashboard builds domain models from the snapshot"""
+        from execution.dashboards import deployment
+
+        project = {
+            "project_name": "Alpha",
+            "deployment_frequency": {"total_successful_builds": 4, "deployments_per_week": 0.3, "by_pipeline": {}},
+        }
+        save_snapshot_section("deployment", {"week_date": "2026-10-16", "projects": [project]})
+
+        with patch("execution.dashboards.deployment.get_ado_rest_client") as get_client:
+            metrics_list, raw_projects, collection_date = await deployment._query_deployment_data()
+
+        get_client.assert_not_called()
+        assert [m.project_name for m in metrics_list] == ["Alpha"]
+        assert raw_projects == [project]
+        assert collection_date == "2026-10-16"
+
+    @pytest.mark.asyncio
+    async def test_target_counts_from_snapshot(self, run):
+        """Test target counts come from the targets and quality sections"""
+        from execution.dashboards import targets
+
+        save_snapshot_section("targets", {"security": 120})
+        save_snapshot_section("quality", {"projects": [{"open_bugs_count": 30}, {"open_bugs_count": 12}]})
+
+        with (
+            patch("execution.dashboards.targets.ArmorCodeVulnerabilityLoader") as loader,
+            patch("execution.dashboards.targets.get_ado_rest_client") as get_client,
+        ):
+            state = await targets._query_current_state({})
+
+        loader.assert_not_called()
+        get_client.assert_not_called()
+        assert state == {"security": 120, "bugs": 42}
+
+    def test_security_records_round_trip(self, run):
+        """Test display records are rebuilt as VulnerabilityDetail objects"""
+        from execution.collectors.armorcode_vulnerability_loader import VulnerabilityDetail
+        from execution.dashboards import security_enhanced
+
+        vuln = VulnerabilityDetail(
+            id="1",
+            title="SQL injection",
+            description="",
+            severity="CRITICAL",
+            status="OPEN",
+            created_at="2026-10-01",
+            product="Alpha",
+            age_days=15,
+            source="Mend",
+        )
+        with (
+            patch.object(security_enhanced, "_load_id_map", return_value={"Alpha": "p1"}),
+            patch.object(security_enhanced, "get_config") as get_config,
+            patch.object(
+                security_enhanced,
+                "_collect_security_data",
+                return_value=({"Alpha": {"critical": 1, "high": 0}}, {}, {"Alpha": [vuln]}),
+            ),
+        ):
+            get_config.return_value.get_optional_env.return_value = "hierarchy"
+            save_snapshot_section(security_enhanced.SNAPSHOT_SECTION, security_enhanced.collect_security_snapshot())
+
+        aql_by_product, _, vulns_by_product = security_enhanced._security_data_from_snapshot(
+            load_snapshot_section(security_enhanced.SNAPSHOT_SECTION)
+        )
+
+        assert aql_by_product == {"Alpha": {"critical": 1, "high": 0}}
+        assert vulns_by_product == {"Alpha": [vuln]}
@@ -0,0 +1,190 @@
+"""
+Unit Tests for the Work Item Fetch Planner
+
+Test Coverage:
+- Overlapping IDs from different collectors are fetched once
+- Concurrent requests for the same IDs are coalesced
+- Union of registered field lists is fetched; views only carry requested fields
+- Failed IDs are reported and retried by later requests
+- Duplicate-fetch statistics
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from execution.collectors import work_item_fetch_planner
+from execution.collectors.work_item_fetch_planner import (
+    WorkItemFetchPlanner,
+    fetch_work_items_shared,
+    get_current_fetch_planner,
+    register_collector_fields,
+    shared_fetch_enabled,
+    use_work_item_fetch_planner,
+)
+from execution.utils.ado_batch_utils import BatchFetchError
+
+
+def _mock_client(missing: set[int] | None = None) -> AsyncMock:
+    """REST client returning every requested field for every ID (except `missing`)."""
+    missing = missing or set()
+
+    async def get_work_items(ids, fields=None):
+        await asyncio.sleep(0)
+        return {
+            "value": [
+                {"id": i, "rev": 1, "fields": {f: f"{f}-{i}" for f in fields or [] if f != "System.Id"}}
+                for i in ids
+                if i not in missing
+            ]
+        }
+
+    client = AsyncMock()
+    client.get_work_items.side_effect = get_work_items
+    return client
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry():
+    """Each test starts with an empty field registry"""
+    with patch.dict(work_item_fetch_planner._collector_fields, clear=True):
+        yield
+
+
+class TestDeduplication:
+    """Test that each item is downloaded once per run"""
+
+    @pytest.mark.asyncio
+    async def test_overlapping_ids_fetched_once(self):
+        """Test a second collector reuses items the first one fetched"""
+        planner = WorkItemFetchPlanner()
+        client = _mock_client()
+
+        await planner.fetch(client, "P", [1, 2, 3], ["System.State"], collector="quality")
+        items, failed = await planner.fetch(client, "P", [2, 3, 4], ["System.State"], collector="flow")
+
+        assert [item["System.Id"] for item in items] == [2, 3, 4]
+        assert failed == []
+        assert client.get_work_items.call_args.kwargs["ids"] == [4]
+        assert planner.stats()["duplicates_avoided"] == 2
+        assert planner.stats()["fetched"] == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_coalesced(self):
+        """Test IDs already in flight for another collector are awaited, not refetched"""
+        planner = WorkItemFetchPlanner()
+        client = _mock_client()
+
+        (quality, _), (flow, _) = await asyncio.gather(
+            planner.fetch(client, "P", [1, 2], ["System.State"], collector="quality"),
+            planner.fetch(client, "P", [1, 2], ["System.State"], collector="flow"),
+        )
+
+        assert client.get_work_items.call_count == 1
+        assert quality == flow
+
+    @pytest.mark.asyncio
+    async def test_projects_not_shared(self):
+        """Test the same ID in another project is fetched separately"""
+        planner = WorkItemFetchPlanner()
+        client = _mock_client()
+
+        await planner.fetch(client, "A", [1], ["System.State"], collector="quality")
+        await planner.fetch(client, "B", [1], ["System.State"], collector="quality")
+
+        assert client.get_work_items.call_count == 2
+
+
+class TestFieldUnion:
+    """Test union-of-fields fetching and per-collector views"""
+
+    @pytest.mark.asyncio
+    async def test_registered_fields_fetched_upfront(self):
+        """Test the first fetch requests every registered collector's fields"""
+        register_collector_fields("quality", ["System.Id", "System.Tags"])
+        register_collector_fields("ownership", ["System.AssignedTo"])
+        planner = WorkItemFetchPlanner()
+        client = _mock_client()
+
+        quality, _ = await planner.fetch(client, "P", [1], ["System.Id", "System.Tags"], collector="quality")
+        ownership, _ = await planner.fetch(client, "P", [1], ["System.AssignedTo"], collector="ownership")
+
+        assert client.get_work_items.call_count == 1
+        assert set(client.get_work_items.call_args.kwargs["fields"]) == {
+            "System.Id",
+            "System.Tags",
+            "System.AssignedTo",
+        }
+        assert "System.AssignedTo" not in quality[0]
+        assert ownership[0]["System.AssignedTo"] == "System.AssignedTo-1"
+
+    @pytest.mark.asyncio
+    async def test_unregistered_field_triggers_refetch(self):
+        """Test a request for a field nobody registered is not served from a narrower fetch"""
+        planner = WorkItemFetchPlanner()
+        client = _mock_client()
+
+        await planner.fetch(client, "P", [1], ["System.State"], collector="quality")
+        items, _ = await planner.fetch(client, "P", [1], ["System.Title"], collector="flow")
+
+        assert client.get_work_items.call_count == 2
+        assert items[0]["System.Title"] == "System.Title-1"
+
+
+class TestFailures:
+    """Test failed item handling"""
+
+    @pytest.mark.asyncio
+    async def test_missing_items_reported_and_retried(self):
+        """Test IDs the API didn't return are failed and fetched again next time"""
+        planner = WorkItemFetchPlanner()
+
+        items, failed = await planner.fetch(_mock_client(missing={2}), "P", [1, 2], ["System.State"], "quality")
+        retry_client = _mock_client()
+        retried, _ = await planner.fetch(retry_client, "P", [2], ["System.State"], "flow")
+
+        assert [item["System.Id"] for item in items] == [1]
+        assert failed == [2]
+        assert retry_client.get_work_items.call_args.kwargs["ids"] == [2]
+        assert retried[0]["System.Id"] == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_propagates(self):
+        """Test a failed fetch raises for the caller and is not cached"""
+        planner = WorkItemFetchPlanner()
+        client = AsyncMock()
+        client.get_work_items.side_effect = Exception("boom")
+
+        with patch("asyncio.sleep", new_callable=AsyncMock), pytest.raises(BatchFetchError, match="All 1 items failed"):
+            await planner.fetch(client, "P", [1], ["System.State"], "quality")
+
+        assert planner._entries == {}
+
+
+class TestRunContext:
+    """Test use_work_item_fetch_planner() and fetch_work_items_shared()"""
+
+    @pytest.mark.asyncio
+    async def test_shared_fetch_uses_active_planner(self):
+        """Test fetch_work_items_shared routes through the active planner"""
+        client = _mock_client()
+        assert not shared_fetch_enabled()
+
+        with use_work_item_fetch_planner() as planner:
+            assert shared_fetch_enabled()
+            await fetch_work_items_shared(client, "P", [1], ["System.State"], collector="quality")
+            await fetch_work_items_shared(client, "P", [1], ["System.State"], collector="flow")
+
+        assert client.get_work_items.call_count == 1
+        assert planner.stats()["by_collector"] == {
+            "flow": {"requested": 1, "shared": 1},
+            "quality": {"requested": 1, "shared": 0},
+        }
+        assert get_current_fetch_planner() is None
+
+    def test_planner_is_reentrant(self):
+        """Test nested contexts share one planner"""
+        with use_work_item_fetch_planner() as outer:
+            with use_work_item_fetch_planner() as inner:
+                assert inner is outer
@@ -0,0 +1,164 @@
+"""
+Unit Tests for the Columnar Work Item Frame
+
+Test Coverage:
+- Timestamp parsing (ADO 'Z', fractional seconds, offsets, invalid -> NaT)
+- Lead time / age semantics match the per-item datetime helpers
+- Columns are parsed once and shared between calculations
+- Flow, quality and ownership calculations give the same result for a list and a frame
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import numpy as np
+
+from execution.collectors import ado_ownership_metrics, ado_quality_metrics, flow_metrics_calculations
+from execution.collectors.ado_rest_transformers import WorkItemTransformer
+from execution.collectors.work_item_frame import WorkItemFrame, group_counts, parse_timestamps
+from execution.utils.datetime_utils import calculate_age_days, calculate_lead_time_days
+
+
+def _items() -> list[dict]:
+    return [
+        {
+            "System.Id": 1,
+            "System.WorkItemType": "Bug",
+            "System.AreaPath": "Proj\\Web",
+            "System.AssignedTo": {"displayName": "Dev A"},
+            "System.CreatedDate": "2026-01-01T00:00:00Z",
+            "Microsoft.VSTS.Common.ClosedDate": "2026-01-05T12:00:00.250Z",
+        },
+        {
+            "System.Id": 2,
+            "System.WorkItemType": "Task",
+            "System.AreaPath": "Proj\\Api",
+            "System.AssignedTo": {"displayName": ""},
+            "System.CreatedDate": "2026-01-03T06:00:00Z",
+            "Microsoft.VSTS.Common.ClosedDate": "2026-01-02T00:00:00Z",  # closed before created
+        },
+        {
+            "System.Id": 3,
+            "System.WorkItemType": "Epic",
+            "System.AreaPath": None,
+            "System.CreatedDate": "not a date",
+            "Microsoft.VSTS.Common.ClosedDate": "2026-02-01T00:00:00Z",
+        },
+        {
+            "System.Id": 4,
+            "System.AssignedTo": "Dev B",
+            "System.CreatedDate": "2025-06-01T00:00:00+02:00",
+            "Microsoft.VSTS.Common.ClosedDate": "2026-01-20T00:00:00Z",
+        },
+    ]
+
+
+class TestParsing:
+    """Test timestamp columns against the per-item helpers"""
+
+    def test_invalid_and_missing_values_are_nat(self):
+        parsed = parse_timestamps(["2026-01-01T00:00:00Z", "bad", "", None, 5])
+
+        assert parsed[0] == np.datetime64("2026-01-01T00:00:00")
+        assert np.isnat(parsed[1:]).all()
+
+    def test_offsets_are_converted_to_utc(self):
+        assert parse_timestamps(["2026-01-02T00:00:00+02:00"])[0] == np.datetime64("2026-01-01T22:00:00")
+
+    def test_lead_time_matches_calculate_lead_time_days(self):
+        items = _items()
+        frame = WorkItemFrame(items)
+
+        for item, days in zip(items, frame.lead_time_days, strict=True):
+            expected = calculate_lead_time_days(item["System.CreatedDate"], item["Microsoft.VSTS.Common.ClosedDate"])
+            assert (np.isnan(days) and expected is None) or days == expected
+
+    def test_age_matches_calculate_age_days(self):
+        items = _items()
+        reference = datetime(2026, 2, 1, tzinfo=UTC)
+
+        ages = WorkItemFrame(items).age_days(reference_time=reference)
+
+        for item, age in zip(items, ages, strict=True):
+            expected = calculate_age_days(item["System.CreatedDate"], reference_time=reference)
+            assert (np.isnan(age) and expected is None) or age == expected
+
+    def test_columns_parsed_once(self):
+        """Test a frame shared by several calculations parses each timestamp column once"""
+        frame = WorkItemTransformer.to_frame(_items())
+
+        with patch("execution.collectors.work_item_frame.parse_timestamps", wraps=parse_timestamps) as parse:
+            flow_metrics_calculations.calculate_lead_time(frame)
+            flow_metrics_calculations.calculate_dual_metrics(frame)
+            flow_metrics_calculations.calculate_cycle_time_variance(frame)
+            ado_quality_metrics.calculate_mttr(frame)
+
+        assert parse.call_count == 2  # created + closed
+
+    def test_transform_work_items_frame(self):
+        response = {"value": [{"id": 7, "rev": 2, "fields": {"System.CreatedDate": "2026-01-01T00:00:00Z"}}]}
+
+        frame = WorkItemTransformer.transform_work_items_frame(response)
+
+        assert frame.items[0]["System.Id"] == 7
+        assert frame.created[0] == np.datetime64("2026-01-01T00:00:00")
+
+
+class TestGroupCounts:
+    """Test first-appearance grouping"""
+
+    def test_keeps_first_appearance_order_and_none_keys(self):
+        keys = np.array(["b", None, "a", "b", None], dtype=object)
+        mask = np.array([True, False, True, False, True])
+
+        uniques, totals, masked = group_counts(keys, mask)
+
+        assert uniques == ["b", None, "a"]
+        assert totals.tolist() == [2, 2, 1]
+        assert masked.tolist() == [1, 1, 1]
+
+
+class TestListAndFrameAgree:
+    """Test the calculations accept a list or a frame with identical results"""
+
+    def test_flow_calculations(self):
+        items = _items()
+        frame = WorkItemFrame(items)
+
+        for calculate in (
+            flow_metrics_calculations.calculate_lead_time,
+            flow_metrics_calculations.calculate_dual_metrics,
+            flow_metrics_calculations.calculate_cycle_time_variance,
+            flow_metrics_calculations.calculate_aging_items,
+        ):
+            assert calculate(items) == calculate(frame)
+
+    def test_lead_time_values(self):
+        result = flow_metrics_calculations.calculate_lead_time(_items())
+
+        # Item 2 is negative and item 3 unparsable; item 4 has a +02:00 offset
+        assert result["sample_size"] == 2
+        assert result["raw_values"][0] == calculate_lead_time_days("2026-01-01T00:00:00Z", "2026-01-05T12:00:00.250Z")
+
+    def test_quality_calculations(self):
+        mttr = ado_quality_metrics.calculate_mttr(WorkItemFrame(_items()))
+        ages = ado_quality_metrics.calculate_bug_age_distribution(_items())
+
+        assert mttr["sample_size"] == 2
+        assert mttr["mttr_distribution"]["30+_days"] == 1
+        assert ages["sample_size"] == 3
+
+    def test_ownership_calculations(self):
+        frame = WorkItemFrame(_items())
+
+        unassigned = ado_ownership_metrics.calculate_unassigned_items(frame)
+        segmentation = ado_ownership_metrics.calculate_work_type_segmentation(frame)
+        distribution = ado_ownership_metrics.calculate_assignment_distribution(frame)
+        areas = ado_ownership_metrics.calculate_area_unassigned_stats(frame)
+
+        assert [item["id"] for item in unassigned["items"]] == [2, 3]
+        assert unassigned["by_type"] == {"bugs": 0, "features": 0, "tasks": 1}
+        assert segmentation["Other"]["types_included"] == "Epic, Unknown"
+        assert distribution["top_assignees"][0] == ("Dev A", 1)
+        assert distribution["assignee_count"] == 3  # Dev A, "" (no displayName), Dev B
+        assert [a["area_path"] for a in areas["areas"]] == ["Proj\\Api", None, "Proj\\Web", "Unknown"]
@@ -0,0 +1,204 @@
+"""
+Unit Tests for the Incremental Work Item Store
+
+Test Coverage:
+- Watermark handling (first sync, changed-items invalidation, query failure)
+- Cache hits avoid REST fetches; only missing IDs are downloaded
+- Field superset logic and same-revision field merging
+- Fallback to plain REST fetch when no store is active
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from execution.collectors.work_item_store import (
+    WorkItemStore,
+    fetch_work_items_incremental,
+    get_current_work_item_store,
+    use_work_item_store,
+)
+
+FIELDS = ["System.Id", "System.State"]
+
+
+def _rest_item(item_id: int, rev: int = 1, **fields) -> dict:
+    return {"id": item_id, "rev": rev, "fields": {"System.State": "Active", **fields}}
+
+
+def _mock_client(items: list[dict], changed_ids: list[int] | None = None) -> AsyncMock:
+    """REST client whose get_work_items returns the requested subset of `items`."""
+    by_id = {item["id"]: item for item in items}
+    client = AsyncMock()
+    client.get_work_items.side_effect = lambda ids, fields=None: {"value": [by_id[i] for i in ids if i in by_id]}
+    client.query_by_wiql.return_value = {"workItems": [{"id": i} for i in changed_ids or []]}
+    return client
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Active work item store backed by a temp database"""
+    with use_work_item_store(tmp_path / "cache.db") as active:
+        yield active
+
+
+class TestWatermarks:
+    """Test per-project sync watermarks"""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_sets_watermark_without_query(self, store):
+        """Test a never-synced project skips the changed-items query"""
+        client = _mock_client([])
+
+        await store.sync_project(client, "ProjectA")
+
+        assert store.get_watermark("ProjectA") is not None
+        client.query_by_wiql.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sync_runs_once_per_run(self, store):
+        """Test repeated syncs in one run share the first result"""
+        store._set_watermark("ProjectA", datetime(2026, 1, 1, tzinfo=UTC))
+        client = _mock_client([])
+
+        await store.sync_project(client, "ProjectA")
+        await store.sync_project(client, "ProjectA")
+
+        assert client.query_by_wiql.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_items_invalidated(self, store):
+        """Test IDs returned by the ChangedDate query are dropped from the cache"""
+        store.put_items("ProjectA", [{"System.Id": 1, "System.Rev": 1}, {"System.Id": 2, "System.Rev": 1}], FIELDS)
+        store._set_watermark("ProjectA", datetime(2026, 1, 10, tzinfo=UTC))
+        client = _mock_client([], changed_ids=[2])
+
+        await store.sync_project(client, "ProjectA")
+
+        assert set(store.get_items("ProjectA", [1, 2], ["System.Id"])) == {1}
+        wiql = client.query_by_wiql.call_args.kwargs["wiql_query"]
+        assert "[System.ChangedDate] >= '2026-01-09'" in wiql
+
+    @pytest.mark.asyncio
+    async def test_failed_query_invalidates_project(self, store):
+        """Test the whole project is refetched when changes can't be determined"""
+        store.put_items("ProjectA", [{"System.Id": 1, "System.Rev": 1}], FIELDS)
+        store._set_watermark("ProjectA", datetime(2026, 1, 10, tzinfo=UTC))
+        client = _mock_client([])
+        client.query_by_wiql.side_effect = Exception("boom")
+
+        await store.sync_project(client, "ProjectA")
+
+        assert store.get_items("ProjectA", [1], ["System.Id"]) == {}
+
+
+class TestItemCache:
+    """Test field-aware caching"""
+
+    def test_requires_superset_of_fields(self, store):
+        """Test a cached record is only served if it has every requested field"""
+        store.put_items("ProjectA", [{"System.Id": 1, "System.Rev": 3, "System.State": "Active"}], FIELDS)
+
+        assert 1 in store.get_items("ProjectA", [1], FIELDS)
+        assert store.get_items("ProjectA", [1], [*FIELDS, "System.Title"]) == {}
+
+    def test_returns_only_requested_fields(self, store):
+        """Test extra cached fields don't leak into results"""
+        store.put_items("ProjectA", [{"System.Id": 1, "System.Rev": 1, "System.State": "New"}], FIELDS)
+
+        assert store.get_items("ProjectA", [1], ["System.Id"])[1] == {"System.Id": 1, "System.Rev": 1}
+
+    def test_same_revision_merges_fields(self, store):
+        """Test field lists from different collectors accumulate on one revision"""
+        store.put_items("ProjectA", [{"System.Id": 1, "System.Rev": 1, "System.State": "New"}], FIELDS)
+        store.put_items("ProjectA", [{"System.Id": 1, "System.Rev": 1, "System.Title": "T"}], ["System.Title"])
+
+        item = store.get_items("ProjectA", [1], [*FIELDS, "System.Title"])[1]
+        assert item["System.State"] == "New"
+        assert item["System.Title"] == "T"
+
+    def test_newer_revision_replaces_record(self, store):
+        """Test fields from an older revision are discarded"""
+        store.put_items("ProjectA", [{"System.Id": 1, "System.Rev": 1, "System.State": "New"}], FIELDS)
+        store.put_items("ProjectA", [{"System.Id": 1, "System.Rev": 2, "System.Title": "T"}], ["System.Title"])
+
+        assert store.get_items("ProjectA", [1], FIELDS) == {}
+
+    def test_projects_are_partitioned(self, store):
+        """Test the same ID in different projects is cached separately"""
+        store.put_items("ProjectA", [{"System.Id": 1, "System.Rev": 1, "System.State": "New"}], FIELDS)
+
+        assert store.get_items("ProjectB", [1], FIELDS) == {}
+
+
+class TestFetchIncremental:
+    """Test fetch_work_items_incremental()"""
+
+    @pytest.mark.asyncio
+    async def test_second_fetch_served_from_cache(self, store):
+        """Test unchanged items are not downloaded again"""
+        client = _mock_client([_rest_item(1), _rest_item(2)])
+
+        first, _ = await fetch_work_items_incremental(client, "ProjectA", [1, 2], FIELDS)
+        second, failed = await fetch_work_items_incremental(client, "ProjectA", [2, 1], FIELDS)
+
+        assert client.get_work_items.call_count == 1
+        assert [item["System.Id"] for item in second] == [2, 1]
+        assert failed == []
+        assert store.cache_hits == 2
+        assert store.cache_misses == 2
+
+    @pytest.mark.asyncio
+    async def test_only_missing_ids_fetched(self, store):
+        """Test a partial cache hit downloads just the new IDs"""
+        client = _mock_client([_rest_item(1), _rest_item(2), _rest_item(3)])
+        await fetch_work_items_incremental(client, "ProjectA", [1], FIELDS)
+
+        items, _ = await fetch_work_items_incremental(client, "ProjectA", [1, 2, 3], FIELDS)
+
+        assert client.get_work_items.call_args.kwargs["ids"] == [2, 3]
+        assert len(items) == 3
+
+    @pytest.mark.asyncio
+    async def test_persists_across_runs(self, tmp_path):
+        """Test a new run reuses items cached by the previous run"""
+        db_path = tmp_path / "cache.db"
+        client = _mock_client([_rest_item(1)])
+        with use_work_item_store(db_path):
+            await fetch_work_items_incremental(client, "ProjectA", [1], FIELDS)
+
+        with use_work_item_store(db_path):
+            items, _ = await fetch_work_items_incremental(client, "ProjectA", [1], FIELDS)
+
+        assert client.get_work_items.call_count == 1
+        assert client.query_by_wiql.call_count == 1
+        assert items[0]["System.State"] == "Active"
+
+    @pytest.mark.asyncio
+    async def test_no_store_falls_back_to_rest(self):
+        """Test every call hits the REST API when the store is not enabled"""
+        assert get_current_work_item_store() is None
+        client = _mock_client([_rest_item(1)])
+
+        await fetch_work_items_incremental(client, "ProjectA", [1], FIELDS)
+        await fetch_work_items_incremental(client, "ProjectA", [1], FIELDS)
+
+        assert client.get_work_items.call_count == 2
+
+
+def test_use_work_item_store_is_reentrant(tmp_path):
+    """Test nested use_work_item_store() calls share the outer store"""
+    with use_work_item_store(tmp_path / "cache.db") as outer:
+        with use_work_item_store(tmp_path / "other.db") as inner:
+            assert inner is outer
+        assert get_current_work_item_store() is outer
+    assert get_current_work_item_store() is None
+
+
+def test_store_creates_parent_directory(tmp_path):
+    """Test the database directory is created on first use"""
+    store = WorkItemStore(tmp_path / "nested" / "cache.db")
+    store.close()
+
+    assert (tmp_path / "nested" / "cache.db").exists()
@@ -113,6 +113,30 @@ class TestCollectorMetricsTracker:
 
         assert tracker.retry_count == 3
 
+    def test_record_connection_counts_per_host(self):
+        """Test connection reuse counters are kept separately per host"""
+        tracker = CollectorMetricsTracker("quality")
+        tracker.record_connection("dev.azure.com", reused=False)
+        tracker.record_connection("dev.azure.com", reused=True)
+        tracker.record_connection("dev.azure.com", reused=True)
+        tracker.record_connection("app.armorcode.com", reused=False)
+
+        assert tracker.connection_reuse["dev.azure.com"] == {"requests": 3, "reused": 2, "new": 1}
+        assert tracker.connection_reuse["app.armorcode.com"] == {"requests": 1, "reused": 0, "new": 1}
+        assert tracker.to_dict()["connection_reuse"] == tracker.connection_reuse
+
+    def test_record_rate_limiter_tracks_min_limit_and_peak_queue(self):
+        """Test limiter snapshots keep the latest/min limit and peak queue depth"""
+        tracker = CollectorMetricsTracker("quality")
+        tracker.record_rate_limiter({"concurrency_limit": 16, "queue_depth": 5})
+        tracker.record_rate_limiter({"concurrency_limit": 8, "queue_depth": 120})
+        tracker.record_rate_limiter({"concurrency_limit": 9, "queue_depth": 3})
+
+        data = tracker.to_dict()
+        assert data["concurrency_limit"] == 9
+        assert data["min_concurrency_limit"] == 8
+        assert data["peak_queue_depth"] == 120
+
     def test_to_dict_successful(self):
         """Test converting successful tracker to dict"""
         tracker = CollectorMetricsTracker("quality")
@@ -302,6 +326,24 @@ class TestTrackCollectorPerformanceContextManager:
         current = get_current_tracker()
         assert current is None
 
+    @pytest.mark.asyncio
+    @patch("execution.core.collector_metrics.CollectorMetricsTracker.save")
+    @patch("execution.core.collector_metrics.track_performance")
+    async def test_concurrent_collectors_keep_separate_trackers(self, mock_track_perf, mock_save):
+        """Test collectors running as concurrent asyncio tasks don't share a tracker"""
+        import asyncio
+
+        mock_track_perf.return_value.__enter__.return_value = MagicMock()
+        mock_track_perf.return_value.__exit__.return_value = False
+
+        async def run(name: str) -> bool:
+            with track_collector_performance(name) as tracker:
+                await asyncio.sleep(0)
+                return get_current_tracker() is tracker
+
+        assert await asyncio.gather(run("quality"), run("flow")) == [True, True]
+        assert get_current_tracker() is None
+
     @patch("execution.core.collector_metrics.track_performance")
     def test_context_manager_integrates_with_sentry(self, mock_track_perf):
         """Test that context manager integrates with Sentry performance tracking"""
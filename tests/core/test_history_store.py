@@ -0,0 +1,253 @@
+"""
+Tests for the week-partitioned history store
+
+Covers legacy (single document) and partitioned modes, migration, the
+{"weeks": [...]} compatibility view, in-place updates of the latest week,
+the process-wide read cache and the typed weeks view.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from execution.core.history_store import (
+    HistoryStore,
+    get_history_cache,
+    history_exists,
+    load_history,
+    load_weeks,
+)
+
+
+def _week(week_date: str, total: int = 0) -> dict:
+    return {"week_date": week_date, "metrics": {"current_total": total}}
+
+
+@pytest.fixture
+def legacy_history(tmp_path: Path) -> Path:
+    """Legacy flow_history.json with three weeks"""
+    path = tmp_path / "flow_history.json"
+    weeks = [_week("2026-01-05", 1), _week("2026-01-12", 2), _week("2026-01-19", 3)]
+    path.write_text(json.dumps({"weeks": weeks}), encoding="utf-8")
+    return path
+
+
+class TestLegacyMode:
+    """Test behaviour before a history is migrated"""
+
+    def test_append_creates_document(self, tmp_path):
+        """Test the first append writes a {"weeks"} document"""
+        path = tmp_path / "quality_history.json"
+
+        count = HistoryStore(path).append(_week("2026-01-05"))
+
+        assert count == 1
+        assert json.loads(path.read_text())["weeks"] == [_week("2026-01-05")]
+        assert not (tmp_path / "history").exists()
+
+    def test_append_respects_retention(self, legacy_history):
+        """Test only the last `retain` weeks are kept"""
+        count = HistoryStore(legacy_history).append(_week("2026-01-26", 4), retain=2)
+
+        weeks = json.loads(legacy_history.read_text())["weeks"]
+        assert count == 2
+        assert [w["week_date"] for w in weeks] == ["2026-01-19", "2026-01-26"]
+
+    def test_load_last_n(self, legacy_history):
+        """Test last_n slices the weeks list"""
+        assert load_history(legacy_history, last_n=1)["weeks"] == [_week("2026-01-19", 3)]
+
+    def test_missing_history_raises(self, tmp_path):
+        """Test loading a history that doesn't exist raises FileNotFoundError"""
+        assert not history_exists(tmp_path / "risk_history.json")
+        with pytest.raises(FileNotFoundError):
+            load_history(tmp_path / "risk_history.json")
+
+
+class TestMigration:
+    """Test migrating a legacy document to week partitions"""
+
+    def test_migrate_writes_one_file_per_week(self, legacy_history):
+        """Test each week becomes a partition, in append order"""
+        store = HistoryStore(legacy_history)
+
+        assert store.migrate() == 3
+        assert store.partitioned
+        assert [p.name for p in sorted(store.partition_dir.glob("*.json"))] == [
+            "000001_2026-01-05.json",
+            "000002_2026-01-12.json",
+            "000003_2026-01-19.json",
+        ]
+        assert store.partition_dir == legacy_history.parent / "history" / "flow"
+
+    def test_view_matches_legacy_document(self, legacy_history):
+        """Test the partitioned view equals the original document"""
+        original = json.loads(legacy_history.read_text())
+        HistoryStore(legacy_history).migrate()
+        legacy_history.unlink()
+
+        assert history_exists(legacy_history)
+        assert load_history(legacy_history) == original
+
+    def test_migrate_is_idempotent(self, legacy_history):
+        """Test an already migrated history is skipped unless forced"""
+        store = HistoryStore(legacy_history)
+        store.migrate()
+
+        assert store.migrate() == 0
+        assert store.migrate(force=True) == 3
+
+    def test_failed_migration_leaves_no_partitions(self, legacy_history):
+        """Test a write failure part-way through doesn't leave a half-built partition directory"""
+        store = HistoryStore(legacy_history)
+
+        with patch("execution.core.history_store.json.dump", side_effect=[None, OSError("disk full")]):
+            with pytest.raises(OSError):
+                store.migrate()
+
+        assert not store.partitioned
+        assert list(legacy_history.parent.iterdir()) == [legacy_history]
+        assert load_history(legacy_history)["weeks"][-1]["week_date"] == "2026-01-19"
+
+
+class TestPartitionedMode:
+    """Test appends and reads after migration"""
+
+    @pytest.fixture
+    def store(self, legacy_history) -> HistoryStore:
+        store = HistoryStore(legacy_history)
+        store.migrate()
+        return store
+
+    def test_append_writes_single_partition(self, store, legacy_history):
+        """Test an append adds one file and leaves the legacy document untouched"""
+        before = legacy_history.read_text()
+
+        count = store.append(_week("2026-01-26", 4))
+
+        assert count == 4
+        assert legacy_history.read_text() == before
+        assert sorted(store.partition_dir.glob("*.json"))[-1].name == "000004_2026-01-26.json"
+
+    def test_append_prunes_beyond_retention(self, store):
+        """Test the oldest partitions are deleted past `retain`"""
+        store.append(_week("2026-01-26", 4), retain=2)
+
+        assert [w["week_date"] for w in store.load()["weeks"]] == ["2026-01-19", "2026-01-26"]
+
+    def test_replace_same_week(self, store):
+        """Test replace_same_week drops the earlier entry for that week_date"""
+        store.append(_week("2026-01-19", 30), replace_same_week=True)
+
+        weeks = store.load()["weeks"]
+        assert [w["week_date"] for w in weeks] == ["2026-01-05", "2026-01-12", "2026-01-19"]
+        assert weeks[-1]["metrics"]["current_total"] == 30
+
+    def test_last_n_reads_only_needed_partitions(self, store):
+        """Test last_n parses N partition files, not the whole history"""
+        with patch("execution.core.history_store.json.loads", wraps=json.loads) as loads:
+            weeks = store.load(last_n=2)["weeks"]
+
+        assert [w["week_date"] for w in weeks] == ["2026-01-12", "2026-01-19"]
+        assert loads.call_count == 2
+
+    def test_update_latest(self, store):
+        """Test update_latest rewrites only the most recent week"""
+
+        def patch_total(weeks: list[dict]) -> bool:
+            assert [w["week_date"] for w in weeks] == ["2026-01-12", "2026-01-19"]
+            weeks[-1]["metrics"]["current_total"] = 99
+            return True
+
+        assert store.update_latest(patch_total)
+        assert [w["metrics"]["current_total"] for w in store.load()["weeks"]] == [1, 2, 99]
+
+    def test_update_latest_rejected(self, store):
+        """Test nothing is written when the callback returns False"""
+        assert not store.update_latest(lambda weeks: False)
+        assert store.load()["weeks"][-1]["metrics"]["current_total"] == 3
+
+    def test_export_round_trip(self, store, legacy_history, tmp_path):
+        """Test export writes a {"weeks"} document that migrates back to the same history"""
+        store.append(_week("2026-01-26", 4))
+
+        exported = store.export(tmp_path / "export" / "flow_history.json")
+
+        assert json.loads(exported.read_text()) == store.load()
+        assert HistoryStore(exported).migrate() == 4
+
+    def test_load_new_reads_only_unseen_partitions(self, store):
+        """Test load_new keys weeks by partition name and parses only unseen ones"""
+        keys, _ = store.load_new(set())
+        get_history_cache().clear()
+
+        with patch("execution.core.history_store.json.load", wraps=json.load) as loads:
+            all_keys, new = store.load_new(set(keys[:2]))
+
+        assert all_keys == keys == ["000001_2026-01-05", "000002_2026-01-12", "000003_2026-01-19"]
+        assert new == [("000003_2026-01-19", _week("2026-01-19", 3))]
+        assert loads.call_count == 1
+
+
+class TestReadCache:
+    """Test the process-wide cache shared by all readers"""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        get_history_cache().clear()
+
+    def test_repeated_reads_parse_once(self, legacy_history):
+        """Test a second reader is served from memory"""
+        with patch("execution.core.history_store.json.load", wraps=json.load) as loads:
+            load_history(legacy_history)
+            load_weeks(legacy_history, last_n=2)
+
+        assert loads.call_count == 1
+        assert get_history_cache().hits == 1
+
+    def test_changed_file_is_reparsed(self, legacy_history):
+        """Test a rewrite by another process (new size) invalidates the entry"""
+        load_history(legacy_history)
+        legacy_history.write_text(json.dumps({"weeks": [_week("2026-02-02", 10)]}), encoding="utf-8")
+
+        assert load_history(legacy_history)["weeks"] == [_week("2026-02-02", 10)]
+
+    def test_store_writes_invalidate(self, legacy_history):
+        """Test appends through HistoryStore are visible to the next read"""
+        load_history(legacy_history)
+        HistoryStore(legacy_history).append(_week("2026-01-26", 4))
+
+        assert load_weeks(legacy_history).latest == _week("2026-01-26", 4)
+
+    def test_callers_cannot_change_cached_weeks_list(self, legacy_history):
+        """Test slicing or appending to a returned weeks list leaves the cache intact"""
+        load_history(legacy_history)["weeks"].append(_week("2099-01-01"))
+
+        assert len(load_history(legacy_history)["weeks"]) == 3
+
+
+class TestWeeksView:
+    """Test the typed view of the last N weeks"""
+
+    def test_view_of_partitioned_history(self, legacy_history):
+        """Test the view reads the same weeks in both modes"""
+        legacy = load_weeks(legacy_history, last_n=2)
+        HistoryStore(legacy_history).migrate()
+        partitioned = load_weeks(legacy_history, last_n=2)
+
+        assert legacy == partitioned
+        assert partitioned.metric == "flow"
+        assert partitioned.week_dates == ["2026-01-12", "2026-01-19"]
+        assert partitioned.latest == _week("2026-01-19", 3)
+
+    def test_document_without_weeks_is_empty(self, tmp_path):
+        """Test a document missing the weeks list yields an empty view"""
+        path = tmp_path / "risk_history.json"
+        path.write_text(json.dumps({"projects": []}), encoding="utf-8")
+
+        view = load_weeks(path)
+
+        assert not view
+        assert view.latest is None
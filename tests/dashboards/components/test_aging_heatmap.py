@@ -0,0 +1,66 @@
+"""
+Tests for aging_heatmap component
+
+Tests bucket counting at the bucket boundaries and the rendered grid.
+All tests use fixture data only — no file I/O or API calls.
+"""
+
+import pytest
+
+from execution.dashboards.components.aging_heatmap import (
+    _count_by_severity_and_bucket,
+    generate_aging_heatmap,
+)
+
+AGE_BUCKETS = [
+    {"label": "0-14", "min": 0, "max": 14},
+    {"label": "15-29", "min": 15, "max": 29},
+    {"label": "30-90", "min": 30, "max": 90},
+    {"label": "91-120", "min": 91, "max": 120},
+    {"label": "121-365", "min": 121, "max": 365},
+    {"label": "366-500", "min": 366, "max": 500},
+    {"label": "500+", "min": 501, "max": 999999},
+]
+
+
+@pytest.mark.parametrize(
+    "age_days,label",
+    [(0, "0-14"), (14, "0-14"), (15, "15-29"), (90, "30-90"), (91, "91-120"), (500, "366-500"), (501, "500+")],
+)
+def test_boundary_ages_land_in_their_bucket(age_days, label):
+    """Each boundary age is counted in exactly one bucket"""
+    counts = _count_by_severity_and_bucket([{"severity": "CRITICAL", "age_days": age_days}], AGE_BUCKETS)
+
+    assert counts["CRITICAL"][label] == 1
+    assert sum(counts["CRITICAL"].values()) == 1
+
+
+def test_out_of_range_and_other_severities_ignored():
+    """Negative ages and non Critical/High findings are not counted"""
+    vulns = [
+        {"severity": "HIGH", "age_days": -1},
+        {"severity": "MEDIUM", "age_days": 10},
+        {"severity": "HIGH", "age_days": 20},
+    ]
+
+    counts = _count_by_severity_and_bucket(vulns, AGE_BUCKETS)
+
+    assert sum(counts["HIGH"].values()) == 1
+    assert counts["HIGH"]["15-29"] == 1
+    assert sum(counts["CRITICAL"].values()) == 0
+
+
+def test_heatmap_renders_counts():
+    """The grid shows the per-bucket counts"""
+    vulns = [{"severity": "CRITICAL", "age_days": 3}] * 4 + [{"severity": "HIGH", "age_days": 200}]
+
+    html = generate_aging_heatmap(vulns)
+
+    assert html.startswith('<div class="detail-content">')
+    assert ">4</div>" in html
+    assert ">1</div>" in html
+
+
+def test_heatmap_empty():
+    """No findings renders the placeholder"""
+    assert "No vulnerability details available" in generate_aging_heatmap([])
@@ -0,0 +1,231 @@
+"""
+Tests for the Dashboard Build Graph
+
+Test Coverage:
+- Dashboards whose inputs are unchanged are skipped; changed inputs rebuild
+- Missing run snapshot sections always rebuild
+- Dashboards that patch history files always rebuild
+- Dependencies finish before their dependents start
+- Failures are reported without stopping independent dashboards
+- The process pool path builds in worker processes and writes the timing report
+"""
+
+import json
+import os
+import textwrap
+
+import pytest
+
+from execution.collectors.run_snapshot import RUN_ID_ENV, save_snapshot_section
+from execution.core.history_store import HistoryStore, load_weeks
+from execution.dashboards.build_graph import DASHBOARDS, DashboardBuildScheduler, DashboardTarget
+
+GENERATORS = textwrap.dedent("""
+    import os
+    from pathlib import Path
+
+
+    def build(output_path):
+        with open(os.environ["BUILD_LOG"], "a", encoding="utf-8") as log:
+            log.write(output_path.name + "\\n")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text("<html></html>", encoding="utf-8")
+
+
+    async def build_async(output_path):
+        build(output_path)
+
+
+    def fail(output_path):
+        raise RuntimeError("boom")
+    """)
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Temp working directory with an importable fake generator module"""
+    (tmp_path / "fake_generators.py").write_text(GENERATORS, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BUILD_LOG", str(tmp_path / "build.log"))
+    monkeypatch.delenv(RUN_ID_ENV, raising=False)
+    (tmp_path / "inputs").mkdir()
+    (tmp_path / "inputs" / "a.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "inputs" / "b.json").write_text("{}", encoding="utf-8")
+    return tmp_path
+
+
+def _targets(workspace):
+    out = workspace / "out"
+    return [
+        DashboardTarget("A", "fake_generators:build", out / "a.html", files=("inputs/a.json",)),
+        DashboardTarget("B", "fake_generators:build_async", out / "b.html", files=("inputs/b.json",)),
+        DashboardTarget("Index", "fake_generators:build", out / "index.html", files=("inputs/a.json",), after=("A",)),
+    ]
+
+
+def _scheduler(workspace, targets=None, workers=1, **kwargs):
+    return DashboardBuildScheduler(
+        _targets(workspace) if targets is None else targets,
+        workers=workers,
+        state_path=workspace / "state.json",
+        report_path=workspace / "report.json",
+        **kwargs,
+    )
+
+
+def _built(workspace):
+    log = workspace / "build.log"
+    names = log.read_text(encoding="utf-8").split() if log.exists() else []
+    log.unlink(missing_ok=True)
+    return names
+
+
+def _statuses(report):
+    return {entry["name"]: entry["status"] for entry in report["dashboards"]}
+
+
+class TestIncrementalBuild:
+    """Test content-hash skipping"""
+
+    def test_second_run_skips_unchanged(self, workspace):
+        """Test nothing is rebuilt when no input changed"""
+        first = _scheduler(workspace).run()
+        _built(workspace)
+
+        second = _scheduler(workspace).run()
+
+        assert set(_statuses(first).values()) == {"built"}
+        assert set(_statuses(second).values()) == {"skipped"}
+        assert _built(workspace) == []
+
+    def test_changed_input_rebuilds_its_dashboards(self, workspace):
+        """Test only dashboards reading the changed file rebuild"""
+        _scheduler(workspace).run()
+        _built(workspace)
+        (workspace / "inputs" / "a.json").write_text('{"changed": true}', encoding="utf-8")
+
+        report = _scheduler(workspace).run()
+
+        assert _statuses(report) == {"A": "built", "B": "skipped", "Index": "built"}
+
+    def test_force_rebuilds_everything(self, workspace):
+        """Test --force ignores the stored hashes"""
+        _scheduler(workspace).run()
+
+        report = _scheduler(workspace, force=True).run()
+
+        assert set(_statuses(report).values()) == {"built"}
+
+    def test_deleted_output_rebuilds(self, workspace):
+        """Test a missing output file is regenerated"""
+        _scheduler(workspace).run()
+        (workspace / "out" / "b.html").unlink()
+
+        assert _statuses(_scheduler(workspace).run())["B"] == "built"
+
+    def test_missing_snapshot_section_always_rebuilds(self, workspace, monkeypatch):
+        """Test a dashboard without its snapshot section is never skipped"""
+        target = DashboardTarget("Q", "fake_generators:build", workspace / "out" / "q.html", sections=("quality",))
+        _scheduler(workspace, [target]).run()
+
+        assert _statuses(_scheduler(workspace, [target]).run()) == {"Q": "built"}
+
+    def test_identical_snapshot_in_new_run_is_skipped(self, workspace, monkeypatch):
+        """Test a new run that collected the same data (new timestamps) reuses the dashboard"""
+        target = DashboardTarget("Q", "fake_generators:build", workspace / "out" / "q.html", sections=("quality",))
+        monkeypatch.setenv(RUN_ID_ENV, "run-1")
+        save_snapshot_section("quality", {"projects": [{"open_bugs_count": 3, "collected_at": "2026-10-15T08:00"}]})
+        _scheduler(workspace, [target]).run()
+
+        monkeypatch.setenv(RUN_ID_ENV, "run-2")
+        save_snapshot_section("quality", {"projects": [{"open_bugs_count": 3, "collected_at": "2026-10-16T08:00"}]})
+
+        assert _statuses(_scheduler(workspace, [target]).run()) == {"Q": "skipped"}
+
+    def test_history_patching_dashboard_patches_newly_appended_week(self, workspace, monkeypatch):
+        """Test the security dashboard is not skipped when the collector appended a week it must patch"""
+        target = next(t for t in DASHBOARDS if t.name.startswith("Security Dashboard"))
+        (workspace / "data").mkdir()
+        (workspace / "data" / "armorcode_id_map.json").write_text('{"Product A": "1"}', encoding="utf-8")
+        section = {
+            "aql_by_product": {"Product A": {"critical": 2, "high": 5}},
+            "bucket_counts_by_product": {
+                "Product A": {"CODE": {"total": 3, "critical": 1, "high": 2}},
+            },
+            "vulns_by_product": {},
+        }
+        store = HistoryStore(".tmp/observatory/security_history.json")
+
+        monkeypatch.setenv(RUN_ID_ENV, "run-1")
+        save_snapshot_section("security_enhanced", section)
+        store.append({"week_date": "2026-10-05", "metrics": {"current_total": 7}})
+        _scheduler(workspace, [target]).run()
+
+        monkeypatch.setenv(RUN_ID_ENV, "run-2")
+        save_snapshot_section("security_enhanced", section)
+        store.append({"week_date": "2026-10-12", "metrics": {"current_total": 7}})
+        report = _scheduler(workspace, [target]).run()
+
+        assert _statuses(report) == {target.name: "built"}
+        latest = load_weeks(".tmp/observatory/security_history.json").latest
+        assert latest is not None
+        assert latest["week_date"] == "2026-10-12"
+        assert latest["metrics"]["bucket_breakdown"]["code_cloud"]["total"] == 3
+
+
+class TestScheduling:
+    """Test dependency order and failure handling"""
+
+    def test_dependency_builds_first(self, workspace):
+        """Test a dashboard starts only after the dashboards it depends on"""
+        _scheduler(workspace).run()
+
+        built = _built(workspace)
+        assert built.index("a.html") < built.index("index.html")
+
+    def test_failure_is_reported_and_others_continue(self, workspace):
+        """Test one failing generator does not stop the rest"""
+        targets = _targets(workspace)
+        targets[1] = DashboardTarget("B", "fake_generators:fail", workspace / "out" / "b.html")
+
+        report = _scheduler(workspace, targets).run()
+
+        assert _statuses(report) == {"A": "built", "B": "failed", "Index": "built"}
+        assert "boom" in next(e["error"] for e in report["dashboards"] if e["name"] == "B")
+
+    def test_failed_dashboard_is_retried_next_run(self, workspace):
+        """Test a failure is not recorded as an up-to-date build"""
+        targets = [DashboardTarget("B", "fake_generators:fail", workspace / "out" / "b.html")]
+        _scheduler(workspace, targets).run()
+
+        assert _statuses(_scheduler(workspace, targets).run()) == {"B": "failed"}
+
+    def test_cycle_is_rejected(self, workspace):
+        """Test circular dependencies fail fast"""
+        targets = [
+            DashboardTarget("A", "fake_generators:build", workspace / "a.html", after=("B",)),
+            DashboardTarget("B", "fake_generators:build", workspace / "b.html", after=("A",)),
+        ]
+
+        with pytest.raises(ValueError, match="cycle"):
+            _scheduler(workspace, targets)
+
+    def test_unknown_dependency_is_rejected(self, workspace):
+        """Test a typo in `after` fails fast"""
+        with pytest.raises(ValueError, match="unknown"):
+            _scheduler(workspace, [DashboardTarget("A", "fake_generators:build", workspace / "a.html", after=("X",))])
+
+
+class TestProcessPool:
+    """Test the parallel path"""
+
+    def test_builds_in_worker_processes_and_writes_report(self, workspace):
+        """Test dashboards render in pool workers and timings are saved"""
+        report = _scheduler(workspace, workers=2).run()
+
+        saved = json.loads((workspace / "report.json").read_text(encoding="utf-8"))
+        assert saved == report
+        assert set(_statuses(report).values()) == {"built"}
+        assert all(entry["worker_pid"] != os.getpid() for entry in report["dashboards"])
+        assert all(entry["seconds"] >= 0 for entry in report["dashboards"])
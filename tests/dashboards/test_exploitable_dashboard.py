@@ -11,6 +11,9 @@ Tests cover:
 """
 
 import json
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -37,6 +40,17 @@ from execution.domain.exploitable import ExploitableMetrics
 # ---------------------------------------------------------------------------
 
 
+@contextmanager
+def _history_file(content: str | None) -> Iterator[Path]:
+    """Point HISTORY_PATH at a temp history file holding content (None = no file)."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        history_path = Path(tmp_dir) / "exploitable_history.json"
+        if content is not None:
+            history_path.write_text(content, encoding="utf-8")
+        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH", history_path):
+            yield history_path
+
+
 @pytest.fixture
 def sample_timestamp() -> datetime:
     return datetime(2026, 2, 19, 10, 0, 0)
@@ -261,24 +275,19 @@ class TestLoadData:
     """Test _load_data() — Stage 1."""
 
     def test_returns_empty_when_no_history_file(self):
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = False
+        with _history_file(None):
             result = _load_data()
         assert result == ([], {}, {})
 
     def test_returns_empty_when_no_weeks(self):
         empty = json.dumps({"weeks": []})
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = empty
+        with _history_file(empty):
             result = _load_data()
         assert result == ([], {}, {})
 
     def test_loads_products_from_latest_week(self, sample_history_json):
         json_str = json.dumps(sample_history_json)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             result, _, _ = _load_data()
         assert len(result) == 2
         names = {m.product for m in result}
@@ -287,9 +296,7 @@ class TestLoadData:
 
     def test_loads_correct_counts(self, sample_history_json):
         json_str = json.dumps(sample_history_json)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             result, _, _ = _load_data()
         eclipse = next(m for m in result if m.product == "Product I")
         assert eclipse.critical == 11
@@ -298,9 +305,7 @@ class TestLoadData:
 
     def test_loads_medium_counts(self, sample_history_json):
         json_str = json.dumps(sample_history_json)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             result, _, _ = _load_data()
         portal = next(m for m in result if m.product == "Portal")
         assert portal.medium == 2
@@ -339,9 +344,7 @@ class TestLoadData:
             ]
         }
         json_str = json.dumps(history)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             result, _, _ = _load_data()
         names = {m.product for m in result}
         assert "NewProduct" in names
@@ -349,9 +352,7 @@ class TestLoadData:
 
     def test_returns_exploitable_metrics_instances(self, sample_history_json):
         json_str = json.dumps(sample_history_json)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             result, _, _ = _load_data()
         assert all(isinstance(m, ExploitableMetrics) for m in result)
 
@@ -373,11 +374,9 @@ class TestLoadData:
         id_map = {"Product I": "45454"}
         json_str = json.dumps(history)
         with (
-            patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path,
+            _history_file(json_str),
             patch("execution.dashboards.exploitable_dashboard._load_id_map", return_value=id_map),
         ):
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
             result, trends, _ = _load_data()
         assert len(result) == 1
         assert result[0].product == "Product I"
@@ -401,14 +400,12 @@ class TestLoadData:
         }
         json_str = json.dumps(history)
         with (
-            patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path,
+            _history_file(json_str),
             patch(
                 "execution.dashboards.exploitable_dashboard._load_id_map",
                 side_effect=FileNotFoundError,
             ),
         ):
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
             result, trends, _ = _load_data()
         assert len(result) == 1
         assert result[0].product == "99999"
@@ -435,9 +432,7 @@ class TestLoadData:
             ]
         }
         json_str = json.dumps(history)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             result, _, _ = _load_data()
         assert len(result) == 1
         assert result[0].medium == 0
@@ -888,78 +883,61 @@ class TestGenerateExploitableDashboard:
 
     def test_returns_html_string(self, sample_history_json, tmp_path):
         json_str = json.dumps(sample_history_json)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             html = generate_exploitable_dashboard(output_dir=tmp_path)
         assert isinstance(html, str)
         assert len(html) > 100
 
     def test_html_contains_product_names(self, sample_history_json, tmp_path):
         json_str = json.dumps(sample_history_json)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             html = generate_exploitable_dashboard(output_dir=tmp_path)
         assert "Product I" in html
         assert "Portal" in html
 
     def test_html_written_to_output_dir(self, sample_history_json, tmp_path):
         json_str = json.dumps(sample_history_json)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             generate_exploitable_dashboard(output_dir=tmp_path)
         output_file = tmp_path / "exploitable_dashboard.html"
         assert output_file.exists()
         assert output_file.stat().st_size > 0
 
     def test_empty_history_generates_without_error(self, tmp_path):
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = False
+        with _history_file(None):
             html = generate_exploitable_dashboard(output_dir=tmp_path)
         assert isinstance(html, str)
 
     def test_html_contains_dashboard_title(self, sample_history_json, tmp_path):
         json_str = json.dumps(sample_history_json)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             html = generate_exploitable_dashboard(output_dir=tmp_path)
         assert "Exploitable" in html
 
     def test_output_file_has_correct_name(self, sample_history_json, tmp_path):
         json_str = json.dumps(sample_history_json)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             generate_exploitable_dashboard(output_dir=tmp_path)
         assert (tmp_path / "exploitable_dashboard.html").exists()
 
     def test_html_no_primary_bucket_column(self, sample_history_json, tmp_path):
         """Template should not contain Primary Bucket column."""
         json_str = json.dumps(sample_history_json)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             html = generate_exploitable_dashboard(output_dir=tmp_path)
         assert "Primary Bucket" not in html
 
     def test_html_no_known_cves_section(self, sample_history_json, tmp_path):
         """Known CVEs section should be removed."""
         json_str = json.dumps(sample_history_json)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             html = generate_exploitable_dashboard(output_dir=tmp_path)
         assert "Known CVEs" not in html
 
     def test_html_contains_medium_in_output(self, sample_history_json, tmp_path):
         """Dashboard HTML should reference Medium severity."""
         json_str = json.dumps(sample_history_json)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             html = generate_exploitable_dashboard(output_dir=tmp_path)
         assert "Medium" in html
 
@@ -984,9 +962,7 @@ class TestGenerateExploitableDashboard:
             ]
         }
         json_str = json.dumps(history)
-        with patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path:
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
+        with _history_file(json_str):
             html = generate_exploitable_dashboard(output_dir=tmp_path)
         assert isinstance(html, str)
         assert "MediumOnlyProduct" in html
@@ -1129,7 +1105,7 @@ class TestFetchProductRecords:
             mock_loader.api_key = "test-key"
             result = _fetch_product_records(zero_metrics, {"Clean": "99"})
         assert result == {}
-        mock_loader.fetch_findings_aql.assert_not_called()
+        mock_loader.fetch_findings_batch_aql.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -1157,25 +1133,21 @@ class TestLoadDataReturnsIdMap:
         id_map = {"Product I": "45454"}
         json_str = json.dumps(history)
         with (
-            patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path,
+            _history_file(json_str),
             patch("execution.dashboards.exploitable_dashboard._load_id_map", return_value=id_map),
         ):
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
             _, _, returned_id_map = _load_data()
         assert returned_id_map == {"Product I": "45454"}
 
     def test_returns_empty_id_map_when_file_missing(self, sample_history_json):
         json_str = json.dumps(sample_history_json)
         with (
-            patch("execution.dashboards.exploitable_dashboard.HISTORY_PATH") as mock_path,
+            _history_file(json_str),
             patch(
                 "execution.dashboards.exploitable_dashboard._load_id_map",
                 side_effect=FileNotFoundError,
             ),
         ):
-            mock_path.exists.return_value = True
-            mock_path.read_text.return_value = json_str
             _, _, returned_id_map = _load_data()
         assert returned_id_map == {}
 
@@ -303,9 +303,8 @@ class TestDashboardGeneration:
     """Tests for main dashboard generation"""
 
     @patch("execution.dashboards.ownership._load_ownership_data")
-    @patch("execution.dashboards.ownership.render_dashboard")
-    def test_generate_ownership_dashboard_success(self, mock_render, mock_load, tmp_path):
-        """Test successful dashboard generation"""
+    def test_generate_ownership_dashboard_success(self, mock_load, tmp_path):
+        """Test the dashboard is streamed to the output file"""
         # Setup mocks
         mock_load.return_value = {
             "week_number": 5,
@@ -315,20 +314,24 @@ class TestDashboardGeneration:
                     "project_name": "TestProject",
                     "total_items_analyzed": 100,
                     "unassigned": {"unassigned_count": 10, "unassigned_pct": 10.0},
-                    "assignment_distribution": {"assignee_count": 5, "top_assignees": [], "load_imbalance_ratio": 2.0},
+                    "assignment_distribution": {
+                        "assignee_count": 5,
+                        "top_assignees": [["Alice", 6]],
+                        "load_imbalance_ratio": 2.0,
+                    },
                 }
             ],
         }
 
-        mock_render.return_value = "<html>Dashboard HTML</html>"
-
         output_path = tmp_path / "ownership_dashboard.html"
         html = generate_ownership_dashboard(output_path)
 
         # Verify
-        assert html == "<html>Dashboard HTML</html>"
-        assert output_path.exists()
-        assert mock_render.called
+        written = output_path.read_text(encoding="utf-8")
+        assert html == ""
+        assert written.startswith("<!DOCTYPE html>")
+        assert "TestProject" in written
+        assert "Alice" in written  # drill-down rendered while streaming
         assert mock_load.called
 
     @patch("execution.dashboards.ownership._load_ownership_data")
@@ -581,17 +581,19 @@ class TestGenerateQualityDashboard:
 
     @pytest.mark.asyncio
     @patch("execution.dashboards.quality._query_quality_data")
-    @patch("execution.dashboards.quality.render_dashboard")
-    async def test_generate_dashboard_with_output_path(self, mock_render, mock_query, sample_quality_data, tmp_path):
-        """Test dashboard generation with file output"""
+    async def test_generate_dashboard_with_output_path(self, mock_query, sample_quality_data, tmp_path):
+        """Test the page is streamed to the file with every project's drill-down"""
         mock_query.return_value = sample_quality_data
-        mock_render.return_value = "<html>Dashboard</html>"
 
         output_path = tmp_path / "quality.html"
         html = await generate_quality_dashboard(output_path)
 
-        assert output_path.exists()
-        assert output_path.read_text(encoding="utf-8") == "<html>Dashboard</html>"
+        written = output_path.read_text(encoding="utf-8")
+        assert html == ""
+        assert written.startswith("<!DOCTYPE html>")
+        assert written.count('class="detail-content"') == len(sample_quality_data["projects"])
+        for project in sample_quality_data["projects"]:
+            assert project["project_name"] in written
 
     @pytest.mark.asyncio
     @patch("execution.dashboards.quality._query_quality_data")
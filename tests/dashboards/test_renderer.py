@@ -12,12 +12,15 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from execution.dashboards.renderer import (
+    LazyHTML,
     format_date,
     format_number,
     format_percent,
     get_jinja_environment,
     render_dashboard,
+    stream_dashboard,
     trend_arrow,
+    write_html_chunks,
 )
 
 
@@ -280,6 +283,66 @@ class TestRenderDashboard:
             assert gen_date[16] == ":"
 
 
+class TestStreamDashboard:
+    """Tests for streaming render to a file"""
+
+    def test_stream_matches_render(self, tmp_path):
+        """Test the streamed file equals the in-memory render"""
+        context = {"framework_css": "", "framework_js": "", "generation_date": "2026-10-16 08:00"}
+        output_path = tmp_path / "out" / "page.html"
+
+        written = stream_dashboard("dashboards/base_dashboard.html", context, output_path)
+
+        expected = render_dashboard("dashboards/base_dashboard.html", context)
+        assert output_path.read_text(encoding="utf-8") == expected
+        assert written == len(expected)
+
+    def test_write_html_chunks_consumes_lazily(self, tmp_path):
+        """Test chunks are written as produced, not collected first"""
+        output_path = tmp_path / "rows.html"
+        seen = []
+
+        def chunks():
+            for i in range(3):
+                seen.append(i)
+                yield f"<tr>{i}</tr>"
+
+        write_html_chunks(chunks(), output_path)
+
+        assert seen == [0, 1, 2]
+        assert output_path.read_text(encoding="utf-8") == "<tr>0</tr><tr>1</tr><tr>2</tr>"
+
+    def test_failed_render_leaves_previous_file(self, tmp_path):
+        """Test an exception mid-stream does not leave a truncated page"""
+        output_path = tmp_path / "page.html"
+        output_path.write_text("previous", encoding="utf-8")
+
+        def chunks():
+            yield "<html>"
+            raise RuntimeError("render failed")
+
+        with pytest.raises(RuntimeError):
+            write_html_chunks(chunks(), output_path)
+
+        assert output_path.read_text(encoding="utf-8") == "previous"
+        assert list(tmp_path.iterdir()) == [output_path]
+
+    def test_lazy_html_rendered_when_output(self):
+        """Test LazyHTML is rendered unescaped only when the template reaches it"""
+        calls = []
+
+        def detail(name):
+            calls.append(name)
+            return f"<div>{name}</div>"
+
+        template = get_jinja_environment().from_string("{% for r in rows %}{{ r|safe }}{% endfor %}")
+        rows = [LazyHTML(detail, "a"), LazyHTML(detail, "b")]
+
+        assert calls == []
+        assert "".join(template.generate(rows=rows)) == "<div>a</div><div>b</div>"
+        assert calls == ["a", "b"]
+
+
 class TestXSSProtection:
     """Tests for XSS protection via auto-escaping"""
 
@@ -695,11 +695,11 @@ class TestBuildContext:
 def _setup_loader_mock(mock_loader_class, product_id_map, critical=None, high=None):
     """Helper: configure ArmorCodeVulnerabilityLoader mock for AQL count approach."""
     mock_loader = Mock()
-    # count_by_severity_aql returns {product_id -> count}; default all zeros
+    # count_matrix_aql returns {scope -> severity -> {product_id -> count}}; default all zeros
     product_ids = list(product_id_map.values())
     critical_counts = critical or dict.fromkeys(product_ids, 0)
     high_counts = high or dict.fromkeys(product_ids, 0)
-    mock_loader.count_by_severity_aql.side_effect = [critical_counts, high_counts]
+    mock_loader.count_matrix_aql.return_value = {"all": {"Critical": critical_counts, "High": high_counts}}
     mock_loader_class.return_value = mock_loader
     return mock_loader
 
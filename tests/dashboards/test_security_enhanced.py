@@ -10,6 +10,7 @@ Tests cover:
 - Error handling (API failures, missing data)
 """
 
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -18,11 +19,13 @@ import pytest
 
 from execution.collectors.armorcode_vulnerability_loader import VulnerabilityDetail
 from execution.dashboards.security_enhanced import (
+    _collect_display_records,
     _generate_bucket_expanded_content,
     _group_findings_by_product,
     _metrics_from_aql_counts,
     generate_security_dashboard_enhanced,
 )
+from execution.dashboards.security_helpers import BUCKET_SOURCE_MAP
 from execution.domain.security import BUCKET_ORDER, SOURCE_BUCKET_MAP, SecurityMetrics
 
 
@@ -41,6 +44,30 @@ def _make_vuln(severity: str, source: str | None, product: str = "Web Applicatio
     )
 
 
+def _matrix(counts: dict) -> Callable:
+    """count_matrix_aql stand-in returning the same per-product counts for every scope and severity."""
+
+    def count_matrix_aql(severities, hierarchy, environment="Production", scopes=None):
+        return {name: {severity: dict(counts) for severity in severities} for name in (scopes or {"all": None})}
+
+    return count_matrix_aql
+
+
+def _batch(records: list) -> Callable:
+    """fetch_findings_batch_aql stand-in returning the same records for every scope."""
+
+    def fetch_findings_batch_aql(hierarchy, scopes, **kwargs):
+        return {key: list(records) for key in scopes}
+
+    return fetch_findings_batch_aql
+
+
+@pytest.fixture(autouse=True)
+def isolated_workdir(tmp_path, monkeypatch):
+    """Run in a temp directory so dashboard runs never patch the real .tmp/observatory/security_history.json."""
+    monkeypatch.chdir(tmp_path)
+
+
 @pytest.fixture
 def sample_vulnerabilities():
     """Sample VulnerabilityDetail objects covering CODE and INFRASTRUCTURE sources."""
@@ -297,8 +324,8 @@ class TestLoadSecurityData:
         mock_load_id_map.return_value = {"Web Application": "pid1", "Mobile App": "pid2"}
         mock_get_config.return_value.get_optional_env.return_value = "test/hierarchy"
         mock_vuln_loader = Mock()
-        mock_vuln_loader.count_by_severity_aql.return_value = {"pid1": 2}
-        mock_vuln_loader.fetch_findings_aql.return_value = sample_vulnerabilities
+        mock_vuln_loader.count_matrix_aql.side_effect = _matrix({"pid1": 2})
+        mock_vuln_loader.fetch_findings_batch_aql.side_effect = _batch(sample_vulnerabilities)
         mock_vuln_loader_class.return_value = mock_vuln_loader
         mock_framework.return_value = ("<style></style>", "<script></script>")
 
@@ -327,8 +354,8 @@ class TestLoadSecurityData:
         mock_load_id_map.return_value = {}
         mock_get_config.return_value.get_optional_env.return_value = "test/hierarchy"
         mock_vuln_loader = Mock()
-        mock_vuln_loader.count_by_severity_aql.return_value = {}
-        mock_vuln_loader.fetch_findings_aql.return_value = []
+        mock_vuln_loader.count_matrix_aql.side_effect = _matrix({})
+        mock_vuln_loader.fetch_findings_batch_aql.side_effect = _batch([])
         mock_vuln_loader_class.return_value = mock_vuln_loader
         mock_framework.return_value = ("<style></style>", "<script></script>")
 
@@ -353,8 +380,10 @@ class TestZeroVulnProducts:
         mock_get_config.return_value.get_optional_env.return_value = "test/hierarchy"
         mock_vuln_loader = Mock()
         # Only Web Application has AQL findings (pid1); Proclaim gets zero-padded from id_map
-        mock_vuln_loader.count_by_severity_aql.return_value = {"pid1": 2}
-        mock_vuln_loader.fetch_findings_aql.return_value = [_make_vuln("CRITICAL", "Mend", product="Web Application")]
+        mock_vuln_loader.count_matrix_aql.side_effect = _matrix({"pid1": 2})
+        mock_vuln_loader.fetch_findings_batch_aql.side_effect = _batch(
+            [_make_vuln("CRITICAL", "Mend", product="Web Application")]
+        )
         mock_vuln_loader_class.return_value = mock_vuln_loader
         mock_framework.return_value = ("<style></style>", "<script></script>")
 
@@ -385,8 +414,8 @@ class TestGenerateSecurityDashboardEnhanced:
         mock_load_id_map.return_value = {"Web Application": "pid1", "Mobile App": "pid2", "API Gateway": "pid3"}
         mock_get_config.return_value.get_optional_env.return_value = "test/hierarchy"
         mock_vuln_loader = Mock()
-        mock_vuln_loader.count_by_severity_aql.return_value = {"pid1": 2}
-        mock_vuln_loader.fetch_findings_aql.return_value = sample_vulnerabilities
+        mock_vuln_loader.count_matrix_aql.side_effect = _matrix({"pid1": 2})
+        mock_vuln_loader.fetch_findings_batch_aql.side_effect = _batch(sample_vulnerabilities)
         mock_vuln_loader_class.return_value = mock_vuln_loader
         mock_framework.return_value = ("<style>.card{}</style>", "<script></script>")
 
@@ -420,8 +449,8 @@ class TestGenerateSecurityDashboardEnhanced:
         mock_load_id_map.return_value = {"Web Application": "pid1"}
         mock_get_config.return_value.get_optional_env.return_value = "test/hierarchy"
         mock_vuln_loader = Mock()
-        mock_vuln_loader.count_by_severity_aql.return_value = {"pid1": 2}
-        mock_vuln_loader.fetch_findings_aql.return_value = sample_vulnerabilities
+        mock_vuln_loader.count_matrix_aql.side_effect = _matrix({"pid1": 2})
+        mock_vuln_loader.fetch_findings_batch_aql.side_effect = _batch(sample_vulnerabilities)
         mock_vuln_loader_class.return_value = mock_vuln_loader
         mock_framework.return_value = ("<style></style>", "<script></script>")
 
@@ -440,20 +469,23 @@ class TestProductionOnlyTotals:
     def test_uses_production_only_aql_when_hierarchy_set(
         self, mock_write, mock_framework, mock_load_id_map, mock_vuln_loader_class, mock_get_config
     ):
-        """When ARMORCODE_HIERARCHY is set, count_by_severity_aql is called with environment='Production'."""
+        """When ARMORCODE_HIERARCHY is set, count_matrix_aql is called with environment='Production'."""
         mock_load_id_map.return_value = {"Product1": "pid1"}
         mock_get_config.return_value.get_optional_env.return_value = "test/hierarchy"
 
         mock_loader = Mock()
-        mock_loader.count_by_severity_aql.return_value = {}
-        mock_loader.fetch_findings_aql.return_value = []
+        mock_loader.count_matrix_aql.side_effect = _matrix({})
+        mock_loader.fetch_findings_batch_aql.side_effect = _batch([])
         mock_vuln_loader_class.return_value = mock_loader
         mock_framework.return_value = ("<style></style>", "<script></script>")
 
         generate_security_dashboard_enhanced()
 
-        mock_loader.count_by_severity_aql.assert_any_call("Critical", "test/hierarchy", environment="Production")
-        mock_loader.count_by_severity_aql.assert_any_call("High", "test/hierarchy", environment="Production")
+        mock_loader.count_matrix_aql.assert_any_call(["Critical", "High"], "test/hierarchy", environment="Production")
+        bucket_call = mock_loader.count_matrix_aql.call_args_list[-1]
+        assert bucket_call.kwargs["environment"] == "Production"
+        assert set(bucket_call.kwargs["scopes"]) == {"CODE", "CLOUD", "INFRASTRUCTURE"}
+        assert bucket_call.kwargs["scopes"]["INFRASTRUCTURE"].asset_cloud_providers == ["aws", "azure"]
 
     @patch("execution.dashboards.security_enhanced.get_config")
     @patch("execution.dashboards.security_enhanced.ArmorCodeVulnerabilityLoader")
@@ -475,8 +507,30 @@ class TestProductionOnlyTotals:
 
         assert html == ""
         assert count == 0
-        mock_loader.count_by_severity_aql.assert_not_called()
-        mock_loader.fetch_findings_aql.assert_not_called()
+        mock_loader.count_matrix_aql.assert_not_called()
+        mock_loader.fetch_findings_batch_aql.assert_not_called()
+
+    def test_display_records_fetched_in_one_batch(self):
+        """Every non-empty (product, bucket) display fetch is sent in one Production batch of 50-record scopes."""
+        loader = Mock()
+        loader.fetch_findings_batch_aql.side_effect = _batch([_make_vuln("HIGH", "Mend")])
+        bucket_counts = {
+            "Product1": {"CODE": {"total": 2}, "CLOUD": {"total": 0}},
+            "Product2": {"INFRASTRUCTURE": {"total": 1}},
+        }
+
+        vulns = _collect_display_records(
+            loader, {"Product1": "pid1", "Product2": "pid2", "Product3": "pid3"}, "h", bucket_counts
+        )
+
+        loader.fetch_findings_batch_aql.assert_called_once()
+        (hierarchy, scopes), kwargs = loader.fetch_findings_batch_aql.call_args
+        assert hierarchy == "h"
+        assert list(scopes) == [("Product1", "CODE"), ("Product2", "INFRASTRUCTURE")]
+        assert scopes[("Product1", "CODE")].product_id == "pid1"
+        assert scopes[("Product1", "CODE")].sources == BUCKET_SOURCE_MAP["CODE"]
+        assert kwargs == {"environment": "Production", "page_size": 50}
+        assert {product: len(records) for product, records in vulns.items()} == {"Product1": 1, "Product2": 1}
 
 
 # ---------------------------------------------------------------------------
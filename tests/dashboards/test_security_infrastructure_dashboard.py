@@ -8,6 +8,7 @@ Verifies that the infrastructure-only dashboard:
 - Is written as a side effect of generate_security_dashboard_enhanced()
 """
 
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -24,6 +25,24 @@ from execution.domain.security import SecurityMetrics
 # ---------------------------------------------------------------------------
 
 
+def _matrix(counts: dict) -> Callable:
+    """count_matrix_aql stand-in returning the same per-product counts for every scope and severity."""
+
+    def count_matrix_aql(severities, hierarchy, environment="Production", scopes=None):
+        return {name: {severity: dict(counts) for severity in severities} for name in (scopes or {"all": None})}
+
+    return count_matrix_aql
+
+
+def _batch(records: list) -> Callable:
+    """fetch_findings_batch_aql stand-in returning the same records for every scope."""
+
+    def fetch_findings_batch_aql(hierarchy, scopes, **kwargs):
+        return {key: list(records) for key in scopes}
+
+    return fetch_findings_batch_aql
+
+
 @pytest.fixture
 def sample_metrics_by_product() -> dict:
     """Minimal SecurityMetrics for one product."""
@@ -202,8 +221,8 @@ class TestGenerateSecurityEnhancedWritesInfraDashboard:
         mock_load_id_map.return_value = {"Web Application": "pid1"}
         mock_get_config.return_value.get_optional_env.return_value = "test/hierarchy"
         mock_vuln_loader = Mock()
-        mock_vuln_loader.count_by_severity_aql.return_value = {"pid1": 2}
-        mock_vuln_loader.fetch_findings_aql.return_value = []
+        mock_vuln_loader.count_matrix_aql.side_effect = _matrix({"pid1": 2})
+        mock_vuln_loader.fetch_findings_batch_aql.side_effect = _batch([])
         mock_vuln_loader_class.return_value = mock_vuln_loader
         mock_framework.return_value = ("<style></style>", "<script></script>")
 
@@ -17,6 +17,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, mock_open, patch
 
 import pytest
 
+from execution.collectors.armorcode_vulnerability_loader import AqlCountScope
 from execution.dashboards.targets import (
     _CODE_CLOUD_SOURCES,
     _build_context,
@@ -141,10 +142,9 @@ async def test_query_current_armorcode_vulns_success():
     """Test Production-only AQL count — same method as security_enhanced.py for zero difference"""
     mock_loader = Mock()
     # Critical: 539, High: 11934 → total 12473 (Production only)
-    mock_loader.count_by_severity_aql.side_effect = [
-        {"pid1": 539},  # Critical counts
-        {"pid1": 11934},  # High counts
-    ]
+    mock_loader.count_matrix_aql.return_value = {
+        "code_cloud": {"Critical": {"pid1": 539}, "High": {"pid1": 11934}},
+    }
 
     with (
         patch("execution.dashboards.targets.ArmorCodeVulnerabilityLoader", return_value=mock_loader),
@@ -154,13 +154,12 @@ async def test_query_current_armorcode_vulns_success():
         result = await _query_current_armorcode_vulns()
 
         assert result == 12473
-        assert mock_loader.count_by_severity_aql.call_count == 2
-        # Must pass environment="Production" and sources=_CODE_CLOUD_SOURCES (70% target scope)
-        mock_loader.count_by_severity_aql.assert_any_call(
-            "Critical", "test/hierarchy", environment="Production", sources=_CODE_CLOUD_SOURCES
-        )
-        mock_loader.count_by_severity_aql.assert_any_call(
-            "High", "test/hierarchy", environment="Production", sources=_CODE_CLOUD_SOURCES
+        # One batch for both severities, environment="Production" and sources=_CODE_CLOUD_SOURCES (70% target scope)
+        mock_loader.count_matrix_aql.assert_called_once_with(
+            ["Critical", "High"],
+            "test/hierarchy",
+            environment="Production",
+            scopes={"code_cloud": AqlCountScope(sources=_CODE_CLOUD_SOURCES)},
         )
 
 
@@ -0,0 +1,90 @@
+"""
+Tests for shared framework asset files
+
+Test Coverage:
+- Framework bundle is memoized per argument set
+- Inline framework blocks become links to content-hashed files written once
+- Without an asset directory the framework stays inline
+- render_dashboard links the assets when the directory is configured
+"""
+
+from execution.dashboards.renderer import render_dashboard
+from execution.framework import get_dashboard_framework
+from execution.framework.assets import FRAMEWORK_ASSET_DIR_ENV, externalize_framework
+
+
+class TestFrameworkMemoization:
+    """Test get_dashboard_framework caching"""
+
+    def test_same_arguments_return_cached_bundle(self):
+        """Test repeated calls reuse the built strings"""
+        assert get_dashboard_framework(include_glossary=False) is get_dashboard_framework(include_glossary=False)
+
+    def test_different_arguments_build_different_bundles(self):
+        """Test feature flags still select the bundle content"""
+        _, with_rows = get_dashboard_framework(include_expandable_rows=True)
+        _, without_rows = get_dashboard_framework(include_expandable_rows=False)
+
+        assert with_rows != without_rows
+
+
+class TestExternalizeFramework:
+    """Test linking framework blocks as static files"""
+
+    def test_blocks_become_links_to_hashed_files(self, tmp_path):
+        """Test CSS and JS are written once and linked relative to the dashboards"""
+        asset_dir = tmp_path / "assets"
+        css, js = get_dashboard_framework()
+
+        context = externalize_framework({"framework_css": css, "framework_js": js, "title": "Q"}, asset_dir)
+
+        css_file = next(asset_dir.glob("framework-*.css"))
+        js_file = next(asset_dir.glob("framework-*.js"))
+        assert context["framework_css"] == f'<link rel="stylesheet" href="assets/{css_file.name}">'
+        assert context["framework_js"] == f'<script src="assets/{js_file.name}"></script>'
+        assert context["title"] == "Q"
+        assert "<style>" not in css_file.read_text(encoding="utf-8")
+        assert "toggleTheme" in js_file.read_text(encoding="utf-8")
+
+    def test_same_bundle_shared_across_dashboards(self, tmp_path):
+        """Test dashboards with the same framework link the same file"""
+        css, js = get_dashboard_framework()
+
+        first = externalize_framework({"framework_css": css, "framework_js": js}, tmp_path / "assets")
+        second = externalize_framework({"framework_css": css, "framework_js": js}, tmp_path / "assets")
+
+        assert first == second
+        assert len(list((tmp_path / "assets").iterdir())) == 2
+
+    def test_inline_without_asset_dir(self, monkeypatch):
+        """Test the framework stays inline unless an asset directory is configured"""
+        monkeypatch.delenv(FRAMEWORK_ASSET_DIR_ENV, raising=False)
+        context = {"framework_css": "<style>a{}</style>"}
+
+        assert externalize_framework(context) is context
+
+    def test_non_framework_markup_left_inline(self, tmp_path):
+        """Test combined or custom blocks are not rewritten"""
+        context = {"framework_css": "<style>a{}</style><style>b{}</style>", "framework_js": ""}
+
+        assert externalize_framework(context, tmp_path / "assets") == context
+        assert not (tmp_path / "assets").exists()
+
+
+class TestRenderDashboardLinksAssets:
+    """Test render_dashboard uses the shared asset files"""
+
+    def test_rendered_dashboard_links_framework(self, tmp_path, monkeypatch):
+        """Test the HTML links the framework instead of inlining it"""
+        monkeypatch.setenv(FRAMEWORK_ASSET_DIR_ENV, str(tmp_path / "assets"))
+        css, js = get_dashboard_framework()
+
+        html = render_dashboard(
+            "dashboards/base_dashboard.html",
+            {"framework_css": css, "framework_js": js},
+        )
+
+        assert 'href="assets/framework-' in html
+        assert 'src="assets/framework-' in html
+        assert "function toggleTheme" not in html
+        assert len(html) < len(css) + len(js)
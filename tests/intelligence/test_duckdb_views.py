@@ -8,22 +8,34 @@ Covers:
 - Invalid metric name raises ValueError (VALID_METRICS whitelist)
 - Empty feature data returns empty DataFrame gracefully
 - query_project_list() returns correct sorted list
+- Shared FeatureSession: views reused until the feature source changes,
+  manifest partitions scanned directly
 """
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
-from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
 from execution.intelligence.duckdb_views import (
     get_connection,
+    get_session,
     query_metric_trend,
     query_portfolio_summary,
     query_project_list,
 )
+from execution.intelligence.feature_engineering import update_features_incremental
+
+
+def _write_features(df: pd.DataFrame, base_dir: Path, metric: str = "quality") -> Path:
+    """Write df as the metric's dated feature snapshot."""
+    path = base_dir / f"{metric}_features_2026-01-01.parquet"
+    df.to_parquet(path, index=False)
+    return path
+
 
 # ---------------------------------------------------------------------------
 # Fixtures — synthetic DataFrames for DuckDB registration
@@ -122,41 +134,29 @@ class TestQueryMetricTrend:
             query_metric_trend("nonexistent_metric", "Product_A", base_dir=tmp_path)
 
     def test_returns_correct_project_rows(self, sample_quality_df: pd.DataFrame, tmp_path: Path) -> None:
-        with patch(
-            "execution.intelligence.duckdb_views.load_features",
-            return_value=sample_quality_df,
-        ):
-            result = query_metric_trend("quality", "Product_A", weeks=4, base_dir=tmp_path)
+        _write_features(sample_quality_df, tmp_path)
+        result = query_metric_trend("quality", "Product_A", weeks=4, base_dir=tmp_path)
 
         assert isinstance(result, pd.DataFrame)
         assert all(result["project"] == "Product_A")
 
     def test_respects_weeks_limit(self, sample_quality_df: pd.DataFrame, tmp_path: Path) -> None:
-        with patch(
-            "execution.intelligence.duckdb_views.load_features",
-            return_value=sample_quality_df,
-        ):
-            result = query_metric_trend("quality", "Product_A", weeks=2, base_dir=tmp_path)
+        _write_features(sample_quality_df, tmp_path)
+        result = query_metric_trend("quality", "Product_A", weeks=2, base_dir=tmp_path)
 
         assert len(result) <= 2
 
     def test_result_sorted_ascending(self, sample_quality_df: pd.DataFrame, tmp_path: Path) -> None:
-        with patch(
-            "execution.intelligence.duckdb_views.load_features",
-            return_value=sample_quality_df,
-        ):
-            result = query_metric_trend("quality", "Product_A", weeks=4, base_dir=tmp_path)
+        _write_features(sample_quality_df, tmp_path)
+        result = query_metric_trend("quality", "Product_A", weeks=4, base_dir=tmp_path)
 
         if len(result) > 1:
             dates = pd.to_datetime(result["week_date"])
             assert dates.is_monotonic_increasing
 
     def test_no_rows_for_unknown_project(self, sample_quality_df: pd.DataFrame, tmp_path: Path) -> None:
-        with patch(
-            "execution.intelligence.duckdb_views.load_features",
-            return_value=sample_quality_df,
-        ):
-            result = query_metric_trend("quality", "Product_Z_NOTEXIST", weeks=20, base_dir=tmp_path)
+        _write_features(sample_quality_df, tmp_path)
+        result = query_metric_trend("quality", "Product_Z_NOTEXIST", weeks=20, base_dir=tmp_path)
 
         assert len(result) == 0
 
@@ -165,13 +165,10 @@ class TestQueryMetricTrend:
         from execution.intelligence.feature_engineering import VALID_METRICS
 
         for metric in VALID_METRICS:
-            with patch(
-                "execution.intelligence.duckdb_views.load_features",
-                return_value=sample_quality_df,
-            ):
-                # Should not raise ValueError for any valid metric
-                result = query_metric_trend(metric, "Product_A", weeks=4, base_dir=tmp_path)
-                assert isinstance(result, pd.DataFrame)
+            _write_features(sample_quality_df, tmp_path, metric)
+            # Should not raise ValueError for any valid metric
+            result = query_metric_trend(metric, "Product_A", weeks=4, base_dir=tmp_path)
+            assert isinstance(result, pd.DataFrame)
 
 
 # ---------------------------------------------------------------------------
@@ -185,11 +182,8 @@ class TestQueryPortfolioSummary:
             query_portfolio_summary("bad_metric", base_dir=tmp_path)
 
     def test_returns_one_row_per_project(self, sample_quality_df: pd.DataFrame, tmp_path: Path) -> None:
-        with patch(
-            "execution.intelligence.duckdb_views.load_features",
-            return_value=sample_quality_df,
-        ):
-            result = query_portfolio_summary("quality", base_dir=tmp_path)
+        _write_features(sample_quality_df, tmp_path)
+        result = query_portfolio_summary("quality", base_dir=tmp_path)
 
         # Each project should have exactly 1 row (latest week only)
         assert isinstance(result, pd.DataFrame)
@@ -198,31 +192,22 @@ class TestQueryPortfolioSummary:
 
     def test_returns_latest_week_values(self, sample_single_project_df: pd.DataFrame, tmp_path: Path) -> None:
         """The latest week's open_bugs should be 285 for the single project."""
-        with patch(
-            "execution.intelligence.duckdb_views.load_features",
-            return_value=sample_single_project_df,
-        ):
-            result = query_portfolio_summary("quality", base_dir=tmp_path)
+        _write_features(sample_single_project_df, tmp_path)
+        result = query_portfolio_summary("quality", base_dir=tmp_path)
 
         assert len(result) == 1
         assert result.iloc[0]["open_bugs"] == 285
 
     def test_sorted_by_project(self, sample_quality_df: pd.DataFrame, tmp_path: Path) -> None:
-        with patch(
-            "execution.intelligence.duckdb_views.load_features",
-            return_value=sample_quality_df,
-        ):
-            result = query_portfolio_summary("quality", base_dir=tmp_path)
+        _write_features(sample_quality_df, tmp_path)
+        result = query_portfolio_summary("quality", base_dir=tmp_path)
 
         projects = result["project"].tolist()
         assert projects == sorted(projects)
 
     def test_empty_data_returns_empty_dataframe(self, empty_df: pd.DataFrame, tmp_path: Path) -> None:
-        with patch(
-            "execution.intelligence.duckdb_views.load_features",
-            return_value=empty_df,
-        ):
-            result = query_portfolio_summary("quality", base_dir=tmp_path)
+        _write_features(empty_df, tmp_path)
+        result = query_portfolio_summary("quality", base_dir=tmp_path)
 
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 0
@@ -239,30 +224,82 @@ class TestQueryProjectList:
             query_project_list("not_a_metric", base_dir=tmp_path)
 
     def test_returns_sorted_list(self, sample_quality_df: pd.DataFrame, tmp_path: Path) -> None:
-        with patch(
-            "execution.intelligence.duckdb_views.load_features",
-            return_value=sample_quality_df,
-        ):
-            result = query_project_list("quality", base_dir=tmp_path)
+        _write_features(sample_quality_df, tmp_path)
+        result = query_project_list("quality", base_dir=tmp_path)
 
         assert isinstance(result, list)
         assert result == sorted(result)
 
     def test_returns_distinct_projects(self, sample_quality_df: pd.DataFrame, tmp_path: Path) -> None:
-        with patch(
-            "execution.intelligence.duckdb_views.load_features",
-            return_value=sample_quality_df,
-        ):
-            result = query_project_list("quality", base_dir=tmp_path)
+        _write_features(sample_quality_df, tmp_path)
+        result = query_project_list("quality", base_dir=tmp_path)
 
         assert len(result) == len(set(result))
         assert set(result) == {"Product_A", "Product_B", "Product_C"}
 
     def test_empty_data_returns_empty_list(self, empty_df: pd.DataFrame, tmp_path: Path) -> None:
-        with patch(
-            "execution.intelligence.duckdb_views.load_features",
-            return_value=empty_df,
-        ):
-            result = query_project_list("quality", base_dir=tmp_path)
+        _write_features(empty_df, tmp_path)
+        result = query_project_list("quality", base_dir=tmp_path)
 
         assert result == []
+
+
+# ---------------------------------------------------------------------------
+# TestFeatureSession
+# ---------------------------------------------------------------------------
+
+
+class TestFeatureSession:
+    def test_view_reused_until_source_changes(self, sample_quality_df: pd.DataFrame, tmp_path: Path) -> None:
+        """Repeated queries don't rebuild the view; a newer snapshot does."""
+        _write_features(sample_quality_df, tmp_path)
+        session = get_session()
+        view = session.view_for("quality", tmp_path)
+        registered = dict(session._views)
+
+        assert session.view_for("quality", tmp_path) == view
+        assert session._views == registered
+
+        newer = sample_quality_df.assign(open_bugs=1)
+        newer.to_parquet(tmp_path / "quality_features_2026-02-01.parquet", index=False)
+        assert session.view_for("quality", tmp_path) == view
+        assert session._views != registered
+
+        assert set(query_project_list("quality", base_dir=tmp_path)) == {"Product_A", "Product_B", "Product_C"}
+        assert (query_metric_trend("quality", "Product_A", base_dir=tmp_path)["open_bugs"] == 1).all()
+
+    def test_scans_manifest_partitions(self, tmp_path: Path) -> None:
+        """Incrementally built partitions are queried and refreshed as the manifest changes."""
+        history = tmp_path / "quality_history.json"
+        features = tmp_path / "features"
+        week = {"week_date": "2026-01-05", "projects": [{"project_key": "Product_A", "open_bugs_count": 10}]}
+        history.write_text(json.dumps({"weeks": [week]}), encoding="utf-8")
+        update_features_incremental("quality", history, base_dir=features)
+
+        assert len(query_metric_trend("quality", "Product_A", base_dir=features)) == 1
+
+        later = {"week_date": "2026-01-12", "projects": [{"project_key": "Product_A", "open_bugs_count": 12}]}
+        history.write_text(json.dumps({"weeks": [week, later]}), encoding="utf-8")
+        update_features_incremental("quality", history, base_dir=features)
+
+        result = query_metric_trend("quality", "Product_A", base_dir=features)
+        assert result["open_bugs"].tolist() == [10, 12]
+
+    def test_portfolio_summary_uses_each_projects_latest_week(self, tmp_path: Path) -> None:
+        """A project whose data stops early still reports its own latest row."""
+        df = pd.DataFrame(
+            {
+                "week_date": pd.to_datetime(["2026-01-05", "2026-01-12", "2026-01-05"]),
+                "project": ["Product_A", "Product_A", "Product_B"],
+                "open_bugs": [10, 12, 7],
+            }
+        )
+        _write_features(df, tmp_path)
+
+        result = query_portfolio_summary("quality", base_dir=tmp_path)
+
+        assert result["open_bugs"].tolist() == [12, 7]
+
+    def test_missing_features_raise_value_error(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="No feature Parquet"):
+            query_project_list("quality", base_dir=tmp_path)
@@ -6,6 +6,8 @@ Covers:
 - extract_features() with mocked file I/O
 - save_features() with mocked PathValidator and Parquet write
 - load_features() with mocked glob and read_parquet
+- update_features_incremental(): manifest, new-week-only extraction, compaction,
+  retention and rebuild when a week is rewritten
 - Invalid metric raises ValueError
 - Missing history file raises FileNotFoundError
 - Empty history file returns empty DataFrame
@@ -21,16 +23,20 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 import pytest
 
+from execution.intelligence import feature_engineering
 from execution.intelligence.feature_engineering import (
     VALID_METRICS,
+    _build_all_features,
     _extract_deployment_row,
     _extract_flow_row,
     _extract_ownership_row,
     _extract_quality_row,
     _extract_security_row,
     extract_features,
+    feature_partition_paths,
     load_features,
     save_features,
+    update_features_incremental,
 )
 
 # ---------------------------------------------------------------------------
@@ -555,3 +561,114 @@ class TestExtractOwnershipRow:
         row = _extract_ownership_row("2025-10-06", {"project_key": "Product_A"})
         assert row["unassigned_count"] == 0
         assert row["total_items"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Incremental feature store
+# ---------------------------------------------------------------------------
+
+
+def _quality_week(week_date: str, open_bugs: int) -> dict:
+    return {"week_date": week_date, "projects": [{"project_key": "Product_A", "open_bugs_count": open_bugs}]}
+
+
+def _write_history(path: Path, weeks: list[dict]) -> None:
+    path.write_text(json.dumps({"weeks": weeks}), encoding="utf-8")
+
+
+class TestIncrementalFeatures:
+    """update_features_incremental() and manifest-backed load_features()"""
+
+    def test_first_run_processes_all_weeks(self, tmp_path: Path, quality_history_json: str) -> None:
+        history = tmp_path / "quality_history.json"
+        history.write_text(quality_history_json, encoding="utf-8")
+        out = tmp_path / "features"
+
+        stats = update_features_incremental("quality", history, base_dir=out)
+
+        assert stats["new_weeks"] == 2
+        assert stats["rows_added"] == 3
+        pd.testing.assert_frame_equal(
+            load_features("quality", base_dir=out), extract_features("quality", history), check_dtype=False
+        )
+
+    def test_second_run_extracts_only_new_weeks(self, tmp_path: Path) -> None:
+        history = tmp_path / "quality_history.json"
+        out = tmp_path / "features"
+        _write_history(history, [_quality_week("2026-01-05", 10)])
+        update_features_incremental("quality", history, base_dir=out)
+
+        _write_history(history, [_quality_week("2026-01-05", 10), _quality_week("2026-01-12", 12)])
+        with patch.object(
+            feature_engineering, "_extract_week_rows", wraps=feature_engineering._extract_week_rows
+        ) as extract:
+            stats = update_features_incremental("quality", history, base_dir=out)
+
+        assert stats["new_weeks"] == 1
+        assert extract.call_count == 1
+        assert load_features("quality", base_dir=out)["open_bugs"].tolist() == [10, 12]
+        assert len(feature_partition_paths("quality", out) or []) == 2
+
+    def test_unchanged_history_writes_nothing(self, tmp_path: Path, quality_history_json: str) -> None:
+        history = tmp_path / "quality_history.json"
+        history.write_text(quality_history_json, encoding="utf-8")
+        out = tmp_path / "features"
+        update_features_incremental("quality", history, base_dir=out)
+
+        stats = update_features_incremental("quality", history, base_dir=out)
+
+        assert stats["new_weeks"] == 0
+        assert stats["partitions"] == 1
+
+    def test_compaction_and_retention(self, tmp_path: Path) -> None:
+        history = tmp_path / "quality_history.json"
+        out = tmp_path / "features"
+        weeks: list[dict] = []
+        for i, week_date in enumerate(["2026-01-05", "2026-01-12", "2026-01-19", "2026-01-26"]):
+            weeks.append(_quality_week(week_date, i))
+            _write_history(history, weeks)
+            stats = update_features_incremental("quality", history, base_dir=out, max_partitions=3, retain_weeks=2)
+
+        assert stats["compacted"] is True
+        assert stats["partitions"] == 1
+        assert list((out / "quality").iterdir()) == feature_partition_paths("quality", out)
+        df = load_features("quality", base_dir=out)
+        assert df["week_date"].dt.strftime("%Y-%m-%d").tolist() == ["2026-01-12", "2026-01-19", "2026-01-26"]
+
+    def test_retention_pruned_history_keeps_rows(self, tmp_path: Path) -> None:
+        history = tmp_path / "quality_history.json"
+        out = tmp_path / "features"
+        _write_history(history, [_quality_week("2026-01-05", 1), _quality_week("2026-01-12", 2)])
+        update_features_incremental("quality", history, base_dir=out)
+
+        _write_history(history, [_quality_week("2026-01-12", 2), _quality_week("2026-01-19", 3)])
+        stats = update_features_incremental("quality", history, base_dir=out)
+
+        assert stats["rebuilt"] is False
+        assert load_features("quality", base_dir=out)["open_bugs"].tolist() == [1, 2, 3]
+
+    def test_rewritten_week_triggers_rebuild(self, tmp_path: Path) -> None:
+        history = tmp_path / "quality_history.json"
+        out = tmp_path / "features"
+        _write_history(history, [_quality_week("2026-01-05", 1), _quality_week("2026-01-12", 2)])
+        update_features_incremental("quality", history, base_dir=out)
+
+        _write_history(history, [_quality_week("2026-01-05", 1), _quality_week("2026-01-12", 20)])
+        stats = update_features_incremental("quality", history, base_dir=out)
+
+        assert stats["rebuilt"] is True
+        assert load_features("quality", base_dir=out)["open_bugs"].tolist() == [1, 20]
+        assert len(list((out / "quality").iterdir())) == 1
+
+    def test_build_all_removes_superseded_snapshots(self, tmp_path: Path, quality_history_json: str) -> None:
+        history_dir = tmp_path / "observatory"
+        history_dir.mkdir()
+        (history_dir / "quality_history.json").write_text(quality_history_json, encoding="utf-8")
+        out = tmp_path / "features"
+        out.mkdir()
+        (out / "quality_features_2025-01-01.parquet").write_bytes(b"old")
+
+        _build_all_features(history_dir=history_dir, output_dir=out)
+
+        assert not (out / "quality_features_2025-01-01.parquet").exists()
+        assert len(load_features("quality", base_dir=out)) == 3
@@ -12,6 +12,7 @@ Covers:
 - save_forecasts() with mocked PathValidator and file write
 - load_forecasts() with mocked glob and JSON read
 - forecast_all_projects() with mocked load_features
+- forecast_projects() batched mode matches the per-project loop
 """
 
 from __future__ import annotations
@@ -32,7 +33,9 @@ from execution.intelligence.forecast_engine import (
     _fit_linear,
     _prediction_stderr,
     compute_trend_strength,
+    forecast_all_projects,
     forecast_metric,
+    forecast_projects,
     load_forecasts,
     save_forecasts,
 )
@@ -421,3 +424,59 @@ class TestLoadForecasts:
         results = load_forecasts("quality", base_dir=tmp_path)
         assert isinstance(results, list)
         assert len(results) == 0
+
+
+# ---------------------------------------------------------------------------
+# TestForecastProjectsBatched
+# ---------------------------------------------------------------------------
+
+
+def _make_portfolio_df() -> pd.DataFrame:
+    """Interleaved multi-project frame: uneven lengths, gaps, a constant and a too-short series."""
+    frames = [
+        _make_quality_df(20, slope=-2.0).assign(project="Product_A"),
+        _make_quality_df(18, slope=3.0, base=50.0).assign(project="Product_B"),
+        _make_quality_df(14, slope=0.0, base=7.0).assign(project="Product_C", open_bugs=7.0),
+        _make_quality_df(5).assign(project="Product_D"),
+    ]
+    df = pd.concat(frames).sort_values("week_date", kind="stable").reset_index(drop=True)
+    df.loc[df.index[::9], "open_bugs"] = np.nan
+    return df
+
+
+class TestForecastProjectsBatched:
+    def test_matches_per_project_loop(self) -> None:
+        df = _make_portfolio_df()
+
+        looped = forecast_projects(df, "open_bugs", batched=False)
+        batched = forecast_projects(df, "open_bugs")
+
+        assert [r.project for r in batched] == [r.project for r in looped] == ["Product_A", "Product_B", "Product_C"]
+        for expected, actual in zip(looped, batched, strict=True):
+            assert actual.trend_direction == expected.trend_direction
+            assert actual.mape == pytest.approx(expected.mape)
+            assert actual.trend_strength == pytest.approx(expected.trend_strength)
+            assert [fp.week for fp in actual.forecast] == [fp.week for fp in expected.forecast]
+            for a, e in zip(actual.forecast, expected.forecast, strict=True):
+                assert (a.p10, a.p50, a.p90) == pytest.approx((e.p10, e.p50, e.p90))
+
+    def test_custom_horizons(self) -> None:
+        results = forecast_projects(_make_portfolio_df(), "open_bugs", horizons=[2, 6])
+        assert all([fp.week for fp in r.forecast] == [2, 6] for r in results)
+
+    def test_missing_column_returns_empty(self) -> None:
+        assert forecast_projects(_make_portfolio_df(), "nonexistent_col") == []
+
+    def test_no_project_with_enough_data_returns_empty(self) -> None:
+        assert forecast_projects(_make_quality_df(5), "open_bugs") == []
+
+    def test_forecast_all_projects_uses_batched_mode(self) -> None:
+        df = _make_portfolio_df()
+        with (
+            patch("execution.intelligence.forecast_engine.load_features", return_value=df),
+            patch("execution.intelligence.forecast_engine.forecast_metric") as per_project,
+        ):
+            results = forecast_all_projects("quality", "open_bugs")
+
+        per_project.assert_not_called()
+        assert len(results) == 3
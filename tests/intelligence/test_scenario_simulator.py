@@ -17,6 +17,8 @@ Covers:
 - compare_scenarios() with BAU already in input dict does not duplicate it
 - trend_slope_override replaces slope
 - All known scenario param keys are accepted
+- run_monte_carlo_batch(): exact mode matches run_monte_carlo(), histogram
+  mode stays close to exact under a small memory budget
 """
 
 from __future__ import annotations
@@ -32,9 +34,12 @@ from execution.domain.intelligence import ScenarioPoint, ScenarioResult
 _TS = datetime(2025, 10, 6)
 from execution.intelligence.scenario_simulator import (
     SCENARIO_PARAM_BOUNDS,
+    ScenarioSpec,
+    _plan_chunks,
     _validate_scenario_params,
     compare_scenarios,
     run_monte_carlo,
+    run_monte_carlo_batch,
 )
 
 # ---------------------------------------------------------------------------
@@ -453,6 +458,72 @@ class TestCompareScenarios:
             compare_scenarios([100.0, 90.0], {"Sprint": {}})
 
 
+# ---------------------------------------------------------------------------
+# TestRunMonteCarloBatch
+# ---------------------------------------------------------------------------
+
+
+def _batch_specs() -> list[ScenarioSpec]:
+    """Scenarios across two metrics and a project-level series."""
+    return [
+        ScenarioSpec(_declining_series(), {}, "BAU", "open_bugs"),
+        ScenarioSpec(_declining_series(), {"closure_rate_multiplier": 1.5}, "Accelerated", "open_bugs"),
+        ScenarioSpec(_rising_series(), {"velocity_multiplier": 1.5}, "Accelerated", "throughput", False),
+        ScenarioSpec(_rising_series(n=8), {}, "BAU", "throughput", False, project="Product_A"),
+    ]
+
+
+class TestRunMonteCarloBatch:
+    def test_exact_mode_matches_run_monte_carlo(self) -> None:
+        """Chunked exact percentiles equal the single-scenario engine with the same seed."""
+        specs = _batch_specs()
+        results = run_monte_carlo_batch(specs, n_simulations=500, random_seed=7, memory_budget_mb=0.05, exact=True)
+
+        for spec, result in zip(specs, results, strict=True):
+            single = run_monte_carlo(
+                spec.base_series,
+                spec.scenario_params,
+                n_simulations=500,
+                lower_is_better=spec.lower_is_better,
+                random_seed=7,
+            )
+            assert result.forecast == single.forecast
+            assert result.probability_of_improvement == single.probability_of_improvement
+            assert (result.scenario_name, result.metric, result.project) == (
+                spec.scenario_name,
+                spec.metric,
+                spec.project,
+            )
+
+    def test_histogram_mode_close_to_exact(self) -> None:
+        specs = _batch_specs()
+        exact = run_monte_carlo_batch(specs, n_simulations=20_000, random_seed=3, exact=True)
+        approx = run_monte_carlo_batch(specs, n_simulations=20_000, random_seed=3, memory_budget_mb=1, exact=False)
+
+        for e, a in zip(exact, approx, strict=True):
+            assert a.probability_of_improvement == e.probability_of_improvement
+            for pe, pa in zip(e.forecast, a.forecast, strict=True):
+                band = pe.p90 - pe.p10
+                assert pa.p10 <= pa.p50 <= pa.p90
+                assert (pa.p10, pa.p50, pa.p90) == pytest.approx((pe.p10, pe.p50, pe.p90), abs=0.01 * band)
+
+    def test_small_budget_switches_to_histograms(self) -> None:
+        exact, chunk_size, bins = _plan_chunks(100, 13, 100_000, 64, None)
+        assert not exact
+        assert bins > 0
+        assert 0 < chunk_size < 100_000
+
+    def test_large_budget_keeps_exact_single_chunk(self) -> None:
+        assert _plan_chunks(3, 13, 1000, 256, None) == (True, 1000, 0)
+
+    def test_empty_specs(self) -> None:
+        assert run_monte_carlo_batch([]) == []
+
+    def test_short_series_raises(self) -> None:
+        with pytest.raises(ValueError, match="minimum 4 required"):
+            run_monte_carlo_batch([ScenarioSpec([1.0, 2.0])])
+
+
 # ---------------------------------------------------------------------------
 # TestScenarioResultDomainModel
 # ---------------------------------------------------------------------------
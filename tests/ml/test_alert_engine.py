@@ -223,6 +223,26 @@ class TestThresholdRules:
 
         assert not any(a.metric_name == "build_success_rate_pct" for a in alerts)
 
+    def test_rules_evaluated_per_project(self, db_path: Path) -> None:
+        """Each project's latest value picks its own rule; other projects do not interfere."""
+        conn = sqlite3.connect(db_path)
+        _insert_metric(conn, "ownership", "Product A", "unassigned_pct", 80.0)
+        _insert_metric(conn, "ownership", "Product B", "unassigned_pct", 65.0)
+        _insert_metric(conn, "ownership", "Product C", "unassigned_pct", 10.0)
+        _insert_metric(conn, "exploitable", "Product A", "critical_vulns", 2.0)
+        _insert_metric(conn, "exploitable", "Product A", "high_vulns", 3.0)
+        conn.close()
+
+        engine = AlertEngine(db_path=db_path)
+        total = engine.run()
+        alerts = {(a.project_name, a.dashboard, a.metric_name): a for a in engine.load_alerts()}
+
+        assert total == 4
+        assert alerts[("Product A", "ownership", "unassigned_pct")].severity == "critical"
+        assert alerts[("Product B", "ownership", "unassigned_pct")].severity == "warn"
+        assert ("Product C", "ownership", "unassigned_pct") not in alerts
+        assert alerts[("Product A", "exploitable", "high_vulns")].expected == 0.0
+
 
 # ---------------------------------------------------------------------------
 # Tests: anomaly-based alerts
@@ -281,6 +301,15 @@ class TestAlertPersistence:
         threshold_alerts = [a for a in alerts if a.metric_name == "build_success_rate_pct"]
         assert len(threshold_alerts) == 1
 
+    def test_run_creates_latest_value_index(self, db_path: Path) -> None:
+        """Databases imported before idx_metrics_latest existed get it on the next run."""
+        AlertEngine(db_path=db_path).run()
+
+        conn = sqlite3.connect(db_path)
+        index = conn.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_metrics_latest'").fetchone()
+        conn.close()
+        assert index is not None
+
     def test_load_alerts_returns_empty_when_no_db(self, tmp_path: Path) -> None:
         engine = AlertEngine(db_path=tmp_path / "missing.db")
         assert engine.load_alerts() == []
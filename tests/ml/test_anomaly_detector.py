@@ -5,6 +5,7 @@ Verifies z-score based anomaly detection across Observatory metrics.
 """
 
 import sqlite3
+from collections.abc import Sequence
 from pathlib import Path
 
 import pytest
@@ -53,7 +54,7 @@ def _create_schema(conn: sqlite3.Connection) -> None:
 
 def _seed(
     conn: sqlite3.Connection,
-    values: list[float],
+    values: Sequence[float | None],
     dashboard: str = "quality",
     project: str = "Product A",
     metric: str = "open_bugs",
@@ -213,3 +214,30 @@ class TestAnomalyDetector:
         detector = AnomalyDetector(db_path=db_path, threshold=2.0)
         results = detector.detect_all()
         assert results == []
+
+    def test_null_latest_value_falls_back_to_previous(self, db_path: Path) -> None:
+        """A NULL newest row is skipped; the latest non-null value is evaluated."""
+        conn = sqlite3.connect(db_path)
+        values: list[float | None] = [100.0] * 7
+        _seed(conn, values + [150.0, None])
+        _seed_stats(conn, mean=100.0, std=5.0)
+        conn.close()
+
+        results = AnomalyDetector(db_path=db_path, threshold=2.0).detect_all()
+
+        assert len(results) == 1
+        assert results[0].value == 150.0
+        assert results[0].metric_date == "2026-01-08"
+
+    def test_each_project_uses_its_own_latest_value(self, db_path: Path) -> None:
+        """Series are evaluated independently, even when they share a metric."""
+        conn = sqlite3.connect(db_path)
+        _seed(conn, [100.0] * 8 + [200.0], project="Product A")
+        _seed(conn, [100.0] * 9, project="Product B")
+        _seed_stats(conn, mean=100.0, std=5.0, project="Product A")
+        _seed_stats(conn, mean=100.0, std=5.0, project="Product B")
+        conn.close()
+
+        results = AnomalyDetector(db_path=db_path, threshold=2.0).detect_all()
+
+        assert [r.project_name for r in results] == ["Product A"]
@@ -9,11 +9,13 @@ import json
 import sqlite3
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from execution.import_to_sqlite import (
     clear_existing_data,
     compute_rolling_stats,
+    configure_connection,
     create_database,
     import_collaboration_metrics,
     import_deployment_metrics,
@@ -515,3 +517,111 @@ class TestComputeRollingStats:
         cursor = db.cursor()
         cursor.execute("SELECT COUNT(*) FROM metrics")
         assert cursor.fetchone()[0] == 0
+
+    def test_matches_reference_formulas(self, db):
+        """Grouped computation matches per-series mean/std/polyfit over the last 52 weeks."""
+        rng = np.random.default_rng(7)
+        values = list(rng.normal(100, 15, 60).round(1))
+        cursor = db.cursor()
+        for i, v in enumerate(values):
+            cursor.execute(
+                "INSERT INTO metrics (metric_date, dashboard, project_name, metric_name, metric_value, metric_unit) "
+                "VALUES (?, 'quality', 'Test Project', 'open_bugs', ?, 'bugs')",
+                (f"2025-{i // 28 + 1:02d}-{i % 28 + 1:02d}", v),
+            )
+        db.commit()
+
+        compute_rolling_stats(db)
+
+        recent = np.array(values[-52:])
+        row = db.execute("SELECT rolling_mean, rolling_std, trend_slope, last_8w_avg FROM rolling_stats").fetchone()
+        assert row[0] == pytest.approx(recent.mean())
+        assert row[1] == pytest.approx(recent.std())
+        assert row[2] == pytest.approx(np.polyfit(np.arange(52), recent, 1)[0])
+        assert row[3] == pytest.approx(recent[-8:].mean())
+
+    def test_multiple_series_in_one_pass(self, db):
+        self._seed_metrics(db, [1.0, 2.0, 3.0])
+        db.execute(
+            "INSERT INTO metrics (metric_date, dashboard, project_name, metric_name, metric_value, metric_unit) "
+            "VALUES ('2026-01-01', 'flow', 'Other', 'wip', 5, 'items'), ('2026-01-02', 'flow', 'Other', 'wip', 3, 'items')"
+        )
+        db.commit()
+
+        assert compute_rolling_stats(db) == 2
+        slope = db.execute("SELECT trend_slope FROM rolling_stats WHERE project_name='Other'").fetchone()[0]
+        assert slope == pytest.approx(-2.0)
+
+
+# ---------------------------------------------------------------------------
+# Tests: incremental import
+# ---------------------------------------------------------------------------
+
+
+class TestIncrementalImport:
+    def _write_quality(self, path: Path, weeks: list[tuple[str, int]]) -> None:
+        data = {
+            "weeks": [
+                _week(week_date, [{"project_name": "Product A", "open_bugs_count": open_bugs}])
+                for week_date, open_bugs in weeks
+            ]
+        }
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    def _open_bugs(self, db) -> list[tuple[str, float]]:
+        rows = db.execute(
+            "SELECT metric_date, metric_value FROM metrics WHERE metric_name='open_bugs' ORDER BY metric_date"
+        ).fetchall()
+        return [(str(metric_date), float(value)) for metric_date, value in rows]
+
+    def test_rerun_is_idempotent(self, db, tmp_path, monkeypatch):
+        _patch_history_dir(monkeypatch, tmp_path)
+        self._write_quality(tmp_path / "quality_history.json", [("2026-02-10", 10), ("2026-02-17", 12)])
+
+        import_quality_metrics(db)
+        import_quality_metrics(db)
+
+        assert self._open_bugs(db) == [("2026-02-10", 10), ("2026-02-17", 12)]
+
+    def test_only_new_weeks_are_read(self, db, tmp_path, monkeypatch):
+        _patch_history_dir(monkeypatch, tmp_path)
+        history = tmp_path / "quality_history.json"
+        self._write_quality(history, [("2026-02-10", 10), ("2026-02-17", 12)])
+        import_quality_metrics(db)
+
+        # Older weeks edited after import are not re-read; the latest and new weeks are
+        self._write_quality(history, [("2026-02-10", 99), ("2026-02-17", 13), ("2026-02-24", 14)])
+        count = import_quality_metrics(db)
+
+        assert count == 2
+        assert self._open_bugs(db) == [("2026-02-10", 10), ("2026-02-17", 13), ("2026-02-24", 14)]
+
+    def test_rolling_stats_only_for_changed_series(self, db, tmp_path, monkeypatch):
+        _patch_history_dir(monkeypatch, tmp_path)
+        self._write_quality(tmp_path / "quality_history.json", [("2026-02-10", 10), ("2026-02-17", 12)])
+        import_quality_metrics(db)
+        assert compute_rolling_stats(db, changed_only=True) == 1
+
+        # Nothing imported since: nothing to recompute
+        assert compute_rolling_stats(db, changed_only=True) == 0
+
+    def test_unique_index_deduplicates_existing_rows(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "legacy.db")
+        conn.execute(
+            "CREATE TABLE metrics (id INTEGER PRIMARY KEY AUTOINCREMENT, metric_date TEXT NOT NULL, "
+            "dashboard TEXT NOT NULL, project_name TEXT NOT NULL, metric_name TEXT NOT NULL, "
+            "metric_value REAL, metric_unit TEXT, created_at TEXT)"
+        )
+        for value in (1.0, 2.0):
+            conn.execute(
+                "INSERT INTO metrics (metric_date, dashboard, project_name, metric_name, metric_value) "
+                "VALUES ('2026-02-17', 'quality', 'Product A', 'open_bugs', ?)",
+                (value,),
+            )
+        conn.commit()
+
+        configure_connection(conn)
+        create_database(conn)
+
+        assert conn.execute("SELECT metric_value FROM metrics").fetchall() == [(2.0,)]
+        conn.close()
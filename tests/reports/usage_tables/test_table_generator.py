@@ -20,6 +20,7 @@ from execution.reports.usage_tables.table_generator import (
     generate_table_html,
     generate_table_row_html,
     get_usage_heatmap_color,
+    iter_table_html,
     parse_access_value,
 )
 
@@ -494,6 +495,59 @@ class TestGenerateTableHtml:
             assert len(row.find_all("td")) == 4
 
 
+class TestIterTableHtml:
+    """Tests for the chunked, column-wise table writer."""
+
+    def test_rows_match_row_generator(self, sample_usage_dataframe: pd.DataFrame):
+        """Test column-wise formatting produces the same markup as generate_table_row_html."""
+        expected_rows = "".join(
+            generate_table_row_html(
+                TableRow(
+                    name=str(row["Name"]),
+                    job_title=str(row["Job Title"]),
+                    access=row["Claude Access"],
+                    usage=float(row["Claude 30 day usage"]),
+                )
+            )
+            for _, row in sample_usage_dataframe.iterrows()
+        )
+
+        html_output = generate_table_html(
+            df=sample_usage_dataframe,
+            table_id="t",
+            title="T",
+            usage_column="Claude 30 day usage",
+            access_column="Claude Access",
+        )
+
+        assert expected_rows in html_output
+
+    def test_yields_one_chunk_per_block_of_rows(self, sample_usage_dataframe: pd.DataFrame):
+        """Test rows are produced in chunks between the header and footer."""
+        chunks = list(
+            iter_table_html(sample_usage_dataframe, "t", "T", "Claude 30 day usage", "Claude Access", chunk_rows=3)
+        )
+
+        assert len(chunks) == 4  # header, 3 rows, 1 row, footer
+        assert chunks[1].count("<tr>") == 3
+        assert chunks[2].count("<tr>") == 1
+        assert "</table>" in chunks[-1]
+
+    def test_missing_columns_raise_before_streaming(self, sample_usage_dataframe: pd.DataFrame):
+        """Test validation happens when called, not when the first chunk is written."""
+        with pytest.raises(KeyError, match="Missing required columns"):
+            iter_table_html(sample_usage_dataframe, "t", "T", "Missing", "Claude Access")
+
+    def test_empty_dataframe(self):
+        """Test an empty table still has header and footer."""
+        empty = pd.DataFrame(columns=["Name", "Job Title", "Claude Access", "Claude 30 day usage"])
+
+        html_output = "".join(iter_table_html(empty, "t", "T", "Claude 30 day usage", "Claude Access"))
+
+        assert "<tbody>" in html_output
+        assert "<tr>\n" not in html_output.split("<tbody>")[1]
+
+
 # Integration Tests
 class TestTableGeneratorIntegration:
     """Integration tests for complete workflow."""
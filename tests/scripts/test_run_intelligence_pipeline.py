@@ -44,7 +44,7 @@ def sample_forecast_result() -> ForecastResult:
 
 @pytest.fixture
 def sample_scenario_result() -> ScenarioResult:
-    """Minimal ScenarioResult for mocking compare_scenarios output."""
+    """Minimal ScenarioResult for mocking run_monte_carlo_batch output."""
     import datetime
 
     return ScenarioResult(
@@ -270,7 +270,7 @@ class TestRunScenarios:
                 return_value=sample_features_df,
             ),
             patch(
-                "scripts.run_intelligence_pipeline.compare_scenarios",
+                "scripts.run_intelligence_pipeline.run_monte_carlo_batch",
                 return_value=[sample_scenario_result],
             ),
             patch.object(pipeline, "_INSIGHTS_DIR", tmp_path),
@@ -322,7 +322,7 @@ class TestRunScenarios:
                 return_value=df_no_col,
             ),
             patch(
-                "scripts.run_intelligence_pipeline.compare_scenarios",
+                "scripts.run_intelligence_pipeline.run_monte_carlo_batch",
                 return_value=[sample_scenario_result],
             ),
             patch.object(pipeline, "_INSIGHTS_DIR", tmp_path),
@@ -332,6 +332,29 @@ class TestRunScenarios:
             # Result should still be True with partial data.
             pipeline._run_scenarios()  # just verify no exception raised
 
+    def test_simulates_all_metrics_in_one_batch(
+        self,
+        tmp_path: Path,
+        sample_features_df: pd.DataFrame,
+        sample_scenario_result: ScenarioResult,
+    ) -> None:
+        """Every metric's BAU/Accelerated/Conservative specs go into a single batched run."""
+        mock_batch = MagicMock(return_value=[sample_scenario_result])
+        with (
+            patch(
+                "scripts.run_intelligence_pipeline.load_features",
+                return_value=sample_features_df,
+            ),
+            patch("scripts.run_intelligence_pipeline.run_monte_carlo_batch", mock_batch),
+            patch.object(pipeline, "_INSIGHTS_DIR", tmp_path),
+        ):
+            pipeline._run_scenarios()
+
+        mock_batch.assert_called_once()
+        specs = mock_batch.call_args.args[0]
+        assert [s.scenario_name for s in specs[:3]] == ["BAU", "Accelerated", "Conservative"]
+        assert {s.metric for s in specs} <= {col for _, col in pipeline._FORECAST_TARGETS}
+
 
 # ---------------------------------------------------------------------------
 # _run_risk_scoring
@@ -0,0 +1,97 @@
+"""
+Tests for execution/collect_all_metrics.py
+
+Covers in-process vs subprocess collector execution and the in-process
+collector wrapper (shared REST client, failure handling).
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from execution.collect_all_metrics import ADO_COLLECTORS, AsyncMetricsOrchestrator
+
+
+def _fake_module(run_result=True, run_side_effect=None) -> SimpleNamespace:
+    """Module exposing a FakeCollector whose run() returns run_result"""
+    instances = []
+
+    class FakeCollector:
+        def __init__(self, rest_client=None):
+            self.rest_client = rest_client
+            self.run = AsyncMock(return_value=run_result, side_effect=run_side_effect)
+            instances.append(self)
+
+    return SimpleNamespace(FakeCollector=FakeCollector, instances=instances)
+
+
+class TestRunCollectorInProcess:
+    """Test AsyncMetricsOrchestrator._run_collector_in_process"""
+
+    @pytest.mark.asyncio
+    async def test_passes_shared_client(self):
+        """Test the collector is built with the orchestrator's REST client"""
+        module = _fake_module()
+        rest_client = MagicMock()
+
+        with patch("execution.collect_all_metrics.importlib.import_module", return_value=module):
+            await AsyncMetricsOrchestrator()._run_collector_in_process("fake", "FakeCollector", rest_client)
+
+        assert module.instances[0].rest_client is rest_client
+        module.instances[0].run.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unsuccessful_run_raises(self):
+        """Test run() returning False is reported as a failure"""
+        module = _fake_module(run_result=False)
+
+        with patch("execution.collect_all_metrics.importlib.import_module", return_value=module):
+            with pytest.raises(RuntimeError, match="did not save"):
+                await AsyncMetricsOrchestrator()._run_collector_in_process("fake", "FakeCollector", None)
+
+    @pytest.mark.asyncio
+    async def test_sys_exit_does_not_stop_orchestrator(self):
+        """Test a collector calling sys.exit() fails only that collector"""
+        module = _fake_module(run_side_effect=SystemExit(1))
+
+        with patch("execution.collect_all_metrics.importlib.import_module", return_value=module):
+            name, success, _ = await AsyncMetricsOrchestrator()._run_collector_async(
+                "Fake",
+                lambda: AsyncMetricsOrchestrator()._run_collector_in_process("fake", "FakeCollector", None),
+            )
+
+        assert name == "Fake"
+        assert success is False
+
+
+class TestCollectorMode:
+    """Test in-process (default) vs subprocess fallback"""
+
+    async def _collect(self, orchestrator: AsyncMetricsOrchestrator) -> tuple[AsyncMock, AsyncMock]:
+        async_runner = AsyncMock(side_effect=lambda name, func: (name, True, 0.0))
+        subprocess_runner = AsyncMock(side_effect=lambda name, path: (name, True, 0.0))
+        with (
+            patch("execution.collectors.ado_rest_client.get_ado_rest_client", side_effect=ValueError("no creds")),
+            patch.object(orchestrator, "_run_collector_async", async_runner),
+            patch.object(orchestrator, "_run_sync_collector_subprocess", subprocess_runner),
+        ):
+            summary = await orchestrator.collect_all_metrics()
+        assert summary["successful"] == 4 + len(ADO_COLLECTORS)
+        return async_runner, subprocess_runner
+
+    @pytest.mark.asyncio
+    async def test_default_runs_everything_in_process(self):
+        """Test no subprocesses are spawned by default"""
+        async_runner, subprocess_runner = await self._collect(AsyncMetricsOrchestrator())
+
+        assert async_runner.await_count == 4 + len(ADO_COLLECTORS)
+        subprocess_runner.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_subprocess_fallback(self):
+        """Test use_subprocesses=True keeps the old process isolation"""
+        async_runner, subprocess_runner = await self._collect(AsyncMetricsOrchestrator(use_subprocesses=True))
+
+        assert async_runner.await_count == 4
+        assert [call.args[1] for call in subprocess_runner.await_args_list] == [c[1] for c in ADO_COLLECTORS]
@@ -0,0 +1,183 @@
+"""
+Unit Tests for HTTP Record/Replay
+
+Test Coverage:
+- Secrets are scrubbed from recorded bodies, headers and query strings
+- Request keys ignore host, parameter order and dates
+- Cassettes round-trip through disk
+- A recorded session replays through the local server with exact request counts
+- HTTP 429 injection and unrecorded requests
+"""
+
+import json
+
+import httpx
+import pytest
+
+from execution.async_http_client import AsyncSecureHTTPClient, get_current_transport_factory, use_transport
+from execution.http_replay import (
+    SCRUBBED,
+    Cassette,
+    MeteredTransport,
+    RecordingTransport,
+    ReplayServer,
+    measure_requests,
+    replay_transport,
+    request_key,
+    scrub_json,
+)
+
+ADO_URL = "https://dev.azure.com/contoso/ProjectA/_apis/wit/wiql?api-version=7.1"
+COUNT_URL = "https://app.armorcode.com/api/aql/count?project=1"
+
+
+def _fake_service(request: httpx.Request) -> httpx.Response:
+    """Upstream standing in for ADO/ArmorCode."""
+    if request.url.path.endswith("/wiql"):
+        return httpx.Response(200, json={"workItems": [{"id": 1}, {"id": 2}], "token": "secret-token"})
+    return httpx.Response(200, json={"count": 7}, headers={"set-cookie": "session=abc"})
+
+
+def _recording_factory(cassette: Cassette):
+    def factory(limits: httpx.Limits, http2: bool) -> httpx.AsyncBaseTransport:
+        return MeteredTransport(RecordingTransport(cassette, httpx.MockTransport(_fake_service)))
+
+    return factory
+
+
+async def _run_session() -> list[dict]:
+    """The "collector" used by the tests: a WIQL query and two count requests."""
+    async with AsyncSecureHTTPClient() as client:
+        responses = [
+            await client.post(ADO_URL, json={"query": "WHERE [System.ChangedDate] >= '2026-01-01'"}),
+            await client.get(COUNT_URL),
+            await client.get(COUNT_URL),
+        ]
+    return [response.json() for response in responses]
+
+
+async def _record() -> Cassette:
+    cassette = Cassette(meta={"organization_url": "https://dev.azure.com/contoso"})
+    with use_transport(_recording_factory(cassette)):
+        await _run_session()
+    return cassette
+
+
+class TestScrubbing:
+    """Test secrets never reach the cassette"""
+
+    def test_scrub_json_replaces_credential_fields(self):
+        """Test nested credential-like fields are replaced, other fields kept"""
+        scrubbed = scrub_json({"items": [{"apiKey": "k", "name": "x"}], "password": "p", "continuationToken": "c"})
+
+        assert scrubbed == {
+            "items": [{"apiKey": SCRUBBED, "name": "x"}],
+            "password": SCRUBBED,
+            "continuationToken": "c",
+        }
+
+    @pytest.mark.asyncio
+    async def test_recorded_interactions_contain_no_secrets(self):
+        """Test bodies and headers are scrubbed before they are stored"""
+        text = json.dumps((await _record()).to_dict())
+
+        assert "secret-token" not in text
+        assert "session=abc" not in text
+
+
+class TestRequestKey:
+    """Test request identity"""
+
+    def test_host_and_parameter_order_ignored(self):
+        """Test the same request to another host with reordered query has the same key"""
+        assert request_key("get", "/org/_apis/x?b=2&a=1") == request_key("GET", "/org/_apis/x?a=1&b=2")
+
+    def test_dates_masked(self):
+        """Test a lookback window recorded yesterday matches today's request"""
+        first = request_key("POST", "/q?fromDate=2026-01-01T00:00:00Z", b'{"query": ">= \'2026-01-01\'"}')
+        second = request_key("POST", "/q?fromDate=2026-01-02T00:00:00Z", b'{"query": ">= \'2026-01-02\'"}')
+
+        assert first == second
+
+    def test_body_distinguishes_requests(self):
+        """Test different request bodies have different keys"""
+        assert request_key("POST", "/q", b'{"a": 1}') != request_key("POST", "/q", b'{"a": 2}')
+
+
+class TestCassette:
+    """Test cassette storage"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        """Test a saved cassette loads with the same interactions and metadata"""
+        cassette = await _record()
+        cassette.save(tmp_path / "cassette.json")
+
+        loaded = Cassette.load(tmp_path / "cassette.json")
+
+        assert len(loaded) == len(cassette) == 3
+        assert loaded.meta["organization_url"] == "https://dev.azure.com/contoso"
+
+    def test_unsupported_version_rejected(self, tmp_path):
+        """Test loading a file of another format raises ValueError"""
+        path = tmp_path / "cassette.json"
+        path.write_text(json.dumps({"version": 99, "interactions": []}), encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            Cassette.load(path)
+
+    def test_last_response_repeated(self):
+        """Test a key asked for more often than recorded repeats its last response"""
+        cassette = Cassette([{"key": "k", "status": 200, "body": "1"}, {"key": "k", "status": 200, "body": "2"}])
+
+        bodies = []
+        for _ in range(3):
+            response = cassette.response_for("k")
+            assert response is not None
+            bodies.append(response["body"])
+
+        assert bodies == ["1", "2", "2"]
+        assert cassette.response_for("missing") is None
+
+
+class TestReplay:
+    """Test offline replay through the local server"""
+
+    @pytest.mark.asyncio
+    async def test_replay_matches_recording_with_exact_counts(self):
+        """Test replayed responses equal the recorded ones and every request is counted"""
+        cassette = await _record()
+
+        with ReplayServer(cassette) as server, use_transport(replay_transport(server.url)):
+            with measure_requests() as metrics:
+                results = await _run_session()
+
+        assert results == [{"workItems": [{"id": 1}, {"id": 2}], "token": SCRUBBED}, {"count": 7}, {"count": 7}]
+        assert metrics.count == server.requests == 3
+        assert metrics.summary()["by_status"] == {"200": 3}
+        assert server.misses == 0
+        assert get_current_transport_factory() is None
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_injection(self):
+        """Test every Nth request is answered with 429 and a Retry-After header"""
+        cassette = await _record()
+
+        with ReplayServer(cassette, rate_limit_every=2, retry_after=3) as server:
+            with use_transport(replay_transport(server.url)):
+                async with AsyncSecureHTTPClient() as client:
+                    statuses = [(await client.get(COUNT_URL)) for _ in range(4)]
+
+        assert [r.status_code for r in statuses] == [200, 429, 200, 429]
+        assert statuses[1].headers["retry-after"] == "3"
+        assert server.throttled == 2
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_request_is_a_miss(self):
+        """Test a request missing from the cassette gets a 404 and is counted"""
+        with ReplayServer(Cassette()) as server, use_transport(replay_transport(server.url)):
+            async with AsyncSecureHTTPClient() as client:
+                response = await client.get("https://dev.azure.com/contoso/_apis/projects")
+
+        assert response.status_code == 404
+        assert server.misses == 1
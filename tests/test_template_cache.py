@@ -0,0 +1,94 @@
+"""
+Tests for the precompiled Jinja2 template cache
+
+Test Coverage:
+- Templates are compiled once into a digest-keyed module directory and reused
+- Editing a template compiles a new cache (stale modules are never loaded)
+- Templates that cannot compile fall back to the source loader
+- Shared environments load project templates from the compiled cache
+"""
+
+from jinja2 import ChoiceLoader, ModuleLoader
+
+from execution.dashboards.renderer import get_jinja_environment
+from execution.template_cache import compile_template_cache, create_environment
+from execution.template_engine import get_template_engine
+
+
+def _write(directory, name, source):
+    path = directory / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source, encoding="utf-8")
+
+
+class TestCompileTemplateCache:
+    """Test compiled cache directories"""
+
+    def test_renders_from_compiled_modules(self, tmp_path):
+        """Test templates are loaded through the ModuleLoader"""
+        _write(tmp_path / "src", "card.html", "<b>{{ title }}</b>")
+
+        env = create_environment([tmp_path / "src"], cache_dir=tmp_path / "cache")
+
+        assert isinstance(env.loader, ChoiceLoader)
+        assert isinstance(env.loader.loaders[0], ModuleLoader)
+        assert env.get_template("card.html").render(title="<x>") == "<b>&lt;x&gt;</b>"
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    def test_unchanged_sources_reuse_cache(self, tmp_path):
+        """Test a second environment reuses the same compiled directory"""
+        _write(tmp_path / "src", "card.html", "{{ title }}")
+
+        first = compile_template_cache(create_environment([tmp_path / "src"], cache_dir=None), tmp_path / "cache")
+        second = compile_template_cache(create_environment([tmp_path / "src"], cache_dir=None), tmp_path / "cache")
+
+        assert first == second
+
+    def test_edited_template_gets_new_cache(self, tmp_path):
+        """Test a changed source is never served from stale modules"""
+        _write(tmp_path / "src", "card.html", "old {{ title }}")
+        create_environment([tmp_path / "src"], cache_dir=tmp_path / "cache")
+        _write(tmp_path / "src", "card.html", "new {{ title }}")
+
+        env = create_environment([tmp_path / "src"], cache_dir=tmp_path / "cache")
+
+        assert env.get_template("card.html").render(title="t") == "new t"
+        assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    def test_uncompilable_template_falls_back_to_source(self, tmp_path):
+        """Test a template using an unregistered filter still renders once it is available"""
+        _write(tmp_path / "src", "num.html", "{{ n|format_number }}")
+        env = create_environment([tmp_path / "src"], cache_dir=tmp_path / "cache")
+
+        env.filters["format_number"] = lambda value: f"{value:,}"
+
+        assert env.get_template("num.html").render(n=1234) == "1,234"
+
+    def test_earlier_directory_wins(self, tmp_path):
+        """Test template directories are searched in order"""
+        _write(tmp_path / "a", "card.html", "from a")
+        _write(tmp_path / "b", "card.html", "from b")
+        _write(tmp_path / "b", "only_b.html", "only b")
+
+        env = create_environment([tmp_path / "a", tmp_path / "b"], cache_dir=tmp_path / "cache")
+
+        assert env.get_template("card.html").render() == "from a"
+        assert env.get_template("only_b.html").render() == "only b"
+
+
+class TestSharedEnvironments:
+    """Test the project environments use the compiled cache"""
+
+    def test_dashboard_environment_is_precompiled(self):
+        """Test render_dashboard's environment loads compiled modules"""
+        env = get_jinja_environment()
+
+        assert isinstance(env.loader, ChoiceLoader)
+        assert isinstance(env.loader.loaders[0], ModuleLoader)
+        assert env.get_template("dashboards/base_dashboard.html") is not None
+
+    def test_template_engine_finds_execution_templates(self):
+        """Test component partials kept only under execution/templates resolve"""
+        html = get_template_engine().render("components/status_indicator.html", color="green")
+
+        assert html.strip()
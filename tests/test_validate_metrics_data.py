@@ -0,0 +1,69 @@
+"""
+Tests for execution/validate_metrics_data.py
+
+Verifies history validation reads through HistoryStore, so migrated
+(week-partitioned) histories are validated from their partitions.
+"""
+
+import json
+from pathlib import Path
+
+from execution.core.history_store import HistoryStore
+from execution.validate_metrics_data import validate_history_file
+
+
+def _week(week_date: str) -> dict:
+    return {"week_date": week_date, "projects": []}
+
+
+def test_legacy_history_valid(tmp_path: Path) -> None:
+    path = tmp_path / "flow_history.json"
+    path.write_text(json.dumps({"weeks": [_week("2026-01-05"), _week("2026-01-12")]}), encoding="utf-8")
+
+    is_valid, message = validate_history_file(str(path), ["projects", "week_date"])
+
+    assert is_valid
+    assert message.startswith("Valid (2 weeks")
+
+
+def test_partitioned_history_validated_from_partitions(tmp_path: Path) -> None:
+    """A stale legacy document is ignored once the history is partitioned"""
+    path = tmp_path / "flow_history.json"
+    path.write_text(json.dumps({"weeks": [_week("2026-01-05")]}), encoding="utf-8")
+    store = HistoryStore(path)
+    store.migrate()
+    store.append(_week("2026-01-12"))
+    path.write_text("{}", encoding="utf-8")
+
+    is_valid, message = validate_history_file(str(path), ["projects", "week_date"])
+
+    assert is_valid
+    assert message.startswith("Valid (2 weeks")
+
+
+def test_partitioned_history_without_legacy_file(tmp_path: Path) -> None:
+    path = tmp_path / "flow_history.json"
+    path.write_text(json.dumps({"weeks": [_week("2026-01-05")]}), encoding="utf-8")
+    HistoryStore(path).migrate()
+    path.unlink()
+
+    is_valid, _ = validate_history_file(str(path), ["week_date"])
+
+    assert is_valid
+
+
+def test_missing_fields_in_latest_partition(tmp_path: Path) -> None:
+    path = tmp_path / "flow_history.json"
+    path.write_text(json.dumps({"weeks": [_week("2026-01-05")]}), encoding="utf-8")
+    store = HistoryStore(path)
+    store.migrate()
+    store.append({"week_date": "2026-01-12"})
+
+    is_valid, message = validate_history_file(str(path), ["projects", "week_date"])
+
+    assert not is_valid
+    assert "projects" in message
+
+
+def test_missing_history(tmp_path: Path) -> None:
+    assert validate_history_file(str(tmp_path / "flow_history.json")) == (False, "File does not exist")